@@ -8,7 +8,11 @@ from django.contrib import admin
 
 @admin.register(ArcGISLayerImport)
 class ArcGISLayerImportAdmin(admin.ModelAdmin):
-    pass
+    list_display = ('id', 'url', 'user', 'status', 'stage', 'processed_count', 'total_count', 'failed_count', 'rate',
+                    'created_at', 'finished_at')
+    list_filter = ('status', 'stage')
+    raw_id_fields = ('user', 'parent')
+    date_hierarchy = 'created_at'
 
 
 @admin.register(ImportedLayer)
@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+"""Import benchmarks against a local stand-in ArcGIS REST server.
+
+``fake_server`` serves synthetic FeatureServer/MapServer layers,
+``run`` runs the end-to-end and per-stage benchmarks and appends the
+results (features/sec, peak memory, commit) to a json lines file that
+``compare`` reads to compare two commits.
+"""
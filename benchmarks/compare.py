@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Compare the benchmark results of two commits.
+
+    python -m arcgis_importer.benchmarks.compare --base <commit> --head <commit>
+
+Without arguments the last two commits of the results file are compared.
+Runs are matched by benchmark, layer, service, server parameters and
+import options, the median rate of the runs is compared.
+"""
+import argparse
+import json
+import statistics
+
+from .run import DEFAULT_OUTPUT
+
+
+def load_results(path):
+    with open(path) as results_file:
+        return [json.loads(line) for line in results_file if line.strip()]
+
+
+def run_key(record):
+    return (record['benchmark'], record['layer'], record['service'], json.dumps(record['server'], sort_keys=True),
+            json.dumps(record['options'], sort_keys=True))
+
+
+def medians(records, commit):
+    by_key = {}
+    for record in records:
+        if record['commit'] and record['commit'].startswith(commit) and 'per_second' in record:
+            by_key.setdefault(run_key(record), []).append(record)
+    return {key: (statistics.median(record['per_second'] for record in runs),
+                  max(record['peak_rss_mb'] for record in runs))
+            for key, runs in by_key.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--results', default=DEFAULT_OUTPUT)
+    parser.add_argument('--base')
+    parser.add_argument('--head')
+    args = parser.parse_args()
+    records = load_results(args.results)
+    commits = []
+    for record in records:
+        if record['commit'] and record['commit'] not in commits:
+            commits.append(record['commit'])
+    head = args.head or (commits[-1] if commits else None)
+    base = args.base or (commits[-2] if len(commits) > 1 else None)
+    if not base or not head:
+        parser.error('two commits with results are needed')
+    base_medians = medians(records, base)
+    head_medians = medians(records, head)
+    print('{:15} {:6} {:>12} {:>12} {:>8} {:>10} {:>10}'.format('benchmark', 'layer', 'base/s', 'head/s', 'change',
+                                                               'base MB', 'head MB'))
+    for key in sorted(set(base_medians) & set(head_medians)):
+        (base_rate, base_memory), (head_rate, head_memory) = base_medians[key], head_medians[key]
+        change = (head_rate - base_rate) / base_rate * 100 if base_rate else 0
+        print('{:15} {:6} {:>12.1f} {:>12.1f} {:>+7.1f}% {:>10.1f} {:>10.1f}'.format(
+            key[0], key[1], base_rate, head_rate, change, base_memory, head_memory))
+
+
+if __name__ == '__main__':
+    main()
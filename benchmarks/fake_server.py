@@ -0,0 +1,365 @@
+# -*- coding: utf-8 -*-
+"""Stand-in ArcGIS REST server with synthetic layers, standard library only.
+
+Serves ``/arcgis/rest/services/Bench/FeatureServer`` and ``.../MapServer``
+with a points (0), lines (1) and polygons (2) layer and a table (3). Every
+layer has a coded value domain, subtypes with their own domains, a date and
+a double field. Queries support ``where`` clauses on the attributes,
+OBJECTID ranges, ``returnCountOnly``, ``returnIdsOnly``, min/max
+``outStatistics``, ``resultOffset``/``resultRecordCount`` paging and
+envelope filters, limited to ``maxRecordCount`` features per response.
+
+    python -m arcgis_importer.benchmarks.fake_server --features 100000 --latency 0.05
+"""
+import argparse
+import bisect
+import json
+import math
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs, urlparse
+
+SERVICE_NAME = 'Bench'
+OID_FIELD = 'OBJECTID'
+# WGS84 extent the features are spread over
+EXTENT = {'xmin': 30.0, 'ymin': 29.0, 'xmax': 32.0, 'ymax': 31.0, 'spatialReference': {'wkid': 4326,
+                                                                                      'latestWkid': 4326}}
+LAYERS = (
+    (0, 'Bench Points', 'esriGeometryPoint'),
+    (1, 'Bench Lines', 'esriGeometryPolyline'),
+    (2, 'Bench Polygons', 'esriGeometryPolygon'),
+    (3, 'Bench Table', None),
+)
+CATEGORY_DOMAIN = {'type': 'codedValue', 'name': 'Category',
+                   'codedValues': [{'code': code, 'name': 'Category {}'.format(code)} for code in range(1, 6)]}
+SUBTYPES = [{'code': code, 'name': 'Subtype {}'.format(code),
+             'domains': {'STATUS': {'type': 'codedValue', 'name': 'Status {}'.format(code),
+                                    'codedValues': [{'code': status, 'name': 'Status {}.{}'.format(code, status)}
+                                                    for status in range(1, 4)]}}}
+            for code in range(1, 4)]
+FIELDS = [
+    {'name': OID_FIELD, 'type': 'esriFieldTypeOID', 'alias': OID_FIELD},
+    {'name': 'NAME', 'type': 'esriFieldTypeString', 'alias': 'Name', 'length': 50},
+    {'name': 'CATEGORY', 'type': 'esriFieldTypeSmallInteger', 'alias': 'Category', 'domain': CATEGORY_DOMAIN},
+    {'name': 'SUBTYPE', 'type': 'esriFieldTypeInteger', 'alias': 'Subtype'},
+    {'name': 'STATUS', 'type': 'esriFieldTypeSmallInteger', 'alias': 'Status'},
+    {'name': 'CREATED', 'type': 'esriFieldTypeDate', 'alias': 'Created', 'length': 8},
+    {'name': 'VALUE', 'type': 'esriFieldTypeDouble', 'alias': 'Value'},
+]
+CONDITION = re.compile(r"([A-Za-z_]\w*)\s*(>=|<=|<>|!=|=|>|<)\s*('[^']*'|-?\d+(?:\.\d+)?)")
+OPERATORS = {'=': '==', '<>': '!=', '!=': '!=', '>': '>', '>=': '>=', '<': '<', '<=': '<='}
+
+
+def ring_around(rng, x, y, radius, vertices):
+    # closed clockwise ring, the orientation of Esri outer rings
+    angles = sorted((rng.uniform(0, 2 * math.pi) for _i in range(vertices)), reverse=True)
+    ring = [[round(x + radius * math.cos(angle), 6), round(y + radius * math.sin(angle), 6)] for angle in angles]
+    return ring + [ring[0]]
+
+
+def make_geometry(rng, geometry_type, vertices):
+    x = rng.uniform(EXTENT['xmin'], EXTENT['xmax'])
+    y = rng.uniform(EXTENT['ymin'], EXTENT['ymax'])
+    if geometry_type == 'esriGeometryPoint':
+        return {'x': round(x, 6), 'y': round(y, 6)}
+    if geometry_type == 'esriGeometryPolyline':
+        path = [[round(x + 0.001 * i, 6), round(y + rng.uniform(-0.001, 0.001), 6)] for i in range(vertices)]
+        return {'paths': [path]}
+    return {'rings': [ring_around(rng, x, y, 0.005, vertices)]}
+
+
+def bbox(geometry):
+    if geometry is None:
+        return None
+    if 'x' in geometry:
+        return geometry['x'], geometry['y'], geometry['x'], geometry['y']
+    points = [point for part in geometry.get('paths') or geometry.get('rings') for point in part]
+    xs = [point[0] for point in points]
+    ys = [point[1] for point in points]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+class FakeLayer(object):
+    def __init__(self, layer_id, name, geometry_type, features_count, vertices, seed, oid_gap):
+        rng = random.Random(seed + layer_id)
+        self.layer_id = layer_id
+        self.name = name
+        self.geometry_type = geometry_type
+        self.features = []
+        oid = 0
+        for index in range(features_count):
+            oid += 1 + (rng.randint(0, oid_gap) if oid_gap else 0)
+            attributes = {
+                OID_FIELD: oid,
+                'NAME': 'Feature {}'.format(index),
+                'CATEGORY': rng.randint(1, 5),
+                'SUBTYPE': rng.randint(1, 3),
+                'STATUS': rng.randint(1, 3),
+                'CREATED': 1500000000000 + rng.randint(0, 10 ** 11),
+                'VALUE': round(rng.uniform(0, 1000), 3) if rng.random() > 0.05 else None,
+            }
+            geometry = make_geometry(rng, geometry_type, vertices) if geometry_type else None
+            self.features.append({'attributes': attributes, 'geometry': geometry, 'bbox': bbox(geometry)})
+        self.oids = [feature['attributes'][OID_FIELD] for feature in self.features]
+
+    def metadata(self, server):
+        metadata = {
+            'currentVersion': 10.81,
+            'id': self.layer_id,
+            'name': self.name,
+            'type': 'Feature Layer' if self.geometry_type else 'Table',
+            'objectIdField': OID_FIELD,
+            'fields': FIELDS,
+            'maxRecordCount': server.max_record_count,
+            'supportsStatistics': server.supports_statistics,
+            'supportsPagination': server.supports_pagination,
+            'advancedQueryCapabilities': {'supportsPagination': server.supports_pagination,
+                                          'supportsStatistics': server.supports_statistics},
+            'supportedQueryFormats': 'JSON',
+            'capabilities': 'Query',
+        }
+        if self.geometry_type:
+            metadata.update({'geometryType': self.geometry_type, 'extent': EXTENT,
+                             'drawingInfo': {'renderer': {'type': 'simple'}}})
+        return metadata
+
+
+def parse_where(where):
+    # translate the SQL where clause to a python predicate over the attributes,
+    # enough for the clauses sent by the importer (OBJECTID ranges, attribute filters)
+    where = (where or '1=1').strip()
+    if where == '1=1':
+        return None
+    expression = CONDITION.sub(lambda match: '(attributes.get({!r}) {} {})'.format(
+        match.group(1), OPERATORS[match.group(2)], match.group(3)), where)
+    expression = re.sub(r'\bAND\b', 'and', re.sub(r'\bOR\b', 'or', re.sub(r'\bNOT\b', 'not', expression)))
+    code = compile(expression, '<where>', 'eval')
+
+    def predicate(attributes):
+        try:
+            return eval(code, {'__builtins__': {}}, {'attributes': attributes})
+        except TypeError:
+            # comparison with NULL
+            return False
+    return predicate
+
+
+def oid_bounds(where):
+    # OBJECTID range of a where clause, to slice the sorted features before evaluating it
+    low, high = None, None
+    for operator, value in re.findall(r'\b{}\s*(>=|>)\s*(-?\d+)'.format(OID_FIELD), where or ''):
+        value = int(value) + (1 if operator == '>' else 0)
+        low = value if low is None else max(low, value)
+    for operator, value in re.findall(r'\b{}\s*(<=|<)\s*(-?\d+)'.format(OID_FIELD), where or ''):
+        value = int(value) - (1 if operator == '<' else 0)
+        high = value if high is None else min(high, value)
+    if ' OR ' in (where or '').upper():
+        return None, None
+    return low, high
+
+
+class FakeArcGISServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, features=10000, vertices=20, max_record_count=1000, latency=0.0,
+                 error_rate=0.0, seed=1, oid_gap=0, supports_statistics=True, supports_pagination=True):
+        HTTPServer.__init__(self, address, FakeArcGISHandler)
+        self.max_record_count = max_record_count
+        self.latency = latency
+        self.error_rate = error_rate
+        self.supports_statistics = supports_statistics
+        self.supports_pagination = supports_pagination
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.bytes_sent = 0
+        self._lock = threading.Lock()
+        self.layers = {layer_id: FakeLayer(layer_id, name, geometry_type, features, vertices, seed, oid_gap)
+                       for layer_id, name, geometry_type in LAYERS}
+
+    @property
+    def url(self):
+        return 'http://{}:{}/arcgis/rest/services/{}'.format(self.server_address[0], self.server_address[1],
+                                                             SERVICE_NAME)
+
+    def layer_url(self, layer_id, service_type='FeatureServer'):
+        return '{}/{}/{}'.format(self.url, service_type, layer_id)
+
+    def count(self, sent_bytes):
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += sent_bytes
+
+    def query(self, layer, params):
+        where = params.get('where')
+        low, high = oid_bounds(where)
+        start = bisect.bisect_left(layer.oids, low) if low is not None else 0
+        end = bisect.bisect_right(layer.oids, high) if high is not None else len(layer.oids)
+        predicate = parse_where(where)
+        envelope = json.loads(params['geometry']) if params.get('geometry') else None
+        if envelope and not isinstance(envelope, dict):
+            envelope = None
+        if envelope and 'xmin' not in envelope:
+            envelope = None
+        matched = []
+        for feature in layer.features[start:end]:
+            if predicate and not predicate(feature['attributes']):
+                continue
+            if envelope:
+                box = feature['bbox']
+                if box is None or box[0] > envelope['xmax'] or box[2] < envelope['xmin'] \
+                        or box[1] > envelope['ymax'] or box[3] < envelope['ymin']:
+                    continue
+            matched.append(feature)
+        if params.get('outStatistics'):
+            values = [feature['attributes'][OID_FIELD] for feature in matched]
+            return {'features': [{'attributes': {'THE_MIN': min(values) if values else None,
+                                                 'THE_MAX': max(values) if values else None}}]}
+        if params.get('returnCountOnly', '').lower() == 'true':
+            return {'count': len(matched)}
+        if params.get('returnIdsOnly', '').lower() == 'true':
+            return {'objectIdFieldName': OID_FIELD,
+                    'objectIds': [feature['attributes'][OID_FIELD] for feature in matched]}
+        offset = int(params.get('resultOffset') or 0)
+        limit = min(int(params.get('resultRecordCount') or self.max_record_count), self.max_record_count)
+        page = matched[offset:offset + limit]
+        out_fields = params.get('outFields') or '*'
+        fields = None if '*' in out_fields else [field.strip() for field in out_fields.split(',')]
+        return_geometry = params.get('returnGeometry', 'true').lower() != 'false'
+        features = []
+        for feature in page:
+            attributes = feature['attributes']
+            if fields is not None:
+                attributes = {name: value for name, value in attributes.items() if name in fields}
+            result = {'attributes': attributes}
+            if return_geometry and feature['geometry']:
+                result['geometry'] = feature['geometry']
+            features.append(result)
+        response = {'objectIdFieldName': OID_FIELD, 'features': features,
+                    'exceededTransferLimit': offset + limit < len(matched)}
+        if layer.geometry_type:
+            response.update({'geometryType': layer.geometry_type, 'spatialReference': EXTENT['spatialReference']})
+        return response
+
+    def handle_path(self, path, params):
+        parts = [part for part in path.split('/') if part]
+        # arcgis/rest/services/<service>/<type>[/<layer id>[/query]] or .../<type>/layers
+        if len(parts) < 5 or parts[:3] != ['arcgis', 'rest', 'services'] or parts[3] != SERVICE_NAME:
+            return 404, {'error': {'code': 404, 'message': 'Not Found', 'details': []}}
+        service_type = parts[4]
+        if service_type not in ('FeatureServer', 'MapServer'):
+            return 404, {'error': {'code': 404, 'message': 'Not Found', 'details': []}}
+        if len(parts) == 5:
+            return 200, {
+                'currentVersion': 10.81,
+                'layers': [{'id': layer.layer_id, 'name': layer.name} for layer in self.layers.values()
+                           if layer.geometry_type],
+                'tables': [{'id': layer.layer_id, 'name': layer.name} for layer in self.layers.values()
+                           if not layer.geometry_type],
+            }
+        if parts[5] == 'layers':
+            metadata = [self.layer_metadata(layer, service_type) for layer in self.layers.values()]
+            return 200, {'layers': [item for item in metadata if item['type'] == 'Feature Layer'],
+                         'tables': [item for item in metadata if item['type'] == 'Table']}
+        layer = self.layers.get(int(parts[5])) if parts[5].isdigit() else None
+        if not layer:
+            return 200, {'error': {'code': 400, 'message': 'Invalid or missing input parameters.', 'details': []}}
+        if len(parts) == 6:
+            return 200, self.layer_metadata(layer, service_type)
+        if parts[6] == 'query':
+            return 200, self.query(layer, params)
+        return 404, {'error': {'code': 404, 'message': 'Not Found', 'details': []}}
+
+    def layer_metadata(self, layer, service_type):
+        metadata = layer.metadata(self)
+        if service_type == 'FeatureServer':
+            metadata.update({'subtypeField': 'SUBTYPE', 'subtypes': SUBTYPES})
+        else:
+            metadata.update({'typeIdField': 'SUBTYPE', 'types': [dict(subtype, id=subtype['code'])
+                                                                 for subtype in SUBTYPES]})
+        return metadata
+
+
+class FakeArcGISHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def respond(self, params):
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency)
+        if server.error_rate and server.random.random() < server.error_rate:
+            status, data = 503, {'error': {'code': 503, 'message': 'Service Unavailable', 'details': []}}
+        else:
+            try:
+                status, data = server.handle_path(urlparse(self.path).path, params)
+            except Exception as e:
+                status, data = 200, {'error': {'code': 400, 'message': str(e), 'details': []}}
+        body = json.dumps(data, separators=(',', ':')).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        server.count(len(body))
+
+    def do_GET(self):
+        params = {key: values[-1] for key, values in parse_qs(urlparse(self.path).query).items()}
+        self.respond(params)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode('utf-8') if length else ''
+        params = {key: values[-1] for key, values in parse_qs(urlparse(self.path).query).items()}
+        params.update({key: values[-1] for key, values in parse_qs(body).items()})
+        self.respond(params)
+
+
+def start_server(host='127.0.0.1', port=0, **options):
+    # start in a background thread, port 0 picks a free port. stop with server.shutdown()
+    server = FakeArcGISServer((host, port), **options)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+def add_server_arguments(parser):
+    parser.add_argument('--features', type=int, default=10000, help='features per layer')
+    parser.add_argument('--vertices', type=int, default=20, help='vertices per line/polygon')
+    parser.add_argument('--max-record-count', type=int, default=1000)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds added to every response')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='ratio of 503 responses')
+    parser.add_argument('--oid-gap', type=int, default=0, help='max random gap between OBJECTIDs')
+    parser.add_argument('--no-statistics', action='store_true', help='disable min/max OBJECTID statistics')
+    parser.add_argument('--no-pagination', action='store_true', help='disable resultOffset pagination')
+    parser.add_argument('--seed', type=int, default=1)
+
+
+def server_options(args):
+    return dict(features=args.features, vertices=args.vertices, max_record_count=args.max_record_count,
+                latency=args.latency, error_rate=args.error_rate, oid_gap=args.oid_gap, seed=args.seed,
+                supports_statistics=not args.no_statistics, supports_pagination=not args.no_pagination)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8099)
+    add_server_arguments(parser)
+    args = parser.parse_args()
+    server = FakeArcGISServer((args.host, args.port), **server_options(args))
+    print('Serving {}/FeatureServer and {}/MapServer'.format(server.url, server.url))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
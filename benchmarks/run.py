@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+"""Run the import benchmarks against the stand-in ArcGIS server.
+
+Runs in the GeoNode project environment, django settings and the
+osgeo_manager stack are needed by the importer:
+
+    DJANGO_SETTINGS_MODULE=<project>.settings python -m arcgis_importer.benchmarks.run \\
+        --features 50000 --benchmarks fetch,convert,gpkg --repeat 3 --option concurrency=4
+
+Each benchmark runs in its own process so the reported peak memory is its
+own. Results are appended as json lines to ``--output`` with the commit
+they ran on, ``compare`` compares the results of two commits.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import tempfile
+import time
+
+import django
+
+from .fake_server import add_server_arguments, server_options, start_server
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# in the working directory, results don't belong to the installed package
+DEFAULT_OUTPUT = 'arcgis_importer_benchmarks.jsonl'
+
+
+def get_commit():
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=PACKAGE_DIR).decode().strip()
+        dirty = bool(subprocess.check_output(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                             cwd=PACKAGE_DIR).strip())
+    except (OSError, subprocess.CalledProcessError):
+        commit, dirty = None, None
+    return commit, dirty
+
+
+def create_manager(url):
+    from ..esri import EsriManager
+    return EsriManager(url)
+
+
+def memory_layer(manager):
+    # OGR layer with the destination fields of the source layer, built as esri_to_postgis does
+    from ..esri import ogr
+    source = ogr.GetDriverByName('Memory').CreateDataSource('benchmark')
+    projection = manager.esri_serializer.get_projection() if manager.esri_serializer.is_feature_layer else None
+    gtype = manager.esri_serializer.get_geometry_type() if manager.esri_serializer.is_feature_layer else ogr.wkbNone
+    layer = source.CreateLayer('benchmark', projection, gtype)
+    for field in manager.esri_serializer.build_fields():
+        layer.CreateField(field)
+    return source, layer, gtype
+
+
+def bench_metadata(url, args):
+    # metadata parsing and destination fields building of the serializer
+    from ..serializers import EsriSerializer
+    serializer = EsriSerializer(url)
+    serializer.get_data()
+    started_at = time.time()
+    for _i in range(args.iterations):
+        serializer.fields_domains = {}
+        serializer.subtypes = {}
+        serializer.subtypes_fields = []
+        serializer.build_fields()
+    return args.iterations, time.time() - started_at
+
+
+def bench_fetch(url, args):
+    # network, decoding and esri json to geojson conversion
+    manager = create_manager(url)
+    started_at = time.time()
+    count = sum(1 for _feature in manager)
+    return count, time.time() - started_at
+
+
+def bench_convert(url, args):
+    # attribute mapping and EWKB building of the COPY writer, features are fetched before timing
+    from ..writers import RowEncoder
+    manager = create_manager(url)
+    features = list(manager)
+    _source, layer, gtype = memory_layer(manager)
+    plan = manager.get_attribute_plan(layer.GetLayerDefn())
+    encoder = RowEncoder(plan, gtype, srid=4326, geometry=manager.esri_serializer.is_feature_layer)
+    page_size = 1000
+    started_at = time.time()
+    for start in range(0, len(features), page_size):
+        encoder(features[start:start + page_size])
+    return len(features), time.time() - started_at
+
+
+def bench_create_feature(url, args):
+    # EsriManager.create_feature into an OGR memory layer, features are fetched before timing
+    manager = create_manager(url)
+    features = list(manager)
+    _source, layer, gtype = memory_layer(manager)
+    started_at = time.time()
+    for feature in features:
+        manager.create_feature(layer, feature, gtype)
+    return len(features), time.time() - started_at
+
+
+def bench_gpkg(url, args):
+    # end to end pipeline into a GeoPackage through the OGR writer
+    from ..esri import ogr
+    from ..writers import OGRFeatureWriter
+    manager = create_manager(url)
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        started_at = time.time()
+        source = ogr.GetDriverByName('GPKG').CreateDataSource(os.path.join(tmp_dir, 'benchmark.gpkg'))
+        serializer = manager.esri_serializer
+        gtype = serializer.get_geometry_type() if serializer.is_feature_layer else ogr.wkbNone
+        projection = serializer.get_projection() if serializer.is_feature_layer else None
+        if projection:
+            manager.set_out_sr(int(projection.GetAuthorityCode(None)))
+        layer = source.CreateLayer('benchmark', projection, gtype)
+        for field in serializer.build_fields():
+            layer.CreateField(field)
+        writer = OGRFeatureWriter(manager, layer, gtype)
+        writer.begin()
+        manager.load_pages(writer, manager.get_oid_column(layer))
+        count = layer.GetFeatureCount()
+        layer = None
+        source = None
+        return count, time.time() - started_at
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def bench_postgis(url, args):
+    # end to end esri_to_postgis into the project database, the table is dropped after
+    from osgeo_manager.base_manager import OSGEOManager, get_connection
+    manager = create_manager(url)
+    started_at = time.time()
+    layer = manager.esri_to_postgis()
+    seconds = time.time() - started_at
+    if not layer:
+        raise RuntimeError('esri_to_postgis failed')
+    count = manager.metrics.counters.get('features_created', 0)
+    layer = None
+    with OSGEOManager.open_source(get_connection(), update_enabled=1) as source:
+        source.DeleteLayer(str(manager.config_obj.name))
+    return count, seconds
+
+
+BENCHMARKS = {
+    'metadata': bench_metadata,
+    'fetch': bench_fetch,
+    'convert': bench_convert,
+    'create_feature': bench_create_feature,
+    'gpkg': bench_gpkg,
+    'postgis': bench_postgis,
+}
+
+
+def parse_options(options):
+    # name=value import options, given to the importer as ARCGIS_IMPORTER_<NAME> settings
+    parsed = {}
+    for option in options or []:
+        name, value = option.split('=', 1)
+        try:
+            value = json.loads(value)
+        except ValueError:
+            pass
+        parsed[name] = value
+    return parsed
+
+
+def run_benchmark(name, url, args, options, results):
+    from django.test.utils import override_settings
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    try:
+        with override_settings(**{'ARCGIS_IMPORTER_{}'.format(key.upper()): value for key, value in options.items()}):
+            count, seconds = BENCHMARKS[name](url, args)
+        results.put({'count': count, 'seconds': seconds,
+                     'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0, 1),
+                     'baseline_rss_mb': round(baseline_kb / 1024.0, 1)})
+    except Exception as e:
+        results.put({'error': repr(e)})
+
+
+def run_isolated(name, url, args, options):
+    results = multiprocessing.Queue()
+    process = multiprocessing.Process(target=run_benchmark, args=(name, url, args, options, results))
+    process.start()
+    result = results.get()
+    process.join()
+    return result
+
+
+def gdal_version():
+    try:
+        from osgeo import gdal
+    except ImportError:
+        return None
+    return gdal.__version__
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    add_server_arguments(parser)
+    parser.add_argument('--benchmarks', default='metadata,fetch,convert,create_feature,gpkg',
+                        help='comma separated, from: {}'.format(', '.join(sorted(BENCHMARKS))))
+    parser.add_argument('--layers', default='0,1,2', help='layer ids: 0 points, 1 lines, 2 polygons, 3 table')
+    parser.add_argument('--service', default='FeatureServer', choices=('FeatureServer', 'MapServer'))
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--iterations', type=int, default=1000, help='iterations of the metadata benchmark')
+    parser.add_argument('--option', action='append', help='import option name=value, may be repeated')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT)
+    args = parser.parse_args()
+    django.setup()
+    # fork keeps django set up in the benchmark processes
+    multiprocessing.set_start_method('fork')
+    options = parse_options(args.option)
+    commit, dirty = get_commit()
+    server = start_server(**server_options(args))
+    try:
+        with open(args.output, 'a') as output:
+            for name in args.benchmarks.split(','):
+                for layer_id in map(int, args.layers.split(',')):
+                    for run in range(args.repeat):
+                        result = run_isolated(name, server.layer_url(layer_id, args.service), args, options)
+                        record = {
+                            'benchmark': name,
+                            'layer': layer_id,
+                            'service': args.service,
+                            'run': run,
+                            'commit': commit,
+                            'dirty': dirty,
+                            'timestamp': time.time(),
+                            'server': server_options(args),
+                            'options': options,
+                            'python': platform.python_version(),
+                            'gdal': gdal_version(),
+                        }
+                        record.update(result)
+                        if 'error' not in result and result['seconds']:
+                            record['per_second'] = round(result['count'] / result['seconds'], 1)
+                        output.write(json.dumps(record) + '\n')
+                        output.flush()
+                        print('{benchmark:15} layer {layer} run {run}: {summary}'.format(
+                            summary=result.get('error') or '{} in {:.2f}s, {}/s, peak {} MB'.format(
+                                result['count'], result['seconds'], record.get('per_second'), result['peak_rss_mb']),
+                            **record))
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
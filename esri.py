@@ -3,24 +3,34 @@ import datetime
 
 import requests
 
-from .import_status import ImportStatus
+from .import_status import ImportStage, ImportStatus
 
 try:
     import ogr
     import osr
 except ImportError:
     from osgeo import ogr, osr
+import hashlib
 import json
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import contextmanager
+from functools import partial
+from multiprocessing import current_process
 
+from ags2sld import handlers as ags2sld_handlers
 from ags2sld.handlers import Layer as AgsLayer
 from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
 from django.urls import reverse_lazy
+from django.utils import timezone
+from esridump import esri2geojson
 from esridump.dumper import EsriDumper
 from esridump.errors import EsriDownloadError
-from requests.exceptions import ConnectionError
+from requests.exceptions import ConnectionError, Timeout
+from six.moves.urllib.parse import urlencode
 
 from geonode.geoserver.helpers import gs_catalog, get_store
 
@@ -34,8 +44,20 @@ from osgeo_manager.os_utils import get_new_dir
 from osgeo_manager.publishers import GeonodePublisher, GeoserverPublisher
 from osgeo_manager.utils import get_store_schema, urljoin
 
+from .geometry import build_wkb, dequantize_features
+from .locks import advisory_lock, advisory_xact_lock, source_lock_name
+from .mapping import AttributePlan
+from .metrics import ImportMetrics
 from .models import ArcGISLayerImport
+from .paging import (MAX_TILE_DEPTH, MIN_PAGE_SIZE, PAGE_MAX_BYTES, PAGE_TARGET_SECONDS, PageSizeController,
+                     split_envelope)
+from .pbf import PBFDecodeError, decode_feature_collection
+from .progress import ProgressReporter
 from .serializers import EsriSerializer
+from .session import HTTP_BACKOFF, HTTP_RETRIES, bound_session, create_session, route_requests
+from .utils import iter_concurrently, iter_expanding, iter_prefetched
+from .writers import (COPY_SUPPORTED, OGRFeatureWriter, PostgisCopyWriter, PostgisDiffWriter,
+                      PostgisSwapWriter, index_loaded_table)
 
 try:
     from celery.utils.log import get_task_logger as get_logger
@@ -44,16 +66,177 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+# AgsLayer takes no session, its style requests use the import session through bound_session
+route_requests(ags2sld_handlers)
+
+# optional request parameters stored with the import task configuration
+IMPORT_OPTIONS = ('concurrency', 'ordered_fetch', 'pbf', 'checkpoint_every', 'converter_workers',
+                  'converter_processes', 'pipeline_queue_size', 'page_size', 'min_page_size', 'page_target_seconds',
+                  'page_max_bytes', 'fetch_strategy', 'max_tile_depth', 'defer_indexes', 'index_fields', 'cluster',
+                  'max_allowable_offset', 'geometry_precision', 'quantization_parameters',
+                  'fields', 'where', 'envelope')
+# options of a partial import, kept with the imported layer for its updates
+FILTER_OPTIONS = ('fields', 'where', 'envelope')
+# options changing the imported data, imports of a source with different ones are not shared
+OUTPUT_OPTIONS = FILTER_OPTIONS + ('max_allowable_offset', 'geometry_precision', 'quantization_parameters')
+# seconds after which an import still pending isn't joined by new requests of its source
+PENDING_IMPORT_TIMEOUT = getattr(settings, 'ARCGIS_IMPORTER_PENDING_IMPORT_TIMEOUT', 24 * 60 * 60)
+# upper limits of the options sizing the thread and connection pools of an import, larger values are clamped
+MAX_CONCURRENCY = getattr(settings, 'ARCGIS_IMPORTER_MAX_CONCURRENCY', 16)
+MAX_SERVICE_CONCURRENCY = getattr(settings, 'ARCGIS_IMPORTER_MAX_SERVICE_CONCURRENCY', 8)
+MAX_CONVERTER_WORKERS = getattr(settings, 'ARCGIS_IMPORTER_MAX_CONVERTER_WORKERS', 8)
+
+
+def parse_fields(fields):
+    # fields option as a list or a comma separated string of source field names
+    if isinstance(fields, str):
+        fields = fields.split(',')
+    fields = [name.strip() for name in fields or [] if name.strip()]
+    return fields or None
+
+
+class ImportOptionError(ValueError):
+    pass
+
+
+def to_bool(value):
+    if isinstance(value, bool):
+        return value
+    if str(value).lower() in ('true', '1', 'yes'):
+        return True
+    if str(value).lower() in ('false', '0', 'no'):
+        return False
+    raise ValueError(value)
+
+
+def at_least(convert, minimum, maximum=None):
+    def coerce(value):
+        value = convert(value)
+        if value < minimum:
+            raise ValueError(value)
+        return min(value, maximum) if maximum is not None else value
+    return coerce
+
+
+def one_of(*choices):
+    def coerce(value):
+        if value not in choices:
+            raise ValueError(value)
+        return value
+    return coerce
+
+
+def to_dict(value):
+    # json options may be sent as objects or as json strings
+    if isinstance(value, str):
+        value = json.loads(value)
+    if not isinstance(value, dict):
+        raise ValueError(value)
+    return value
+
+
+def to_envelope(value):
+    envelope = to_dict(value)
+    for key in ('xmin', 'ymin', 'xmax', 'ymax'):
+        envelope[key] = float(envelope[key])
+    return envelope
+
+
+def to_where(value):
+    if not isinstance(value, str):
+        raise ValueError(value)
+    return value
+
+
+# coercion of the request options, stored values are used as is by get_option
+OPTION_TYPES = {
+    'concurrency': at_least(int, 1, MAX_CONCURRENCY),
+    'service_concurrency': at_least(int, 1, MAX_SERVICE_CONCURRENCY),
+    'ordered_fetch': to_bool,
+    'pbf': to_bool,
+    'checkpoint_every': at_least(int, 0),
+    'converter_workers': at_least(int, 1, MAX_CONVERTER_WORKERS),
+    'converter_processes': to_bool,
+    'pipeline_queue_size': at_least(int, 1),
+    'page_size': at_least(int, 1),
+    'min_page_size': at_least(int, 1),
+    'page_target_seconds': at_least(float, 0.1),
+    'page_max_bytes': at_least(int, 1),
+    'fetch_strategy': one_of('auto', 'tiles'),
+    'max_tile_depth': at_least(int, 0),
+    'defer_indexes': to_bool,
+    'index_fields': parse_fields,
+    'cluster': to_bool,
+    'max_allowable_offset': at_least(float, 0),
+    'geometry_precision': at_least(int, 0),
+    'quantization_parameters': to_dict,
+    'fields': parse_fields,
+    'where': to_where,
+    'envelope': to_envelope,
+}
+
+
+def clean_options(options):
+    # validated and coerced import options, an import with a bad option would fail before it starts
+    cleaned = {}
+    for name, value in (options or {}).items():
+        if value is None:
+            continue
+        try:
+            cleaned[name] = OPTION_TYPES[name](value) if name in OPTION_TYPES else value
+        except (ValueError, TypeError, KeyError):
+            raise ImportOptionError("Invalid value {!r} of the {} option".format(value, name))
+    return cleaned
+
+
+def is_import_alive(task):
+    # imports left IN_PROGRESS by a dead worker don't hold the lock of their source anymore,
+    # pending imports whose task was lost are given up after PENDING_IMPORT_TIMEOUT
+    if task.status == ImportStatus.IN_PROGRESS:
+        with advisory_lock(source_lock_name(task.url)) as locked:
+            return not locked
+    return task.updated_at > timezone.now() - datetime.timedelta(seconds=PENDING_IMPORT_TIMEOUT)
+
+
+def convert_page(converter, page):
+    # converter stage, module level so it can run in converter processes
+    page_max, features = page
+    if converter is None:
+        return page_max, len(features), features, {}
+    rows, timings = converter.convert(features)
+    return page_max, len(features), rows, timings
+
 
 class EsriManager(EsriDumper):
     def __init__(self, *args, **kwargs):
         self.task_id = kwargs.pop('task_id', None)
+        session = kwargs.pop('session', None)
+        # page size chosen by the previous import of the layer
+        self._initial_page_size = kwargs.pop('page_size', None)
+        self._page_size_controller = None
+        self.metrics = ImportMetrics()
         self._conf = None
         self._task = None
+        self._progress = None
+        self._attribute_plan = None
+        self._geometry_query_args = None
+        self._feature_count = None
         super(EsriManager, self).__init__(*args, **kwargs)
-        self.esri_serializer = EsriSerializer(self._layer_url)
-        self.update_task("Getting Layer Info", ImportStatus.IN_PROGRESS)
-        self.esri_serializer.get_data()
+        geometry_precision = self.get_option('geometry_precision', None)
+        if geometry_precision is not None:
+            # decimals of the returned coordinates, also used by the sequential fallback of the dumper
+            self._precision = int(geometry_precision)
+        # one keep-alive pool per import shared by the metadata and the pages requests,
+        # or the pool of the whole service import
+        self.session = session or create_session(pool_size=self.concurrency + 2, timeout=self._http_timeout,
+                                      retries=int(self.get_option('http_retries', HTTP_RETRIES)),
+                                      backoff=float(self.get_option('http_backoff', HTTP_BACKOFF)))
+        self.esri_serializer = EsriSerializer(self._layer_url, session=self.session,
+                                              fields=self.get_selected_fields())
+        self.update_task("Getting Layer Info", ImportStatus.IN_PROGRESS, stage=ImportStage.METADATA)
+        with self.metrics.timed('metadata'):
+            self.esri_serializer.get_data()
+        self.apply_filters()
         if not self.config_obj.name:
             self.config_obj.name = self.esri_serializer.get_name()
         self.config_obj.get_new_name()
@@ -68,12 +251,48 @@ class EsriManager(EsriDumper):
                 logger.warn(e)
         return self._task
 
-    def update_task(self, message, status=None):
-        logger.info(message)
-        self.task.task_result = message
+    @property
+    def progress(self):
+        if self.task and not self._progress:
+            self._progress = ProgressReporter(self.task,
+                                              interval=float(self.get_option('progress_interval', 2)),
+                                              every=int(self.get_option('progress_every', 1000)))
+        return self._progress
+
+    def update_task(self, message, status=None, force=True, stage=None):
+        # force=False coalesces frequent updates (feature counters) into periodic saves
+        if force:
+            logger.info(message)
+        if not self.progress:
+            return
+        fields = {'task_result': message}
         if status:
-            self.task.status = status
-        self.task.save()
+            fields['status'] = status
+            if status == ImportStatus.IN_PROGRESS and not self.task.started_at:
+                fields['started_at'] = timezone.now()
+            elif status in (ImportStatus.FINISHED, ImportStatus.FAILED):
+                fields['finished_at'] = timezone.now()
+                fields['eta'] = None
+        if stage:
+            fields['stage'] = stage
+        self.progress.update(force=force, **fields)
+
+    def update_progress(self, message, total, created, failed, force=False):
+        # structured counters of the loading, with the rate and estimated end from the loading start
+        if not self.progress:
+            return
+        processed = created + failed
+        elapsed = time.time() - self.metrics.load_started_at if self.metrics.load_started_at else 0
+        rate = processed / elapsed if elapsed > 0 else None
+        eta = None
+        if rate and total and total > processed:
+            eta = timezone.now() + datetime.timedelta(seconds=(total - processed) / rate)
+        self.progress.update(force=force, task_result=message, total_count=total, processed_count=processed,
+                             created_count=created, failed_count=failed,
+                             bytes_transferred=self.metrics.counters.get('http_bytes', 0),
+                             rate=round(rate, 1) if rate else None, eta=eta,
+                             # saved with the coalesced progress updates
+                             metrics=self.metrics.to_json())
 
     @property
     def config_obj(self):
@@ -87,16 +306,96 @@ class EsriManager(EsriDumper):
     def config_obj(self, value):
         self._conf = value
 
+    def get_option(self, name, default=None):
+        # import options are saved with the task config,
+        # fallback to ARCGIS_IMPORTER_<NAME> in django settings then to the default
+        value = None
+        if self.task:
+            value = self.task.config_dict.get(name, None)
+        if value is None:
+            value = getattr(settings, 'ARCGIS_IMPORTER_{}'.format(name.upper()), default)
+        return value
+
+    def get_selected_fields(self):
+        return parse_fields(self.get_option('fields', None))
+
+    @property
+    def filter_envelope(self):
+        # envelope of the spatial filter option, in the layer spatial reference unless it has its own
+        envelope = self.get_option('envelope', None)
+        if isinstance(envelope, str):
+            envelope = json.loads(envelope)
+        return envelope or None
+
+    @property
+    def is_filtered(self):
+        return bool(self.get_option('where', None) or self.filter_envelope)
+
+    def apply_filters(self):
+        # partial import: only the selected fields are requested and created, rows are restricted by the where
+        # and envelope options in all the queries of the import (counts and OBJECTID statistics included)
+        if self.esri_serializer.selected_fields:
+            self._fields = self.esri_serializer.get_out_fields()
+        where = self.get_option('where', None)
+        if where:
+            self.add_where(where)
+        envelope = self.filter_envelope
+        if envelope:
+            self._query_params.update({
+                'geometry': json.dumps(envelope),
+                'geometryType': 'esriGeometryEnvelope',
+                'spatialRel': 'esriSpatialRelIntersects',
+            })
+            spatial_reference = envelope.get('spatialReference', None) or {}
+            in_sr = spatial_reference.get('latestWkid', None) or spatial_reference.get('wkid', None)
+            if in_sr:
+                self._query_params['inSR'] = in_sr
+
+    @property
+    def concurrency(self):
+        # number of pages fetched at the same time
+        return min(max(int(self.get_option('concurrency', 1)), 1), MAX_CONCURRENCY)
+
     @classmethod
-    def create_task(cls, url, config=LayerConfig()):
+    def create_task(cls, url, config=LayerConfig(), options=None, parent=None):
+        options = clean_options(options)
         config_obj = validate_config(config_obj=config)
         esri_serializer = EsriSerializer(url)
         esri_serializer.get_data()
+        fields = parse_fields(options.get('fields', None))
+        if fields and not parent:
+            # layers of a service import keep the selected fields they have
+            esri_serializer.validate_fields(fields)
         if not config_obj.name:
             config_obj.name = esri_serializer.get_name()
+        # same source, requested destination and output options, before the name is made unique
+        output_options = json.dumps({key: fields if key == 'fields' else options[key]
+                                     for key in OUTPUT_OPTIONS if options.get(key) is not None}, sort_keys=True)
+        source_key = hashlib.md5('{}|{}|{}'.format(url.rstrip('/').lower(), config_obj.name,
+                                                   output_options).encode('utf-8')).hexdigest()
         config_obj.get_new_name()
-        import_obj, _created = ArcGISLayerImport.objects.get_or_create(url=url, config=json.dumps(config_obj.as_dict()),
-                                                                       status=ImportStatus.PENDING, user=config_obj.get_user())
+        config_dict = config_obj.as_dict()
+        # extra import options (concurrency, ...) are kept with the layer configuration
+        config_dict.update(options)
+        user = config_obj.get_user()
+        with transaction.atomic():
+            # serialize the requests of the same source so only one of them creates the import
+            advisory_xact_lock('arcgis_importer:create:{}'.format(source_key))
+            in_flight = None
+            if not parent:
+                # layers of a service import are always imported by the service, queued by the source lock
+                candidates = ArcGISLayerImport.objects.filter(
+                    source_key=source_key, parent__isnull=True,
+                    status__in=[ImportStatus.PENDING, ImportStatus.IN_PROGRESS]).order_by('id')
+                in_flight = next((candidate for candidate in candidates if is_import_alive(candidate)), None)
+            if in_flight:
+                logger.info("import of {} attached to the in-flight import {}".format(url, in_flight.id))
+                if in_flight.user_id != user.id:
+                    in_flight.followers.add(user)
+                return in_flight.id
+            import_obj = ArcGISLayerImport.objects.create(url=url, config=json.dumps(config_dict),
+                                                          status=ImportStatus.PENDING, user=user,
+                                                          parent=parent, source_key=source_key)
         return import_obj.id
 
     # set _outSR to fetch the data with a projection
@@ -104,6 +403,264 @@ class EsriManager(EsriDumper):
     def set_out_sr(self, wkid):
         self._outSR = wkid
 
+    @property
+    def query_format(self):
+        # protocol buffer pages are smaller and faster to decode than json
+        if self.esri_serializer.supports_pbf and self.get_option('pbf', True):
+            return 'pbf'
+        return 'json'
+
+    def __iter__(self):
+        return self.iter_parallel()
+
+    @property
+    def page_size(self):
+        # page size reached by the adaptive controller, None when no page was fetched by OBJECTID ranges
+        return self._page_size_controller.size if self._page_size_controller else None
+
+    def create_page_size_controller(self, metadata):
+        # start from the size chosen by the previous import of the layer, limited by the server maxRecordCount
+        maximum = metadata.get('maxRecordCount', None) or min(self._max_page_size, 500)
+        size = self.get_option('page_size', None) or self._initial_page_size or min(self._max_page_size, maximum)
+        return PageSizeController(int(size), maximum,
+                                  minimum=int(self.get_option('min_page_size', MIN_PAGE_SIZE)),
+                                  target_seconds=float(self.get_option('page_target_seconds', PAGE_TARGET_SECONDS)),
+                                  max_bytes=int(self.get_option('page_max_bytes', PAGE_MAX_BYTES)))
+
+    def get_oid_ranges(self, metadata):
+        # (exclusive min, inclusive max) OBJECTID ranges, generated lazily with the current adaptive page size
+        oid_field_name = self._find_oid_field_name(metadata)
+        if not oid_field_name:
+            raise EsriDownloadError("Could not find object ID field name for pagination")
+        controller = self._page_size_controller
+        if metadata.get('supportsStatistics'):
+            try:
+                oid_min, oid_max = self._get_layer_min_max(oid_field_name)
+
+                def iter_ranges():
+                    page_min = oid_min - 1
+                    while page_min < oid_max:
+                        page_max = min(page_min + controller.size, oid_max)
+                        yield page_min, page_max
+                        page_min = page_max
+                return oid_field_name, iter_ranges()
+            except EsriDownloadError as e:
+                logger.warning("Finding min/max OID from statistics failed, enumerating OIDs. {}".format(e))
+        oids = sorted(map(int, self._get_layer_oids()))
+
+        def iter_listed_ranges():
+            start = 0
+            while start < len(oids):
+                end = min(start + controller.size, len(oids))
+                yield oids[start] - 1, oids[end - 1]
+                start = end
+        return oid_field_name, iter_listed_ranges()
+
+    def get_metadata(self):
+        # layer metadata is already fetched (and cached) by the serializer
+        self.esri_serializer.get_data()
+        return self.esri_serializer._data
+
+    def _request(self, method, url, **kwargs):
+        # same as EsriDumper._request through the import session
+        if self._proxy:
+            url = self._proxy + url
+            params = kwargs.pop('params', None)
+            if params:
+                url += '?' + urlencode(params)
+        try:
+            response = self.session.request(method, url, timeout=self._http_timeout, **kwargs)
+        except requests.exceptions.SSLError:
+            logger.warning("Retrying {} without SSL verification".format(url))
+            response = self.session.request(method, url, timeout=self._http_timeout, verify=False, **kwargs)
+        self.metrics.incr('http_requests')
+        self.metrics.incr('http_bytes', len(response.content))
+        return response
+
+    def query_page(self, query_args):
+        # (esri json response, response bytes) of a query page.
+        # connection errors, 429 and 5xx responses are retried with backoff by the session
+        query_url = self._build_url('/query')
+        headers = self._build_headers()
+        try:
+            with self.metrics.timed('fetch'):
+                response = self._request('POST', query_url, headers=headers, data=query_args)
+        except (ConnectionError, Timeout) as e:
+            raise EsriDownloadError("Could not connect to URL", e)
+        with self.metrics.timed('decode'):
+            if query_args.get('f') == 'pbf' and response.status_code == 200 \
+                    and 'json' not in response.headers.get('Content-Type', ''):
+                try:
+                    data = decode_feature_collection(response.content)
+                except PBFDecodeError as e:
+                    logger.warning("Could not decode pbf page, fetching it as json. {}".format(e))
+                    data = None
+            else:
+                # errors are returned as json even for pbf queries
+                data = self._handle_esri_errors(response, "Could not retrieve this chunk of objects")
+                if data.get('transform'):
+                    dequantize_features(data)
+        if data is None:
+            return self.query_page(dict(query_args, f='json'))
+        return data, len(response.content)
+
+    def fetch_page_data(self, query_args):
+        # (features, response bytes) of a query page
+        data, content_bytes = self.query_page(query_args)
+        with self.metrics.timed('decode'):
+            return [esri2geojson(feature) for feature in data.get('features', [])], content_bytes
+
+    def fetch_page(self, query_args):
+        return self.fetch_page_data(query_args)[0]
+
+    def add_where(self, clause):
+        # restrict all the queries of this import, ANDed with the page clauses by _build_query_args
+        where = self._query_params.get('where', None)
+        self._query_params['where'] = '({}) AND ({})'.format(where, clause) if where else clause
+        self._feature_count = None
+
+    def get_feature_count(self):
+        # asked by the progress and by the paging of the same load, counted once per where clause
+        if self._feature_count is None:
+            self._feature_count = super(EsriManager, self).get_feature_count()
+        return self._feature_count
+
+    def geometry_query_args(self):
+        # server side generalization and precision of the returned geometries, smaller pages for small scale layers
+        if self._geometry_query_args is None:
+            query_args = {'geometryPrecision': self._precision}
+            max_allowable_offset = self.get_option('max_allowable_offset', None)
+            if max_allowable_offset is not None:
+                query_args['maxAllowableOffset'] = float(max_allowable_offset)
+            quantization_parameters = self.get_option('quantization_parameters', None)
+            if quantization_parameters:
+                # integer coordinates relative to a transform, see dequantize_features
+                query_args['quantizationParameters'] = json.dumps(quantization_parameters) if isinstance(
+                    quantization_parameters, dict) else quantization_parameters
+            self._geometry_query_args = query_args
+        return self._geometry_query_args
+
+    def page_query_args(self, oid_field_name, page_min, page_max):
+        return self._build_query_args(dict({
+            'where': '{0} > {1} AND {0} <= {2}'.format(oid_field_name, page_min, page_max),
+            'returnGeometry': self._request_geometry,
+            'outSR': self._outSR,
+            'outFields': ','.join(self._fields or ['*']),
+            'f': self.query_format,
+        }, **self.geometry_query_args()))
+
+    def fetch_range(self, oid_field_name, oid_range):
+        page_min, page_max = oid_range
+        started_at = time.time()
+        try:
+            features, content_bytes = self.fetch_page_data(self.page_query_args(oid_field_name, page_min, page_max))
+        except EsriDownloadError as e:
+            # timeouts and server errors of heavy pages: shrink the next pages and retry this one in two halves
+            self._page_size_controller.failed()
+            if page_max - page_min <= 1:
+                raise
+            logger.warning("Page {} - {} failed, retrying it in smaller pages. {}".format(page_min, page_max, e))
+            middle = page_min + (page_max - page_min) // 2
+            return page_max, (self.fetch_range(oid_field_name, (page_min, middle))[1] +
+                              self.fetch_range(oid_field_name, (middle, page_max))[1])
+        self._page_size_controller.observe(page_max - page_min, time.time() - started_at, content_bytes)
+        return page_max, features
+
+    def iter_pages(self):
+        # yield (max OBJECTID of the page, features), pages come in OBJECTID order unless ordered_fetch is false,
+        # the max OBJECTID is None when the pages are not in OBJECTID order
+        metadata = self.get_metadata()
+        try:
+            if self.get_feature_count() == 0:
+                return
+        except EsriDownloadError:
+            logger.info("Source does not support feature count")
+        self._page_size_controller = self.create_page_size_controller(metadata)
+        try:
+            if self.get_option('fetch_strategy', 'auto') == 'tiles':
+                raise EsriDownloadError("Fetching by tiles is requested")
+            oid_field_name, oid_ranges = self.get_oid_ranges(metadata)
+        except EsriDownloadError as e:
+            self._page_size_controller = None
+            logger.warning("Fetching by OBJECTID ranges is not possible. {}".format(e))
+            try:
+                extent = self.get_tiles_extent(metadata)
+            except EsriDownloadError as e:
+                # let the dumper fallback to its sequential methods
+                logger.warning("Fetching by tiles is not possible, fetching sequentially. {}".format(e))
+                for feature in super(EsriManager, self).__iter__():
+                    yield None, [feature]
+                return
+            for features in self.iter_tiles(metadata, extent):
+                yield None, features
+            return
+        logger.info("Fetching pages of {} features using {} workers".format(self._page_size_controller.size,
+                                                                           self.concurrency))
+        ordered = bool(self.get_option('ordered_fetch', True))
+        for page_max, features in iter_concurrently(partial(self.fetch_range, oid_field_name), oid_ranges,
+                                                    self.concurrency, ordered=ordered):
+            yield (page_max if ordered else None), features
+
+    def get_tiles_extent(self, metadata):
+        # tiles of the envelope filter only, queried in its place
+        extent = self.filter_envelope or metadata.get('extent', None)
+        if not self.esri_serializer.is_feature_layer or not extent:
+            raise EsriDownloadError("Layer has no extent to split into tiles")
+        if any(not isinstance(extent.get(key), (int, float)) for key in ('xmin', 'ymin', 'xmax', 'ymax')):
+            raise EsriDownloadError("Layer extent is empty")
+        return extent
+
+    def fetch_tile(self, max_count, tile):
+        # (features, smaller tiles), a tile hitting the transfer limit is split into its quadrants instead
+        envelope, depth = tile
+        query_args = self._build_query_args(dict({
+            'where': '1=1',
+            'returnGeometry': self._request_geometry,
+            'outSR': self._outSR,
+            'outFields': ','.join(self._fields or ['*']),
+            'f': self.query_format,
+        }, **self.geometry_query_args()))
+        # set after the import query parameters which may hold the envelope filter the tiles are split from
+        query_args.update({
+            'geometry': json.dumps(envelope),
+            'geometryType': 'esriGeometryEnvelope',
+            'spatialRel': 'esriSpatialRelIntersects',
+        })
+        data, _content_bytes = self.query_page(query_args)
+        features = data.get('features', [])
+        if data.get('exceededTransferLimit') or len(features) >= max_count:
+            if depth < int(self.get_option('max_tile_depth', MAX_TILE_DEPTH)):
+                return [], [(quadrant, depth + 1) for quadrant in split_envelope(envelope)]
+            logger.warning("Tile {} still exceeds the transfer limit, some features may be missing".format(envelope))
+        with self.metrics.timed('decode'):
+            return [esri2geojson(feature) for feature in features], []
+
+    def iter_tiles(self, metadata, extent):
+        # fetch the features intersecting recursively split tiles of the layer extent, in parallel.
+        # features crossing tiles are returned by each of them and are only yielded once
+        max_count = metadata.get('maxRecordCount', None) or min(self._max_page_size, 500)
+        oid_field_name = self._find_oid_field_name(metadata)
+        seen = set()
+        logger.info("Fetching tiles of the layer extent using {} workers".format(self.concurrency))
+        for features in iter_expanding(partial(self.fetch_tile, max_count), [(extent, 0)], self.concurrency):
+            unique_features = []
+            for feature in features:
+                if oid_field_name:
+                    key = (feature.get('properties') or {}).get(oid_field_name)
+                else:
+                    key = hashlib.md5(json.dumps(feature, sort_keys=True).encode('utf-8')).hexdigest()
+                if key in seen:
+                    continue
+                seen.add(key)
+                unique_features.append(feature)
+            if unique_features:
+                yield unique_features
+
+    def iter_parallel(self):
+        for _page_max, features in self.iter_pages():
+            for feature in features:
+                yield feature
+
     def get_geom_coords(self, geom_dict):
         if "rings" in geom_dict:
             return geom_dict["rings"]
@@ -113,41 +670,37 @@ class EsriManager(EsriDumper):
         else:
             return geom_dict["coordinates"]
 
+    def get_attribute_plan(self, layer_defn):
+        # compiled once per import, after build_fields() collected domains and subtypes
+        if not self._attribute_plan:
+            self._attribute_plan = AttributePlan.compile(self.esri_serializer, layer_defn)
+        return self._attribute_plan
+
+    def convert_properties(self, layer_defn, featureDict):
+        # feature properties as a list of values in destination field order
+        return self.get_attribute_plan(layer_defn).apply(featureDict["properties"] or {})
+
     def create_feature(self, layer, featureDict, expected_type, srs=None):
         created = False
         try:
-            feature = ogr.Feature(layer.GetLayerDefn())
+            layer_defn = layer.GetLayerDefn()
+            feature = ogr.Feature(layer_defn)
 
             if self.esri_serializer.is_feature_layer:
                 geom = self.create_geometry(expected_type, featureDict, srs)
                 if geom and expected_type == geom.GetGeometryType() and geom.IsValid():
                     feature.SetGeometry(geom)
 
-            for prop, value in featureDict["properties"].items():
-                name = str(SLUGIFIER(prop))
-                field_index = layer.GetLayerDefn().GetFieldIndex(name)
-                # property should have value and the field is created and mapped in the destination layer to be handled
-                if value and field_index != -1:
-                    if layer.schema[field_index].type == ogr.OFTDateTime:
-                        # convert from milliseconds to seconds(value/1000) and get datetime object
-                        datetime_value = datetime.datetime.fromtimestamp(value/1000)
-                        feature.SetField(name, datetime_value.year, datetime_value.month, datetime_value.day,
-                                         datetime_value.hour, datetime_value.minute, datetime_value.second,
-                                         0  # 0 for unknown timezone , TODO: check if it handled properly
-                                         )
-                        continue
-                    # replace id/code with mapped valued for subtypes
-                    elif prop in self.esri_serializer.subtypes_fields:
-                        type_field_value = featureDict["properties"][self.esri_serializer.subtype_field_name]
-                        # It is supposed to find the value, but check in case the data is not correct
-                        if value in self.esri_serializer.subtypes[type_field_value][prop]:
-                            value = self.esri_serializer.subtypes[type_field_value][prop][value]
-                    # It is supposed to find the value, but check in case the data is not correct
-                    elif prop in self.esri_serializer.fields_domains \
-                            and value in self.esri_serializer.fields_domains[prop]:
-                        # replace id/code with mapped value for domain coded values
-                        value = self.esri_serializer.fields_domains[prop][value]
-                    feature.SetField(name, value)
+            for field_index, value in enumerate(self.convert_properties(layer_defn, featureDict)):
+                if value is None:
+                    continue
+                if isinstance(value, datetime.datetime):
+                    feature.SetField(field_index, value.year, value.month, value.day,
+                                     value.hour, value.minute, value.second,
+                                     0  # 0 for unknown timezone , TODO: check if it handled properly
+                                     )
+                else:
+                    feature.SetField(field_index, value)
             created = layer.CreateFeature(feature) == ogr.OGRERR_NONE
         except Exception as e:
             logger.error('Failed to create feature', e)
@@ -157,16 +710,50 @@ class EsriManager(EsriDumper):
         geom_dict = featureDict["geometry"]
         if not geom_dict:
             raise EsriFeatureLayerException("No Geometry Information")
-        geom_type = geom_dict["type"]
-        coords = self.get_geom_coords(geom_dict)
-        f_json = json.dumps({"type": geom_type, "coordinates": coords})
-        geom = ogr.CreateGeometryFromJson(f_json)
+        wkb = build_wkb(geom_dict, expected_type)
+        if wkb:
+            geom = ogr.CreateGeometryFromWkb(wkb)
+        else:
+            # not directly expressible as the expected type, let OGR parse and force it
+            geom_type = geom_dict["type"]
+            coords = self.get_geom_coords(geom_dict)
+            f_json = json.dumps({"type": geom_type, "coordinates": coords})
+            geom = ogr.CreateGeometryFromJson(f_json)
         if geom and srs:
             geom.Transform(srs)
         if geom and expected_type != geom.GetGeometryType():
             geom = ogr.ForceTo(geom, expected_type)
         return geom
 
+    def get_oid_column(self, layer):
+        # destination column of the source OBJECTID, None for tables imported without it
+        oid_field_name = self._find_oid_field_name(self.esri_serializer._data)
+        if oid_field_name:
+            oid_column = str(SLUGIFIER(oid_field_name))
+            if layer.GetLayerDefn().GetFieldIndex(oid_column) != -1:
+                return oid_column
+        return None
+
+    def get_writer(self, layer, gtype, connection_string, schema, table, replace=False):
+        # bulk COPY into PostGIS when possible, otherwise insert through OGR.
+        # replace=True loads all features again, by default only changed rows are written when the table has
+        # the source OBJECTID, otherwise the data is loaded into a staging table swapped with the live one.
+        if COPY_SUPPORTED and self.get_option('writer', 'copy') == 'copy':
+            options = {
+                'batch_size': int(self.get_option('copy_batch_size', 10000)),
+                'validate_geometry': bool(self.get_option('validate_geometry', True)),
+            }
+            if replace:
+                strategy = self.get_option('reload_strategy', 'diff')
+                oid_column = self.get_oid_column(layer)
+                if strategy == 'diff' and oid_column:
+                    return PostgisDiffWriter(self, layer, gtype, connection_string, schema, table, oid_column,
+                                             **options)
+                if strategy in ('diff', 'swap'):
+                    return PostgisSwapWriter(self, layer, gtype, connection_string, schema, table, **options)
+            return PostgisCopyWriter(self, layer, gtype, connection_string, schema, table, **options)
+        return OGRFeatureWriter(self, layer, gtype)
+
     @contextmanager
     def create_source_layer(self, source, name, projection, gtype, options):
         layer = source.CreateLayer(str(name), srs=projection, geom_type=gtype, options=options)
@@ -175,18 +762,131 @@ class EsriManager(EsriDumper):
         yield layer
         layer = None
 
-    def esri_to_postgis(self, geom_name='geom'):
+    def save_task_fields(self, **fields):
+        if self.progress:
+            self.progress.update(force=True, **fields)
+
+    @contextmanager
+    def open_source_layer(self, source, name, schema):
+        # existing table of the layer, tables out of the public schema are named schema.table by OGR
+        layer = source.GetLayerByName(str(name) if schema == 'public' else '{}.{}'.format(schema, name))
+        if not layer:
+            raise EsriFeatureLayerException("Layer Table {} Not Found".format(name))
+        yield layer
+        layer = None
+
+    def resume_from_checkpoint(self, writer, oid_column):
+        checkpoint = self.task.checkpoint if self.task else None
+        oid_field_name = self._find_oid_field_name(self.get_metadata())
+        if checkpoint is None or not oid_column or not oid_field_name:
+            raise EsriFeatureLayerException("This Import Has No Checkpoint To Resume From")
+        # rows after the checkpoint may have been committed before the checkpoint was saved
+        writer.delete_features_after(oid_column, checkpoint)
+        self.add_where('{} > {}'.format(oid_field_name, int(checkpoint)))
+        self.update_task("Resuming after OBJECTID {}".format(checkpoint))
+
+    def iter_converted(self, converter):
+        # fetcher -> converter stages connected by bounded queues, yield (page max OBJECTID, features count, rows)
+        # in page order. the fetcher runs in a background thread and at most queue_size pages wait for each stage
+        queue_size = max(int(self.get_option('pipeline_queue_size', 4)), 1)
+        pages = iter_prefetched(self.iter_pages(), queue_size)
+        if converter is None:
+            return (convert_page(None, page) for page in pages)
+        workers = min(max(int(self.get_option('converter_workers', 2)), 1), MAX_CONVERTER_WORKERS)
+        executor_class = ThreadPoolExecutor
+        if self.get_option('converter_processes', False):
+            # converter processes need a worker allowed to have children (celery threads or solo pool), processes of
+            # the default prefork pool are daemonic. the forked processes don't use the inherited connections
+            if current_process().daemon:
+                logger.warning("Converter processes can't be started from a daemonic worker, using threads")
+            else:
+                executor_class = ProcessPoolExecutor
+        return iter_concurrently(partial(convert_page, converter), pages, workers, ordered=True,
+                                 max_pending=workers + queue_size, executor_class=executor_class)
+
+    def load_pages(self, writer, oid_column):
+        created_count = 0
+        failed_count = 0
+        feature_count = self.get_feature_count()
+        static_msg = "Features: Processed {processed} of {total}, Created {created}, Failed {failed}"
+        current_state = static_msg.format(processed=0, total=feature_count, created=0, failed=0)
+        self.update_task(current_state, stage=ImportStage.LOAD)
+        # pages arriving in OBJECTID order are committed and checkpointed every checkpoint_every features,
+        # an interrupted import can then be resumed after the last checkpoint
+        checkpoint_every = int(self.get_option('checkpoint_every', 50000)) if oid_column else 0
+        uncommitted = 0
+        load_started_at = self.metrics.load_started_at = time.time()
+        try:
+            # writer stage, the database is loaded while the next pages are fetched and converted
+            for page_max, page_count, rows, timings in self.iter_converted(writer.get_converter()):
+                for stage, seconds in timings.items():
+                    self.metrics.add_time(stage, seconds, calls=page_count)
+                self.metrics.incr('features', page_count)
+                with self.metrics.timed('db_write'):
+                    created = writer.write_rows(rows)
+                created_count += created
+                failed_count += page_count - created
+                current_state = static_msg.format(processed=created_count+failed_count,
+                                                  total=feature_count,
+                                                  created=created_count, failed=failed_count)
+                self.update_progress(current_state, feature_count, created_count, failed_count)
+                uncommitted += page_count
+                if checkpoint_every and page_max is not None and uncommitted >= checkpoint_every:
+                    writer.checkpoint()
+                    self.save_task_fields(checkpoint=page_max)
+                    uncommitted = 0
+        except BaseException:
+            writer.rollback()
+            raise
+        # always persist the final counters
+        self.update_progress(current_state, feature_count, created_count, failed_count, force=True)
+        with self.metrics.timed('db_write'):
+            writer.commit()
+        self.metrics.add_time('load', time.time() - load_started_at)
+        self.metrics.incr('features_created', created_count)
+        self.metrics.incr('features_failed', failed_count)
+        self.save_metrics()
+        self.record_page_size()
+
+    def index_table(self, connection_string, schema, table, layer, oid_column):
+        # indexes of the table created without them, built over the loaded rows before publishing
+        self.update_task("Building table indexes", stage=ImportStage.INDEX)
+        columns = [oid_column] if oid_column else []
+        layer_defn = layer.GetLayerDefn()
+        # fields not selected by a partial import have no column
+        columns.extend(str(SLUGIFIER(field_name)) for field_name in self.get_option('index_fields', None) or []
+                       if str(SLUGIFIER(field_name)) not in columns
+                       and layer_defn.GetFieldIndex(str(SLUGIFIER(field_name))) != -1)
+        geometry_column = layer.GetGeometryColumn() if self.esri_serializer.is_feature_layer else None
+        index_loaded_table(connection_string, schema, table, self.metrics, geometry_column=geometry_column,
+                           columns=columns, cluster=bool(self.get_option('cluster', False)))
+        self.save_metrics()
+
+    def save_metrics(self):
+        self.save_task_fields(metrics=self.metrics.to_json())
+
+    def record_page_size(self):
+        # the next import of the task (resume) starts from the reached page size
+        config = self.task.config_dict if self.task else None
+        # configurations that are not json objects are left untouched
+        if config and self.page_size:
+            config['page_size'] = self.page_size
+            self.save_task_fields(config=json.dumps(config))
+
+    def esri_to_postgis(self, geom_name='geom', resume=False):
         gpkg_layer = None
         try:
-            # self.esri_serializer.get_data()
-            if not self.config_obj.name:
-                self.config_obj.name = self.esri_serializer.get_name()
-            self.config_obj.get_new_name()
-            feature_iter = iter(self)
-            if self.task:
-                self.task.status = ImportStatus.IN_PROGRESS
-                self.task.save()
-            with OSGEOManager.open_source(get_connection()) as source:
+            if resume:
+                # continue loading into the table of the interrupted import
+                self.config_obj.name = self.task.table_name
+            else:
+                if not self.config_obj.name:
+                    self.config_obj.name = self.esri_serializer.get_name()
+                self.config_obj.get_new_name()
+            self.update_task("Fetching features", ImportStatus.IN_PROGRESS)
+            connection_string = get_connection()
+            schema = get_store_schema()
+            with OSGEOManager.open_source(connection_string, update_enabled=1) as source:
                 options = [
                     'OVERWRITE={}'.format(
                         "YES" if self.config_obj.overwrite else 'NO'),
@@ -196,41 +896,54 @@ class EsriManager(EsriDumper):
                         "YES" if self.config_obj.launder else "NO"),
                     'GEOMETRY_NAME={}'.format(
                         geom_name if geom_name else 'geom'),
-                    'SCHEMA={}'.format(get_store_schema())
+                    'SCHEMA={}'.format(schema)
                 ]
+                defer_indexes = COPY_SUPPORTED and self.get_option('defer_indexes', True)
+                if defer_indexes:
+                    # the spatial index is built after the bulk load, NO is accepted by GDAL before and after 2.4
+                    options.append('SPATIAL_INDEX=NO')
                 gtype = self.esri_serializer.get_geometry_type()
                 # get source layer projection
                 projection = self.esri_serializer.get_projection()
                 # set outSR with original wkid , so no need to transform the geometry after fetching
                 self.set_out_sr(int(projection.GetAuthorityCode(None)))
                 try:
-                    with self.create_source_layer(source, str(self.config_obj.name), projection, gtype, options) as layer:
-                        self.update_task("DB table created")
-                        for field in self.esri_serializer.build_fields():
-                            layer.CreateField(field)
-                        layer.StartTransaction()
+                    if resume:
+                        layer_context = self.open_source_layer(source, self.config_obj.name, schema)
+                    else:
+                        layer_context = self.create_source_layer(source, str(self.config_obj.name), projection,
+                                                                 gtype, options)
+                    with layer_context as layer:
+                        if resume:
+                            # build fields is mandatory for domain fields and subtypes
+                            self.esri_serializer.build_fields()
+                        else:
+                            self.update_task("DB table created")
+                            for field in self.esri_serializer.build_fields():
+                                layer.CreateField(field)
+                            self.save_task_fields(table_name=str(self.config_obj.name), checkpoint=None)
+                        writer = self.get_writer(layer, gtype, connection_string, schema, str(self.config_obj.name))
+                        writer.begin()
+                        oid_column = self.get_oid_column(layer)
+                        if resume:
+                            self.resume_from_checkpoint(writer, oid_column)
                         self.update_task("Starting loading data into db table")
-                        created_count = 0
-                        failed_count = 0
-                        feature_count = self.get_feature_count()
-                        static_msg = "Features: Processed {processed} of {total}, Created {created}, Failed {failed}"
-                        for next_feature in feature_iter:
-                            if self.create_feature(layer, next_feature, gtype):
-                                created_count += 1
-                            else:
-                                failed_count += 1
-                            current_state = static_msg.format(processed=created_count+failed_count,
-                                                              total=feature_count,
-                                                              created=created_count, failed=failed_count)
-                            self.update_task(current_state)
-                        layer.CommitTransaction()
+                        self.load_pages(writer, oid_column)
+                        if defer_indexes:
+                            self.index_table(connection_string, schema, str(self.config_obj.name), layer,
+                                             oid_column)
                         self.update_task("Data imported into DB table")
                         gpkg_layer = OSGEOLayer(layer, source)
                 # TODO: check all possible exceptions and handle it properly
                 except EsriDownloadError as e:
-                    # delete the layer as not all features imported successfully
-                    source.DeleteLayer(self.config_obj.name)
                     logger.error(e)
+                    if self.task and self.task.checkpoint is not None:
+                        # keep the committed pages, the import can be resumed
+                        self.update_task("Import interrupted after OBJECTID {}, it can be resumed".format(
+                            self.task.checkpoint), ImportStatus.FAILED)
+                    else:
+                        # delete the layer as not all features imported successfully
+                        source.DeleteLayer(self.config_obj.name)
         except (StopIteration, EsriFeatureLayerException, ConnectionError) as e:
             logger.debug(e)
         # except BaseException as e:
@@ -239,25 +952,31 @@ class EsriManager(EsriDumper):
         #     return gpkg_layer
         return gpkg_layer
 
-    def publish(self):
+    def publish(self, resume=False):
         try:
             geonode_layer = None
-            layer = self.esri_to_postgis()
+            layer = self.esri_to_postgis(resume=resume)
             if not layer:
+                if self.task and self.task.status == ImportStatus.FAILED:
+                    # failure already reported, with the checkpoint to resume from when there is one
+                    return None
                 raise Exception("failed to dump layer")
-            self.update_task("Publishing to Geoserver")
+            self.update_task("Publishing to Geoserver", stage=ImportStage.GEOSERVER_PUBLISH)
             gs_pub = GeoserverPublisher()
             geonode_pub = GeonodePublisher(owner=self.config_obj.get_user())
-            published = gs_pub.publish_postgis_layer(
-                self.config_obj.name, layername=self.config_obj.name)
+            with self.metrics.timed('geoserver_publish'):
+                published = gs_pub.publish_postgis_layer(
+                    self.config_obj.name, layername=self.config_obj.name)
             if published:
+                sld_started_at = time.time()
                 agsURL, agsId = self._layer_url.rsplit('/', 1)
                 tmp_dir = get_new_dir()
-                ags_layer = AgsLayer(agsURL + "/", int(agsId), dump_folder=tmp_dir)
-                try:
-                    ags_layer.dump_sld_file()
-                except Exception as e:
-                    logger.error(e)
+                with bound_session(self.session):
+                    ags_layer = AgsLayer(agsURL + "/", int(agsId), dump_folder=tmp_dir)
+                    try:
+                        ags_layer.dump_sld_file()
+                    except Exception as e:
+                        logger.error(e)
                 sld_path = None
                 icon_paths = []
                 for file in os.listdir(tmp_dir):
@@ -277,41 +996,36 @@ class EsriManager(EsriDumper):
                         if not uploaded:
                             logger.error("Failed To Upload SLD Icon {}".format(icon_path))
                 if sld_path:
-                    self.update_task("Creating Style")
+                    self.update_task("Creating Style", stage=ImportStage.SLD)
                     style = gs_pub.create_style(
                         self.config_obj.name, sld_path, overwrite=True)
                     if style:
                         gs_pub.set_default_style(self.config_obj.name, style)
-            self.update_task("Publishing to GeoNode")
-            geonode_layer = geonode_pub.publish(self.config_obj)
+                self.metrics.add_time('sld', time.time() - sld_started_at)
+            self.update_task("Publishing to GeoNode", stage=ImportStage.GEONODE_PUBLISH)
+            with self.metrics.timed('geonode_publish'):
+                geonode_layer = geonode_pub.publish(self.config_obj)
             if geonode_layer:
                 logger.info(geonode_layer.alternate)
                 gs_pub.remove_cached(geonode_layer.alternate)
 
         except Exception as e:
             logger.error(e)
-            if self.task:
-                self.task.status = ImportStatus.FAILED
-                self.task.task_result = e
-                self.task.save()
+            self.update_task(str(e), ImportStatus.FAILED)
         finally:
+            self.save_metrics()
             if geonode_layer:
                 layer_url = reverse_lazy('layer_detail', kwargs={'layername': geonode_layer.alternate})
                 msg = "your layer title is {} and url is {}".format(
                     geonode_layer.title,
                     urljoin(settings.SITEURL, layer_url.lstrip('/'))
                 )
-                if self.task:
-                    self.task.status = ImportStatus.FINISHED
-                    self.task.task_result = msg
-                    self.task.save()
+                self.update_task(msg, ImportStatus.FINISHED)
             return geonode_layer
 
     # delete all data exist and import it again from the ArcGIS service.
     def reload_data(self, geonode_layer):
-        if self.task:
-            self.task.status = ImportStatus.IN_PROGRESS
-            self.task.save()
+        self.update_task("Reloading data", ImportStatus.IN_PROGRESS, stage=ImportStage.LOAD)
         # To get layer name from alternate as it is the same as DB table name and geoserver layer name
         self.config_obj.name = geonode_layer.alternate.split(':')[-1]
         self.config_obj.overwrite = True
@@ -321,22 +1035,18 @@ class EsriManager(EsriDumper):
         # get database name and schema name from layer datastore
         # TODO: get all parameters for the datastore
         # TODO: find a way to pass the database password also , as it is encrypted in the datastore.
-        db_connection = get_connection(database_name=store.connection_parameters['database'],
-                                       schema=store.connection_parameters.get('schema', 'public'))
+        schema = store.connection_parameters.get('schema', 'public')
+        db_connection = get_connection(database_name=store.connection_parameters['database'], schema=schema)
         with OSGEOManager.open_source(db_connection, update_enabled=1) as source:
             geoserver_layer = gs_catalog.get_layer(geonode_layer.alternate)
             # pass native_name to GetLayer as it represents the table name
             layer = source.GetLayer(geoserver_layer.resource.native_name)
+            writer = self.get_writer(layer, gtype, db_connection, schema, geoserver_layer.resource.native_name,
+                                     replace=True)
             try:
-                layer.StartTransaction()
-                # remove all features
-                # Note: remove features one by one allow to rollback if the error raised
-                # TODO: check if truncating the table is possible to enhance the performance
-                old_feature = layer.GetNextFeature()
-                while old_feature:
-                    layer.DeleteFeature(old_feature.GetFID())
-                    old_feature = layer.GetNextFeature()
-                # TODO: reset FID sequence otherwise new FIDs will be generated
+                writer.begin()
+                # remove all features in the same transaction of the new ones (nothing to remove in a staging table)
+                writer.clear()
 
                 # build fields is mandatory for domain fields and subtypes
                 self.esri_serializer.build_fields()
@@ -345,22 +1055,29 @@ class EsriManager(EsriDumper):
                 self.set_out_sr(int(layer.GetSpatialRef().GetAuthorityCode(None)))
 
                 # importing the features again
-                for next_feature in feature_iter:
-                    self.create_feature(layer, next_feature, gtype)
-                layer.CommitTransaction()
+                features_count = 0
+                with self.metrics.timed('load'):
+                    for next_feature in feature_iter:
+                        writer.write(next_feature)
+                        features_count += 1
+                    with self.metrics.timed('db_write'):
+                        writer.commit()
+                if COPY_SUPPORTED and not writer.analyzes_on_commit:
+                    # all the rows were replaced, update the table statistics
+                    index_loaded_table(db_connection, schema, geoserver_layer.resource.native_name, self.metrics)
+                self.metrics.incr('features', features_count)
+                self.save_metrics()
 
                 geoserver_pub = GeoserverPublisher()
                 # remove layer caching to update rendering.
                 # otherwise changes will not be rendered until layer refreshed
                 geoserver_pub.remove_cached(geonode_layer.typename)
 
-                if self.task:
-                    self.task.status = ImportStatus.FINISHED
-                    self.task.save()
-            # TODO: check the which exceptions should be handled
-            except (StopIteration, EsriFeatureLayerException, ConnectionError, BaseException) as e:
-                layer.RollbackTransaction()
+                self.update_task("Data reloaded", ImportStatus.FINISHED)
+            except Exception as e:
+                writer.rollback()
                 logger.error(e)
+                self.update_task(str(e), ImportStatus.FAILED)
                 return False
             else:
                 return True
@@ -377,8 +1094,8 @@ class EsriManager(EsriDumper):
         # get database name and schema name from layer datastore
         # TODO: get all parameters for the datastore
         # TODO: find a way to pass the database password also , as it is encrypted in the datastore.
-        db_connection = get_connection(database_name=store.connection_parameters['database'],
-                                       schema=store.connection_parameters.get('schema', 'public'))
+        schema = store.connection_parameters.get('schema', 'public')
+        db_connection = get_connection(database_name=store.connection_parameters['database'], schema=schema)
         geoserver_layer = gs_catalog.get_layer(geonode_layer.alternate)
 
         with OSGEOManager.open_source(db_connection) as ds:
@@ -396,8 +1113,9 @@ class EsriManager(EsriDumper):
 
             # pass native_name to GetLayer as it represents the table name
             layer = source.GetLayer(geoserver_layer.resource.native_name)
+            writer = self.get_writer(layer, gtype, db_connection, schema, geoserver_layer.resource.native_name)
             try:
-                layer.StartTransaction()
+                writer.begin()
 
                 # build fields is mandatory for domain fields and subtypes
                 self.esri_serializer.build_fields()
@@ -408,8 +1126,8 @@ class EsriManager(EsriDumper):
 
                 # importing new features
                 for next_feature in feature_iter:
-                    self.create_feature(layer, next_feature, gtype)
-                layer.CommitTransaction()
+                    writer.write(next_feature)
+                writer.commit()
 
                 geoserver_pub = GeoserverPublisher()
                 # remove layer caching to update rendering.
@@ -417,10 +1135,128 @@ class EsriManager(EsriDumper):
                 geoserver_pub.remove_cached(geonode_layer.typename)
 
                 self.update_task("", ImportStatus.FINISHED)
-            # TODO: check the which exceptions should be handled
-            except (StopIteration, EsriFeatureLayerException, ConnectionError, BaseException) as e:
-                layer.RollbackTransaction()
+            except Exception as e:
+                writer.rollback()
+                logger.error(e)
+                self.update_task(str(e), ImportStatus.FAILED)
+                return False
+            else:
+                return True
+
+    @property
+    def service_url(self):
+        return self._layer_url.rsplit('/', 1)[0]
+
+    @property
+    def layer_id(self):
+        return int(self._layer_url.rsplit('/', 1)[1])
+
+    def get_server_gen(self):
+        # current change tracking generation of the layer, None if the service doesn't track changes
+        if self._layer_url.split('/')[-2].lower() != 'featureserver':
+            return None
+        response = self._request('GET', self.service_url, params={'f': 'json'}, headers=self._build_headers())
+        service = self._handle_esri_errors(response, "Could not retrieve service metadata")
+        if 'ChangeTracking' not in service.get('capabilities', ''):
+            return None
+        for layer_gen in service.get('changeTrackingInfo', {}).get('layerServerGens', []):
+            if layer_gen.get('id') == self.layer_id:
+                return layer_gen.get('serverGen')
+        return None
+
+    def extract_changes(self, server_gen):
+        # adds, updates and deleted OBJECTIDs since server_gen
+        query_args = {
+            'layers': json.dumps([self.layer_id]),
+            'layerServerGens': json.dumps([{'id': self.layer_id, 'serverGen': server_gen}]),
+            'returnInserts': 'true',
+            'returnUpdates': 'true',
+            'returnDeletes': 'true',
+            'returnIdsOnly': 'false',
+            'returnExtentOnly': 'false',
+            'returnAttachments': 'false',
+            'dataFormat': 'json',
+            'f': 'json',
+        }
+        response = self._request('POST', self.service_url + '/extractChanges', headers=self._build_headers(),
+                                 data=query_args)
+        data = self._handle_esri_errors(response, "Could not extract changes")
+        for layer_edits in data.get('edits', []):
+            if layer_edits.get('id') == self.layer_id:
+                features = layer_edits.get('features', {})
+                return features.get('adds', []), features.get('updates', []), features.get('deleteIds', [])
+        return [], [], []
+
+    def is_in_out_sr(self):
+        # extracted changes are in the layer spatial reference, they can be used as they are when it is the outSR
+        spatial_reference = (self.get_metadata().get('extent') or {}).get('spatialReference') or {}
+        return not self._outSR or self._outSR in (spatial_reference.get('wkid'), spatial_reference.get('latestWkid'))
+
+    def query_features(self, oid_field_name, oids):
+        # features by OBJECTID in the outSR spatial reference, requested by pages of the server limit
+        page_size = self.get_metadata().get('maxRecordCount', None) or min(self._max_page_size, 500)
+        features = []
+        for start in range(0, len(oids), page_size):
+            query_args = self._build_query_args(dict({
+                'where': '1=1',
+                'objectIds': ','.join(str(oid) for oid in oids[start:start + page_size]),
+                'returnGeometry': self._request_geometry,
+                'outSR': self._outSR,
+                'outFields': ','.join(self._fields or ['*']),
+                'f': self.query_format,
+            }, **self.geometry_query_args()))
+            data, _content_bytes = self.query_page(query_args)
+            features.extend(data.get('features', []))
+        return features
+
+    # apply the edits made since server_gen, features are upserted by their source OBJECTID.
+    # returns None if the layer table can't be synced (no source OBJECTID column) and a full reload is needed.
+    def sync_changes(self, geonode_layer, server_gen):
+        if self.is_filtered:
+            # extracted changes aren't filtered, rows out of the filter would be added
+            logger.info("{} is a filtered import, it is reloaded".format(geonode_layer.alternate))
+            return None
+        self.update_task("Extracting changes", ImportStatus.IN_PROGRESS)
+        oid_field_name = self._find_oid_field_name(self.esri_serializer._data)
+        gtype = self.esri_serializer.get_geometry_type()
+        store = get_store(gs_catalog, geonode_layer.store, geonode_layer.workspace)
+        schema = store.connection_parameters.get('schema', 'public')
+        db_connection = get_connection(database_name=store.connection_parameters['database'], schema=schema)
+        with OSGEOManager.open_source(db_connection, update_enabled=1) as source:
+            geoserver_layer = gs_catalog.get_layer(geonode_layer.alternate)
+            layer = source.GetLayer(geoserver_layer.resource.native_name)
+            oid_column = self.get_oid_column(layer)
+            if not oid_column:
+                logger.warning("{} has no source OBJECTID column, it can't be synced".format(geonode_layer.alternate))
+                return None
+            writer = self.get_writer(layer, gtype, db_connection, schema, geoserver_layer.resource.native_name)
+            if self.esri_serializer.is_feature_layer:
+                # edits are applied in the spatial reference of the destination layer like the reloads
+                self.set_out_sr(int(layer.GetSpatialRef().GetAuthorityCode(None)))
+            try:
+                adds, updates, deletes = self.extract_changes(server_gen)
+                changed = adds + updates
+                changed_oids = [feature['attributes'][oid_field_name] for feature in changed]
+                self.update_task("Applying changes: {} added, {} updated, {} deleted".format(
+                    len(adds), len(updates), len(deletes)))
+                if changed and not self.is_in_out_sr():
+                    changed = self.query_features(oid_field_name, changed_oids)
+                writer.begin()
+                # changed features are deleted then inserted, applying the same changes twice is harmless
+                writer.delete_features(oid_column, deletes + changed_oids)
+                # build fields is mandatory for domain fields and subtypes
+                self.esri_serializer.build_fields()
+                for feature in changed:
+                    writer.write(esri2geojson(feature))
+                writer.commit()
+                if changed or deletes:
+                    # remove layer caching to update rendering.
+                    GeoserverPublisher().remove_cached(geonode_layer.typename)
+                self.update_task("Changes applied", ImportStatus.FINISHED)
+            except Exception as e:
+                writer.rollback()
                 logger.error(e)
+                self.update_task(str(e), ImportStatus.FAILED)
                 return False
             else:
                 return True
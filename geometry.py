@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+import struct
+
+try:
+    import ogr
+except ImportError:
+    from osgeo import ogr
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from esridump.esri2geojson import convert_esri_geometry
+
+from .pbf import Transform
+
+EWKB_SRID_FLAG = 0x20000000
+# below this number of points struct is faster than building a numpy array
+NUMPY_MIN_POINTS = 64
+
+SINGLE_TYPES = {
+    "Point": ogr.wkbPoint,
+    "LineString": ogr.wkbLineString,
+    "Polygon": ogr.wkbPolygon,
+}
+MULTI_TYPES = {
+    "MultiPoint": ogr.wkbMultiPoint,
+    "MultiLineString": ogr.wkbMultiLineString,
+    "MultiPolygon": ogr.wkbMultiPolygon,
+}
+MULTI_OF = {
+    ogr.wkbMultiPoint: ogr.wkbPoint,
+    ogr.wkbMultiLineString: ogr.wkbLineString,
+    ogr.wkbMultiPolygon: ogr.wkbPolygon,
+}
+
+
+def pack_points(points):
+    # little endian x, y doubles, z/m values are dropped as destination types are 2D
+    if numpy is not None and len(points) >= NUMPY_MIN_POINTS:
+        packed = numpy.asarray(points, dtype='<f8')
+        if packed.shape[1] > 2:
+            packed = numpy.ascontiguousarray(packed[:, :2])
+        return packed.tobytes()
+    flat = []
+    for point in points:
+        flat.append(point[0])
+        flat.append(point[1])
+    return struct.pack('<{}d'.format(len(flat)), *flat)
+
+
+def pack_geometry(wkb_type, coordinates, srid=None):
+    if srid is None:
+        header = struct.pack('<BI', 1, wkb_type)
+    else:
+        header = struct.pack('<BII', 1, wkb_type | EWKB_SRID_FLAG, srid)
+    if wkb_type == ogr.wkbPoint:
+        return header + pack_points([coordinates])
+    if wkb_type == ogr.wkbLineString:
+        return header + struct.pack('<I', len(coordinates)) + pack_points(coordinates)
+    if wkb_type == ogr.wkbPolygon:
+        return header + struct.pack('<I', len(coordinates)) + b''.join(
+            struct.pack('<I', len(ring)) + pack_points(ring) for ring in coordinates)
+    part_type = MULTI_OF[wkb_type]
+    return header + struct.pack('<I', len(coordinates)) + b''.join(
+        pack_geometry(part_type, part) for part in coordinates)
+
+
+def build_wkb(geometry, expected_type, srid=None):
+    # (E)WKB of expected_type from a GeoJSON or ArcGIS geometry dict, None when OGR must convert it
+    if 'type' not in geometry:
+        # ArcGIS rings/paths/points, rings are grouped into polygons by their orientation
+        geometry = convert_esri_geometry(geometry)
+        if not geometry:
+            return None
+    geom_type = geometry["type"]
+    coordinates = geometry["coordinates"]
+    if not coordinates:
+        return None
+    if geom_type in SINGLE_TYPES:
+        wkb_type = SINGLE_TYPES[geom_type]
+        if wkb_type == expected_type:
+            return pack_geometry(wkb_type, coordinates, srid)
+        if MULTI_OF.get(expected_type) == wkb_type:
+            return pack_geometry(expected_type, [coordinates], srid)
+    elif geom_type in MULTI_TYPES:
+        wkb_type = MULTI_TYPES[geom_type]
+        if wkb_type == expected_type:
+            return pack_geometry(wkb_type, coordinates, srid)
+        if MULTI_OF[wkb_type] == expected_type and len(coordinates) == 1:
+            return pack_geometry(expected_type, coordinates[0], srid)
+    return None
+
+
+def dequantize_path(path, transform):
+    # the first vertex of a quantized path (or multipoint) is absolute, the next ones are offsets from the previous
+    x = y = 0
+    points = []
+    for point in path:
+        x += point[0]
+        y += point[1]
+        points.append(transform.point(x, y))
+    return points
+
+
+def dequantize_features(data):
+    # convert in place the geometries of a query result requested with quantizationParameters
+    transform_json = data.pop('transform')
+    scale = transform_json.get('scale', [1.0, 1.0])
+    translate = transform_json.get('translate', [0.0, 0.0])
+    transform = Transform(x_scale=scale[0], y_scale=scale[1], x_translate=translate[0], y_translate=translate[1],
+                          upper_left=transform_json.get('originPosition', 'upperLeft') == 'upperLeft')
+    for feature in data.get('features', []):
+        geometry = feature.get('geometry')
+        if not geometry:
+            continue
+        if 'x' in geometry and geometry['x'] is not None:
+            geometry['x'], geometry['y'] = transform.point(geometry['x'], geometry['y'])
+        elif 'points' in geometry:
+            geometry['points'] = dequantize_path(geometry['points'], transform)
+        elif 'paths' in geometry:
+            geometry['paths'] = [dequantize_path(path, transform) for path in geometry['paths']]
+        elif 'rings' in geometry:
+            geometry['rings'] = [dequantize_path(ring, transform) for ring in geometry['rings']]
+    return data
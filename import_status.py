@@ -1,9 +1,14 @@
-from enum import Enum
-
-
 class ImportStatus:
     PENDING = 'PENDING'
     IN_PROGRESS = 'IN_PROGRESS'
     FINISHED = 'FINISHED'
     FAILED = 'FAILED'
 
+
+class ImportStage:
+    METADATA = 'metadata'
+    LOAD = 'load'
+    INDEX = 'index'
+    GEOSERVER_PUBLISH = 'geoserver_publish'
+    SLD = 'sld'
+    GEONODE_PUBLISH = 'geonode_publish'
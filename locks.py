@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import struct
+import time
+from contextlib import contextmanager
+
+from django.db import connection
+
+
+def lock_id(name):
+    # postgres advisory locks are identified by a signed 64 bits integer
+    return struct.unpack('<q', hashlib.md5(name.encode('utf-8')).digest()[:8])[0]
+
+
+def source_lock_name(url):
+    return 'arcgis_importer:source:{}'.format(url.rstrip('/').lower())
+
+
+def advisory_xact_lock(name):
+    # wait for the lock until the end of the current transaction, must be called inside transaction.atomic
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_advisory_xact_lock(%s)', [lock_id(name)])
+
+
+def try_advisory_lock(name):
+    # take a session advisory lock without waiting, held until advisory_unlock or the end of the connection
+    if connection.vendor != 'postgresql':
+        return True
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_try_advisory_lock(%s)', [lock_id(name)])
+        return cursor.fetchone()[0]
+
+
+def advisory_unlock(name):
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_advisory_unlock(%s)', [lock_id(name)])
+
+
+def acquire_slot(name, limit):
+    # take one of limit slots of a named semaphore shared by all the workers, slots of a worker killed while
+    # holding them are released with its connection. returns the slot name or None if all are taken.
+    # other databases have no advisory locks, slots are not limited there
+    for slot in range(limit):
+        slot_name = 'arcgis_importer:slot:{}:{}'.format(name, slot)
+        if try_advisory_lock(slot_name):
+            return slot_name
+    return None
+
+
+def release_slot(slot_name):
+    if slot_name:
+        advisory_unlock(slot_name)
+
+
+@contextmanager
+def advisory_lock(name, wait=False, poll_interval=5):
+    # hold a session advisory lock while in the block and yield whether it was taken,
+    # with wait the lock is polled until taken so the connection isn't blocked by the server
+    locked = try_advisory_lock(name)
+    while wait and not locked:
+        time.sleep(poll_interval)
+        locked = try_advisory_lock(name)
+    try:
+        yield locked
+    finally:
+        if locked:
+            advisory_unlock(name)
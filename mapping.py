@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import datetime
+
+try:
+    import ogr
+except ImportError:
+    from osgeo import ogr
+
+from osgeo_manager.constants import SLUGIFIER
+
+
+class DateConverter(object):
+    def __call__(self, value, properties):
+        # convert from milliseconds to seconds(value/1000) and get datetime object
+        return datetime.datetime.fromtimestamp(value / 1000)
+
+
+class DomainConverter(object):
+    def __init__(self, coded_values):
+        self.coded_values = coded_values
+
+    def __call__(self, value, properties):
+        # replace id/code with mapped value for domain coded values
+        # It is supposed to find the value, but keep it in case the data is not correct
+        return self.coded_values.get(value, value)
+
+
+class SubtypeConverter(object):
+    def __init__(self, subtype_field_name, coded_values_by_type):
+        self.subtype_field_name = subtype_field_name
+        self.coded_values_by_type = coded_values_by_type
+
+    def __call__(self, value, properties):
+        # replace id/code with mapped value of the feature subtype
+        coded_values = self.coded_values_by_type.get(properties.get(self.subtype_field_name), {})
+        return coded_values.get(value, value)
+
+
+class AttributePlan(object):
+    # attribute mapping compiled once per destination layer, picklable to the converter processes
+
+    def __init__(self, columns, field_count):
+        self.columns = columns
+        self.field_count = field_count
+
+    @classmethod
+    def compile(cls, esri_serializer, layer_defn):
+        # esri_serializer.build_fields() must be called before to collect domains and subtypes
+        columns = []
+        for field in esri_serializer.get_fields_list():
+            source = field["name"]
+            field_index = layer_defn.GetFieldIndex(str(SLUGIFIER(source)))
+            if field_index == -1:
+                continue
+            converter = None
+            if layer_defn.GetFieldDefn(field_index).GetType() == ogr.OFTDateTime:
+                converter = DateConverter()
+            elif source in esri_serializer.subtypes_fields:
+                converter = SubtypeConverter(esri_serializer.subtype_field_name,
+                                             {sub_type: coded_values[source]
+                                              for sub_type, coded_values in esri_serializer.subtypes.items()
+                                              if source in coded_values})
+            elif source in esri_serializer.fields_domains:
+                converter = DomainConverter(esri_serializer.fields_domains[source])
+            columns.append((source, field_index, converter))
+        return cls(columns, layer_defn.GetFieldCount())
+
+    def apply(self, properties):
+        values = [None] * self.field_count
+        for source, field_index, converter in self.columns:
+            value = properties.get(source)
+            # empty values are left unset (NULL) as before
+            if value:
+                values[field_index] = converter(value, properties) if converter else value
+        return values
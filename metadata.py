@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+# seconds the layer metadata is used without asking the server
+METADATA_TTL = getattr(settings, 'ARCGIS_IMPORTER_METADATA_TTL', 300)
+# seconds the metadata is kept in the django cache to be revalidated with ETag/Last-Modified after the TTL
+METADATA_MAX_AGE = getattr(settings, 'ARCGIS_IMPORTER_METADATA_MAX_AGE', 24 * 60 * 60)
+
+_local_cache = {}
+_local_lock = threading.Lock()
+
+
+def cache_key(url):
+    return 'arcgis_importer:metadata:{}'.format(hashlib.md5(url.encode('utf-8')).hexdigest())
+
+
+def get_cached(url):
+    # the django cache may hold a fresher entry stored by another worker,
+    # the local one is used when the django cache didn't keep it (dummy backend, eviction)
+    entry = cache.get(cache_key(url))
+    if entry:
+        with _local_lock:
+            _local_cache[url] = entry
+        return entry
+    with _local_lock:
+        return _local_cache.get(url, None)
+
+
+def set_cached(url, entry):
+    with _local_lock:
+        _local_cache[url] = entry
+    cache.set(cache_key(url), entry, METADATA_MAX_AGE)
+
+
+def get_metadata(url, session, ttl=METADATA_TTL):
+    # url?f=json from the cache while fresh, stale entries are revalidated with the ETag or Last-Modified
+    now = time.time()
+    entry = get_cached(url)
+    if entry and entry['expires'] > now:
+        return entry['data']
+    headers = {}
+    if entry and entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry and entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+    response = session.get(url, params={'f': 'json'}, headers=headers)
+    if response.status_code == 304 and entry:
+        data = entry['data']
+    else:
+        data = response.json()
+    if 'error' not in data:
+        set_cached(url, {
+            'data': data,
+            'etag': response.headers.get('ETag', None),
+            'last_modified': response.headers.get('Last-Modified', None),
+            'expires': now + ttl,
+        })
+    return data
+
+
+def prime_metadata(url, data, ttl=METADATA_TTL):
+    # cache metadata fetched by another request (the service /layers resource)
+    set_cached(url, {
+        'data': data,
+        'etag': None,
+        'last_modified': None,
+        'expires': time.time() + ttl,
+    })
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+
+# imports updated in the last METRICS_WINDOW seconds are summed by the prometheus endpoint
+METRICS_WINDOW = getattr(settings, 'ARCGIS_IMPORTER_METRICS_WINDOW', 24 * 60 * 60)
+# stages in the order of an import, used to render them
+STAGES = ('metadata', 'fetch', 'decode', 'attribute_map', 'geometry_build', 'db_write', 'load',
+          'index', 'cluster', 'analyze', 'geoserver_publish', 'sld', 'geonode_publish')
+
+
+class ImportMetrics(object):
+    # per stage timings and counters of an import, stage seconds are summed over the workers running them
+
+    def __init__(self):
+        self.stages = {}
+        self.counters = {}
+        # start of the features loading, for the rate while loading
+        self.load_started_at = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def timed(self, stage):
+        started_at = time.time()
+        try:
+            yield
+        finally:
+            self.add_time(stage, time.time() - started_at)
+
+    def add_time(self, stage, seconds, calls=1):
+        with self._lock:
+            total = self.stages.setdefault(stage, [0.0, 0])
+            total[0] += seconds
+            total[1] += calls
+
+    def incr(self, name, value=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def as_dict(self):
+        with self._lock:
+            data = {
+                'stages': {name: {'seconds': round(seconds, 3), 'calls': calls}
+                           for name, (seconds, calls) in self.stages.items()},
+                'counters': dict(self.counters),
+            }
+        load_seconds = data['stages'].get('load', {}).get('seconds', 0)
+        if not load_seconds and self.load_started_at:
+            load_seconds = time.time() - self.load_started_at
+        if load_seconds:
+            data['features_per_second'] = round(data['counters'].get('features', 0) / load_seconds, 1)
+        return data
+
+    def to_json(self):
+        return json.dumps(self.as_dict())
+
+
+def metric_line(name, value, **labels):
+    if labels:
+        name = '{}{{{}}}'.format(name, ','.join('{}="{}"'.format(key, str(label).replace('"', '\\"'))
+                                               for key, label in sorted(labels.items())))
+    return '{} {}'.format(name, value)
+
+
+def render_prometheus(status_counts, recent_metrics, running_metrics):
+    # prometheus text exposition of the imports by status and of the recent and running imports metrics
+    lines = ['# HELP arcgis_importer_imports Imports by status.', '# TYPE arcgis_importer_imports gauge']
+    lines.extend(metric_line('arcgis_importer_imports', count, status=status)
+                 for status, count in sorted(status_counts.items()))
+    stage_seconds = {}
+    stage_calls = {}
+    counters = {}
+    for metrics in recent_metrics:
+        for stage, values in metrics.get('stages', {}).items():
+            stage_seconds[stage] = stage_seconds.get(stage, 0) + values.get('seconds', 0)
+            stage_calls[stage] = stage_calls.get(stage, 0) + values.get('calls', 0)
+        for name, value in metrics.get('counters', {}).items():
+            counters[name] = counters.get(name, 0) + value
+    ordered_stages = sorted(stage_seconds, key=lambda stage: STAGES.index(stage) if stage in STAGES else len(STAGES))
+    lines.extend(['# HELP arcgis_importer_stage_seconds Seconds spent per stage by the recent imports.',
+                  '# TYPE arcgis_importer_stage_seconds gauge'])
+    lines.extend(metric_line('arcgis_importer_stage_seconds', round(stage_seconds[stage], 3), stage=stage)
+                 for stage in ordered_stages)
+    lines.extend(['# HELP arcgis_importer_stage_calls Calls per stage by the recent imports.',
+                  '# TYPE arcgis_importer_stage_calls gauge'])
+    lines.extend(metric_line('arcgis_importer_stage_calls', stage_calls[stage], stage=stage)
+                 for stage in ordered_stages)
+    for name in sorted(counters):
+        lines.extend(['# TYPE arcgis_importer_{} gauge'.format(name),
+                      metric_line('arcgis_importer_{}'.format(name), counters[name])])
+    lines.extend(['# HELP arcgis_importer_features_per_second Loading rate of the running imports.',
+                  '# TYPE arcgis_importer_features_per_second gauge'])
+    lines.extend(metric_line('arcgis_importer_features_per_second', metrics['features_per_second'], id=import_id)
+                 for import_id, metrics in running_metrics if 'features_per_second' in metrics)
+    return '\n'.join(lines) + '\n'
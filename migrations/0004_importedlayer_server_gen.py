@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('arcgis_importer', '0003_importedlayer'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importedlayer',
+            name='server_gen',
+            field=models.BigIntegerField(blank=True, null=True, verbose_name='Server Generation'),
+        ),
+    ]
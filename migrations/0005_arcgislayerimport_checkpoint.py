@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('arcgis_importer', '0004_importedlayer_server_gen'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='arcgislayerimport',
+            name='table_name',
+            field=models.CharField(blank=True, max_length=63, null=True),
+        ),
+        migrations.AddField(
+            model_name='arcgislayerimport',
+            name='checkpoint',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('arcgis_importer', '0005_arcgislayerimport_checkpoint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='arcgislayerimport',
+            name='parent',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE,
+                                    related_name='children', to='arcgis_importer.ArcGISLayerImport'),
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('arcgis_importer', '0006_arcgislayerimport_parent'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importedlayer',
+            name='page_size',
+            field=models.PositiveIntegerField(blank=True, null=True, verbose_name='Page Size'),
+        ),
+    ]
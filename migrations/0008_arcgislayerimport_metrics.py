@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('arcgis_importer', '0007_importedlayer_page_size'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='arcgislayerimport',
+            name='metrics',
+            field=models.TextField(blank=True, null=True),
+        ),
+    ]
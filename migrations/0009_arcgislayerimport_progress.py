@@ -0,0 +1,74 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('arcgis_importer', '0008_arcgislayerimport_metrics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='arcgislayerimport',
+            name='stage',
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='arcgislayerimport',
+            name='total_count',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='arcgislayerimport',
+            name='processed_count',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='arcgislayerimport',
+            name='created_count',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='arcgislayerimport',
+            name='failed_count',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='arcgislayerimport',
+            name='bytes_transferred',
+            field=models.BigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='arcgislayerimport',
+            name='rate',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='arcgislayerimport',
+            name='eta',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='arcgislayerimport',
+            name='started_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='arcgislayerimport',
+            name='finished_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='arcgislayerimport',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AddIndex(
+            model_name='arcgislayerimport',
+            index=models.Index(fields=['user', '-created_at'], name='arcgis_import_user_created'),
+        ),
+        migrations.AddIndex(
+            model_name='arcgislayerimport',
+            index=models.Index(fields=['status', 'created_at'], name='arcgis_import_status_created'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('arcgis_importer', '0009_arcgislayerimport_progress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='arcgislayerimport',
+            name='source_key',
+            field=models.CharField(blank=True, db_index=True, max_length=32, null=True),
+        ),
+        migrations.AddField(
+            model_name='arcgislayerimport',
+            name='followers',
+            field=models.ManyToManyField(blank=True, related_name='followed_arcgis_imports',
+                                         to=settings.AUTH_USER_MODEL),
+        ),
+    ]
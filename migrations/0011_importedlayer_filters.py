@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('arcgis_importer', '0010_arcgislayerimport_source_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='importedlayer',
+            name='filters',
+            field=models.TextField(blank=True, null=True, verbose_name='Filters'),
+        ),
+    ]
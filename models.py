@@ -4,10 +4,19 @@ from __future__ import unicode_literals
 import json
 
 from django.db import models
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
 from django.utils.translation import ugettext as _
 
 from geonode.people.models import Profile
 
+try:
+    from celery.utils.log import get_task_logger as get_logger
+except ImportError:
+    from cartoview.log_handler import get_logger
+
+logger = get_logger(__name__)
+
 URL_HELP = "Esri Feature Layer URL Example: https://xxx/ArcGIS/rest/services/xxx/xxx/MapServer/0"
 
 
@@ -21,12 +30,35 @@ class ArcGISLayerImport(models.Model):
         null=False, verbose_name="Layer URL", help_text=_(URL_HELP),
         blank=False)
     config = models.TextField(null=True, blank=True)
-    created_at = models.DateTimeField(auto_now=False, auto_now_add=True)
+    created_at = models.DateTimeField(auto_now=False, auto_now_add=True, db_index=True)
     updated_at = models.DateTimeField(auto_now=True, auto_now_add=False)
     user = models.ForeignKey(Profile, blank=False, null=False, on_delete=models.CASCADE)
     status = models.CharField(max_length=50, null=False, blank=False,
                               default="PENDING")
     task_result = models.TextField(null=True, blank=True)
+    # structured progress, task_result keeps the human readable message
+    stage = models.CharField(max_length=32, null=True, blank=True)
+    total_count = models.BigIntegerField(null=True, blank=True)
+    processed_count = models.BigIntegerField(default=0)
+    created_count = models.BigIntegerField(default=0)
+    failed_count = models.BigIntegerField(default=0)
+    bytes_transferred = models.BigIntegerField(default=0)
+    # features per second and estimated end of the loading
+    rate = models.FloatField(null=True, blank=True)
+    eta = models.DateTimeField(null=True, blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    # destination table and last committed source OBJECTID, used to resume an interrupted import
+    table_name = models.CharField(max_length=63, null=True, blank=True)
+    checkpoint = models.BigIntegerField(null=True, blank=True)
+    # whole service import the layer import belongs to
+    parent = models.ForeignKey('self', related_name='children', null=True, blank=True, on_delete=models.CASCADE)
+    # per stage timings and counters of the import as json, see metrics.ImportMetrics
+    metrics = models.TextField(null=True, blank=True)
+    # source url and destination of the import, requests of an in-flight import are attached to it
+    source_key = models.CharField(max_length=32, null=True, blank=True, db_index=True)
+    # users of the attached requests, they can follow the progress and result of the import
+    followers = models.ManyToManyField(Profile, related_name='followed_arcgis_imports', blank=True)
 
     @property
     def config_obj(self):
@@ -47,6 +79,13 @@ class ArcGISLayerImport(models.Model):
     def __unicode__(self):
         return self.url
 
+    @property
+    def metrics_dict(self):
+        try:
+            return json.loads(self.metrics or '{}')
+        except ValueError:
+            return {}
+
     @config_obj.setter
     def config_obj(self, value):
         if isinstance(value, dict):
@@ -57,6 +96,12 @@ class ArcGISLayerImport(models.Model):
         verbose_name = "ArcGIS Layer Import"
         verbose_name_plural = "ArcGIS Layer Imports"
         ordering = ['-created_at', ]
+        indexes = [
+            # imports of a user, newest first (the importer list)
+            models.Index(fields=['user', '-created_at'], name='arcgis_import_user_created'),
+            # active imports and the retention job
+            models.Index(fields=['status', 'created_at'], name='arcgis_import_status_created'),
+        ]
 
 
 class ImportedLayer(models.Model):
@@ -64,8 +109,28 @@ class ImportedLayer(models.Model):
     name = models.CharField(_('name'), max_length=128, null=True, blank=True)
     last_update_status = models.CharField(_('Last Update Status'), max_length=128, null=True, blank=True,
                                           choices=(('Failed', _('Failed')), ('Succeeded', _('Succeeded'))))
+    # change tracking generation of the source layer at the last update, used to extract changes since then
+    server_gen = models.BigIntegerField(_('Server Generation'), null=True, blank=True)
+    # features per page reached by the adaptive page size of the last import, the next update starts from it
+    page_size = models.PositiveIntegerField(_('Page Size'), null=True, blank=True)
+    # fields, where and envelope options of a partial import as json, applied to the updates too
+    filters = models.TextField(_('Filters'), null=True, blank=True)
     created_at = models.DateTimeField(auto_now=False, auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True, auto_now_add=False)
 
     def __str__(self):
         return self.name
+
+
+@receiver(post_delete, sender=ImportedLayer)
+def delete_imported_layer_hashes(sender, instance, **kwargs):
+    # the row hashes of the diff updates aren't useful anymore once the layer isn't updated
+    from osgeo_manager.base_manager import get_connection
+    from osgeo_manager.utils import get_store_schema
+    from .writers import COPY_SUPPORTED, drop_layer_hashes
+    if not COPY_SUPPORTED or not instance.name:
+        return
+    try:
+        drop_layer_hashes(get_connection(), get_store_schema(), instance.name.split(':')[-1])
+    except Exception as e:
+        logger.warning('failed to delete the row hashes of {}: {}'.format(instance.name, e))
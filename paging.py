@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+import threading
+
+from django.conf import settings
+
+# seconds a page should take to be fetched, slower pages shrink the page size and faster ones grow it
+PAGE_TARGET_SECONDS = getattr(settings, 'ARCGIS_IMPORTER_PAGE_TARGET_SECONDS', 5)
+# response bytes above which the page size shrinks
+PAGE_MAX_BYTES = getattr(settings, 'ARCGIS_IMPORTER_PAGE_MAX_BYTES', 20 * 1024 * 1024)
+MIN_PAGE_SIZE = getattr(settings, 'ARCGIS_IMPORTER_MIN_PAGE_SIZE', 10)
+# levels a tile of the layer extent is split at most, 4 ** depth tiles
+MAX_TILE_DEPTH = getattr(settings, 'ARCGIS_IMPORTER_MAX_TILE_DEPTH', 12)
+
+
+class PageSizeController(object):
+    # features per page, adjusted from the duration and size of the observed pages and shared by the fetch workers
+
+    def __init__(self, size, maximum, minimum=MIN_PAGE_SIZE, target_seconds=PAGE_TARGET_SECONDS,
+                 max_bytes=PAGE_MAX_BYTES):
+        self.maximum = max(int(maximum), 1)
+        self.minimum = max(min(int(minimum), self.maximum), 1)
+        self.target_seconds = float(target_seconds)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size = self.clamp(size)
+
+    @property
+    def size(self):
+        return self._size
+
+    def clamp(self, size):
+        return int(max(self.minimum, min(self.maximum, size)))
+
+    def observe(self, requested, seconds, content_bytes):
+        ratio = self.target_seconds / max(seconds, 0.001)
+        if content_bytes:
+            ratio = min(ratio, float(self.max_bytes) / content_bytes)
+        ratio = max(0.5, min(1.5, ratio))
+        with self._lock:
+            # the last (partial) page of a range doesn't tell if a bigger page would be fast enough
+            if ratio > 1 and requested < self._size:
+                return
+            self._size = self.clamp(self._size * ratio)
+
+    def failed(self):
+        with self._lock:
+            self._size = self.clamp(self._size // 2)
+
+
+def split_envelope(envelope):
+    # four quadrants of an Esri envelope, with the same spatial reference
+    x_middle = (envelope['xmin'] + envelope['xmax']) / 2.0
+    y_middle = (envelope['ymin'] + envelope['ymax']) / 2.0
+    quadrants = []
+    for xmin, xmax in ((envelope['xmin'], x_middle), (x_middle, envelope['xmax'])):
+        for ymin, ymax in ((envelope['ymin'], y_middle), (y_middle, envelope['ymax'])):
+            quadrant = {'xmin': xmin, 'ymin': ymin, 'xmax': xmax, 'ymax': ymax}
+            if envelope.get('spatialReference'):
+                quadrant['spatialReference'] = envelope['spatialReference']
+            quadrants.append(quadrant)
+    return quadrants
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+# decoder of the ArcGIS f=pbf query results to the f=json features, without protobuf runtime
+import struct
+
+WIRE_VARINT = 0
+WIRE_64BIT = 1
+WIRE_LENGTH_DELIMITED = 2
+WIRE_32BIT = 5
+
+# FeatureCollectionPBuffer.GeometryType
+GEOMETRY_POINT = 0
+GEOMETRY_MULTIPOINT = 1
+GEOMETRY_POLYLINE = 2
+GEOMETRY_POLYGON = 3
+
+# FeatureCollectionPBuffer.QuantizeOriginPostion
+ORIGIN_UPPER_LEFT = 0
+
+
+class PBFDecodeError(ValueError):
+    pass
+
+
+def read_varint(buf, pos):
+    result = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7f) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def zigzag(value):
+    return (value >> 1) ^ -(value & 1)
+
+
+def signed64(value):
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def iter_fields(buf):
+    # yield (field number, wire type, value) of a protobuf message
+    pos = 0
+    end = len(buf)
+    while pos < end:
+        key, pos = read_varint(buf, pos)
+        field_number, wire_type = key >> 3, key & 0x07
+        if wire_type == WIRE_VARINT:
+            value, pos = read_varint(buf, pos)
+        elif wire_type == WIRE_64BIT:
+            value = buf[pos:pos + 8]
+            pos += 8
+        elif wire_type == WIRE_LENGTH_DELIMITED:
+            length, pos = read_varint(buf, pos)
+            value = buf[pos:pos + length]
+            pos += length
+        elif wire_type == WIRE_32BIT:
+            value = buf[pos:pos + 4]
+            pos += 4
+        else:
+            raise PBFDecodeError("Unsupported wire type {}".format(wire_type))
+        yield field_number, wire_type, value
+
+
+def read_packed_varints(buf):
+    values = []
+    pos = 0
+    end = len(buf)
+    while pos < end:
+        value, pos = read_varint(buf, pos)
+        values.append(value)
+    return values
+
+
+def decode_value(buf):
+    for field_number, wire_type, value in iter_fields(buf):
+        if field_number == 1:
+            return bytes(value).decode('utf-8')
+        if field_number == 2:
+            return struct.unpack('<f', value)[0]
+        if field_number == 3:
+            return struct.unpack('<d', value)[0]
+        if field_number in (4, 8):
+            return zigzag(value)
+        if field_number in (5, 7):
+            return value
+        if field_number == 6:
+            return signed64(value)
+        if field_number == 9:
+            return bool(value)
+    # no value set, null attribute
+    return None
+
+
+def decode_doubles(buf, names):
+    values = dict.fromkeys(names.values(), 0.0)
+    for field_number, wire_type, value in iter_fields(buf):
+        if field_number in names and wire_type == WIRE_64BIT:
+            values[names[field_number]] = struct.unpack('<d', value)[0]
+    return values
+
+
+class Transform(object):
+    # upperLeft is the 0 value of the enum, proto3 doesn't serialize it
+    def __init__(self, x_scale=1.0, y_scale=1.0, z_scale=1.0, x_translate=0.0, y_translate=0.0,
+                 z_translate=0.0, upper_left=True):
+        self.x_scale = x_scale
+        self.y_scale = y_scale
+        self.z_scale = z_scale
+        self.x_translate = x_translate
+        self.y_translate = y_translate
+        self.z_translate = z_translate
+        self.upper_left = upper_left
+
+    @classmethod
+    def decode(cls, buf):
+        transform = cls()
+        for field_number, wire_type, value in iter_fields(buf):
+            if field_number == 1:
+                transform.upper_left = value == ORIGIN_UPPER_LEFT
+            elif field_number == 2:
+                scale = decode_doubles(value, {1: 'x', 2: 'y', 4: 'z'})
+                transform.x_scale, transform.y_scale, transform.z_scale = scale['x'], scale['y'], scale['z'] or 1.0
+            elif field_number == 3:
+                translate = decode_doubles(value, {1: 'x', 2: 'y', 4: 'z'})
+                transform.x_translate, transform.y_translate, transform.z_translate = \
+                    translate['x'], translate['y'], translate['z']
+        return transform
+
+    def point(self, x, y):
+        if self.upper_left:
+            return [x * self.x_scale + self.x_translate, self.y_translate - y * self.y_scale]
+        return [x * self.x_scale + self.x_translate, y * self.y_scale + self.y_translate]
+
+
+def decode_parts(buf, transform, dimensions):
+    # quantized coordinates are delta encoded over the whole geometry, split into parts by lengths
+    lengths = []
+    coords = []
+    for field_number, wire_type, value in iter_fields(buf):
+        if field_number == 2:
+            lengths.extend(read_packed_varints(value) if wire_type == WIRE_LENGTH_DELIMITED else [value])
+        elif field_number == 3:
+            coords.extend(map(zigzag, read_packed_varints(value)) if wire_type == WIRE_LENGTH_DELIMITED
+                          else [zigzag(value)])
+    if not lengths:
+        lengths = [len(coords) // dimensions]
+    parts = []
+    x = y = 0
+    index = 0
+    for length in lengths:
+        part = []
+        for _i in range(length):
+            x += coords[index]
+            y += coords[index + 1]
+            # z/m are not kept as destination geometries are 2D
+            part.append(transform.point(x, y))
+            index += dimensions
+        parts.append(part)
+    return parts
+
+
+def decode_geometry(buf, geometry_type, transform, dimensions):
+    parts = decode_parts(buf, transform, dimensions)
+    if geometry_type == GEOMETRY_POINT:
+        x, y = parts[0][0]
+        return {"x": x, "y": y}
+    if geometry_type == GEOMETRY_MULTIPOINT:
+        return {"points": [point for part in parts for point in part]}
+    if geometry_type == GEOMETRY_POLYLINE:
+        return {"paths": parts}
+    if geometry_type == GEOMETRY_POLYGON:
+        return {"rings": parts}
+    raise PBFDecodeError("Unsupported geometry type {}".format(geometry_type))
+
+
+def decode_feature(buf, field_names, geometry_type, transform, dimensions):
+    attributes = []
+    geometry = None
+    for field_number, wire_type, value in iter_fields(buf):
+        if field_number == 1:
+            attributes.append(decode_value(value))
+        elif field_number == 2 and len(value):
+            geometry = decode_geometry(value, geometry_type, transform, dimensions)
+    return {"attributes": dict(zip(field_names, attributes)), "geometry": geometry}
+
+
+def decode_feature_result(buf):
+    field_names = []
+    # point is the 0 value of the enum, not serialized by proto3
+    geometry_type = GEOMETRY_POINT
+    # identity when the coordinates aren't quantized
+    transform = Transform(upper_left=False)
+    has_z = has_m = False
+    exceeded_transfer_limit = False
+    feature_buffers = []
+    for field_number, wire_type, value in iter_fields(buf):
+        if field_number == 7:
+            geometry_type = value
+        elif field_number == 9:
+            exceeded_transfer_limit = bool(value)
+        elif field_number == 10:
+            has_z = bool(value)
+        elif field_number == 11:
+            has_m = bool(value)
+        elif field_number == 12:
+            transform = Transform.decode(value)
+        elif field_number == 13:
+            for field_field_number, _wire_type, field_value in iter_fields(value):
+                if field_field_number == 1:
+                    field_names.append(bytes(field_value).decode('utf-8'))
+                    break
+        elif field_number == 15:
+            # fields may come after features, decode features at the end
+            feature_buffers.append(value)
+    dimensions = 2 + int(has_z) + int(has_m)
+    features = [decode_feature(feature_buffer, field_names, geometry_type, transform, dimensions)
+                for feature_buffer in feature_buffers]
+    return {"features": features, "exceededTransferLimit": exceeded_transfer_limit}
+
+
+def decode_feature_collection(content):
+    # decode f=pbf query response bytes to {'features': [...], 'exceededTransferLimit': bool}
+    buf = memoryview(content)
+    try:
+        for field_number, wire_type, query_result in iter_fields(buf):
+            if field_number != 2:
+                continue
+            for result_field_number, _wire_type, result in iter_fields(query_result):
+                if result_field_number == 1:
+                    return decode_feature_result(result)
+    except (IndexError, struct.error) as e:
+        raise PBFDecodeError("Truncated pbf response {}".format(e))
+    return {"features": [], "exceededTransferLimit": False}
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+import time
+
+from .status import publish_version
+
+
+class ProgressReporter(object):
+    # coalesce the import task updates, changed columns are saved every interval seconds or every updates
+
+    def __init__(self, task, interval=2, every=1000):
+        self.task = task
+        self.interval = interval
+        self.every = every
+        self._changed = set()
+        self._pending = 0
+        self._last_flush = time.time()
+
+    def update(self, force=False, **fields):
+        for name, value in fields.items():
+            if getattr(self.task, name) != value:
+                setattr(self.task, name, value)
+                self._changed.add(name)
+        self._pending += 1
+        if force or self._pending >= self.every or time.time() - self._last_flush >= self.interval:
+            self.flush()
+
+    def flush(self):
+        if self._changed:
+            # updated_at is auto_now, it is only refreshed when listed in update_fields
+            self.task.save(update_fields=list(self._changed) + ['updated_at'])
+            publish_version(self.task)
+        self._changed = set()
+        self._pending = 0
+        self._last_flush = time.time()
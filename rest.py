@@ -12,10 +12,12 @@ from tastypie.utils import trailing_slash
 from geonode.api.api import ProfileResource
 from osgeo_manager.config import LayerConfig
 
-from .esri import EsriManager
+from .esri import IMPORT_OPTIONS, EsriManager, ImportOptionError, clean_options
+from .import_status import ImportStatus
 from .models import ArcGISLayerImport
 from .serializers import EsriSerializer
-from .tasks import background_import, celery_import_task
+from .services import create_service_task, is_service_url
+from .tasks import background_import, celery_import_task, celery_resume_task, celery_service_import_task
 from .utils import check_broker_status
 
 
@@ -38,6 +40,14 @@ class ArcGISImportResource(BaseModelResource):
                 (self._meta.resource_name, trailing_slash()),
                 self.wrap_view('esri_import_layer'),
                 name="esri_import_layer"),
+            url(r"^(?P<resource_name>%s)/import_service%s$" %
+                (self._meta.resource_name, trailing_slash()),
+                self.wrap_view('esri_import_service'),
+                name="esri_import_service"),
+            url(r"^(?P<resource_name>%s)/(?P<pk>\d+)/resume%s$" %
+                (self._meta.resource_name, trailing_slash()),
+                self.wrap_view('esri_resume_import'),
+                name="esri_resume_import"),
         ]
 
     def esri_import_layer(self, request, **kwargs):
@@ -54,10 +64,14 @@ class ArcGISImportResource(BaseModelResource):
         if permissions:
             config_dict.update({"permissions": permissions})
         config = LayerConfig(config=config_dict)
+        try:
+            options = clean_options({key: data[key] for key in IMPORT_OPTIONS if data.get(key, None) is not None})
+        except ImportOptionError as e:
+            return self.get_err_response(request, str(e), http.HttpBadRequest)
         try:
             es = EsriSerializer(url)
             es.get_data()
-            task_id = EsriManager.create_task(url, config=config)
+            task_id = EsriManager.create_task(url, config=config, options=options)
             if check_broker_status():
                 celery_import_task.delay(task_id)
             else:
@@ -68,6 +82,58 @@ class ArcGISImportResource(BaseModelResource):
         except BaseException as e:
             return self.get_err_response(request, e)
 
+    def esri_import_service(self, request, **kwargs):
+        self.method_check(request, allowed=['post'])
+        self.is_authenticated(request)
+        self.throttle_check(request)
+        data = self.deserialize(request, request.body)
+        url = data.get('url', None)
+        permissions = data.get('permissions', None)
+        config_dict = {}
+        if not url or not is_service_url(url):
+            return self.get_err_response(request,
+                                         "url of a MapServer or FeatureServer service is required")
+        if permissions:
+            config_dict.update({"permissions": permissions})
+        config = LayerConfig(config=config_dict)
+        try:
+            options = clean_options({key: data[key] for key in IMPORT_OPTIONS + ('service_concurrency',)
+                                     if data.get(key, None) is not None})
+        except ImportOptionError as e:
+            return self.get_err_response(request, str(e), http.HttpBadRequest)
+        try:
+            task_id = create_service_task(url, config=config, options=options)
+            if check_broker_status():
+                celery_service_import_task.delay(task_id)
+            else:
+                background_import(task_id, task=celery_service_import_task)
+            return self.create_response(request, {
+                "id": task_id,
+            }, http.HttpAccepted)
+        except BaseException as e:
+            return self.get_err_response(request, e)
+
+    def esri_resume_import(self, request, pk=None, **kwargs):
+        self.method_check(request, allowed=['post'])
+        self.is_authenticated(request)
+        self.throttle_check(request)
+        try:
+            task = ArcGISLayerImport.objects.get(id=pk, user=request.user)
+        except ArcGISLayerImport.DoesNotExist:
+            return self.get_err_response(request, "import not found", http.HttpNotFound)
+        if task.status == ImportStatus.FINISHED:
+            return self.get_err_response(request, "import is already finished")
+        if task.checkpoint is None or not task.table_name:
+            return self.get_err_response(request, "import has no checkpoint to resume from")
+        if check_broker_status():
+            celery_resume_task.delay(task.id)
+        else:
+            background_import(task.id, task=celery_resume_task)
+        return self.create_response(request, {
+            "id": task.id,
+            "checkpoint": task.checkpoint,
+        }, http.HttpAccepted)
+
     class Meta:
         resource_name = "arcgis_import"
         queryset = ArcGISLayerImport.objects.all()
@@ -76,6 +142,7 @@ class ArcGISImportResource(BaseModelResource):
         serializer = Serializer(formats=['json', 'plist'])
         filtering = {
             "id": ALL,
+            "parent": ALL,
             "created_at": ALL,
             "updated_at": ALL,
             "user": ALL_WITH_RELATIONS
@@ -3,11 +3,12 @@ try:
     import osr
 except ImportError:
     from osgeo import ogr, osr
-import requests
-
 from osgeo_manager.constants import SLUGIFIER
 from osgeo_manager.exceptions import EsriFeatureLayerException
 
+from .metadata import get_metadata
+from .session import get_session
+
 
 class EsriSerializer(object):
     field_types_mapping = {
@@ -19,6 +20,8 @@ class EsriSerializer(object):
         "esriFieldTypeDate": ogr.OFTDateTime,
         "esriFieldTypeBlob": ogr.OFTBinary,
         "esriFieldTypeXML": ogr.OFTBinary,
+        # source OBJECTID is kept to match features on incremental updates
+        "esriFieldTypeOID": ogr.OFTInteger64,
         # "esriFieldTypeGUID": "XXXX",
     }
     ignored_fields = [
@@ -46,9 +49,12 @@ class EsriSerializer(object):
         "MultiLineString": ogr.wkbMultiLineString,
     }
 
-    def __init__(self, url):
+    def __init__(self, url, session=None, fields=None):
         self._url = url
         self._data = None
+        self.session = session or get_session()
+        # names of the source fields to import, None imports all of them
+        self.selected_fields = fields
         self.fields_domains = {}
         self.subtypes = {}
         self.subtypes_fields = []  # maintain list of sub types fields to easily check which field has a subtype
@@ -66,9 +72,8 @@ class EsriSerializer(object):
                 "This URL {} Is Not A FeatureServer Nor MapServer URL".format(self._url))
 
     def get_data(self):
-        req = requests.get(self._url + "?f=json")
         if not self._data:
-            self._data = req.json()
+            self._data = get_metadata(self._url, self.session)
             if 'error' in self._data:
                 raise EsriFeatureLayerException(
                     "This URL {} Is Not A FeatureServer Nor MapServer URL".format(self._url))
@@ -95,10 +100,31 @@ class EsriSerializer(object):
         for field in data_fields:
             if field["type"] in self.field_types_mapping.keys(
             ) and field["name"] not in self.ignored_fields and \
-                    not search_by_name(field["name"]):
+                    not search_by_name(field["name"]) and self.is_selected(field):
                 layer_fields.append(field)
         return layer_fields
 
+    def is_selected(self, field):
+        # the source OBJECTID is always kept to match features on updates and to resume imports
+        if not self.selected_fields or field["type"] == "esriFieldTypeOID":
+            return True
+        return field["name"].lower() in [name.lower() for name in self.selected_fields]
+
+    def validate_fields(self, names):
+        source_names = [field["name"].lower() for field in self._data['fields'] or []]
+        unknown = [name for name in names if name.lower() not in source_names]
+        if unknown:
+            raise EsriFeatureLayerException(
+                "Fields {} Not Found In {}".format(', '.join(unknown), self._url))
+
+    def get_out_fields(self):
+        # source fields to request, the subtype field is needed to map the subtypes coded values
+        out_fields = [field["name"] for field in self.get_fields_list()]
+        subtype_field = self._data.get(self.subtype_property_name, None)
+        if subtype_field and subtype_field.lower() not in [name.lower() for name in out_fields]:
+            out_fields.append(subtype_field)
+        return out_fields
+
     def build_subtypes(self):
         # build subtype data structure to facilitate replacing id/code with mapped value
         for sub_type in self._data[self.subtypes_dict_property_name]:
@@ -107,8 +133,8 @@ class EsriSerializer(object):
                 if sub_type['domains'][field_name]['type'] == 'codedValue':
                     if field_name not in self.subtypes_fields:
                         self.subtypes_fields.append(field_name)
-                    sub_types[field_name] = \
-                        {coded_value['code']: coded_value['name'] for coded_value in sub_type['domains'][field_name]['codedValues']}
+                    sub_types[field_name] = {coded_value['code']: coded_value['name']
+                                             for coded_value in sub_type['domains'][field_name]['codedValues']}
             if len(sub_types):
                 self.subtypes[sub_type[self.subtype_id_property_name]] = sub_types
 
@@ -156,6 +182,12 @@ class EsriSerializer(object):
     def is_feature_layer(self):
         return self._data['type'] == "Feature Layer"
 
+    @property
+    def supports_pbf(self):
+        # ArcGIS Server 10.7+ / ArcGIS Online list pbf in supportedQueryFormats
+        query_formats = self._data.get('supportedQueryFormats', None) or ''
+        return 'pbf' in [query_format.strip().lower() for query_format in query_formats.split(',')]
+
     @property
     def is_table(self):
         return self._data['type'] == "Table"
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+import json
+
+from osgeo_manager.config import LayerConfig
+from osgeo_manager.decorators import validate_config
+from osgeo_manager.exceptions import EsriFeatureLayerException
+
+from .esri import clean_options
+from .import_status import ImportStatus
+from .metadata import get_metadata, prime_metadata
+from .models import ArcGISLayerImport
+
+SERVICE_TYPES = ('mapserver', 'featureserver')
+
+
+def is_service_url(url):
+    return url.rstrip('/').split('/')[-1].lower() in SERVICE_TYPES
+
+
+def get_service_layers(url, session):
+    # urls of the layers and tables of a MapServer/FeatureServer service, group layers are skipped
+    url = url.rstrip('/')
+    data = get_metadata('{}/layers'.format(url), session)
+    if 'error' in data:
+        raise EsriFeatureLayerException(
+            "This URL {} Is Not A FeatureServer Nor MapServer URL".format(url))
+    layer_urls = []
+    for layer in data.get('layers', []) + data.get('tables', []):
+        if layer.get('type') == 'Group Layer' or layer.get('subLayers'):
+            continue
+        layer_url = '{}/{}'.format(url, layer['id'])
+        prime_metadata(layer_url, layer)
+        layer_urls.append(layer_url)
+    return layer_urls
+
+
+def create_service_task(url, config=LayerConfig(), options=None):
+    # parent import of a whole service, the layer imports are created by the service import task
+    config_obj = validate_config(config_obj=config)
+    config_dict = config_obj.as_dict()
+    config_dict.update(clean_options(options))
+    task = ArcGISLayerImport.objects.create(url=url.rstrip('/'), config=json.dumps(config_dict),
+                                            status=ImportStatus.PENDING, user=config_obj.get_user())
+    return task.id
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+import threading
+from contextlib import contextmanager
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+HTTP_TIMEOUT = getattr(settings, 'ARCGIS_IMPORTER_HTTP_TIMEOUT', 60)
+HTTP_RETRIES = getattr(settings, 'ARCGIS_IMPORTER_HTTP_RETRIES', 5)
+# exponential backoff between retries: backoff * (2 ** (retry - 1)) seconds
+HTTP_BACKOFF = getattr(settings, 'ARCGIS_IMPORTER_HTTP_BACKOFF', 1.0)
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+_shared_session = None
+_thread_sessions = threading.local()
+
+
+class ImporterSession(requests.Session):
+    # requests session with a default timeout, ArcGIS queries are sent as POST and are safe to retry
+
+    def __init__(self, timeout=HTTP_TIMEOUT):
+        super(ImporterSession, self).__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return super(ImporterSession, self).request(method, url, **kwargs)
+
+
+def build_retry(retries, backoff):
+    retry_args = dict(total=retries, connect=retries, read=retries, status=retries, backoff_factor=backoff,
+                      status_forcelist=RETRY_STATUS, raise_on_status=False)
+    try:
+        # retry all methods, POST included
+        return Retry(allowed_methods=None, **retry_args)
+    except TypeError:
+        # urllib3 < 1.26
+        return Retry(method_whitelist=False, **retry_args)
+
+
+def create_session(pool_size=10, timeout=HTTP_TIMEOUT, retries=HTTP_RETRIES, backoff=HTTP_BACKOFF):
+    # keep-alive connections pool with retries on connection errors, 429 and 5xx responses.
+    # gzip is requested by requests by default.
+    session = ImporterSession(timeout=timeout)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                          max_retries=build_retry(retries, backoff))
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_session():
+    # process wide session for requests made outside an import (metadata checks of the rest api)
+    global _shared_session
+    if not _shared_session:
+        _shared_session = create_session()
+    return _shared_session
+
+
+class SessionRequests(object):
+    # stands for the requests module of a library without a session parameter (ags2sld),
+    # its requests go through the session bound to the current thread by bound_session
+
+    def __init__(self, module):
+        self._module = module
+
+    def __getattr__(self, name):
+        session = getattr(_thread_sessions, 'session', None)
+        if session is not None and name in ('request', 'get', 'post', 'head'):
+            return getattr(session, name)
+        return getattr(self._module, name)
+
+
+def route_requests(module):
+    # module uses "import requests", calls made outside bound_session are unchanged
+    if getattr(module, 'requests', None) is requests:
+        module.requests = SessionRequests(requests)
+
+
+@contextmanager
+def bound_session(session):
+    previous = getattr(_thread_sessions, 'session', None)
+    _thread_sessions.session = session
+    try:
+        yield session
+    finally:
+        _thread_sessions.session = previous
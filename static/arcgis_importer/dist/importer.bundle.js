@@ -1 +1 @@
-!function(t){function e(e){for(var n,i,u=e[0],s=e[1],l=e[2],f=0,p=[];u.length>f;f++)Object.prototype.hasOwnProperty.call(o,i=u[f])&&o[i]&&p.push(o[i][0]),o[i]=0;for(n in s)Object.prototype.hasOwnProperty.call(s,n)&&(t[n]=s[n]);for(c&&c(e);p.length;)p.shift()();return a.push.apply(a,l||[]),r()}function r(){for(var t,e=0;a.length>e;e++){for(var r=a[e],n=!0,u=1;r.length>u;u++){0!==o[r[u]]&&(n=!1)}n&&(a.splice(e--,1),t=i(i.s=r[0]))}return t}var n={},o={1:0},a=[];function i(e){if(n[e])return n[e].exports;var r=n[e]={i:e,l:!1,exports:{}};return t[e].call(r.exports,r,r.exports,i),r.l=!0,r.exports}i.m=t,i.c=n,i.d=function(t,e,r){i.o(t,e)||Object.defineProperty(t,e,{enumerable:!0,get:r})},i.r=function(t){"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(t,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(t,"__esModule",{value:!0})},i.t=function(t,e){if(1&e&&(t=i(t)),8&e)return t;if(4&e&&"object"==typeof t&&t&&t.__esModule)return t;var r=Object.create(null);if(i.r(r),Object.defineProperty(r,"default",{enumerable:!0,value:t}),2&e&&"string"!=typeof t)for(var n in t)i.d(r,n,function(e){return t[e]}.bind(null,n));return r},i.n=function(t){var e=t&&t.__esModule?function(){return t.default}:function(){return t};return i.d(e,"a",e),e},i.o=function(t,e){return Object.prototype.hasOwnProperty.call(t,e)},i.p="/";var u=window.webpackJsonp=window.webpackJsonp||[],s=u.push.bind(u);u.push=e,u=u.slice();for(var l=0;u.length>l;l++)e(u[l]);var c=s;a.push(["qNbZ",0,2]),r()}({"+Dok":function(t,e,r){var n=r("zpUs"),o=r("jaA8");t.exports=function(t){return!n(t)&&"object"==typeof t&&!o(t)}},"/Dqh":function(t,e,r){},"/Se1":function(t,e){t.exports=function(t,e){for(var r in e)e.hasOwnProperty(r)&&(t[r]=e[r]);return t}},"0M54":function(t,e){t.exports=function(t){return"function"==typeof t}},"1VoI":function(t,e,r){var n=r("ggqX");t.exports=n("Any",function(){return!0})},"1z8J":function(t,e,r){"use strict";var n=Object.assign||function(t){for(var e=1;arguments.length>e;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},o=function(){function t(t,e){for(var r=0;e.length>r;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,n.key,n)}}return function(e,r,n){return r&&t(e.prototype,r),n&&t(e,n),e}}(),a=c(r("17x9")),i=c(r("q1tI")),u=c(r("TSYQ")),s=c(r("MgzW")),l=r("dnV1");function c(t){return t&&t.__esModule?t:{default:t}}function f(t,e,r){return e in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}Object({NODE_ENV:"production"}).REACT_SPINKIT_NO_STYLES||(r("SnpG"),r("9xji"),r("4sg8"),r("2HEg"),r("4ei+"),r("jj1x"),r("BxbG"),r("uTZF"),r("5LqS"),r("qSQR"),r("5kE2"),r("ucTV"),r("fKeY"),r("99Y8"),r("qZaT"));var p="Deprecation Warning (react-spinkit): noFadeIn prop should be replaced with fadeIn='none'",d=function(t){function e(t){!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),t.noFadeIn&&console.warn(p);var r=function(t,e){if(!t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return!e||"object"!=typeof e&&"function"!=typeof e?t:e}(this,(e.__proto__||Object.getPrototypeOf(e)).call(this,t));return r.displayName="SpinKit",r}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function, not "+typeof e);t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,enumerable:!1,writable:!0,configurable:!0}}),e&&(Object.setPrototypeOf?Object.setPrototypeOf(t,e):t.__proto__=e)}(e,i.default.Component),o(e,[{key:"render",value:function(){var t,e=l.allSpinners[this.props.name]||l.allSpinners["three-bounce"],r=(0,u.default)((f(t={"sk-fade-in":"full"===this.props.fadeIn&&!this.props.noFadeIn,"sk-fade-in-half-second":"half"===this.props.fadeIn&&!this.props.noFadeIn,"sk-fade-in-quarter-second":"quarter"===this.props.fadeIn&&!this.props.noFadeIn,"sk-spinner":!this.props.overrideSpinnerClassName},this.props.overrideSpinnerClassName,!!this.props.overrideSpinnerClassName),f(t,this.props.className,!!this.props.className),f(t,e.className||this.props.name,!0),t)),o=(0,s.default)({},this.props);return delete o.name,delete o.fadeIn,delete o.noFadeIn,delete o.overrideSpinnerClassName,delete o.className,this.props.color&&(o.style=o.style?n({},o.style,{color:this.props.color}):{color:this.props.color}),i.default.createElement("div",n({},o,{className:r}),[].concat(function(t){if(Array.isArray(t)){for(var e=0,r=Array(t.length);t.length>e;e++)r[e]=t[e];return r}return Array.from(t)}(Array(e.divCount))).map(function(t,e){return i.default.createElement("div",{key:e})}))}}]),e}();d.propTypes={name:a.default.string.isRequired,noFadeIn:a.default.bool,fadeIn:a.default.oneOf(["full","half","quarter","none"]),overrideSpinnerClassName:a.default.string,className:a.default.string,color:a.default.string},d.defaultProps={name:"three-bounce",noFadeIn:!1,fadeIn:"full",overrideSpinnerClassName:""},t.exports=d},"2HEg":function(t,e,r){var n=r("PcrD");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},"2bqR":function(t,e,r){var n=r("i0Gq");t.exports=function(t){return n(t)&&"maybe"===t.meta.kind}},"3bF+":function(t,e,r){r("g2aq")},"4Eei":function(t,e,r){"use strict";var n,o=r("RRLq"),a=(n=o)&&n.__esModule?n:{default:n},i=function(t){if(t&&t.__esModule)return t;var e={};if(null!=t)for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r]);return e.default=t,e}(r("OG1J"));a.default.form=i,a.default.form.File=a.default.irreducible("File",function(t){return t instanceof File}),t.exports=a.default},"4Go9":function(t,e,r){"use strict";e.__esModule=!0,e.default=function(t,e){return a.default.createElement("div",{className:"alert alert-"+t},e)};var n,o=r("q1tI"),a=(n=o)&&n.__esModule?n:{default:n};t.exports=e.default},"4ei+":function(t,e,r){var n=r("9eiu");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},"4sg8":function(t,e,r){var n=r("qd7R");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},"5/9A":function(t,e,r){r("NTmt"),r("0M54"),r("jaA8");var n=r("GUwf"),o=(r("O+2d"),r("Pa4o"),r("+Dok")),a=r("NSHF"),i=r("lXET");t.exports=function(t,e,r){var u={},s={},l=[],c={};e.forEach(function(t,e){var r,a=i(t),f=a.unrefinedType;Array.prototype.push.apply(l,a.predicates),n(u,o(r=f)?r:r.meta.props),n(s,f.prototype),n(c,function(t){return o(t)?null:t.meta.defaultProps}(f),!0)}),(r=t.getOptions(r)).defaultProps=n(c,r.defaultProps,!0);var f=function(t,e,r){var n=t.reduce(function(t,e){return a(t,e)},e);return r&&(n.displayName=r,n.meta.name=r),n}(l,t(u,{strict:r.strict,defaultProps:r.defaultProps}),r.name);return n(f.prototype,s),f}},"5LqS":function(t,e,r){var n=r("k0p1");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},"5WQK":function(t,e,r){var n=r("NTmt"),o=r("vGpM");t.exports=function(t,e){n(!(t instanceof e),function(){return"Cannot use the new operator to instantiate the type "+o(e)})}},"5kE2":function(t,e,r){var n=r("8eIi");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},"6q9x":function(t,e,r){"use strict";e.__esModule=!0;var n=Object.assign||function(t){for(var e=1;arguments.length>e;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t};function o(t){return t&&t.__esModule?t:{default:t}}var a=o(r("q1tI")),i=o(r("rAY/")),u=o(r("TSYQ")),s=o(r("csEI")),l=o(r("y9rk")),c=o(r("lgOA")),f=o(r("vHpL")),p=i.default.struct({horizontal:i.default.maybe(s.default)},"CheckboxConfig");e.default=function t(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};function r(t){t.config=r.getConfig(t);var e=t.config.horizontal?r.renderHorizontal(t):r.renderVertical(t);return r.renderFormGroup(e,t)}return r.getConfig=e.getConfig||function(t){return new p(t.config||{})},r.getAttrs=e.getAttrs||function(t){var e=i.default.mixin({},t.attrs);return e.type="checkbox",e.disabled=t.disabled,e.checked=t.value,e.onChange=function(e){return t.onChange(e.target.checked)},t.help&&(e["aria-describedby"]=e["aria-describedby"]||e.id+"-tip"),e},r.renderCheckbox=e.renderCheckbox||function(t){var e=r.getAttrs(t);return a.default.createElement("div",{className:u.default({checkbox:!0,disabled:e.disabled})},a.default.createElement("label",{htmlFor:e.id},a.default.createElement("input",e)," ",t.label))},r.renderError=e.renderError||function(t){return l.default(t)},r.renderHelp=e.renderHelp||function(t){return c.default(t)},r.renderVertical=e.renderVertical||function(t){return[r.renderCheckbox(t),r.renderError(t),r.renderHelp(t)]},r.renderHorizontal=e.renderHorizontal||function(t){var e=t.config.horizontal.getOffsetClassName();return a.default.createElement("div",{className:u.default(e)},r.renderCheckbox(t),r.renderError(t),r.renderHelp(t))},r.renderFormGroup=e.renderFormGroup||f.default,r.clone=function(){return t(n({},e,arguments.length>0&&void 0!==arguments[0]?arguments[0]:{}))},r}(),t.exports=e.default},"7I/v":function(t,e,r){var n=r("ggqX"),o=r("zpUs");t.exports=n("Nil",o)},"8eIi":function(t,e,r){},"8isp":function(t,e){t.exports=function(t){throw new TypeError("[tcomb] "+t)}},"99Y8":function(t,e,r){var n=r("LDv6");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},"9eiu":function(t,e,r){},"9tPo":function(t,e){t.exports=function(t){var e="undefined"!=typeof window&&window.location;if(!e)throw Error("fixUrls requires window.location");if(!t||"string"!=typeof t)return t;var r=e.protocol+"//"+e.host,n=r+e.pathname.replace(/\/[^\/]*$/,"/");return t.replace(/url\s*\(((?:[^)(]|\((?:[^)(]+|\([^)(]*\))*\))*)\)/gi,function(t,e){var o,a=e.trim().replace(/^"(.*)"$/,function(t,e){return e}).replace(/^'(.*)'$/,function(t,e){return e});return/^(#|data:|http:\/\/|https:\/\/|file:\/\/\/|\s*$)/i.test(a)?t:(o=0===a.indexOf("//")?a:0===a.indexOf("/")?r+a:n+a.replace(/^\.\//,""),"url("+JSON.stringify(o)+")")})}},"9xji":function(t,e,r){var n=r("z2SR");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},BxbG:function(t,e,r){var n=r("ve+q");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},CZBd:function(t,e,r){var n=r("NTmt"),o=(r("EGGr"),r("5WQK"),r("jLcX")),a=r("J1ta");r("+Dok");function i(t){return Object.keys(t).map(function(t){return n.stringify(t)}).join(" | ")}function u(t,e){var r=e||i(t);function n(t,e){return t}return n.meta={kind:"enums",map:t,name:e,identity:!0},n.displayName=r,n.is=function(e){return(a(e)||o(e))&&t.hasOwnProperty(e)},n}u.of=function(t,e){var r={};return(t=a(t)?t.split(" "):t).forEach(function(t){r[t]=t}),u(r,e)},u.getDefaultName=i,t.exports=u},"DCK+":function(t,e,r){var n=r("NTmt"),o=(r("EGGr"),r("0M54"),r("vGpM")),a=r("Pq4a"),i=r("gXA1"),u=r("vHtj"),s=r("jaA8");function l(t){return"Array<"+o(t)+">"}function c(t,e){var r=e||l(t),c=(o(t),a(t));function f(e,r){if(c)return e;for(var n=!0,o=[],a=0,u=e.length;u>a;a++){var s=e[a],l=i(t,s,null);n=n&&s===l,o.push(l)}return n&&(o=e),o}return f.meta={kind:"list",type:t,name:e,identity:c},f.displayName=r,f.is=function(e){return s(e)&&e.every(function(e){return u(e,t)})},f.update=function(t,e){return f(n.update(t,e))},f}c.getDefaultName=l,t.exports=c},EGGr:function(t,e,r){var n=r("zpUs"),o=r("J1ta");t.exports=function(t){return n(t)||o(t)}},EjkC:function(t,e,r){var n=r("ggqX"),o=r("jLcX");t.exports=n("Number",o)},EoZQ:function(t,e,r){r("NTmt"),r("EGGr"),r("i0Gq"),r("zpUs");var n=r("GUwf"),o=r("vGpM"),a=r("O5ya"),i=1;t.exports=function(t){var e;function r(t,r){return e(t,r)}return r.define=function(o){return a(o)&&r.hasOwnProperty("dispatch")&&(o.dispatch=r.dispatch),n(r,e=o,!0),t&&(e.displayName=r.displayName=t,r.meta.name=t),r.meta.identity=e.meta.identity,r.prototype=e.prototype,r},r.displayName=t||o(r)+"$"+i++,r.meta={identity:!1},r.prototype=null,r}},F4uB:function(t,e,r){var n=r("vGpM");t.exports=function(t){return"{"+Object.keys(t).map(function(e){return e+": "+n(t[e])}).join(", ")+"}"}},GUwf:function(t,e,r){var n=r("zpUs");r("NTmt");t.exports=function(t,e,r){if(n(e))return t;for(var o in e)e.hasOwnProperty(o)&&(t[o]=e[o]);return t}},GeYz:function(t,e,r){r("NTmt");var n=r("+Dok"),o=(r("0M54"),r("jaA8")),a=(r("jLcX"),r("/Se1"));function i(t){return n(t)?t instanceof Date||t instanceof RegExp?t:a({},t):o(t)?t.concat():t}function u(t){return l.commands.hasOwnProperty(t)}function s(t){return l.commands[t]}function l(t,e){var r,n=t,o=!1;for(var a in e)e.hasOwnProperty(a)&&(u(a)?(r=s(a)(e[a],n))!==t?(o=!0,n=r):n=t:(n===t&&(n=i(t)),r=l(n[a],e[a]),o=o||r!==n[a],n[a]=r));return o?n:t}l.commands={$apply:function(t,e){return t(e)},$push:function(t,e){return t.length>0?e.concat(t):e},$remove:function(t,e){if(t.length>0){e=i(e);for(var r=0,n=t.length;n>r;r++)delete e[t[r]]}return e},$set:function(t){return t},$splice:function(t,e){return t.length>0?(e=i(e),t.reduce(function(t,e){return t.splice.apply(t,e),t},e)):e},$swap:function(t,e){if(t.from!==t.to){var r=(e=i(e))[t.to];e[t.to]=e[t.from],e[t.from]=r}return e},$unshift:function(t,e){return t.length>0?t.concat(e):e},$merge:function(t,e){var r=!1,n=i(e);for(var o in t)t.hasOwnProperty(o)&&(n[o]=t[o],r=r||n[o]!==e[o]);return r?n:e}},t.exports=l},J1ta:function(t,e){t.exports=function(t){return"string"==typeof t}},JHhY:function(t,e,r){"use strict";function n(t){return t&&t.__esModule?t:{default:t}}e.__esModule=!0,e.default=function(t,e){var r=e.label?o.default.createElement("legend",null,e.label):null,n={className:function(t){var e=t.path.length,r="fieldset fieldset-depth-"+e;e>0&&(r+=" fieldset-"+t.path.join("-"));t.className&&(r+=" "+a.default(t.className));return r}(e),disabled:e.disabled};return o.default.createElement.apply(null,["fieldset",n,r].concat(t))};var o=n(r("q1tI")),a=n(r("TSYQ"));t.exports=e.default},JOeG:function(t,e,r){},JfN4:function(t,e,r){var n=r("NSHF"),o=r("EjkC");t.exports=n(o,function(t){return t%1==0},"Integer")},KthS:function(t,e,r){"use strict";e.__esModule=!0;var n=Object.assign||function(t){for(var e=1;arguments.length>e;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t};function o(t){return t&&t.__esModule?t:{default:t}}var a=o(r("4Go9")),i=o(r("JHhY"));e.default=function t(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};function r(t){var e=[];return t.help&&e.push(r.renderHelp(t)),t.error&&t.hasError&&e.push(r.renderError(t)),e=e.concat(t.order.map(function(e){return t.inputs[e]})),r.renderFieldset(e,t)}return r.renderHelp=e.renderHelp||function(t){return a.default("info",t.help)},r.renderError=e.renderError||function(t){return a.default("danger",t.error)},r.renderFieldset=e.renderFieldset||i.default,r.clone=function(){return t(n({},e,arguments.length>0&&void 0!==arguments[0]?arguments[0]:{}))},r}(),t.exports=e.default},L6ir:function(t,e,r){r("NTmt"),r("EGGr");var n=r("YI9c"),o=r("jaA8"),a=(r("DCK+"),r("+Dok")),i=r("gXA1"),u=(r("zpUs"),r("iqFv"),r("fqnr"),r("cWHx")),s=r("vGpM"),l=r("i0Gq");function c(t,e){return"("+t.map(s).join(", ")+") => "+s(e)}function f(t){return n.is(t)&&a(t.instrumentation)}function p(t){for(var e=t.length,r=!1,n=e-1;n>=0;n--){var o=t[n];if(!l(o)||"maybe"!==o.meta.kind)return n+1;r=!0}return r?0:e}function d(t,e,r){t=o(t)?t:[t];var n=r||c(t,e),a=t.length;p(t);function s(t,e){return f(t)?t:s.of(t)}return s.meta={kind:"func",domain:t,codomain:e,name:r,identity:!0},s.displayName=n,s.is=function(r){return f(r)&&r.instrumentation.domain.length===a&&r.instrumentation.domain.every(function(e,r){return e===t[r]})&&r.instrumentation.codomain===e},s.of=function(r,n){if(s.is(r))return r;function o(){var o=Array.prototype.slice.call(arguments),u=o.length;if(n&&a>u){0;var s=Function.prototype.bind.apply(r,[this].concat(o));return d(t.slice(u),e).of(s,!0)}return i(e,r.apply(this,o))}return o.instrumentation={domain:t,codomain:e,f:r},o.displayName=u(r),o},s}d.getDefaultName=c,d.getOptionalArgumentsIndex=p,t.exports=d},LDv6:function(t,e,r){},N2jO:function(t,e,r){},NSHF:function(t,e,r){var n=r("NTmt"),o=(r("EGGr"),r("0M54"),r("5WQK"),r("Pq4a")),a=r("gXA1"),i=r("vHtj"),u=r("vGpM"),s=r("cWHx");function l(t,e){return"{"+u(t)+" | "+s(e)+"}"}function c(t,e,r){var u=r||l(t,e),s=o(t);function c(e,r){return a(t,e,r)}return c.meta={kind:"subtype",type:t,predicate:e,name:r,identity:s},c.displayName=u,c.is=function(r){return i(r,t)&&e(r)},c.update=function(t,e){return c(n.update(t,e))},c}c.getDefaultName=l,t.exports=c},NTmt:function(t,e,r){var n=r("0M54"),o=r("zpUs"),a=r("8isp"),i=r("oj2M");function u(t,e){!0!==t&&(n(e)?e=e():o(e)&&(e='Assert failed (turn on "Pause on exceptions" in your Source panel)'),u.fail(e))}u.fail=a,u.stringify=i,t.exports=u},NWmT:function(t,e,r){"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.store=void 0,e.storeWithInitial=function(t){return(0,n.configureStore)(t)};var n=r("X9qQ");e.store=(0,n.configureStore)()},Nkhh:function(t,e,r){var n=r("ggqX"),o=r("jaA8");t.exports=n("Array",o)},"O+2d":function(t,e,r){var n=r("i0Gq");t.exports=function(t){return n(t)&&"struct"===t.meta.kind}},O5ya:function(t,e,r){var n=r("i0Gq");t.exports=function(t){return n(t)&&"union"===t.meta.kind}},OG1J:function(t,e,r){"use strict";e.__esModule=!0;var n=function(){function t(t,e){for(var r=0;e.length>r;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,n.key,n)}}return function(e,r,n){return r&&t(e.prototype,r),n&&t(e,n),e}}();function o(t){return t&&t.__esModule?t:{default:t}}function a(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}function i(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function, not "+typeof e);t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,enumerable:!1,writable:!0,configurable:!0}}),e&&(Object.setPrototypeOf?Object.setPrototypeOf(t,e):t.__proto__=e)}var u=o(r("q1tI")),s=o(r("RRLq")),l=r("ep+N"),c=s.default.Nil,f="tcomb-form",p=Object.freeze({}),d=Object.freeze([]),v=function(){};function m(t,e){var r=!0;t:for(;r;){var n=t,o=e;if(r=!1,o.factory)return o.factory;if(n.getTcombFormFactory)return n.getTcombFormFactory(o);var a=s.default.getTypeName(n);switch(n.meta.kind){case"irreducible":return n===s.default.Boolean?O:n===s.default.Date?C:I;case"struct":case"interface":return S;case"list":return P;case"enums":return N;case"maybe":case"subtype":t=n.meta.type,e=o,r=!0,a=void 0;continue t;default:s.default.fail("["+f+"] unsupported kind "+n.meta.kind+" for type "+a)}}}function h(t,e){return t.text.localeCompare(e.text)}function g(t){return{asc:h,desc:function(t,e){return-h(t,e)}}[t]}e.getComponent=m;var y={template:function(t){return function(e){e.prototype.getTemplate=function(){return this.props.options.template||this.props.ctx.templates[t]}}},attrs:function(t){t.prototype.getAttrs=function(){var t=s.default.mixin({},this.props.options.attrs);return t.id=this.getId(),t.name=this.getName(),t}},templates:function(t){t.prototype.getTemplates=function(){return l.merge(this.props.ctx.templates,this.props.options.templates)}}};e.decorators=y;var b=function(t){function e(r){var n=this;a(this,e),t.call(this,r),this.onChange=function(t){n.setState({value:t,isPristine:!1},function(){n.props.onChange(t,n.props.ctx.path)})},this.typeInfo=l.getTypeInfo(r.type),this.state={isPristine:!0,hasError:!1,value:this.getTransformer().format(r.value)}}return i(e,t),n(e,null,[{key:"transformer",value:{format:function(t){return c.is(t)?null:t},parse:function(t){return t}},enumerable:!0}]),e.prototype.getTransformer=function(){return this.props.options.transformer||this.constructor.transformer},e.prototype.shouldComponentUpdate=function(t,e){var r=this.props,n=this.state;return e.value!==n.value||e.hasError!==n.hasError||t.options!==r.options||t.type!==r.type||l.isArraysShallowDiffers(!!t.ctx&&t.ctx.path,!!r.ctx&&r.ctx.path)},e.prototype.componentWillReceiveProps=function(t){t.type!==this.props.type&&(this.typeInfo=l.getTypeInfo(t.type));var e=this.getTransformer().format(t.value);this.setState({value:e})},e.prototype.getValidationOptions=function(){return{path:this.props.ctx.path,context:s.default.mixin(s.default.mixin({},this.props.context||this.props.ctx.context),{options:this.props.options})}},e.prototype.getValue=function(){return this.getTransformer().parse(this.state.value)},e.prototype.isValueNully=function(){return c.is(this.getValue())},e.prototype.removeErrors=function(){this.setState({hasError:!1})},e.prototype.validate=function(){var t=s.default.validate(this.getValue(),this.props.type,this.getValidationOptions());return this.setState({hasError:!t.isValid()}),t},e.prototype.getAuto=function(){return this.props.options.auto||this.props.ctx.auto},e.prototype.getI18n=function(){return this.props.options.i18n||this.props.ctx.i18n},e.prototype.getDefaultLabel=function(){var t=this.props.ctx.label;if(t)return t+(this.typeInfo.isMaybe?this.getI18n().optional:this.getI18n().required)},e.prototype.getLabel=function(){var t=this.props.options.label||this.props.options.legend;return c.is(t)&&"labels"===this.getAuto()&&(t=this.getDefaultLabel()),t},e.prototype.getError=function(){if(this.hasError()){var t=this.props.options.error||this.typeInfo.getValidationErrorMessage;if(s.default.Function.is(t)){var e=this.getValidationOptions(),r=e.path,n=e.context;return t(this.getValue(),r,n)}return t}},e.prototype.hasError=function(){return this.props.options.hasError||this.state.hasError},e.prototype.getConfig=function(){return l.merge(this.props.ctx.config,this.props.options.config)},e.prototype.getId=function(){var t=this.props.options.attrs||p;return t.id?t.id:(this.uid||(this.uid=this.props.ctx.uidGenerator.next()),this.uid)},e.prototype.getName=function(){return this.props.options.name||this.props.ctx.name||this.getId()},e.prototype.getLocals=function(){var t=this.props.options,e=this.state.value;return{typeInfo:this.typeInfo,path:this.props.ctx.path,isPristine:this.state.isPristine,error:this.getError(),hasError:this.hasError(),label:this.getLabel(),onChange:this.onChange,config:this.getConfig(),value:e,disabled:t.disabled,help:t.help,context:this.props.ctx.context}},e.prototype.render=function(){var t=this.getLocals();return this.getTemplate()(t)},e}(u.default.Component);function x(t){return s.default.String.is(t)&&""===t.trim()||c.is(t)?null:t}function E(t){var e=parseFloat(t);return t==e?e:x(t)}e.Component=b;var I=function(t){function e(){a(this,r),t.apply(this,arguments)}i(e,t),e.prototype.getTransformer=function(){var t=this.props.options;return t.transformer?t.transformer:this.typeInfo.innerType===s.default.Number?e.numberTransformer:e.transformer},e.prototype.getPlaceholder=function(){var t=(this.props.options.attrs||p).placeholder;return c.is(t)&&"placeholders"===this.getAuto()&&(t=this.getDefaultLabel()),t},e.prototype.getLocals=function(){var e=t.prototype.getLocals.call(this);return e.attrs=this.getAttrs(),e.attrs.placeholder=this.getPlaceholder(),e.type=this.props.options.type||"text",e},n(e,null,[{key:"transformer",value:{format:function(t){return c.is(t)?"":t},parse:x},enumerable:!0},{key:"numberTransformer",value:{format:function(t){return c.is(t)?"":t+""},parse:E},enumerable:!0}]);var r=e;return e=y.template("textbox")(e)||e,e=y.attrs(e)||e}(b);e.Textbox=I;var O=function(t){function e(){a(this,r),t.apply(this,arguments)}i(e,t),e.prototype.getLocals=function(){var e=t.prototype.getLocals.call(this);return e.attrs=this.getAttrs(),e.label=e.label||this.getDefaultLabel(),e},n(e,null,[{key:"transformer",value:{format:function(t){return!c.is(t)&&t},parse:function(t){return t}},enumerable:!0}]);var r=e;return e=y.template("checkbox")(e)||e,e=y.attrs(e)||e}(b);e.Checkbox=O;var N=function(t){function e(){a(this,r),t.apply(this,arguments)}i(e,t),e.prototype.getTransformer=function(){var t=this.props.options;return t.transformer?t.transformer:this.isMultiple()?e.multipleTransformer:e.transformer(this.getNullOption())},e.prototype.getNullOption=function(){return this.props.options.nullOption||{value:"",text:"-"}},e.prototype.isMultiple=function(){return"list"===this.typeInfo.innerType.meta.kind},e.prototype.getEnum=function(){return this.isMultiple()?l.getTypeInfo(this.typeInfo.innerType.meta.type).innerType:this.typeInfo.innerType},e.prototype.getOptions=function(){var t=this.props.options,e=t.options?t.options.slice():l.getOptionsOfEnum(this.getEnum());t.order&&e.sort(g(t.order));var r=this.getNullOption();return this.isMultiple()||!1===t.nullOption||e.unshift(r),e},e.prototype.getLocals=function(){var e=t.prototype.getLocals.call(this);return e.attrs=this.getAttrs(),e.options=this.getOptions(),e.isMultiple=this.isMultiple(),e},n(e,null,[{key:"transformer",value:function(t){return{format:function(e){return c.is(e)&&t?t.value:e},parse:function(e){return t&&t.value===e?null:e}}},enumerable:!0},{key:"multipleTransformer",value:{format:function(t){return c.is(t)?d:t},parse:function(t){return t}},enumerable:!0}]);var r=e;return e=y.template("select")(e)||e,e=y.attrs(e)||e}(b);e.Select=N;var T=function(t){function e(){a(this,r),t.apply(this,arguments)}i(e,t),e.prototype.getOptions=function(){var t=this.props.options,e=t.options?t.options.slice():l.getOptionsOfEnum(this.typeInfo.innerType);return t.order&&e.sort(g(t.order)),e},e.prototype.getLocals=function(){var e=t.prototype.getLocals.call(this);return e.attrs=this.getAttrs(),e.options=this.getOptions(),e},n(e,null,[{key:"transformer",value:{format:function(t){return c.is(t)?null:t},parse:function(t){return t}},enumerable:!0}]);var r=e;return e=y.template("radio")(e)||e,e=y.attrs(e)||e}(b);e.Radio=T;var _=Object.freeze([null,null,null]),C=function(t){function e(){a(this,r),t.apply(this,arguments)}i(e,t),e.prototype.getOrder=function(){return this.props.options.order||["M","D","YY"]},e.prototype.getLocals=function(){var e=t.prototype.getLocals.call(this);return e.attrs=this.getAttrs(),e.order=this.getOrder(),e},n(e,null,[{key:"transformer",value:{format:function(t){return s.default.Array.is(t)?t:s.default.Date.is(t)?[t.getFullYear(),t.getMonth(),t.getDate()].map(String):_},parse:function(t){var e=t.map(E);return e.every(s.default.Number.is)?new Date(e[0],e[1],e[2]):e.every(c.is)?null:e}},enumerable:!0}]);var r=e;return e=y.template("date")(e)||e,e=y.attrs(e)||e}(b);e.Datetime=C;var k=function(t){function e(){var r=this;a(this,e),t.apply(this,arguments),this.childRefs={},this.setChildRefFor=function(t){return function(e){e?r.childRefs[t]=e:delete r.childRefs[t]}}}return i(e,t),e}(b),S=function(t){function e(){var e=this;a(this,r),t.apply(this,arguments),this.onChange=function(t,r,n,o){var a=s.default.mixin({},e.state.value);a[t]=r,e.setState({value:a,isPristine:!1},function(){e.props.onChange(a,n,o)})}}i(e,t),e.prototype.isValueNully=function(){var t=this;return Object.keys(this.childRefs).every(function(e){return t.childRefs[e].isValueNully()})},e.prototype.removeErrors=function(){var t=this;this.setState({hasError:!1}),Object.keys(this.childRefs).forEach(function(e){return t.childRefs[e].removeErrors()})},e.prototype.validate=function(){var t={},e=[],r=void 0;if(this.typeInfo.isMaybe&&this.isValueNully())return this.removeErrors(),new s.default.ValidationResult({errors:[],value:null});var n=this.getTypeProps();for(var o in n)this.childRefs.hasOwnProperty(o)&&(r=this.childRefs[o].validate(),e=e.concat(r.errors),t[o]=r.value);0===e.length&&(t=new(0,this.typeInfo.innerType)(t=this.getTransformer().parse(t)),this.typeInfo.isSubtype&&(e=(r=s.default.validate(t,this.props.type,this.getValidationOptions())).errors));return this.setState({hasError:e.length>0}),new s.default.ValidationResult({errors:e,value:t})},e.prototype.getTemplate=function(){return this.props.options.template||this.getTemplates().struct},e.prototype.getTypeProps=function(){return this.typeInfo.innerType.meta.props},e.prototype.getOrder=function(){return this.props.options.order||Object.keys(this.getTypeProps())},e.prototype.getInputs=function(){var t=this.props,e=t.options,r=t.ctx,n=this.getTypeProps(),o=this.getAuto(),a=this.getI18n(),i=this.getConfig(),s=this.getTemplates(),c=this.state.value,f={};for(var d in n)if(n.hasOwnProperty(d)){var v=n[d],h=c[d],g=l.getTypeFromUnion(v,h),y=l.getComponentOptions((e.fields||p)[d],p,h,v);f[d]=u.default.createElement(m(g,y),{key:d,ref:this.setChildRefFor(d),type:g,options:y,value:h,onChange:this.onChange.bind(this,d),ctx:{context:r.context,uidGenerator:r.uidGenerator,auto:o,config:i,name:r.name?r.name+"["+d+"]":d,label:l.humanize(d),i18n:a,templates:s,path:r.path.concat(d)}})}return f},e.prototype.getLocals=function(){var e=this.props.options,r=t.prototype.getLocals.call(this);return r.order=this.getOrder(),r.inputs=this.getInputs(),r.className=e.className,r},n(e,null,[{key:"transformer",value:{format:function(t){return c.is(t)?p:t},parse:function(t){return t}},enumerable:!0}]);var r=e;return e=y.templates(e)||e}(k);function w(t,e,r){if(t.length===e.length)return e;for(var n=[],o=0,a=t.length;a>o;o++)n[o]=e[o]||r.next();return n}e.Struct=S;var P=function(t){function e(e){var n=this;a(this,r),t.call(this,e),this.onChange=function(t,e,r,o){var a=w(t,e,n.props.ctx.uidGenerator);n.setState({value:t,keys:a,isPristine:!1},function(){n.props.onChange(t,r,o)})},this.addItem=function(){var t=n.state.value.concat(void 0),e=n.state.keys.concat(n.props.ctx.uidGenerator.next());n.onChange(t,e,n.props.ctx.path.concat(t.length-1),"add")},this.state.keys=this.state.value.map(function(){return e.ctx.uidGenerator.next()})}i(e,t),n(e,null,[{key:"transformer",value:{format:function(t){return c.is(t)?d:t},parse:function(t){return t}},enumerable:!0}]),e.prototype.componentWillReceiveProps=function(t){t.type!==this.props.type&&(this.typeInfo=l.getTypeInfo(t.type));var e=this.getTransformer().format(t.value);this.setState({value:e,keys:w(e,this.state.keys,t.ctx.uidGenerator)})},e.prototype.isValueNully=function(){return 0===this.state.value.length},e.prototype.removeErrors=function(){var t=this;this.setState({hasError:!1}),Object.keys(this.childRefs).forEach(function(e){return t.childRefs[e].removeErrors()})},e.prototype.validate=function(){var t=[],e=[],r=void 0;if(this.typeInfo.isMaybe&&this.isValueNully())return this.removeErrors(),new s.default.ValidationResult({errors:[],value:null});for(var n=0,o=this.state.value.length;o>n;n++)r=this.childRefs[n].validate(),e=e.concat(r.errors),t.push(r.value);return this.typeInfo.isSubtype&&0===e.length&&(t=this.getTransformer().parse(t),e=(r=s.default.validate(t,this.props.type,this.getValidationOptions())).errors),this.setState({hasError:e.length>0}),new s.default.ValidationResult({errors:e,value:t})},e.prototype.onItemChange=function(t,e,r,n){var o=this.state.value.slice();o[t]=e,this.onChange(o,this.state.keys,r,n)},e.prototype.removeItem=function(t){var e=this.state.value.slice();e.splice(t,1);var r=this.state.keys.slice();r.splice(t,1),this.onChange(e,r,this.props.ctx.path.concat(t),"remove")},e.prototype.moveUpItem=function(t){t>0&&this.onChange(l.move(this.state.value.slice(),t,t-1),l.move(this.state.keys.slice(),t,t-1),this.props.ctx.path.concat(t),"moveUp")},e.prototype.moveDownItem=function(t){this.state.value.length-1>t&&this.onChange(l.move(this.state.value.slice(),t,t+1),l.move(this.state.keys.slice(),t,t+1),this.props.ctx.path.concat(t),"moveDown")},e.prototype.getTemplate=function(){return this.props.options.template||this.getTemplates().list},e.prototype.getItems=function(){var t=this,e=this.props,r=e.options,n=e.ctx,o=this.getAuto(),a=this.getI18n(),i=this.getConfig(),s=this.getTemplates();return this.state.value.map(function(e,c){var f=t.typeInfo.innerType.meta.type,d=l.getTypeFromUnion(f,e),v=l.getComponentOptions(r.item,p,e,f),h=m(d,v),g=[];return r.disableRemove||g.push({type:"remove",label:a.remove,click:t.removeItem.bind(t,c)}),r.disableOrder||g.push({type:"move-up",label:a.up,click:t.moveUpItem.bind(t,c)}),r.disableOrder||g.push({type:"move-down",label:a.down,click:t.moveDownItem.bind(t,c)}),{input:u.default.createElement(h,{ref:t.setChildRefFor(c),type:d,options:v,value:e,onChange:t.onItemChange.bind(t,c),ctx:{context:n.context,uidGenerator:n.uidGenerator,auto:o,config:i,i18n:a,name:n.name?n.name+"["+c+"]":c+"",templates:s,path:n.path.concat(c)}}),key:t.state.keys[c],buttons:g}})},e.prototype.getLocals=function(){var e=this.props.options,r=this.getI18n(),n=t.prototype.getLocals.call(this);return n.add=e.disableAdd?null:{type:"add",label:r.add,click:this.addItem},n.items=this.getItems(),n.className=e.className,n};var r=e;return e=y.templates(e)||e}(k);e.List=P;var A=function(t){function e(){var r=this;a(this,e),t.apply(this,arguments),this.inputRef=null,this.setInputRef=function(t){r.inputRef=t}}return i(e,t),e.prototype.validate=function(){return this.inputRef.validate()},e.prototype.getValue=function(){var t=this.validate();return t.isValid()?t.value:null},e.prototype.getComponent=function(t){return(s.default.String.is(t)?t.split("."):t).reduce(function(t,e){return t.childRefs[e]},this.inputRef)},e.prototype.getSeed=function(){var t=this._reactInternalInstance;if(t){if(t._hostContainerInfo)return t._hostContainerInfo._idCounter;if(t._nativeContainerInfo)return t._nativeContainerInfo._idCounter;if(t._rootNodeID)return t._rootNodeID}return"0"},e.prototype.getUIDGenerator=function(){return this.uidGenerator=this.uidGenerator||new l.UIDGenerator(this.getSeed()),this.uidGenerator},e.prototype.render=function(){var t=e.i18n,r=e.templates;var n=this.props.value,o=l.getTypeFromUnion(this.props.type,n),a=l.getComponentOptions(this.props.options,p,n,this.props.type),i=this.getUIDGenerator();return u.default.createElement(m(o,a),{ref:this.setInputRef,type:o,options:a,value:n,onChange:this.props.onChange||v,ctx:this.props.ctx||{context:this.props.context,uidGenerator:i,auto:"labels",templates:r,i18n:t,path:[]}})},e}(u.default.Component);e.Form=A},OQ51:function(t,e,r){"use strict";function n(t){return t&&t.__esModule?t:{default:t}}e.__esModule=!0;var o=n(r("6q9x")),a=n(r("mKLz")),i=n(r("q4eH")),u=n(r("yFBk")),s=n(r("Vz4J")),l=n(r("KthS")),c=n(r("wGuA"));e.default={checkbox:o.default,date:a.default,list:i.default,radio:u.default,select:s.default,struct:l.default,textbox:c.default},t.exports=e.default},Ofox:function(t,e,r){var n=r("NTmt"),o=(r("EGGr"),r("0M54"),r("jaA8"),r("Pq4a"),r("vHtj")),a=r("vGpM"),i=r("Pq4a");function u(t){return t.map(a).join(" & ")}function s(t,e){var r=e||u(t),a=t.every(i);function s(t,e){return t}return s.meta={kind:"intersection",types:t,name:e,identity:a},s.displayName=r,s.is=function(e){return t.every(function(t){return o(e,t)})},s.update=function(t,e){return s(n.update(t,e))},s}s.getDefaultName=u,t.exports=s},Pa4o:function(t,e,r){var n=r("i0Gq");t.exports=function(t){return n(t)&&"interface"===t.meta.kind}},PcrD:function(t,e,r){},Pq4a:function(t,e,r){r("NTmt"),r("xQ3S");var n=r("i0Gq");r("vGpM");t.exports=function(t){return!n(t)||t.meta.identity}},RRLq:function(t,e,r){"use strict";var n=r("rAY/"),o=n.stringify,a={},i=n.struct({message:n.Any,actual:n.Any,expected:n.Any,path:n.list(n.union([n.String,n.Number]))},"ValidationError");function u(t,e,r,a){return n.Function.is(e.getValidationErrorMessage)?e.getValidationErrorMessage(t,r,a):function(t,e,r){var a=n.getTypeName(e),i=r.length?"/"+r.join("/")+": "+a:a;return"Invalid value "+o(t)+" supplied to "+i}(t,e,r)}i.of=function(t,e,r,n){return new i({message:u(t,e,r,n),actual:t,expected:e,path:r})};var s=n.struct({errors:n.list(i),value:n.Any},"ValidationResult");function l(t,e,r){var o=n.Array.is(r=r||{})?r:r.path||[];return new s(c(t,e,o,r))}function c(t,e,r,o){return n.isType(e)?f[e.meta.kind](t,e,r,o):f.es6classes(t,e,r,o)}s.prototype.isValid=function(){return!this.errors.length},s.prototype.firstError=function(){return this.isValid()?null:this.errors[0]},s.prototype.toString=function(){return this.isValid()?"[ValidationResult, true, "+o(this.value)+"]":"[ValidationResult, false, ("+this.errors.map(function(t){return o(t.message)}).join(", ")+")]"};var f=l.validators={};f.es6classes=function(t,e,r,n){return{value:t,errors:t instanceof e?[]:[i.of(t,e,r,n.context)]}},f.irreducible=f.enums=function(t,e,r,n){return{value:t,errors:e.is(t)?[]:[i.of(t,e,r,n.context)]}},f.list=function(t,e,r,o){if(!n.Array.is(t))return{value:t,errors:[i.of(t,e,r,o.context)]};for(var a={value:[],errors:[]},u=0,s=t.length;s>u;u++){var l=c(t[u],e.meta.type,r.concat(u),o);a.value[u]=l.value,a.errors=a.errors.concat(l.errors)}return a},f.subtype=function(t,e,r,n){var o=c(t,e.meta.type,r,n);return o.errors.length?o:(e.meta.predicate(o.value)||(o.errors=[i.of(t,e,r,n.context)]),o)},f.maybe=function(t,e,r,o){return n.Nil.is(t)?{value:t,errors:[]}:c(t,e.meta.type,r,o)},f.struct=function(t,e,r,o){if(!n.Object.is(t))return{value:t,errors:[i.of(t,e,r,o.context)]};if(e.is(t))return{value:t,errors:[]};var u={value:{},errors:[]},s=e.meta.props,l=e.meta.defaultProps||a;for(var f in s)if(s.hasOwnProperty(f)){var p=t[f];void 0===p&&(p=l[f]);var d=c(p,s[f],r.concat(f),o);u.value[f]=d.value,u.errors=u.errors.concat(d.errors)}if(o.hasOwnProperty("strict")?o.strict:e.meta.strict)for(var v in t)t.hasOwnProperty(v)&&!s.hasOwnProperty(v)&&u.errors.push(i.of(t[v],n.Nil,r.concat(v),o.context));return u.errors.length||(u.value=new e(u.value)),u},f.tuple=function(t,e,r,o){var a=e.meta.types,u=a.length;if(!n.Array.is(t)||t.length>u)return{value:t,errors:[i.of(t,e,r,o.context)]};for(var s={value:[],errors:[]},l=0;u>l;l++){var f=c(t[l],a[l],r.concat(l),o);s.value[l]=f.value,s.errors=s.errors.concat(f.errors)}return s},f.dict=function(t,e,r,o){if(!n.Object.is(t))return{value:t,errors:[i.of(t,e,r,o.context)]};var a={value:{},errors:[]};for(var u in t)if(t.hasOwnProperty(u)){var s=r.concat(u),l=c(u,e.meta.domain,s,o),f=c(t[u],e.meta.codomain,s,o);a.value[u]=f.value,a.errors=a.errors.concat(l.errors,f.errors)}return a},f.union=function(t,e,r,o){var a=e.dispatch(t);return n.Function.is(a)?c(t,a,r.concat(e.meta.types.indexOf(a)),o):{value:t,errors:[i.of(t,e,r,o.context)]}},f.intersection=function(t,e,r,n){for(var o=e.meta.types,a=o.length,u={value:t,errors:[]},s=0,l=0;a>l;l++){"struct"===o[l].meta.kind&&s++;var f=c(t,o[l],r,n);u.errors=u.errors.concat(f.errors)}return s>1&&u.errors.push(i.of(t,e,r,n.context)),u},f.interface=function(t,e,r,o){if(!n.Object.is(t))return{value:t,errors:[i.of(t,e,r,o.context)]};var a={value:{},errors:[]},u=e.meta.props;for(var s in u){var l=c(t[s],u[s],r.concat(s),o);a.value[s]=l.value,a.errors=a.errors.concat(l.errors)}if(o.hasOwnProperty("strict")?o.strict:e.meta.strict)for(var f in t)u.hasOwnProperty(f)||n.Nil.is(t[f])||a.errors.push(i.of(t[f],n.Nil,r.concat(f),o.context));return a},n.mixin(n,{ValidationError:i,ValidationResult:s,validate:l}),t.exports=n},SnpG:function(t,e,r){var n=r("c95b");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},TSYQ:function(t,e,r){var n;!function(){"use strict";var r={}.hasOwnProperty;function o(){for(var t=[],e=0;arguments.length>e;e++){var n=arguments[e];if(n){var a=typeof n;if("string"===a||"number"===a)t.push(n);else if(Array.isArray(n)){if(n.length){var i=o.apply(null,n);i&&t.push(i)}}else if("object"===a)if(n.toString===Object.prototype.toString)for(var u in n)r.call(n,u)&&n[u]&&t.push(u);else t.push(""+n)}}return t.join(" ")}t.exports?(o.default=o,t.exports=o):void 0===(n=function(){return o}.apply(e,[]))||(t.exports=n)}()},V7NQ:function(t,e,r){var n=r("NTmt"),o=(r("EGGr"),r("avBd"),r("YI9c"),r("iqFv"),r("+Dok")),a=r("zpUs"),i=r("gXA1"),u=(r("vGpM"),r("b055"),r("F4uB")),s=r("Pq4a"),l=r("vHtj"),c=r("5/9A"),f=r("/Se1");function p(t,e){return c(v,t,e)}function d(t){return o(t)||(t=a(t)?{}:{name:t}),t.hasOwnProperty("strict")||(t.strict=v.strict),t}function v(t,e){var r=(e=d(e)).name,o=e.strict;var c=r||u(t),v=Object.keys(t).map(function(e){return t[e]}).every(s);function m(e,r){if(v)return e;var n=!0,o=v?{}:f({},e);for(var a in t){var u=e[a],s=i(t[a],u,null);n=n&&u===s,o[a]=s}return n&&(o=e),o}return m.meta={kind:"interface",props:t,name:r,identity:v,strict:o},m.displayName=c,m.is=function(e){if(a(e))return!1;if(o)for(var r in e)if(!t.hasOwnProperty(r))return!1;for(var n in t)if(!l(e[n],t[n]))return!1;return!0},m.update=function(t,e){return m(n.update(t,e))},m.extend=function(t,e){return p([m].concat(t),e)},m}v.strict=!1,v.getOptions=d,v.getDefaultName=u,v.extend=p,t.exports=v},V7pp:function(t,e,r){var n=r("ggqX"),o=r("i0Gq");t.exports=n("Type",o)},Vz4J:function(t,e,r){"use strict";e.__esModule=!0;var n=Object.assign||function(t){for(var e=1;arguments.length>e;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t};function o(t){return t&&t.__esModule?t:{default:t}}var a=o(r("q1tI")),i=o(r("rAY/")),u=o(r("TSYQ")),s=o(r("csEI")),l=o(r("iF7n")),c=o(r("y9rk")),f=o(r("lgOA")),p=o(r("vHpL")),d=i.default.struct({horizontal:i.default.maybe(s.default)},"SelectConfig");function v(t){return a.default.createElement("option",{disabled:t.disabled,value:t.value,key:t.value},t.text)}e.default=function t(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};function r(t){t.config=r.getConfig(t),t.attrs=r.getAttrs(t);var e=t.config.horizontal?r.renderHorizontal(t):r.renderVertical(t);return r.renderFormGroup(e,t)}return r.getConfig=e.getConfig||function(t){return new d(t.config||{})},r.getAttrs=e.getAttrs||function(t){var e=i.default.mixin({},t.attrs);return e.className=u.default(e.className),e.className+=(e.className?" ":"")+"form-control",e.multiple=t.isMultiple,e.disabled=t.disabled,e.value=t.value,e.onChange=function(e){var r=t.isMultiple?Array.prototype.slice.call(e.target.options).filter(function(t){return t.selected}).map(function(t){return t.value}):e.target.value;t.onChange(r)},t.help&&(e["aria-describedby"]=e["aria-describedby"]||e.id+"-tip"),e},r.renderOptions=e.renderOptions||function(t){return t.options.map(function(t){return t.label?(r=(e=t).options.map(v),a.default.createElement("optgroup",{disabled:e.disabled,label:e.label,key:e.label},r)):v(t);var e,r})},r.renderSelect=e.renderSelect||function(t){return a.default.createElement("select",t.attrs,r.renderOptions(t))},r.renderLabel=e.renderLabel||function(t){return l.default({label:t.label,htmlFor:t.attrs.id,breakpoints:t.config.horizontal})},r.renderError=e.renderError||function(t){return c.default(t)},r.renderHelp=e.renderHelp||function(t){return f.default(t)},r.renderVertical=e.renderVertical||function(t){return[r.renderLabel(t),r.renderSelect(t),r.renderError(t),r.renderHelp(t)]},r.renderHorizontal=e.renderHorizontal||function(t){var e=r.renderLabel(t),n=e?t.config.horizontal.getInputClassName():t.config.horizontal.getOffsetClassName();return[e,a.default.createElement("div",{className:u.default(n)},r.renderSelect(t),r.renderError(t),r.renderHelp(t))]},r.renderFormGroup=e.renderFormGroup||p.default,r.clone=function(){return t(n({},e,arguments.length>0&&void 0!==arguments[0]?arguments[0]:{}))},r}(),t.exports=e.default},X4Nx:function(t,e,r){"use strict";Object.defineProperty(e,"__esModule",{value:!0});e.IMPORT_IN_PROGRESS="IMPORT_IN_PROGRESS",e.SET_IMPORT_LIST="SET_IMPORT_LIST",e.RESET_IMPORT_LIST="RESET_IMPORT_LIST",e.UPDATE_IMPORT_LIST="UPDATE_IMPORT_LIST",e.DELETE_IMPORT="DELETE_IMPORT",e.IMPORTS_LOADING="IMPORTS_LOADING"},X9qQ:function(t,e,r){"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.configureStore=function(t){return(0,n.createStore)(o.default,t,(0,n.applyMiddleware)(a.default))};var n=r("ANjH"),o=i(r("nKEc")),a=i(r("sINF"));function i(t){return t&&t.__esModule?t:{default:t}}},XFaX:function(t,e,r){r("NTmt"),r("EGGr"),r("0M54");var n=r("2bqR"),o=r("Pq4a"),a=r("1VoI"),i=r("gXA1"),u=r("7I/v"),s=(r("5WQK"),r("vHtj")),l=r("vGpM");function c(t){return"?"+l(t)}function f(t,e){if(n(t)||t===a||t===u)return t;var r=e||c(t),l=o(t);function f(e,r){return u.is(e)?e:i(t,e,r)}return f.meta={kind:"maybe",type:t,name:e,identity:l},f.displayName=r,f.is=function(e){return u.is(e)||s(e,t)},f}f.getDefaultName=c,t.exports=f},YI9c:function(t,e,r){var n=r("ggqX"),o=r("0M54");t.exports=n("Function",o)},"aET+":function(t,e,r){var n,o,a={},i=(n=function(){return window&&document&&document.all&&!window.atob},function(){return void 0===o&&(o=n.apply(this,arguments)),o}),u=function(t){var e={};return function(t,r){if("function"==typeof t)return t();if(void 0===e[t]){var n=function(t,e){return e?e.querySelector(t):document.querySelector(t)}(t,r);if(window.HTMLIFrameElement&&n instanceof window.HTMLIFrameElement)try{n=n.contentDocument.head}catch(t){n=null}e[t]=n}return e[t]}}(),s=null,l=0,c=[],f=r("9tPo");function p(t,e){for(var r=0;t.length>r;r++){var n=t[r],o=a[n.id];if(o){o.refs++;for(var i=0;o.parts.length>i;i++)o.parts[i](n.parts[i]);for(;n.parts.length>i;i++)o.parts.push(y(n.parts[i],e))}else{var u=[];for(i=0;n.parts.length>i;i++)u.push(y(n.parts[i],e));a[n.id]={id:n.id,refs:1,parts:u}}}}function d(t,e){for(var r=[],n={},o=0;t.length>o;o++){var a=t[o],i=e.base?a[0]+e.base:a[0],u={css:a[1],media:a[2],sourceMap:a[3]};n[i]?n[i].parts.push(u):r.push(n[i]={id:i,parts:[u]})}return r}function v(t,e){var r=u(t.insertInto);if(!r)throw Error("Couldn't find a style target. This probably means that the value for the 'insertInto' parameter is invalid.");var n=c[c.length-1];if("top"===t.insertAt)n?n.nextSibling?r.insertBefore(e,n.nextSibling):r.appendChild(e):r.insertBefore(e,r.firstChild),c.push(e);else if("bottom"===t.insertAt)r.appendChild(e);else{if("object"!=typeof t.insertAt||!t.insertAt.before)throw Error("[Style Loader]\n\n Invalid value for parameter 'insertAt' ('options.insertAt') found.\n Must be 'top', 'bottom', or Object.\n (https://github.com/webpack-contrib/style-loader#insertat)\n");var o=u(t.insertAt.before,r);r.insertBefore(e,o)}}function m(t){if(null===t.parentNode)return!1;t.parentNode.removeChild(t);var e=c.indexOf(t);0>e||c.splice(e,1)}function h(t){var e=document.createElement("style");if(void 0===t.attrs.type&&(t.attrs.type="text/css"),void 0===t.attrs.nonce){var n=function(){0;return r.nc}();n&&(t.attrs.nonce=n)}return g(e,t.attrs),v(t,e),e}function g(t,e){Object.keys(e).forEach(function(r){t.setAttribute(r,e[r])})}function y(t,e){var r,n,o,a;if(e.transform&&t.css){if(!(a="function"==typeof e.transform?e.transform(t.css):e.transform.default(t.css)))return function(){};t.css=a}if(e.singleton){var i=l++;r=s||(s=h(e)),n=E.bind(null,r,i,!1),o=E.bind(null,r,i,!0)}else t.sourceMap&&"function"==typeof URL&&"function"==typeof URL.createObjectURL&&"function"==typeof URL.revokeObjectURL&&"function"==typeof Blob&&"function"==typeof btoa?(r=function(t){var e=document.createElement("link");return void 0===t.attrs.type&&(t.attrs.type="text/css"),t.attrs.rel="stylesheet",g(e,t.attrs),v(t,e),e}(e),n=function(t,e,r){var n=r.css,o=r.sourceMap,a=void 0===e.convertToAbsoluteUrls&&o;(e.convertToAbsoluteUrls||a)&&(n=f(n));o&&(n+="\n/*# sourceMappingURL=data:application/json;base64,"+btoa(unescape(encodeURIComponent(JSON.stringify(o))))+" */");var i=new Blob([n],{type:"text/css"}),u=t.href;t.href=URL.createObjectURL(i),u&&URL.revokeObjectURL(u)}.bind(null,r,e),o=function(){m(r),r.href&&URL.revokeObjectURL(r.href)}):(r=h(e),n=function(t,e){var r=e.css,n=e.media;n&&t.setAttribute("media",n);if(t.styleSheet)t.styleSheet.cssText=r;else{for(;t.firstChild;)t.removeChild(t.firstChild);t.appendChild(document.createTextNode(r))}}.bind(null,r),o=function(){m(r)});return n(t),function(e){if(e){if(e.css===t.css&&e.media===t.media&&e.sourceMap===t.sourceMap)return;n(t=e)}else o()}}t.exports=function(t,e){if("undefined"!=typeof DEBUG&&DEBUG&&"object"!=typeof document)throw Error("The style-loader cannot be used in a non-browser environment");(e=e||{}).attrs="object"==typeof e.attrs?e.attrs:{},e.singleton||"boolean"==typeof e.singleton||(e.singleton=i()),e.insertInto||(e.insertInto="head"),e.insertAt||(e.insertAt="bottom");var r=d(t,e);return p(r,e),function(t){for(var n=[],o=0;r.length>o;o++){(i=a[r[o].id]).refs--,n.push(i)}t&&p(d(t,e),e);for(o=0;n.length>o;o++){var i;if(0===(i=n[o]).refs){for(var u=0;i.parts.length>u;u++)i.parts[u]();delete a[i.id]}}}};var b,x=(b=[],function(t,e){return b[t]=e,b.filter(Boolean).join("\n")});function E(t,e,r,n){var o=r?"":n.css;if(t.styleSheet)t.styleSheet.cssText=x(e,o);else{var a=document.createTextNode(o),i=t.childNodes;i[e]&&t.removeChild(i[e]),i.length?t.insertBefore(a,i[e]):t.appendChild(a)}}},avBd:function(t,e,r){var n=r("ggqX"),o=r("J1ta");t.exports=n("String",o)},b055:function(t,e,r){var n=r("NTmt"),o=(r("EGGr"),r("0M54"),r("vGpM")),a=r("Pq4a"),i=r("+Dok"),u=r("gXA1"),s=r("vHtj");function l(t,e){return"{[key: "+o(t)+"]: "+o(e)+"}"}function c(t,e,r){var c=r||l(t,e),f=(o(t),o(e),a(t)&&a(e));function p(r,n){if(f)return r;var o=!0,a={};for(var i in r)if(r.hasOwnProperty(i)){var s=r[i=u(t,i,null)],l=u(e,s,null);o=o&&s===l,a[i]=l}return o&&(a=r),a}return p.meta={kind:"dict",domain:t,codomain:e,name:r,identity:f},p.displayName=c,p.is=function(r){if(!i(r))return!1;for(var n in r)if(r.hasOwnProperty(n)&&(!s(n,t)||!s(r[n],e)))return!1;return!0},p.update=function(t,e){return p(n.update(t,e))},p}c.getDefaultName=l,t.exports=c},c6Rl:function(t,e,r){"use strict";function n(t){return t&&t.__esModule?t:{default:t}}e.__esModule=!0,e.default=function(t){var e={"form-group":!0,"has-error":t.hasError};t.className&&(e[t.className]=!0);return o.default.createElement("div",{className:a.default(e)},t.children)};var o=n(r("q1tI")),a=n(r("TSYQ"));t.exports=e.default},c95b:function(t,e,r){},cWHx:function(t,e){t.exports=function(t){return t.displayName||t.name||"<function"+t.length+">"}},csEI:function(t,e,r){"use strict";e.__esModule=!0;var n,o=r("rAY/"),a=(n=o)&&n.__esModule?n:{default:n},i=a.default.refinement(a.default.Number,function(t){return t%1==0&&t>=0},"Positive"),u=a.default.tuple([i,i],"Cols"),s=a.default.struct({xs:a.default.maybe(u),sm:a.default.maybe(u),md:a.default.maybe(u),lg:a.default.maybe(u)},"Breakpoints");function l(t){var e={};for(var r in t)t.hasOwnProperty(r)&&(e["col-"+r+"-"+t[r]]=!0);return e}s.prototype.getBreakpoints=function(t){var e={};for(var r in this)this.hasOwnProperty(r)&&!a.default.Nil.is(this[r])&&(e[r]=this[r][t]);return e},s.prototype.getLabelClassName=function(){return l(this.getBreakpoints(0))},s.prototype.getInputClassName=function(){return l(this.getBreakpoints(1))},s.prototype.getOffsetClassName=function(){return a.default.mixin(function(t){var e={};for(var r in t)t.hasOwnProperty(r)&&(e["col-"+r+"-offset-"+(12-t[r])]=!0);return e}(this.getBreakpoints(1)),l(this.getBreakpoints(1)))},e.default=s,t.exports=e.default},d9Mc:function(t,e,r){"use strict";e.__esModule=!0,e.default={optional:" (optional)",required:"",add:"Add",remove:"Remove",up:"Up",down:"Down"},t.exports=e.default},d9h0:function(t,e,r){var n=r("NTmt"),o=(r("EGGr"),r("avBd"),r("YI9c"),r("iqFv"),r("+Dok")),a=r("zpUs"),i=r("gXA1"),u=(r("vGpM"),r("b055"),r("F4uB")),s=r("5/9A");function l(t){return"Struct"+u(t)}function c(t,e){return s(p,t,e)}function f(t){return o(t)||(t=a(t)?{}:{name:t}),t.hasOwnProperty("strict")||(t.strict=p.strict),t.hasOwnProperty("defaultProps")||(t.defaultProps={}),t}function p(t,e){var r=(e=f(e)).name,o=e.strict,a=e.defaultProps;var u=r||l(t);function s(e,r){if(s.is(e))return e;if(!(this instanceof s))return new s(e,r);for(var n in t)if(t.hasOwnProperty(n)){var o=e[n];void 0===o&&(o=a[n]),this[n]=i(t[n],o,null)}}return s.meta={kind:"struct",props:t,name:r,identity:!1,strict:o,defaultProps:a},s.displayName=u,s.is=function(t){return t instanceof s},s.update=function(t,e){return new s(n.update(t,e))},s.extend=function(t,e){return c([s].concat(t),e)},s}p.strict=!1,p.getOptions=f,p.getDefaultName=l,p.extend=c,t.exports=p},dnV1:function(t,e,r){"use strict";var n={circle:{className:"sk-circle",divCount:12},"cube-grid":{className:"sk-cube-grid",divCount:9},wave:{className:"sk-wave",divCount:5},"folding-cube":{className:"sk-folding-cube",divCount:4},"three-bounce":{className:"sk-three-bounce",divCount:3},"double-bounce":{className:"sk-double-bounce",divCount:2},"wandering-cubes":{className:"sk-wandering-cubes",divCount:2},"chasing-dots":{className:"sk-chasing-dots",divCount:2},"rotating-plane":{className:"sk-rotating-plane",divCount:1},pulse:{className:"sk-pulse",divCount:1},wordpress:{className:"sk-wordpress",divCount:1}},o={"ball-grid-beat":{divCount:9},"ball-grid-pulse":{divCount:9},"line-spin-fade-loader":{divCount:8},"ball-spin-fade-loader":{divCount:8},"ball-pulse-rise":{divCount:5},"line-scale":{divCount:5},"line-scale-pulse-out":{divCount:5},"line-scale-pulse-out-rapid":{divCount:5},pacman:{divCount:5},"line-scale-party":{divCount:4},"ball-triangle-path":{divCount:3},"ball-scale-multiple":{divCount:3},"ball-scale-ripple-multiple":{divCount:3},"ball-pulse-sync":{divCount:3},"ball-beat":{divCount:3},"ball-zig-zag":{divCount:2},"ball-zig-zag-deflect":{divCount:2},"ball-clip-rotate-pulse":{divCount:2},"ball-clip-rotate-multiple":{divCount:2},"ball-clip-rotate":{divCount:1},"ball-scale-ripple":{divCount:1},"triangle-skew-spin":{divCount:1}};t.exports={spinkitSpinners:n,loadersCssSpinners:o,allSpinners:(Object.assign||function(t){for(var e=1;arguments.length>e;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t})({},n,o)}},"ep+N":function(t,e,r){"use strict";e.__esModule=!0,e.getOptionsOfEnum=function(t){var e=t.meta.map;return Object.keys(e).map(function(t){return{value:t,text:e[t]}})},e.getTypeInfo=function(t){var e=t,r=!1,n=!1,o=void 0,i=void 0;for(;e;)if(o=e.meta.kind,a.default.Function.is(e.getValidationErrorMessage)&&(i=e.getValidationErrorMessage),"maybe"!==o){if("subtype"!==o)break;n=!0,e=e.meta.type}else r=!0,e=e.meta.type;var u=i?function(e,r,n){var o=a.default.validate(e,t,{path:r,context:n});if(!o.isValid()){for(var u=0,s=o.errors.length;s>u;u++)if(a.default.Function.is(o.errors[u].expected.getValidationErrorMessage))return o.errors[u].message;return i(e,r,n)}}:void 0;return{type:t,isMaybe:r,isSubtype:n,innerType:e,getValidationErrorMessage:u}},e.humanize=function(t){return function(t){return t.charAt(0).toUpperCase()+t.slice(1)}(function(t){return t.trim().replace(/([a-z\d])([A-Z]+)/g,"$1_$2").replace(/[-\s]+/g,"_").toLowerCase()}(t).replace(/_id$/,"").replace(/_/g," "))},e.merge=function(t,e){return o.mixin(o.mixin({},t),e,!0)},e.move=function(t,e,r){var n=t.splice(e,1)[0];return t.splice(r,0,n),t},e.getTypeFromUnion=function(t,e){if(u(t))return function t(e,r){var n=e.meta.kind;if("union"===n){var o=e.dispatch(r);return o}if("maybe"===n){var i=a.default.maybe(t(e.meta.type,r),e.meta.name);return i.getValidationErrorMessage=e.getValidationErrorMessage,i.getTcombFormFactory=e.getTcombFormFactory,i}if("subtype"===n){var u=a.default.subtype(t(e.meta.type,r),e.meta.predicate,e.meta.name);return u.getValidationErrorMessage=e.getValidationErrorMessage,u.getTcombFormFactory=e.getTcombFormFactory,u}}(t,e);return t},e.getBaseComponentOptions=s,e.getComponentOptions=l,e.isArraysShallowDiffers=function(t,e){if(t===e)return!1;var r=t.length;if(r!==e.length)return!0;var n=-1;for(;++n<r;)if(t[n]!==e[n])return!0;return!1};var n,o=r("RRLq"),a=(n=o)&&n.__esModule?n:{default:n};var i=function(){function t(e){!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,t),this.seed="tfid-"+e+"-",this.counter=0}return t.prototype.next=function(){return this.seed+this.counter++},t}();function u(t){var e=!0;t:for(;e;){var r=t;switch(e=!1,r.meta.kind){case"union":return!0;case"maybe":case"subtype":t=r.meta.type,e=!0;continue t;default:return!1}}}function s(t,e,r,n){if(a.default.Nil.is(t))return e;if(a.default.Function.is(t))return t(r);if(a.default.Array.is(t)&&u(n)){var o=function(t){for(var e=!0;e;){var r=t;if(e=!1,"union"===r.meta.kind)return r;t=r.meta.type,e=!0}}(n),i=o.dispatch(r);return l(t[function(t,e){for(var r=0,n=t.length;n>r;r++)if(t[r]===e)return r;return-1}(o.meta.types,i)],e,r,i)}return t}function l(t,e,r,n){var o=s(t,e,r,n);return a.default.Function.is(n.getTcombFormOptions)?n.getTcombFormOptions(o):o}e.UIDGenerator=i},fKeY:function(t,e,r){var n=r("N2jO");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},foPf:function(t,e,r){var n=r("ggqX"),o=r("+Dok");t.exports=n("Object",o)},fqnr:function(t,e,r){var n=r("NTmt"),o=(r("EGGr"),r("0M54"),r("vGpM")),a=r("Pq4a"),i=r("jaA8"),u=r("gXA1"),s=r("vHtj");function l(t){return"["+t.map(o).join(", ")+"]"}function c(t,e){var r=e||l(t),o=t.every(a);function c(e,r){if(o)return e;for(var n=!0,a=[],i=0,s=t.length;s>i;i++){var l=e[i],c=u(t[i],l,null);n=n&&l===c,a.push(c)}return n&&(a=e),a}return c.meta={kind:"tuple",types:t,name:e,identity:o},c.displayName=r,c.is=function(e){return i(e)&&e.length===t.length&&t.every(function(t,r){return s(e[r],t)})},c.update=function(t,e){return c(n.update(t,e))},c}c.getDefaultName=l,t.exports=c},"gVk+":function(t,e,r){},gXA1:function(t,e,r){var n=r("i0Gq");r("cWHx"),r("NTmt"),r("oj2M");t.exports=function(t,e,r){return n(t)?t.meta.identity||"object"!=typeof e||null===e?t(e,r):new t(e,r):e}},ggqX:function(t,e,r){r("NTmt"),r("J1ta"),r("0M54"),r("5WQK");t.exports=function(t,e){function r(t,e){return t}return r.meta={kind:"irreducible",name:t,predicate:e,identity:!0},r.displayName=t,r.is=e,r}},i0Gq:function(t,e,r){var n=r("0M54"),o=r("+Dok");t.exports=function(t){return n(t)&&o(t.meta)}},iF7n:function(t,e,r){"use strict";function n(t){return t&&t.__esModule?t:{default:t}}e.__esModule=!0,e.default=function(t){var e=t.label,r=t.breakpoints,n=t.htmlFor,i=t.id;if(e){var u=r?r.getLabelClassName():{};return u["control-label"]=!0,o.default.createElement("label",{htmlFor:n,id:i,className:a.default(u)},e)}};var o=n(r("q1tI")),a=n(r("TSYQ"));t.exports=e.default},iqFv:function(t,e){t.exports=function(t){return!0===t||!1===t}},jLcX:function(t,e){t.exports=function(t){return"number"==typeof t&&isFinite(t)&&!isNaN(t)}},jaA8:function(t,e){t.exports=function(t){return Array.isArray?Array.isArray(t):t instanceof Array}},jj1x:function(t,e,r){var n=r("qwaU");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},k0p1:function(t,e,r){},l260:function(t,e,r){var n=r("NTmt"),o=r("0M54"),a=r("i0Gq"),i=r("1VoI");t.exports=function(t){for(var e,r,u,s=1,l=arguments.length;l>s;)if(e=arguments[s],r=arguments[s+1],o(u=arguments[s+2])&&!a(u)?s+=3:(u=r,r=i.is,s+=2),e.is(t)&&r(t))return u(t);n.fail("Match error")}},l48M:function(t,e,r){},lXET:function(t,e,r){var n=r("i0Gq");function o(t){return n(t)&&"subtype"===t.meta.kind}t.exports=function(t){return{predicates:function t(e){return o(e)?[e.meta.predicate].concat(t(e.meta.type)):[]}(t),unrefinedType:function t(e){return o(e)?t(e.meta.type):e}(t)}}},lgOA:function(t,e,r){"use strict";e.__esModule=!0,e.default=function(t){var e=t.help;if(e)return a.default.createElement("span",{className:"help-block",id:t.attrs.id+"-tip"},e)};var n,o=r("q1tI"),a=(n=o)&&n.__esModule?n:{default:n};t.exports=e.default},mKLz:function(t,e,r){"use strict";e.__esModule=!0;var n=Object.assign||function(t){for(var e=1;arguments.length>e;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t};function o(t){return t&&t.__esModule?t:{default:t}}var a=o(r("q1tI")),i=o(r("rAY/")),u=o(r("TSYQ")),s=o(r("csEI")),l=o(r("iF7n")),c=o(r("y9rk")),f=o(r("lgOA")),p=o(r("vHpL")),d=i.default.struct({horizontal:i.default.maybe(s.default)},"DateConfig");function v(t){for(var e=[],r=1;t>=r;r++)e.push(r);return e}function m(t,e){for(var r=t+"",n=e-r.length,o=0;n>o;o++)r="0"+r;return r}function h(t,e){return a.default.createElement("option",{key:t,value:t+""},e)}var g=[h("","-")],y=g.concat(v(31).map(function(t){return h(t,m(t,2))})),b=g.concat(v(12).map(function(t){return h(t-1,m(t,2))}));e.default=function t(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};function r(t){t.config=r.getConfig(t),t.attrs=r.getAttrs(t);var e=t.config.horizontal?r.renderHorizontal(t):r.renderVertical(t);return r.renderFormGroup(e,t)}return r.getConfig=e.getConfig||function(t){return new d(t.config||{})},r.getAttrs=e.getAttrs||function(t){return i.default.mixin({},t.attrs)},r.renderLabel=e.renderLabel||function(t){return l.default({label:t.label,breakpoints:t.config.horizontal})},r.renderError=e.renderError||function(t){return c.default(t)},r.renderHelp=e.renderHelp||function(t){return f.default(t)},r.renderDate=e.renderDate||function(t){var e=t.value.map(function(t){return t||""}),r={D:a.default.createElement("li",{key:"D"},a.default.createElement("select",{disabled:t.disabled,className:"form-control",value:e[2],onChange:function(r){e[2]="-"===r.target.value?null:r.target.value,t.onChange(e)}},y)),M:a.default.createElement("li",{key:"M"},a.default.createElement("select",{disabled:t.disabled,className:"form-control",value:e[1],onChange:function(r){e[1]="-"===r.target.value?null:r.target.value,t.onChange(e)}},b)),YY:a.default.createElement("li",{key:"YY"},a.default.createElement("input",{type:"text",size:"5",disabled:t.disabled,className:"form-control",value:e[0],onChange:function(r){e[0]=""===r.target.value.trim()?null:r.target.value.trim(),t.onChange(e)}}))};return a.default.createElement("ul",{className:"nav nav-pills"},t.order.map(function(t){return r[t]}))},r.renderVertical=e.renderVertical||function(t){return[r.renderLabel(t),r.renderDate(t),r.renderError(t),r.renderHelp(t)]},r.renderHorizontal=e.renderHorizontal||function(t){var e=r.renderLabel(t),n=e?t.config.horizontal.getInputClassName():t.config.horizontal.getOffsetClassName();return[e,a.default.createElement("div",{className:u.default(n)},r.renderDate(t),r.renderError(t),r.renderHelp(t))]},r.renderFormGroup=e.renderFormGroup||p.default,r.clone=function(){return t(n({},e,arguments.length>0&&void 0!==arguments[0]?arguments[0]:{}))},r}(),t.exports=e.default},"n+pM":function(t,e,r){"use strict";Object.defineProperty(e,"__esModule",{value:!0});var n=Object.assign||function(t){for(var e=1;arguments.length>e;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},o=function(){function t(t,e){for(var r=0;e.length>r;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,n.key,n)}}return function(e,r,n){return r&&t(e.prototype,r),n&&t(e,n),e}}();function a(t){if(t.lengthComputable);}function i(t){console.log("The transfer is complete.")}function u(t){console.error("An error occurred while transferring the file.")}e.isURL=function(t){return/^(https?:\/\/)?((([a-z\d]([a-z\d-]*[a-z\d])*)\.)+[a-z]{2,}|((\d{1,3}\.){3}\d{1,3}))(\:\d+)?(\/[-a-z\d%@_.~+&:]*)*(\?[;&a-z\d%@_.,~+&:=-]*)?(\#[-a-z\d_]*)?$/i.test(t)},e.convertToSlug=function(t){return t.toLowerCase().replace(/ /g,"_").replace(/[^\w-]+/g,"")};e.ApiRequests=function(){function t(e,r){!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,t),this.token=r,this.username=e}return o(t,[{key:"doPost",value:function(t,e){return fetch(t,{method:"POST",redirect:"follow",credentials:"include",headers:new Headers(n({Authorization:"ApiKey "+this.username+":"+this.token},arguments.length>2&&void 0!==arguments[2]?arguments[2]:{})),body:e}).then(function(t){return t.json()})}},{key:"doDelete",value:function(t){return fetch(t,{method:"DELETE",redirect:"follow",credentials:"include",headers:n({Authorization:"ApiKey "+this.username+":"+this.token},arguments.length>1&&void 0!==arguments[1]?arguments[1]:{})}).then(function(t){return t.text()})}},{key:"doGet",value:function(t){return fetch(t,{method:"GET",redirect:"follow",credentials:"include",headers:n({Authorization:"ApiKey "+this.username+":"+this.token},arguments.length>1&&void 0!==arguments[1]?arguments[1]:{})}).then(function(t){return t.json()})}},{key:"uploadWithProgress",value:function(t,e,r){var n=arguments.length>3&&void 0!==arguments[3]?arguments[3]:a,o=arguments.length>4&&void 0!==arguments[4]?arguments[4]:i,s=arguments.length>5&&void 0!==arguments[5]?arguments[5]:u,l=new XMLHttpRequest;l.upload.addEventListener("progress",function(t){n(t)},!1),l.addEventListener("load",function(t){o(l)}),l.addEventListener("error",function(){s(l)}),l.onreadystatechange=function(){l.readyState==XMLHttpRequest.DONE&&r(l.responseText)},l.open("POST",t,!0),l.setRequestHeader("Cache-Control","no-cache"),l.setRequestHeader("Authorization","ApiKey "+this.username+":"+this.token),l.send(e)}}]),t}()},n5MW:function(t,e,r){"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.importInProgress=function(t){return{type:n.IMPORT_IN_PROGRESS,loading:t}},e.importsLoading=function(t){return{type:n.IMPORTS_LOADING,loading:t}},e.setImportList=function(t){return{type:n.SET_IMPORT_LIST,imports:t}},e.updateImports=function(t){return{type:n.UPDATE_IMPORT_LIST,imports:t}},e.resetImports=function(t){return{type:n.RESET_IMPORT_LIST,imports:t}},e.deleteImport=function(t){return{type:n.DELETE_IMPORT,import_obj:t}};var n=r("X4Nx")},nKEc:function(t,e,r){"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.imports=u,e.importsLoading=s,e.importInProgress=l;var n=r("X4Nx"),o=r("ANjH");function a(t){if(Array.isArray(t)){for(var e=0,r=Array(t.length);t.length>e;e++)r[e]=t[e];return r}return Array.from(t)}var i={imports:[],importsLoading:!1,importInProgress:!1};function u(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:i.imports,e=arguments[1];switch(e.type){case n.UPDATE_IMPORT_LIST:return[].concat(a(t),a(e.imports));case n.SET_IMPORT_LIST:return e.imports;case n.RESET_IMPORT_LIST:return i.imports;case n.DELETE_IMPORT:return t.filter(function(t){return!e.import_obj.id!==t.id});default:return t}}function s(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:i.importsLoading,e=arguments[1];switch(e.type){case n.IMPORTS_LOADING:return e.loading;default:return t}}function l(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:i.importInProgress,e=arguments[1];switch(e.type){case n.IMPORT_IN_PROGRESS:return e.loading;default:return t}}e.default=(0,o.combineReducers)({imports:u,importsLoading:s,importInProgress:l})},oj2M:function(t,e,r){var n=r("cWHx");function o(t,e){return"function"==typeof e?n(e):e}t.exports=function(t){try{return JSON.stringify(t,o,2)}catch(e){return t+""}}},pADC:function(t,e,r){"use strict";function n(t){return t&&t.__esModule?t:{default:t}}e.__esModule=!0;var o=n(r("4Eei")),a=n(r("OQ51")),i=n(r("d9Mc"));o.default.form.Form.templates=a.default,o.default.form.Form.i18n=i.default,e.default=o.default,t.exports=e.default},pdGt:function(t,e,r){var n=r("NTmt"),o=(r("EGGr"),r("0M54"),r("vGpM")),a=r("Pq4a"),i=(r("jaA8"),r("gXA1")),u=r("vHtj"),s=(r("5WQK"),r("O5ya")),l=r("zpUs");function c(t){return t.map(o).join(" | ")}function f(t,e){var r=e||c(t),o=t.every(a);function f(t,e){if(o)return t;var r=f.dispatch(t);return!r&&f.is(t)?t:i(r,t,e)}return f.meta={kind:"union",types:t,name:e,identity:o},f.displayName=r,f.is=function(e){return t.some(function(t){return u(e,t)})},f.dispatch=function(e){for(var r=0,n=t.length;n>r;r++){var o=t[r];if(s(o)){var a=o.dispatch(e);if(!l(a))return a}else if(u(e,o))return o}},f.update=function(t,e){return f(n.update(t,e))},f}f.getDefaultName=c,t.exports=f},q4eH:function(t,e,r){"use strict";e.__esModule=!0;var n=Object.assign||function(t){for(var e=1;arguments.length>e;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t};function o(t){return t&&t.__esModule?t:{default:t}}var a=o(r("q1tI")),i=o(r("TSYQ")),u=o(r("4Go9")),s=o(r("JHhY"));function l(t,e){var r=i.default(function(t){var e={};for(var r in t)t.hasOwnProperty(r)&&(e["col-"+r+"-"+t[r]]=!0);return e}(t));return a.default.createElement("div",{className:r},e)}e.default=function t(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};function r(t){var e=[];return t.help&&e.push(r.renderHelp(t)),t.error&&t.hasError&&e.push(r.renderError(t)),e=e.concat(t.items.map(function(e){return 0===e.buttons.length?r.renderRowWithoutButtons(e,t):r.renderRow(e,t)})),t.add&&e.push(r.renderAddButton(t)),r.renderFieldset(e,t)}return r.renderHelp=e.renderHelp||function(t){return u.default("info",t.help)},r.renderError=e.renderError||function(t){return u.default("danger",t.error)},r.renderRowWithoutButtons=e.renderRowWithoutButtons||function(t){return a.default.createElement("div",{className:"row",key:t.key},l({xs:12},t.input))},r.renderRowButton=e.renderRowButton||function(t){return a.default.createElement("button",{key:t.type,type:"button",className:"btn btn-default btn-"+t.type,onClick:t.click},t.label)},r.renderButtonGroup=e.renderButtonGroup||function(t){return a.default.createElement("div",{className:"btn-group"},t.map(r.renderRowButton))},r.renderRow=e.renderRow||function(t,e){return a.default.createElement("div",{className:"row"},l({sm:8,xs:6},t.input),l({sm:4,xs:6},r.renderButtonGroup(t.buttons,e)))},r.renderAddButton=e.renderAddButton||function(t){var e=t.add;return a.default.createElement("div",{className:"row"},a.default.createElement("div",{className:"col-lg-12"},a.default.createElement("div",{style:{marginBottom:"15px"}},a.default.createElement("button",{type:"button",className:"btn btn-default btn-"+e.type,onClick:e.click},e.label))))},r.renderFieldset=e.renderFieldset||s.default,r.clone=function(){return t(n({},e,arguments.length>0&&void 0!==arguments[0]?arguments[0]:{}))},r}(),t.exports=e.default},qNbZ:function(t,e,r){"use strict";!function(t){var e=function(){function t(t,e){for(var r=0;e.length>r;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,n.key,n)}}return function(e,r,n){return r&&t(e.prototype,r),n&&t(e,n),e}}();r("3bF+");var n=r("q1tI"),o=v(n),a=r("vDVn"),i=r("n5MW"),u=r("n+pM"),s=v(r("17x9")),l=r("/MKj"),c=v(r("1z8J")),f=r("i8i4"),p=r("NWmT"),d=v(r("pADC"));function v(t){return t&&t.__esModule?t:{default:t}}var m=Object.freeze({PENDING:"PENDING",IN_PROGRESS:"IN_PROGRESS",FINISHED:"FINISHED",FAILED:"FAILED"}),h=function(t){function r(t){!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,r);var e=function(t,e){if(!t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return!e||"object"!=typeof e&&"function"!=typeof e?t:e}(this,(r.__proto__||Object.getPrototypeOf(r)).call(this,t));e.getImports=function(){var t=e.props,r=t.urls,n=t.setImports,o=t.setImportsLoading;o(!0),e.requests.doGet(r.importsURL).then(function(t){n(t.objects),o(!1)})},e.getImportStatus=function(t){var r=e,n=e.props,o=n.setImportInProgress;e.requests.doGet(n.urls.importsURL+t).then(function(n){n.error?e.setState({status:m.FAILED,result:n.error},function(){return o(!1)}):e.setState({status:n.status,result:n.task_result},n.status!==m.FINISHED&&n.status!=m.FAILED?function(){setTimeout(function(){r.getImportStatus(t)},6e3)}:function(){return o(!1)})}).catch(function(t){r.setState({status:m.FAILED,result:t.message},function(){return o(!1)})})},e.importLayer=function(t){var r=e,n=e.props,o=n.urls,a=n.setImportInProgress;e.setState({status:m.PENDING,result:"Getting Layer Info"},function(){return a(!0)}),e.requests.doPost(o.importURL,JSON.stringify(t),{Accept:"application/json","Content-Type":"application/json"}).then(function(t){t.error?e.setState({status:m.FAILED,result:t.error},function(){return a(!1)}):e.setState({status:m.IN_PROGRESS,result:"Processing"},function(){return e.getImportStatus(t.id)})}).catch(function(t){r.setState({status:m.FAILED,result:t.message},function(){return a(!1)})})},e.onSubmit=function(t){t.preventDefault();var r=e.form.getValue();r&&e.importLayer({url:r.url,permissions:permissionsString("#permission_form","layers")})},e.state={status:m.PENDING,result:null};var n=e.props,o=n.username,a=n.token.split(" for ")[0];return e.requests=new u.ApiRequests(o,a),e}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function, not "+typeof e);t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,enumerable:!1,writable:!0,configurable:!0}}),e&&(Object.setPrototypeOf?Object.setPrototypeOf(t,e):t.__proto__=e)}(r,n.Component),e(r,[{key:"componentDidMount",value:function(){this.getImports()}},{key:"render",value:function(){var t=this,e=this.props,r=e.importInProgress;return o.default.createElement("div",null,o.default.createElement("div",{className:"importer-spinner"},(e.importsLoading||r)&&o.default.createElement(c.default,{className:"center",name:"three-bounce"})),o.default.createElement("form",{onSubmit:this.onSubmit},o.default.createElement(d.default.form.Form,{ref:function(e){return t.form=e},type:a.layerForm,options:a.formOptions}),o.default.createElement("div",{className:"form-group"},o.default.createElement("button",{disabled:r,type:"submit",className:"btn btn-primary"},"Import Layer"))),this.state.result&&o.default.createElement("div",{className:"alert alert-"+(this.state.status!=m.FAILED?"success":"danger")},this.state.result))}}]),r}();h.propTypes={urls:s.default.object.isRequired,username:s.default.string.isRequired,token:s.default.string.isRequired,setImportsLoading:s.default.func.isRequired,setImports:s.default.func.isRequired,setImportInProgress:s.default.func.isRequired,importsLoading:s.default.bool.isRequired,imports:s.default.array.isRequired,importInProgress:s.default.bool.isRequired};var g=(0,l.connect)(function(t){return{importsLoading:t.importsLoading,imports:t.imports,importInProgress:t.importInProgress}},function(t){return{setImportsLoading:function(e){return t((0,i.importsLoading)(e))},setImports:function(e){return t((0,i.setImportList)(e))},setImportInProgress:function(e){return t((0,i.importInProgress)(e))}}})(h);t.ArcGISImporterRenderer={show:function(t,e){(0,f.render)(o.default.createElement(l.Provider,{store:p.store},o.default.createElement(g,e)),document.getElementById(t))}}}(r("yLpj"))},qSQR:function(t,e,r){var n=r("l48M");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},qZaT:function(t,e,r){var n=r("JOeG");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},qd7R:function(t,e,r){},qwaU:function(t,e,r){},"rAY/":function(t,e,r){var n=r("NTmt");n.Any=r("1VoI"),n.Array=r("Nkhh"),n.Boolean=r("xQ3S"),n.Date=r("wJ7t"),n.Error=r("yoTv"),n.Function=r("YI9c"),n.Nil=r("7I/v"),n.Number=r("EjkC"),n.Integer=r("JfN4"),n.IntegerT=n.Integer,n.Object=r("foPf"),n.RegExp=r("xoZS"),n.String=r("avBd"),n.Type=r("V7pp"),n.TypeT=n.Type,n.Arr=n.Array,n.Bool=n.Boolean,n.Dat=n.Date,n.Err=n.Error,n.Func=n.Function,n.Num=n.Number,n.Obj=n.Object,n.Re=n.RegExp,n.Str=n.String,n.dict=r("b055"),n.declare=r("EoZQ"),n.enums=r("CZBd"),n.irreducible=r("ggqX"),n.list=r("DCK+"),n.maybe=r("XFaX"),n.refinement=r("NSHF"),n.struct=r("d9h0"),n.tuple=r("fqnr"),n.union=r("pdGt"),n.func=r("L6ir"),n.intersection=r("Ofox"),n.subtype=n.refinement,n.inter=r("V7NQ"),n.interface=n.inter,n.assert=n,n.update=r("GeYz"),n.mixin=r("GUwf"),n.isType=r("i0Gq"),n.is=r("vHtj"),n.getTypeName=r("vGpM"),n.match=r("l260"),t.exports=n},uTZF:function(t,e,r){var n=r("/Dqh");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},ucTV:function(t,e,r){var n=r("gVk+");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},vDVn:function(t,e,r){"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.formOptions=e.layerForm=void 0;var n=i(r("q1tI")),o=r("n+pM"),a=i(r("pADC"));function i(t){return t&&t.__esModule?t:{default:t}}var u=a.default.refinement(a.default.String,function(t){return(0,o.isURL)(t)});e.layerForm=a.default.struct({url:u}),e.formOptions={fields:{url:{label:n.default.createElement("i",null,"Layer URL"),placeholder:"Enter Your Layer URL",help:"Esri Feature Layer URL Example: https://xxx/ArcGIS/rest/services/xxx/xxx/MapServer/0"}}}},vGpM:function(t,e,r){var n=r("i0Gq"),o=r("cWHx");t.exports=function(t){return n(t)?t.displayName:o(t)}},vHpL:function(t,e,r){"use strict";function n(t){return t&&t.__esModule?t:{default:t}}e.__esModule=!0,e.default=function(t,e){var r=e.path,n=e.hasError,i="form-group-depth-"+r.length;r.length>0&&(i+=" form-group-"+r.join("-"));return o.default.createElement.apply(null,[a.default,{className:i,hasError:n}].concat(t))};var o=n(r("q1tI")),a=n(r("c6Rl"));t.exports=e.default},vHtj:function(t,e,r){var n=r("i0Gq");t.exports=function(t,e){return n(e)?e.is(t):t instanceof e}},"ve+q":function(t,e,r){},wGuA:function(t,e,r){"use strict";e.__esModule=!0;var n=Object.assign||function(t){for(var e=1;arguments.length>e;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t};function o(t){return t&&t.__esModule?t:{default:t}}var a=o(r("q1tI")),i=o(r("rAY/")),u=o(r("TSYQ")),s=o(r("csEI")),l=o(r("iF7n")),c=o(r("y9rk")),f=o(r("lgOA")),p=o(r("vHpL")),d=i.default.struct({addonBefore:i.default.Any,addonAfter:i.default.Any,horizontal:i.default.maybe(s.default),buttonBefore:i.default.Any,buttonAfter:i.default.Any},"TextboxConfig");function v(t){return a.default.createElement("div",{className:"input-group-btn"},t)}function m(t){return a.default.createElement("span",{className:"input-group-addon"},t)}e.default=function t(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};function r(t){if(t.config=r.getConfig(t),t.attrs=r.getAttrs(t),"hidden"===t.type)return r.renderHiddenTextbox(t);var e=t.config.horizontal?r.renderHorizontal(t):r.renderVertical(t);return r.renderFormGroup(e,t)}return r.getConfig=e.getConfig||function(t){return new d(t.config||{})},r.getAttrs=e.getAttrs||function(t){var e=i.default.mixin({},t.attrs);return e.type=t.type,e.className=u.default(e.className),e.className+=(e.className?" ":"")+"form-control",e.disabled=t.disabled,"file"!==t.type&&(e.value=t.value),e.onChange="file"===t.type?function(e){return t.onChange(e.target.files[0])}:function(e){return t.onChange(e.target.value)},t.help&&(e["aria-describedby"]=e["aria-describedby"]||e.id+"-tip"),e},r.renderHiddenTextbox=e.renderHiddenTextbox||function(t){return a.default.createElement("input",{type:"hidden",value:t.value,name:t.attrs.name})},r.renderStatic=e.renderStatic||function(t){return a.default.createElement("p",{className:"form-control-static"},t.value)},r.renderTextbox=e.renderTextbox||function(t){if("static"===t.type)return r.renderStatic(t);var e="textarea"!==t.type?r.renderInput(t):r.renderTextarea(t);return(t.config.addonBefore||t.config.addonAfter||t.config.buttonBefore||t.config.buttonAfter)&&(e=r.renderInputGroup(e,t)),e},r.renderInputGroup=e.renderInputGroup||function(t,e){return r=[e.config.buttonBefore?v(e.config.buttonBefore):null,e.config.addonBefore?m(e.config.addonBefore):null,t,e.config.addonAfter?m(e.config.addonAfter):null,e.config.buttonAfter?v(e.config.buttonAfter):null],a.default.createElement.apply(null,["div",{className:"input-group"}].concat(r));var r},r.renderInput=e.renderInput||function(t){return a.default.createElement("input",t.attrs)},r.renderTextarea=e.renderTextarea||function(t){return a.default.createElement("textarea",t.attrs)},r.renderLabel=e.renderLabel||function(t){return l.default({label:t.label,htmlFor:t.attrs.id,breakpoints:t.config.horizontal})},r.renderError=e.renderError||function(t){return c.default(t)},r.renderHelp=e.renderHelp||function(t){return f.default(t)},r.renderVertical=e.renderVertical||function(t){return[r.renderLabel(t),r.renderTextbox(t),r.renderError(t),r.renderHelp(t)]},r.renderHorizontal=e.renderHorizontal||function(t){var e=r.renderLabel(t),n=e?t.config.horizontal.getInputClassName():t.config.horizontal.getOffsetClassName();return[e,a.default.createElement("div",{className:u.default(n)},r.renderTextbox(t),r.renderError(t),r.renderHelp(t))]},r.renderFormGroup=e.renderFormGroup||p.default,r.clone=function(){return t(n({},e,arguments.length>0&&void 0!==arguments[0]?arguments[0]:{}))},r}(),t.exports=e.default},wJ7t:function(t,e,r){var n=r("ggqX");t.exports=n("Date",function(t){return t instanceof Date})},xQ3S:function(t,e,r){var n=r("ggqX"),o=r("iqFv");t.exports=n("Boolean",o)},xoZS:function(t,e,r){var n=r("ggqX");t.exports=n("RegExp",function(t){return t instanceof RegExp})},y9rk:function(t,e,r){"use strict";e.__esModule=!0,e.default=function(t){var e=t.error;if(t.hasError&&e)return a.default.createElement("span",{className:"help-block error-block"},e)};var n,o=r("q1tI"),a=(n=o)&&n.__esModule?n:{default:n};t.exports=e.default},yFBk:function(t,e,r){"use strict";e.__esModule=!0;var n=Object.assign||function(t){for(var e=1;arguments.length>e;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t};function o(t){return t&&t.__esModule?t:{default:t}}var a=o(r("q1tI")),i=o(r("rAY/")),u=o(r("TSYQ")),s=o(r("csEI")),l=o(r("iF7n")),c=o(r("y9rk")),f=o(r("lgOA")),p=o(r("vHpL")),d=i.default.struct({horizontal:i.default.maybe(s.default)},"RadioConfig");e.default=function t(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};function r(t){t.config=r.getConfig(t);var e=t.config.horizontal?r.renderHorizontal(t):r.renderVertical(t);return r.renderFormGroup(e,t)}return r.getConfig=e.getConfig||function(t){return new d(t.config||{})},r.renderRadios=e.renderRadios||function(t){var e=t.attrs.id,r=function(e){return t.onChange(e.target.value)};return t.options.map(function(n,o){var s=i.default.mixin({},t.attrs);return s.type="radio",s.checked=n.value===t.value,s.disabled=t.disabled,s.value=n.value,s.autoFocus=s.autoFocus&&0===o,s.id=e+"_"+o,s["aria-describedby"]=s["aria-describedby"]||(t.label?e:null),s.onChange=r,function(t,e,r){var n=u.default({radio:!0,disabled:t.disabled});return a.default.createElement("div",{key:r,className:n},a.default.createElement("label",{htmlFor:t.id},a.default.createElement("input",t)," ",e))}(s,n.text,n.value)})},r.renderLabel=e.renderLabel||function(t){return l.default({label:t.label,htmlFor:t.attrs.id,breakpoints:t.config.horizontal})},r.renderError=e.renderError||function(t){return c.default(t)},r.renderHelp=e.renderHelp||function(t){return f.default(t)},r.renderVertical=e.renderVertical||function(t){return[r.renderLabel(t),r.renderRadios(t),r.renderError(t),r.renderHelp(t)]},r.renderHorizontal=e.renderHorizontal||function(t){var e=r.renderLabel(t),n=e?t.config.horizontal.getInputClassName():t.config.horizontal.getOffsetClassName();return[e,a.default.createElement("div",{className:u.default(n)},r.renderRadios(t),r.renderError(t),r.renderHelp(t))]},r.renderFormGroup=e.renderFormGroup||p.default,r.clone=function(){return t(n({},e,arguments.length>0&&void 0!==arguments[0]?arguments[0]:{}))},r}(),t.exports=e.default},yoTv:function(t,e,r){var n=r("ggqX");t.exports=n("Error",function(t){return t instanceof Error})},z2SR:function(t,e,r){},zpUs:function(t,e){t.exports=function(t){return null===t||void 0===t}}});
\ No newline at end of file
+!function(t){function e(e){for(var n,i,u=e[0],s=e[1],l=e[2],f=0,p=[];u.length>f;f++)Object.prototype.hasOwnProperty.call(o,i=u[f])&&o[i]&&p.push(o[i][0]),o[i]=0;for(n in s)Object.prototype.hasOwnProperty.call(s,n)&&(t[n]=s[n]);for(c&&c(e);p.length;)p.shift()();return a.push.apply(a,l||[]),r()}function r(){for(var t,e=0;a.length>e;e++){for(var r=a[e],n=!0,u=1;r.length>u;u++){0!==o[r[u]]&&(n=!1)}n&&(a.splice(e--,1),t=i(i.s=r[0]))}return t}var n={},o={1:0},a=[];function i(e){if(n[e])return n[e].exports;var r=n[e]={i:e,l:!1,exports:{}};return t[e].call(r.exports,r,r.exports,i),r.l=!0,r.exports}i.m=t,i.c=n,i.d=function(t,e,r){i.o(t,e)||Object.defineProperty(t,e,{enumerable:!0,get:r})},i.r=function(t){"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(t,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(t,"__esModule",{value:!0})},i.t=function(t,e){if(1&e&&(t=i(t)),8&e)return t;if(4&e&&"object"==typeof t&&t&&t.__esModule)return t;var r=Object.create(null);if(i.r(r),Object.defineProperty(r,"default",{enumerable:!0,value:t}),2&e&&"string"!=typeof t)for(var n in t)i.d(r,n,function(e){return t[e]}.bind(null,n));return r},i.n=function(t){var e=t&&t.__esModule?function(){return t.default}:function(){return t};return i.d(e,"a",e),e},i.o=function(t,e){return Object.prototype.hasOwnProperty.call(t,e)},i.p="/";var u=window.webpackJsonp=window.webpackJsonp||[],s=u.push.bind(u);u.push=e,u=u.slice();for(var l=0;u.length>l;l++)e(u[l]);var c=s;a.push(["qNbZ",0,2]),r()}({"+Dok":function(t,e,r){var n=r("zpUs"),o=r("jaA8");t.exports=function(t){return!n(t)&&"object"==typeof t&&!o(t)}},"/Dqh":function(t,e,r){},"/Se1":function(t,e){t.exports=function(t,e){for(var r in e)e.hasOwnProperty(r)&&(t[r]=e[r]);return t}},"0M54":function(t,e){t.exports=function(t){return"function"==typeof t}},"1VoI":function(t,e,r){var n=r("ggqX");t.exports=n("Any",function(){return!0})},"1z8J":function(t,e,r){"use strict";var n=Object.assign||function(t){for(var e=1;arguments.length>e;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},o=function(){function t(t,e){for(var r=0;e.length>r;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,n.key,n)}}return function(e,r,n){return r&&t(e.prototype,r),n&&t(e,n),e}}(),a=c(r("17x9")),i=c(r("q1tI")),u=c(r("TSYQ")),s=c(r("MgzW")),l=r("dnV1");function c(t){return t&&t.__esModule?t:{default:t}}function f(t,e,r){return e in t?Object.defineProperty(t,e,{value:r,enumerable:!0,configurable:!0,writable:!0}):t[e]=r,t}Object({NODE_ENV:"production"}).REACT_SPINKIT_NO_STYLES||(r("SnpG"),r("9xji"),r("4sg8"),r("2HEg"),r("4ei+"),r("jj1x"),r("BxbG"),r("uTZF"),r("5LqS"),r("qSQR"),r("5kE2"),r("ucTV"),r("fKeY"),r("99Y8"),r("qZaT"));var p="Deprecation Warning (react-spinkit): noFadeIn prop should be replaced with fadeIn='none'",d=function(t){function e(t){!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,e),t.noFadeIn&&console.warn(p);var r=function(t,e){if(!t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return!e||"object"!=typeof e&&"function"!=typeof e?t:e}(this,(e.__proto__||Object.getPrototypeOf(e)).call(this,t));return r.displayName="SpinKit",r}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function, not "+typeof e);t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,enumerable:!1,writable:!0,configurable:!0}}),e&&(Object.setPrototypeOf?Object.setPrototypeOf(t,e):t.__proto__=e)}(e,i.default.Component),o(e,[{key:"render",value:function(){var t,e=l.allSpinners[this.props.name]||l.allSpinners["three-bounce"],r=(0,u.default)((f(t={"sk-fade-in":"full"===this.props.fadeIn&&!this.props.noFadeIn,"sk-fade-in-half-second":"half"===this.props.fadeIn&&!this.props.noFadeIn,"sk-fade-in-quarter-second":"quarter"===this.props.fadeIn&&!this.props.noFadeIn,"sk-spinner":!this.props.overrideSpinnerClassName},this.props.overrideSpinnerClassName,!!this.props.overrideSpinnerClassName),f(t,this.props.className,!!this.props.className),f(t,e.className||this.props.name,!0),t)),o=(0,s.default)({},this.props);return delete o.name,delete o.fadeIn,delete o.noFadeIn,delete o.overrideSpinnerClassName,delete o.className,this.props.color&&(o.style=o.style?n({},o.style,{color:this.props.color}):{color:this.props.color}),i.default.createElement("div",n({},o,{className:r}),[].concat(function(t){if(Array.isArray(t)){for(var e=0,r=Array(t.length);t.length>e;e++)r[e]=t[e];return r}return Array.from(t)}(Array(e.divCount))).map(function(t,e){return i.default.createElement("div",{key:e})}))}}]),e}();d.propTypes={name:a.default.string.isRequired,noFadeIn:a.default.bool,fadeIn:a.default.oneOf(["full","half","quarter","none"]),overrideSpinnerClassName:a.default.string,className:a.default.string,color:a.default.string},d.defaultProps={name:"three-bounce",noFadeIn:!1,fadeIn:"full",overrideSpinnerClassName:""},t.exports=d},"2HEg":function(t,e,r){var n=r("PcrD");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},"2bqR":function(t,e,r){var n=r("i0Gq");t.exports=function(t){return n(t)&&"maybe"===t.meta.kind}},"3bF+":function(t,e,r){r("g2aq")},"4Eei":function(t,e,r){"use strict";var n,o=r("RRLq"),a=(n=o)&&n.__esModule?n:{default:n},i=function(t){if(t&&t.__esModule)return t;var e={};if(null!=t)for(var r in t)Object.prototype.hasOwnProperty.call(t,r)&&(e[r]=t[r]);return e.default=t,e}(r("OG1J"));a.default.form=i,a.default.form.File=a.default.irreducible("File",function(t){return t instanceof File}),t.exports=a.default},"4Go9":function(t,e,r){"use strict";e.__esModule=!0,e.default=function(t,e){return a.default.createElement("div",{className:"alert alert-"+t},e)};var n,o=r("q1tI"),a=(n=o)&&n.__esModule?n:{default:n};t.exports=e.default},"4ei+":function(t,e,r){var n=r("9eiu");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},"4sg8":function(t,e,r){var n=r("qd7R");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},"5/9A":function(t,e,r){r("NTmt"),r("0M54"),r("jaA8");var n=r("GUwf"),o=(r("O+2d"),r("Pa4o"),r("+Dok")),a=r("NSHF"),i=r("lXET");t.exports=function(t,e,r){var u={},s={},l=[],c={};e.forEach(function(t,e){var r,a=i(t),f=a.unrefinedType;Array.prototype.push.apply(l,a.predicates),n(u,o(r=f)?r:r.meta.props),n(s,f.prototype),n(c,function(t){return o(t)?null:t.meta.defaultProps}(f),!0)}),(r=t.getOptions(r)).defaultProps=n(c,r.defaultProps,!0);var f=function(t,e,r){var n=t.reduce(function(t,e){return a(t,e)},e);return r&&(n.displayName=r,n.meta.name=r),n}(l,t(u,{strict:r.strict,defaultProps:r.defaultProps}),r.name);return n(f.prototype,s),f}},"5LqS":function(t,e,r){var n=r("k0p1");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},"5WQK":function(t,e,r){var n=r("NTmt"),o=r("vGpM");t.exports=function(t,e){n(!(t instanceof e),function(){return"Cannot use the new operator to instantiate the type "+o(e)})}},"5kE2":function(t,e,r){var n=r("8eIi");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},"6q9x":function(t,e,r){"use strict";e.__esModule=!0;var n=Object.assign||function(t){for(var e=1;arguments.length>e;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t};function o(t){return t&&t.__esModule?t:{default:t}}var a=o(r("q1tI")),i=o(r("rAY/")),u=o(r("TSYQ")),s=o(r("csEI")),l=o(r("y9rk")),c=o(r("lgOA")),f=o(r("vHpL")),p=i.default.struct({horizontal:i.default.maybe(s.default)},"CheckboxConfig");e.default=function t(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};function r(t){t.config=r.getConfig(t);var e=t.config.horizontal?r.renderHorizontal(t):r.renderVertical(t);return r.renderFormGroup(e,t)}return r.getConfig=e.getConfig||function(t){return new p(t.config||{})},r.getAttrs=e.getAttrs||function(t){var e=i.default.mixin({},t.attrs);return e.type="checkbox",e.disabled=t.disabled,e.checked=t.value,e.onChange=function(e){return t.onChange(e.target.checked)},t.help&&(e["aria-describedby"]=e["aria-describedby"]||e.id+"-tip"),e},r.renderCheckbox=e.renderCheckbox||function(t){var e=r.getAttrs(t);return a.default.createElement("div",{className:u.default({checkbox:!0,disabled:e.disabled})},a.default.createElement("label",{htmlFor:e.id},a.default.createElement("input",e)," ",t.label))},r.renderError=e.renderError||function(t){return l.default(t)},r.renderHelp=e.renderHelp||function(t){return c.default(t)},r.renderVertical=e.renderVertical||function(t){return[r.renderCheckbox(t),r.renderError(t),r.renderHelp(t)]},r.renderHorizontal=e.renderHorizontal||function(t){var e=t.config.horizontal.getOffsetClassName();return a.default.createElement("div",{className:u.default(e)},r.renderCheckbox(t),r.renderError(t),r.renderHelp(t))},r.renderFormGroup=e.renderFormGroup||f.default,r.clone=function(){return t(n({},e,arguments.length>0&&void 0!==arguments[0]?arguments[0]:{}))},r}(),t.exports=e.default},"7I/v":function(t,e,r){var n=r("ggqX"),o=r("zpUs");t.exports=n("Nil",o)},"8eIi":function(t,e,r){},"8isp":function(t,e){t.exports=function(t){throw new TypeError("[tcomb] "+t)}},"99Y8":function(t,e,r){var n=r("LDv6");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},"9eiu":function(t,e,r){},"9tPo":function(t,e){t.exports=function(t){var e="undefined"!=typeof window&&window.location;if(!e)throw Error("fixUrls requires window.location");if(!t||"string"!=typeof t)return t;var r=e.protocol+"//"+e.host,n=r+e.pathname.replace(/\/[^\/]*$/,"/");return t.replace(/url\s*\(((?:[^)(]|\((?:[^)(]+|\([^)(]*\))*\))*)\)/gi,function(t,e){var o,a=e.trim().replace(/^"(.*)"$/,function(t,e){return e}).replace(/^'(.*)'$/,function(t,e){return e});return/^(#|data:|http:\/\/|https:\/\/|file:\/\/\/|\s*$)/i.test(a)?t:(o=0===a.indexOf("//")?a:0===a.indexOf("/")?r+a:n+a.replace(/^\.\//,""),"url("+JSON.stringify(o)+")")})}},"9xji":function(t,e,r){var n=r("z2SR");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},BxbG:function(t,e,r){var n=r("ve+q");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},CZBd:function(t,e,r){var n=r("NTmt"),o=(r("EGGr"),r("5WQK"),r("jLcX")),a=r("J1ta");r("+Dok");function i(t){return Object.keys(t).map(function(t){return n.stringify(t)}).join(" | ")}function u(t,e){var r=e||i(t);function n(t,e){return t}return n.meta={kind:"enums",map:t,name:e,identity:!0},n.displayName=r,n.is=function(e){return(a(e)||o(e))&&t.hasOwnProperty(e)},n}u.of=function(t,e){var r={};return(t=a(t)?t.split(" "):t).forEach(function(t){r[t]=t}),u(r,e)},u.getDefaultName=i,t.exports=u},"DCK+":function(t,e,r){var n=r("NTmt"),o=(r("EGGr"),r("0M54"),r("vGpM")),a=r("Pq4a"),i=r("gXA1"),u=r("vHtj"),s=r("jaA8");function l(t){return"Array<"+o(t)+">"}function c(t,e){var r=e||l(t),c=(o(t),a(t));function f(e,r){if(c)return e;for(var n=!0,o=[],a=0,u=e.length;u>a;a++){var s=e[a],l=i(t,s,null);n=n&&s===l,o.push(l)}return n&&(o=e),o}return f.meta={kind:"list",type:t,name:e,identity:c},f.displayName=r,f.is=function(e){return s(e)&&e.every(function(e){return u(e,t)})},f.update=function(t,e){return f(n.update(t,e))},f}c.getDefaultName=l,t.exports=c},EGGr:function(t,e,r){var n=r("zpUs"),o=r("J1ta");t.exports=function(t){return n(t)||o(t)}},EjkC:function(t,e,r){var n=r("ggqX"),o=r("jLcX");t.exports=n("Number",o)},EoZQ:function(t,e,r){r("NTmt"),r("EGGr"),r("i0Gq"),r("zpUs");var n=r("GUwf"),o=r("vGpM"),a=r("O5ya"),i=1;t.exports=function(t){var e;function r(t,r){return e(t,r)}return r.define=function(o){return a(o)&&r.hasOwnProperty("dispatch")&&(o.dispatch=r.dispatch),n(r,e=o,!0),t&&(e.displayName=r.displayName=t,r.meta.name=t),r.meta.identity=e.meta.identity,r.prototype=e.prototype,r},r.displayName=t||o(r)+"$"+i++,r.meta={identity:!1},r.prototype=null,r}},F4uB:function(t,e,r){var n=r("vGpM");t.exports=function(t){return"{"+Object.keys(t).map(function(e){return e+": "+n(t[e])}).join(", ")+"}"}},GUwf:function(t,e,r){var n=r("zpUs");r("NTmt");t.exports=function(t,e,r){if(n(e))return t;for(var o in e)e.hasOwnProperty(o)&&(t[o]=e[o]);return t}},GeYz:function(t,e,r){r("NTmt");var n=r("+Dok"),o=(r("0M54"),r("jaA8")),a=(r("jLcX"),r("/Se1"));function i(t){return n(t)?t instanceof Date||t instanceof RegExp?t:a({},t):o(t)?t.concat():t}function u(t){return l.commands.hasOwnProperty(t)}function s(t){return l.commands[t]}function l(t,e){var r,n=t,o=!1;for(var a in e)e.hasOwnProperty(a)&&(u(a)?(r=s(a)(e[a],n))!==t?(o=!0,n=r):n=t:(n===t&&(n=i(t)),r=l(n[a],e[a]),o=o||r!==n[a],n[a]=r));return o?n:t}l.commands={$apply:function(t,e){return t(e)},$push:function(t,e){return t.length>0?e.concat(t):e},$remove:function(t,e){if(t.length>0){e=i(e);for(var r=0,n=t.length;n>r;r++)delete e[t[r]]}return e},$set:function(t){return t},$splice:function(t,e){return t.length>0?(e=i(e),t.reduce(function(t,e){return t.splice.apply(t,e),t},e)):e},$swap:function(t,e){if(t.from!==t.to){var r=(e=i(e))[t.to];e[t.to]=e[t.from],e[t.from]=r}return e},$unshift:function(t,e){return t.length>0?t.concat(e):e},$merge:function(t,e){var r=!1,n=i(e);for(var o in t)t.hasOwnProperty(o)&&(n[o]=t[o],r=r||n[o]!==e[o]);return r?n:e}},t.exports=l},J1ta:function(t,e){t.exports=function(t){return"string"==typeof t}},JHhY:function(t,e,r){"use strict";function n(t){return t&&t.__esModule?t:{default:t}}e.__esModule=!0,e.default=function(t,e){var r=e.label?o.default.createElement("legend",null,e.label):null,n={className:function(t){var e=t.path.length,r="fieldset fieldset-depth-"+e;e>0&&(r+=" fieldset-"+t.path.join("-"));t.className&&(r+=" "+a.default(t.className));return r}(e),disabled:e.disabled};return o.default.createElement.apply(null,["fieldset",n,r].concat(t))};var o=n(r("q1tI")),a=n(r("TSYQ"));t.exports=e.default},JOeG:function(t,e,r){},JfN4:function(t,e,r){var n=r("NSHF"),o=r("EjkC");t.exports=n(o,function(t){return t%1==0},"Integer")},KthS:function(t,e,r){"use strict";e.__esModule=!0;var n=Object.assign||function(t){for(var e=1;arguments.length>e;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t};function o(t){return t&&t.__esModule?t:{default:t}}var a=o(r("4Go9")),i=o(r("JHhY"));e.default=function t(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};function r(t){var e=[];return t.help&&e.push(r.renderHelp(t)),t.error&&t.hasError&&e.push(r.renderError(t)),e=e.concat(t.order.map(function(e){return t.inputs[e]})),r.renderFieldset(e,t)}return r.renderHelp=e.renderHelp||function(t){return a.default("info",t.help)},r.renderError=e.renderError||function(t){return a.default("danger",t.error)},r.renderFieldset=e.renderFieldset||i.default,r.clone=function(){return t(n({},e,arguments.length>0&&void 0!==arguments[0]?arguments[0]:{}))},r}(),t.exports=e.default},L6ir:function(t,e,r){r("NTmt"),r("EGGr");var n=r("YI9c"),o=r("jaA8"),a=(r("DCK+"),r("+Dok")),i=r("gXA1"),u=(r("zpUs"),r("iqFv"),r("fqnr"),r("cWHx")),s=r("vGpM"),l=r("i0Gq");function c(t,e){return"("+t.map(s).join(", ")+") => "+s(e)}function f(t){return n.is(t)&&a(t.instrumentation)}function p(t){for(var e=t.length,r=!1,n=e-1;n>=0;n--){var o=t[n];if(!l(o)||"maybe"!==o.meta.kind)return n+1;r=!0}return r?0:e}function d(t,e,r){t=o(t)?t:[t];var n=r||c(t,e),a=t.length;p(t);function s(t,e){return f(t)?t:s.of(t)}return s.meta={kind:"func",domain:t,codomain:e,name:r,identity:!0},s.displayName=n,s.is=function(r){return f(r)&&r.instrumentation.domain.length===a&&r.instrumentation.domain.every(function(e,r){return e===t[r]})&&r.instrumentation.codomain===e},s.of=function(r,n){if(s.is(r))return r;function o(){var o=Array.prototype.slice.call(arguments),u=o.length;if(n&&a>u){0;var s=Function.prototype.bind.apply(r,[this].concat(o));return d(t.slice(u),e).of(s,!0)}return i(e,r.apply(this,o))}return o.instrumentation={domain:t,codomain:e,f:r},o.displayName=u(r),o},s}d.getDefaultName=c,d.getOptionalArgumentsIndex=p,t.exports=d},LDv6:function(t,e,r){},N2jO:function(t,e,r){},NSHF:function(t,e,r){var n=r("NTmt"),o=(r("EGGr"),r("0M54"),r("5WQK"),r("Pq4a")),a=r("gXA1"),i=r("vHtj"),u=r("vGpM"),s=r("cWHx");function l(t,e){return"{"+u(t)+" | "+s(e)+"}"}function c(t,e,r){var u=r||l(t,e),s=o(t);function c(e,r){return a(t,e,r)}return c.meta={kind:"subtype",type:t,predicate:e,name:r,identity:s},c.displayName=u,c.is=function(r){return i(r,t)&&e(r)},c.update=function(t,e){return c(n.update(t,e))},c}c.getDefaultName=l,t.exports=c},NTmt:function(t,e,r){var n=r("0M54"),o=r("zpUs"),a=r("8isp"),i=r("oj2M");function u(t,e){!0!==t&&(n(e)?e=e():o(e)&&(e='Assert failed (turn on "Pause on exceptions" in your Source panel)'),u.fail(e))}u.fail=a,u.stringify=i,t.exports=u},NWmT:function(t,e,r){"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.store=void 0,e.storeWithInitial=function(t){return(0,n.configureStore)(t)};var n=r("X9qQ");e.store=(0,n.configureStore)()},Nkhh:function(t,e,r){var n=r("ggqX"),o=r("jaA8");t.exports=n("Array",o)},"O+2d":function(t,e,r){var n=r("i0Gq");t.exports=function(t){return n(t)&&"struct"===t.meta.kind}},O5ya:function(t,e,r){var n=r("i0Gq");t.exports=function(t){return n(t)&&"union"===t.meta.kind}},OG1J:function(t,e,r){"use strict";e.__esModule=!0;var n=function(){function t(t,e){for(var r=0;e.length>r;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,n.key,n)}}return function(e,r,n){return r&&t(e.prototype,r),n&&t(e,n),e}}();function o(t){return t&&t.__esModule?t:{default:t}}function a(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}function i(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function, not "+typeof e);t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,enumerable:!1,writable:!0,configurable:!0}}),e&&(Object.setPrototypeOf?Object.setPrototypeOf(t,e):t.__proto__=e)}var u=o(r("q1tI")),s=o(r("RRLq")),l=r("ep+N"),c=s.default.Nil,f="tcomb-form",p=Object.freeze({}),d=Object.freeze([]),v=function(){};function m(t,e){var r=!0;t:for(;r;){var n=t,o=e;if(r=!1,o.factory)return o.factory;if(n.getTcombFormFactory)return n.getTcombFormFactory(o);var a=s.default.getTypeName(n);switch(n.meta.kind){case"irreducible":return n===s.default.Boolean?O:n===s.default.Date?C:I;case"struct":case"interface":return S;case"list":return P;case"enums":return N;case"maybe":case"subtype":t=n.meta.type,e=o,r=!0,a=void 0;continue t;default:s.default.fail("["+f+"] unsupported kind "+n.meta.kind+" for type "+a)}}}function h(t,e){return t.text.localeCompare(e.text)}function g(t){return{asc:h,desc:function(t,e){return-h(t,e)}}[t]}e.getComponent=m;var y={template:function(t){return function(e){e.prototype.getTemplate=function(){return this.props.options.template||this.props.ctx.templates[t]}}},attrs:function(t){t.prototype.getAttrs=function(){var t=s.default.mixin({},this.props.options.attrs);return t.id=this.getId(),t.name=this.getName(),t}},templates:function(t){t.prototype.getTemplates=function(){return l.merge(this.props.ctx.templates,this.props.options.templates)}}};e.decorators=y;var b=function(t){function e(r){var n=this;a(this,e),t.call(this,r),this.onChange=function(t){n.setState({value:t,isPristine:!1},function(){n.props.onChange(t,n.props.ctx.path)})},this.typeInfo=l.getTypeInfo(r.type),this.state={isPristine:!0,hasError:!1,value:this.getTransformer().format(r.value)}}return i(e,t),n(e,null,[{key:"transformer",value:{format:function(t){return c.is(t)?null:t},parse:function(t){return t}},enumerable:!0}]),e.prototype.getTransformer=function(){return this.props.options.transformer||this.constructor.transformer},e.prototype.shouldComponentUpdate=function(t,e){var r=this.props,n=this.state;return e.value!==n.value||e.hasError!==n.hasError||t.options!==r.options||t.type!==r.type||l.isArraysShallowDiffers(!!t.ctx&&t.ctx.path,!!r.ctx&&r.ctx.path)},e.prototype.componentWillReceiveProps=function(t){t.type!==this.props.type&&(this.typeInfo=l.getTypeInfo(t.type));var e=this.getTransformer().format(t.value);this.setState({value:e})},e.prototype.getValidationOptions=function(){return{path:this.props.ctx.path,context:s.default.mixin(s.default.mixin({},this.props.context||this.props.ctx.context),{options:this.props.options})}},e.prototype.getValue=function(){return this.getTransformer().parse(this.state.value)},e.prototype.isValueNully=function(){return c.is(this.getValue())},e.prototype.removeErrors=function(){this.setState({hasError:!1})},e.prototype.validate=function(){var t=s.default.validate(this.getValue(),this.props.type,this.getValidationOptions());return this.setState({hasError:!t.isValid()}),t},e.prototype.getAuto=function(){return this.props.options.auto||this.props.ctx.auto},e.prototype.getI18n=function(){return this.props.options.i18n||this.props.ctx.i18n},e.prototype.getDefaultLabel=function(){var t=this.props.ctx.label;if(t)return t+(this.typeInfo.isMaybe?this.getI18n().optional:this.getI18n().required)},e.prototype.getLabel=function(){var t=this.props.options.label||this.props.options.legend;return c.is(t)&&"labels"===this.getAuto()&&(t=this.getDefaultLabel()),t},e.prototype.getError=function(){if(this.hasError()){var t=this.props.options.error||this.typeInfo.getValidationErrorMessage;if(s.default.Function.is(t)){var e=this.getValidationOptions(),r=e.path,n=e.context;return t(this.getValue(),r,n)}return t}},e.prototype.hasError=function(){return this.props.options.hasError||this.state.hasError},e.prototype.getConfig=function(){return l.merge(this.props.ctx.config,this.props.options.config)},e.prototype.getId=function(){var t=this.props.options.attrs||p;return t.id?t.id:(this.uid||(this.uid=this.props.ctx.uidGenerator.next()),this.uid)},e.prototype.getName=function(){return this.props.options.name||this.props.ctx.name||this.getId()},e.prototype.getLocals=function(){var t=this.props.options,e=this.state.value;return{typeInfo:this.typeInfo,path:this.props.ctx.path,isPristine:this.state.isPristine,error:this.getError(),hasError:this.hasError(),label:this.getLabel(),onChange:this.onChange,config:this.getConfig(),value:e,disabled:t.disabled,help:t.help,context:this.props.ctx.context}},e.prototype.render=function(){var t=this.getLocals();return this.getTemplate()(t)},e}(u.default.Component);function x(t){return s.default.String.is(t)&&""===t.trim()||c.is(t)?null:t}function E(t){var e=parseFloat(t);return t==e?e:x(t)}e.Component=b;var I=function(t){function e(){a(this,r),t.apply(this,arguments)}i(e,t),e.prototype.getTransformer=function(){var t=this.props.options;return t.transformer?t.transformer:this.typeInfo.innerType===s.default.Number?e.numberTransformer:e.transformer},e.prototype.getPlaceholder=function(){var t=(this.props.options.attrs||p).placeholder;return c.is(t)&&"placeholders"===this.getAuto()&&(t=this.getDefaultLabel()),t},e.prototype.getLocals=function(){var e=t.prototype.getLocals.call(this);return e.attrs=this.getAttrs(),e.attrs.placeholder=this.getPlaceholder(),e.type=this.props.options.type||"text",e},n(e,null,[{key:"transformer",value:{format:function(t){return c.is(t)?"":t},parse:x},enumerable:!0},{key:"numberTransformer",value:{format:function(t){return c.is(t)?"":t+""},parse:E},enumerable:!0}]);var r=e;return e=y.template("textbox")(e)||e,e=y.attrs(e)||e}(b);e.Textbox=I;var O=function(t){function e(){a(this,r),t.apply(this,arguments)}i(e,t),e.prototype.getLocals=function(){var e=t.prototype.getLocals.call(this);return e.attrs=this.getAttrs(),e.label=e.label||this.getDefaultLabel(),e},n(e,null,[{key:"transformer",value:{format:function(t){return!c.is(t)&&t},parse:function(t){return t}},enumerable:!0}]);var r=e;return e=y.template("checkbox")(e)||e,e=y.attrs(e)||e}(b);e.Checkbox=O;var N=function(t){function e(){a(this,r),t.apply(this,arguments)}i(e,t),e.prototype.getTransformer=function(){var t=this.props.options;return t.transformer?t.transformer:this.isMultiple()?e.multipleTransformer:e.transformer(this.getNullOption())},e.prototype.getNullOption=function(){return this.props.options.nullOption||{value:"",text:"-"}},e.prototype.isMultiple=function(){return"list"===this.typeInfo.innerType.meta.kind},e.prototype.getEnum=function(){return this.isMultiple()?l.getTypeInfo(this.typeInfo.innerType.meta.type).innerType:this.typeInfo.innerType},e.prototype.getOptions=function(){var t=this.props.options,e=t.options?t.options.slice():l.getOptionsOfEnum(this.getEnum());t.order&&e.sort(g(t.order));var r=this.getNullOption();return this.isMultiple()||!1===t.nullOption||e.unshift(r),e},e.prototype.getLocals=function(){var e=t.prototype.getLocals.call(this);return e.attrs=this.getAttrs(),e.options=this.getOptions(),e.isMultiple=this.isMultiple(),e},n(e,null,[{key:"transformer",value:function(t){return{format:function(e){return c.is(e)&&t?t.value:e},parse:function(e){return t&&t.value===e?null:e}}},enumerable:!0},{key:"multipleTransformer",value:{format:function(t){return c.is(t)?d:t},parse:function(t){return t}},enumerable:!0}]);var r=e;return e=y.template("select")(e)||e,e=y.attrs(e)||e}(b);e.Select=N;var T=function(t){function e(){a(this,r),t.apply(this,arguments)}i(e,t),e.prototype.getOptions=function(){var t=this.props.options,e=t.options?t.options.slice():l.getOptionsOfEnum(this.typeInfo.innerType);return t.order&&e.sort(g(t.order)),e},e.prototype.getLocals=function(){var e=t.prototype.getLocals.call(this);return e.attrs=this.getAttrs(),e.options=this.getOptions(),e},n(e,null,[{key:"transformer",value:{format:function(t){return c.is(t)?null:t},parse:function(t){return t}},enumerable:!0}]);var r=e;return e=y.template("radio")(e)||e,e=y.attrs(e)||e}(b);e.Radio=T;var _=Object.freeze([null,null,null]),C=function(t){function e(){a(this,r),t.apply(this,arguments)}i(e,t),e.prototype.getOrder=function(){return this.props.options.order||["M","D","YY"]},e.prototype.getLocals=function(){var e=t.prototype.getLocals.call(this);return e.attrs=this.getAttrs(),e.order=this.getOrder(),e},n(e,null,[{key:"transformer",value:{format:function(t){return s.default.Array.is(t)?t:s.default.Date.is(t)?[t.getFullYear(),t.getMonth(),t.getDate()].map(String):_},parse:function(t){var e=t.map(E);return e.every(s.default.Number.is)?new Date(e[0],e[1],e[2]):e.every(c.is)?null:e}},enumerable:!0}]);var r=e;return e=y.template("date")(e)||e,e=y.attrs(e)||e}(b);e.Datetime=C;var k=function(t){function e(){var r=this;a(this,e),t.apply(this,arguments),this.childRefs={},this.setChildRefFor=function(t){return function(e){e?r.childRefs[t]=e:delete r.childRefs[t]}}}return i(e,t),e}(b),S=function(t){function e(){var e=this;a(this,r),t.apply(this,arguments),this.onChange=function(t,r,n,o){var a=s.default.mixin({},e.state.value);a[t]=r,e.setState({value:a,isPristine:!1},function(){e.props.onChange(a,n,o)})}}i(e,t),e.prototype.isValueNully=function(){var t=this;return Object.keys(this.childRefs).every(function(e){return t.childRefs[e].isValueNully()})},e.prototype.removeErrors=function(){var t=this;this.setState({hasError:!1}),Object.keys(this.childRefs).forEach(function(e){return t.childRefs[e].removeErrors()})},e.prototype.validate=function(){var t={},e=[],r=void 0;if(this.typeInfo.isMaybe&&this.isValueNully())return this.removeErrors(),new s.default.ValidationResult({errors:[],value:null});var n=this.getTypeProps();for(var o in n)this.childRefs.hasOwnProperty(o)&&(r=this.childRefs[o].validate(),e=e.concat(r.errors),t[o]=r.value);0===e.length&&(t=new(0,this.typeInfo.innerType)(t=this.getTransformer().parse(t)),this.typeInfo.isSubtype&&(e=(r=s.default.validate(t,this.props.type,this.getValidationOptions())).errors));return this.setState({hasError:e.length>0}),new s.default.ValidationResult({errors:e,value:t})},e.prototype.getTemplate=function(){return this.props.options.template||this.getTemplates().struct},e.prototype.getTypeProps=function(){return this.typeInfo.innerType.meta.props},e.prototype.getOrder=function(){return this.props.options.order||Object.keys(this.getTypeProps())},e.prototype.getInputs=function(){var t=this.props,e=t.options,r=t.ctx,n=this.getTypeProps(),o=this.getAuto(),a=this.getI18n(),i=this.getConfig(),s=this.getTemplates(),c=this.state.value,f={};for(var d in n)if(n.hasOwnProperty(d)){var v=n[d],h=c[d],g=l.getTypeFromUnion(v,h),y=l.getComponentOptions((e.fields||p)[d],p,h,v);f[d]=u.default.createElement(m(g,y),{key:d,ref:this.setChildRefFor(d),type:g,options:y,value:h,onChange:this.onChange.bind(this,d),ctx:{context:r.context,uidGenerator:r.uidGenerator,auto:o,config:i,name:r.name?r.name+"["+d+"]":d,label:l.humanize(d),i18n:a,templates:s,path:r.path.concat(d)}})}return f},e.prototype.getLocals=function(){var e=this.props.options,r=t.prototype.getLocals.call(this);return r.order=this.getOrder(),r.inputs=this.getInputs(),r.className=e.className,r},n(e,null,[{key:"transformer",value:{format:function(t){return c.is(t)?p:t},parse:function(t){return t}},enumerable:!0}]);var r=e;return e=y.templates(e)||e}(k);function w(t,e,r){if(t.length===e.length)return e;for(var n=[],o=0,a=t.length;a>o;o++)n[o]=e[o]||r.next();return n}e.Struct=S;var P=function(t){function e(e){var n=this;a(this,r),t.call(this,e),this.onChange=function(t,e,r,o){var a=w(t,e,n.props.ctx.uidGenerator);n.setState({value:t,keys:a,isPristine:!1},function(){n.props.onChange(t,r,o)})},this.addItem=function(){var t=n.state.value.concat(void 0),e=n.state.keys.concat(n.props.ctx.uidGenerator.next());n.onChange(t,e,n.props.ctx.path.concat(t.length-1),"add")},this.state.keys=this.state.value.map(function(){return e.ctx.uidGenerator.next()})}i(e,t),n(e,null,[{key:"transformer",value:{format:function(t){return c.is(t)?d:t},parse:function(t){return t}},enumerable:!0}]),e.prototype.componentWillReceiveProps=function(t){t.type!==this.props.type&&(this.typeInfo=l.getTypeInfo(t.type));var e=this.getTransformer().format(t.value);this.setState({value:e,keys:w(e,this.state.keys,t.ctx.uidGenerator)})},e.prototype.isValueNully=function(){return 0===this.state.value.length},e.prototype.removeErrors=function(){var t=this;this.setState({hasError:!1}),Object.keys(this.childRefs).forEach(function(e){return t.childRefs[e].removeErrors()})},e.prototype.validate=function(){var t=[],e=[],r=void 0;if(this.typeInfo.isMaybe&&this.isValueNully())return this.removeErrors(),new s.default.ValidationResult({errors:[],value:null});for(var n=0,o=this.state.value.length;o>n;n++)r=this.childRefs[n].validate(),e=e.concat(r.errors),t.push(r.value);return this.typeInfo.isSubtype&&0===e.length&&(t=this.getTransformer().parse(t),e=(r=s.default.validate(t,this.props.type,this.getValidationOptions())).errors),this.setState({hasError:e.length>0}),new s.default.ValidationResult({errors:e,value:t})},e.prototype.onItemChange=function(t,e,r,n){var o=this.state.value.slice();o[t]=e,this.onChange(o,this.state.keys,r,n)},e.prototype.removeItem=function(t){var e=this.state.value.slice();e.splice(t,1);var r=this.state.keys.slice();r.splice(t,1),this.onChange(e,r,this.props.ctx.path.concat(t),"remove")},e.prototype.moveUpItem=function(t){t>0&&this.onChange(l.move(this.state.value.slice(),t,t-1),l.move(this.state.keys.slice(),t,t-1),this.props.ctx.path.concat(t),"moveUp")},e.prototype.moveDownItem=function(t){this.state.value.length-1>t&&this.onChange(l.move(this.state.value.slice(),t,t+1),l.move(this.state.keys.slice(),t,t+1),this.props.ctx.path.concat(t),"moveDown")},e.prototype.getTemplate=function(){return this.props.options.template||this.getTemplates().list},e.prototype.getItems=function(){var t=this,e=this.props,r=e.options,n=e.ctx,o=this.getAuto(),a=this.getI18n(),i=this.getConfig(),s=this.getTemplates();return this.state.value.map(function(e,c){var f=t.typeInfo.innerType.meta.type,d=l.getTypeFromUnion(f,e),v=l.getComponentOptions(r.item,p,e,f),h=m(d,v),g=[];return r.disableRemove||g.push({type:"remove",label:a.remove,click:t.removeItem.bind(t,c)}),r.disableOrder||g.push({type:"move-up",label:a.up,click:t.moveUpItem.bind(t,c)}),r.disableOrder||g.push({type:"move-down",label:a.down,click:t.moveDownItem.bind(t,c)}),{input:u.default.createElement(h,{ref:t.setChildRefFor(c),type:d,options:v,value:e,onChange:t.onItemChange.bind(t,c),ctx:{context:n.context,uidGenerator:n.uidGenerator,auto:o,config:i,i18n:a,name:n.name?n.name+"["+c+"]":c+"",templates:s,path:n.path.concat(c)}}),key:t.state.keys[c],buttons:g}})},e.prototype.getLocals=function(){var e=this.props.options,r=this.getI18n(),n=t.prototype.getLocals.call(this);return n.add=e.disableAdd?null:{type:"add",label:r.add,click:this.addItem},n.items=this.getItems(),n.className=e.className,n};var r=e;return e=y.templates(e)||e}(k);e.List=P;var A=function(t){function e(){var r=this;a(this,e),t.apply(this,arguments),this.inputRef=null,this.setInputRef=function(t){r.inputRef=t}}return i(e,t),e.prototype.validate=function(){return this.inputRef.validate()},e.prototype.getValue=function(){var t=this.validate();return t.isValid()?t.value:null},e.prototype.getComponent=function(t){return(s.default.String.is(t)?t.split("."):t).reduce(function(t,e){return t.childRefs[e]},this.inputRef)},e.prototype.getSeed=function(){var t=this._reactInternalInstance;if(t){if(t._hostContainerInfo)return t._hostContainerInfo._idCounter;if(t._nativeContainerInfo)return t._nativeContainerInfo._idCounter;if(t._rootNodeID)return t._rootNodeID}return"0"},e.prototype.getUIDGenerator=function(){return this.uidGenerator=this.uidGenerator||new l.UIDGenerator(this.getSeed()),this.uidGenerator},e.prototype.render=function(){var t=e.i18n,r=e.templates;var n=this.props.value,o=l.getTypeFromUnion(this.props.type,n),a=l.getComponentOptions(this.props.options,p,n,this.props.type),i=this.getUIDGenerator();return u.default.createElement(m(o,a),{ref:this.setInputRef,type:o,options:a,value:n,onChange:this.props.onChange||v,ctx:this.props.ctx||{context:this.props.context,uidGenerator:i,auto:"labels",templates:r,i18n:t,path:[]}})},e}(u.default.Component);e.Form=A},OQ51:function(t,e,r){"use strict";function n(t){return t&&t.__esModule?t:{default:t}}e.__esModule=!0;var o=n(r("6q9x")),a=n(r("mKLz")),i=n(r("q4eH")),u=n(r("yFBk")),s=n(r("Vz4J")),l=n(r("KthS")),c=n(r("wGuA"));e.default={checkbox:o.default,date:a.default,list:i.default,radio:u.default,select:s.default,struct:l.default,textbox:c.default},t.exports=e.default},Ofox:function(t,e,r){var n=r("NTmt"),o=(r("EGGr"),r("0M54"),r("jaA8"),r("Pq4a"),r("vHtj")),a=r("vGpM"),i=r("Pq4a");function u(t){return t.map(a).join(" & ")}function s(t,e){var r=e||u(t),a=t.every(i);function s(t,e){return t}return s.meta={kind:"intersection",types:t,name:e,identity:a},s.displayName=r,s.is=function(e){return t.every(function(t){return o(e,t)})},s.update=function(t,e){return s(n.update(t,e))},s}s.getDefaultName=u,t.exports=s},Pa4o:function(t,e,r){var n=r("i0Gq");t.exports=function(t){return n(t)&&"interface"===t.meta.kind}},PcrD:function(t,e,r){},Pq4a:function(t,e,r){r("NTmt"),r("xQ3S");var n=r("i0Gq");r("vGpM");t.exports=function(t){return!n(t)||t.meta.identity}},RRLq:function(t,e,r){"use strict";var n=r("rAY/"),o=n.stringify,a={},i=n.struct({message:n.Any,actual:n.Any,expected:n.Any,path:n.list(n.union([n.String,n.Number]))},"ValidationError");function u(t,e,r,a){return n.Function.is(e.getValidationErrorMessage)?e.getValidationErrorMessage(t,r,a):function(t,e,r){var a=n.getTypeName(e),i=r.length?"/"+r.join("/")+": "+a:a;return"Invalid value "+o(t)+" supplied to "+i}(t,e,r)}i.of=function(t,e,r,n){return new i({message:u(t,e,r,n),actual:t,expected:e,path:r})};var s=n.struct({errors:n.list(i),value:n.Any},"ValidationResult");function l(t,e,r){var o=n.Array.is(r=r||{})?r:r.path||[];return new s(c(t,e,o,r))}function c(t,e,r,o){return n.isType(e)?f[e.meta.kind](t,e,r,o):f.es6classes(t,e,r,o)}s.prototype.isValid=function(){return!this.errors.length},s.prototype.firstError=function(){return this.isValid()?null:this.errors[0]},s.prototype.toString=function(){return this.isValid()?"[ValidationResult, true, "+o(this.value)+"]":"[ValidationResult, false, ("+this.errors.map(function(t){return o(t.message)}).join(", ")+")]"};var f=l.validators={};f.es6classes=function(t,e,r,n){return{value:t,errors:t instanceof e?[]:[i.of(t,e,r,n.context)]}},f.irreducible=f.enums=function(t,e,r,n){return{value:t,errors:e.is(t)?[]:[i.of(t,e,r,n.context)]}},f.list=function(t,e,r,o){if(!n.Array.is(t))return{value:t,errors:[i.of(t,e,r,o.context)]};for(var a={value:[],errors:[]},u=0,s=t.length;s>u;u++){var l=c(t[u],e.meta.type,r.concat(u),o);a.value[u]=l.value,a.errors=a.errors.concat(l.errors)}return a},f.subtype=function(t,e,r,n){var o=c(t,e.meta.type,r,n);return o.errors.length?o:(e.meta.predicate(o.value)||(o.errors=[i.of(t,e,r,n.context)]),o)},f.maybe=function(t,e,r,o){return n.Nil.is(t)?{value:t,errors:[]}:c(t,e.meta.type,r,o)},f.struct=function(t,e,r,o){if(!n.Object.is(t))return{value:t,errors:[i.of(t,e,r,o.context)]};if(e.is(t))return{value:t,errors:[]};var u={value:{},errors:[]},s=e.meta.props,l=e.meta.defaultProps||a;for(var f in s)if(s.hasOwnProperty(f)){var p=t[f];void 0===p&&(p=l[f]);var d=c(p,s[f],r.concat(f),o);u.value[f]=d.value,u.errors=u.errors.concat(d.errors)}if(o.hasOwnProperty("strict")?o.strict:e.meta.strict)for(var v in t)t.hasOwnProperty(v)&&!s.hasOwnProperty(v)&&u.errors.push(i.of(t[v],n.Nil,r.concat(v),o.context));return u.errors.length||(u.value=new e(u.value)),u},f.tuple=function(t,e,r,o){var a=e.meta.types,u=a.length;if(!n.Array.is(t)||t.length>u)return{value:t,errors:[i.of(t,e,r,o.context)]};for(var s={value:[],errors:[]},l=0;u>l;l++){var f=c(t[l],a[l],r.concat(l),o);s.value[l]=f.value,s.errors=s.errors.concat(f.errors)}return s},f.dict=function(t,e,r,o){if(!n.Object.is(t))return{value:t,errors:[i.of(t,e,r,o.context)]};var a={value:{},errors:[]};for(var u in t)if(t.hasOwnProperty(u)){var s=r.concat(u),l=c(u,e.meta.domain,s,o),f=c(t[u],e.meta.codomain,s,o);a.value[u]=f.value,a.errors=a.errors.concat(l.errors,f.errors)}return a},f.union=function(t,e,r,o){var a=e.dispatch(t);return n.Function.is(a)?c(t,a,r.concat(e.meta.types.indexOf(a)),o):{value:t,errors:[i.of(t,e,r,o.context)]}},f.intersection=function(t,e,r,n){for(var o=e.meta.types,a=o.length,u={value:t,errors:[]},s=0,l=0;a>l;l++){"struct"===o[l].meta.kind&&s++;var f=c(t,o[l],r,n);u.errors=u.errors.concat(f.errors)}return s>1&&u.errors.push(i.of(t,e,r,n.context)),u},f.interface=function(t,e,r,o){if(!n.Object.is(t))return{value:t,errors:[i.of(t,e,r,o.context)]};var a={value:{},errors:[]},u=e.meta.props;for(var s in u){var l=c(t[s],u[s],r.concat(s),o);a.value[s]=l.value,a.errors=a.errors.concat(l.errors)}if(o.hasOwnProperty("strict")?o.strict:e.meta.strict)for(var f in t)u.hasOwnProperty(f)||n.Nil.is(t[f])||a.errors.push(i.of(t[f],n.Nil,r.concat(f),o.context));return a},n.mixin(n,{ValidationError:i,ValidationResult:s,validate:l}),t.exports=n},SnpG:function(t,e,r){var n=r("c95b");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},TSYQ:function(t,e,r){var n;!function(){"use strict";var r={}.hasOwnProperty;function o(){for(var t=[],e=0;arguments.length>e;e++){var n=arguments[e];if(n){var a=typeof n;if("string"===a||"number"===a)t.push(n);else if(Array.isArray(n)){if(n.length){var i=o.apply(null,n);i&&t.push(i)}}else if("object"===a)if(n.toString===Object.prototype.toString)for(var u in n)r.call(n,u)&&n[u]&&t.push(u);else t.push(""+n)}}return t.join(" ")}t.exports?(o.default=o,t.exports=o):void 0===(n=function(){return o}.apply(e,[]))||(t.exports=n)}()},V7NQ:function(t,e,r){var n=r("NTmt"),o=(r("EGGr"),r("avBd"),r("YI9c"),r("iqFv"),r("+Dok")),a=r("zpUs"),i=r("gXA1"),u=(r("vGpM"),r("b055"),r("F4uB")),s=r("Pq4a"),l=r("vHtj"),c=r("5/9A"),f=r("/Se1");function p(t,e){return c(v,t,e)}function d(t){return o(t)||(t=a(t)?{}:{name:t}),t.hasOwnProperty("strict")||(t.strict=v.strict),t}function v(t,e){var r=(e=d(e)).name,o=e.strict;var c=r||u(t),v=Object.keys(t).map(function(e){return t[e]}).every(s);function m(e,r){if(v)return e;var n=!0,o=v?{}:f({},e);for(var a in t){var u=e[a],s=i(t[a],u,null);n=n&&u===s,o[a]=s}return n&&(o=e),o}return m.meta={kind:"interface",props:t,name:r,identity:v,strict:o},m.displayName=c,m.is=function(e){if(a(e))return!1;if(o)for(var r in e)if(!t.hasOwnProperty(r))return!1;for(var n in t)if(!l(e[n],t[n]))return!1;return!0},m.update=function(t,e){return m(n.update(t,e))},m.extend=function(t,e){return p([m].concat(t),e)},m}v.strict=!1,v.getOptions=d,v.getDefaultName=u,v.extend=p,t.exports=v},V7pp:function(t,e,r){var n=r("ggqX"),o=r("i0Gq");t.exports=n("Type",o)},Vz4J:function(t,e,r){"use strict";e.__esModule=!0;var n=Object.assign||function(t){for(var e=1;arguments.length>e;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t};function o(t){return t&&t.__esModule?t:{default:t}}var a=o(r("q1tI")),i=o(r("rAY/")),u=o(r("TSYQ")),s=o(r("csEI")),l=o(r("iF7n")),c=o(r("y9rk")),f=o(r("lgOA")),p=o(r("vHpL")),d=i.default.struct({horizontal:i.default.maybe(s.default)},"SelectConfig");function v(t){return a.default.createElement("option",{disabled:t.disabled,value:t.value,key:t.value},t.text)}e.default=function t(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};function r(t){t.config=r.getConfig(t),t.attrs=r.getAttrs(t);var e=t.config.horizontal?r.renderHorizontal(t):r.renderVertical(t);return r.renderFormGroup(e,t)}return r.getConfig=e.getConfig||function(t){return new d(t.config||{})},r.getAttrs=e.getAttrs||function(t){var e=i.default.mixin({},t.attrs);return e.className=u.default(e.className),e.className+=(e.className?" ":"")+"form-control",e.multiple=t.isMultiple,e.disabled=t.disabled,e.value=t.value,e.onChange=function(e){var r=t.isMultiple?Array.prototype.slice.call(e.target.options).filter(function(t){return t.selected}).map(function(t){return t.value}):e.target.value;t.onChange(r)},t.help&&(e["aria-describedby"]=e["aria-describedby"]||e.id+"-tip"),e},r.renderOptions=e.renderOptions||function(t){return t.options.map(function(t){return t.label?(r=(e=t).options.map(v),a.default.createElement("optgroup",{disabled:e.disabled,label:e.label,key:e.label},r)):v(t);var e,r})},r.renderSelect=e.renderSelect||function(t){return a.default.createElement("select",t.attrs,r.renderOptions(t))},r.renderLabel=e.renderLabel||function(t){return l.default({label:t.label,htmlFor:t.attrs.id,breakpoints:t.config.horizontal})},r.renderError=e.renderError||function(t){return c.default(t)},r.renderHelp=e.renderHelp||function(t){return f.default(t)},r.renderVertical=e.renderVertical||function(t){return[r.renderLabel(t),r.renderSelect(t),r.renderError(t),r.renderHelp(t)]},r.renderHorizontal=e.renderHorizontal||function(t){var e=r.renderLabel(t),n=e?t.config.horizontal.getInputClassName():t.config.horizontal.getOffsetClassName();return[e,a.default.createElement("div",{className:u.default(n)},r.renderSelect(t),r.renderError(t),r.renderHelp(t))]},r.renderFormGroup=e.renderFormGroup||p.default,r.clone=function(){return t(n({},e,arguments.length>0&&void 0!==arguments[0]?arguments[0]:{}))},r}(),t.exports=e.default},X4Nx:function(t,e,r){"use strict";Object.defineProperty(e,"__esModule",{value:!0});e.IMPORT_IN_PROGRESS="IMPORT_IN_PROGRESS",e.SET_IMPORT_LIST="SET_IMPORT_LIST",e.RESET_IMPORT_LIST="RESET_IMPORT_LIST",e.UPDATE_IMPORT_LIST="UPDATE_IMPORT_LIST",e.DELETE_IMPORT="DELETE_IMPORT",e.IMPORTS_LOADING="IMPORTS_LOADING"},X9qQ:function(t,e,r){"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.configureStore=function(t){return(0,n.createStore)(o.default,t,(0,n.applyMiddleware)(a.default))};var n=r("ANjH"),o=i(r("nKEc")),a=i(r("sINF"));function i(t){return t&&t.__esModule?t:{default:t}}},XFaX:function(t,e,r){r("NTmt"),r("EGGr"),r("0M54");var n=r("2bqR"),o=r("Pq4a"),a=r("1VoI"),i=r("gXA1"),u=r("7I/v"),s=(r("5WQK"),r("vHtj")),l=r("vGpM");function c(t){return"?"+l(t)}function f(t,e){if(n(t)||t===a||t===u)return t;var r=e||c(t),l=o(t);function f(e,r){return u.is(e)?e:i(t,e,r)}return f.meta={kind:"maybe",type:t,name:e,identity:l},f.displayName=r,f.is=function(e){return u.is(e)||s(e,t)},f}f.getDefaultName=c,t.exports=f},YI9c:function(t,e,r){var n=r("ggqX"),o=r("0M54");t.exports=n("Function",o)},"aET+":function(t,e,r){var n,o,a={},i=(n=function(){return window&&document&&document.all&&!window.atob},function(){return void 0===o&&(o=n.apply(this,arguments)),o}),u=function(t){var e={};return function(t,r){if("function"==typeof t)return t();if(void 0===e[t]){var n=function(t,e){return e?e.querySelector(t):document.querySelector(t)}(t,r);if(window.HTMLIFrameElement&&n instanceof window.HTMLIFrameElement)try{n=n.contentDocument.head}catch(t){n=null}e[t]=n}return e[t]}}(),s=null,l=0,c=[],f=r("9tPo");function p(t,e){for(var r=0;t.length>r;r++){var n=t[r],o=a[n.id];if(o){o.refs++;for(var i=0;o.parts.length>i;i++)o.parts[i](n.parts[i]);for(;n.parts.length>i;i++)o.parts.push(y(n.parts[i],e))}else{var u=[];for(i=0;n.parts.length>i;i++)u.push(y(n.parts[i],e));a[n.id]={id:n.id,refs:1,parts:u}}}}function d(t,e){for(var r=[],n={},o=0;t.length>o;o++){var a=t[o],i=e.base?a[0]+e.base:a[0],u={css:a[1],media:a[2],sourceMap:a[3]};n[i]?n[i].parts.push(u):r.push(n[i]={id:i,parts:[u]})}return r}function v(t,e){var r=u(t.insertInto);if(!r)throw Error("Couldn't find a style target. This probably means that the value for the 'insertInto' parameter is invalid.");var n=c[c.length-1];if("top"===t.insertAt)n?n.nextSibling?r.insertBefore(e,n.nextSibling):r.appendChild(e):r.insertBefore(e,r.firstChild),c.push(e);else if("bottom"===t.insertAt)r.appendChild(e);else{if("object"!=typeof t.insertAt||!t.insertAt.before)throw Error("[Style Loader]\n\n Invalid value for parameter 'insertAt' ('options.insertAt') found.\n Must be 'top', 'bottom', or Object.\n (https://github.com/webpack-contrib/style-loader#insertat)\n");var o=u(t.insertAt.before,r);r.insertBefore(e,o)}}function m(t){if(null===t.parentNode)return!1;t.parentNode.removeChild(t);var e=c.indexOf(t);0>e||c.splice(e,1)}function h(t){var e=document.createElement("style");if(void 0===t.attrs.type&&(t.attrs.type="text/css"),void 0===t.attrs.nonce){var n=function(){0;return r.nc}();n&&(t.attrs.nonce=n)}return g(e,t.attrs),v(t,e),e}function g(t,e){Object.keys(e).forEach(function(r){t.setAttribute(r,e[r])})}function y(t,e){var r,n,o,a;if(e.transform&&t.css){if(!(a="function"==typeof e.transform?e.transform(t.css):e.transform.default(t.css)))return function(){};t.css=a}if(e.singleton){var i=l++;r=s||(s=h(e)),n=E.bind(null,r,i,!1),o=E.bind(null,r,i,!0)}else t.sourceMap&&"function"==typeof URL&&"function"==typeof URL.createObjectURL&&"function"==typeof URL.revokeObjectURL&&"function"==typeof Blob&&"function"==typeof btoa?(r=function(t){var e=document.createElement("link");return void 0===t.attrs.type&&(t.attrs.type="text/css"),t.attrs.rel="stylesheet",g(e,t.attrs),v(t,e),e}(e),n=function(t,e,r){var n=r.css,o=r.sourceMap,a=void 0===e.convertToAbsoluteUrls&&o;(e.convertToAbsoluteUrls||a)&&(n=f(n));o&&(n+="\n/*# sourceMappingURL=data:application/json;base64,"+btoa(unescape(encodeURIComponent(JSON.stringify(o))))+" */");var i=new Blob([n],{type:"text/css"}),u=t.href;t.href=URL.createObjectURL(i),u&&URL.revokeObjectURL(u)}.bind(null,r,e),o=function(){m(r),r.href&&URL.revokeObjectURL(r.href)}):(r=h(e),n=function(t,e){var r=e.css,n=e.media;n&&t.setAttribute("media",n);if(t.styleSheet)t.styleSheet.cssText=r;else{for(;t.firstChild;)t.removeChild(t.firstChild);t.appendChild(document.createTextNode(r))}}.bind(null,r),o=function(){m(r)});return n(t),function(e){if(e){if(e.css===t.css&&e.media===t.media&&e.sourceMap===t.sourceMap)return;n(t=e)}else o()}}t.exports=function(t,e){if("undefined"!=typeof DEBUG&&DEBUG&&"object"!=typeof document)throw Error("The style-loader cannot be used in a non-browser environment");(e=e||{}).attrs="object"==typeof e.attrs?e.attrs:{},e.singleton||"boolean"==typeof e.singleton||(e.singleton=i()),e.insertInto||(e.insertInto="head"),e.insertAt||(e.insertAt="bottom");var r=d(t,e);return p(r,e),function(t){for(var n=[],o=0;r.length>o;o++){(i=a[r[o].id]).refs--,n.push(i)}t&&p(d(t,e),e);for(o=0;n.length>o;o++){var i;if(0===(i=n[o]).refs){for(var u=0;i.parts.length>u;u++)i.parts[u]();delete a[i.id]}}}};var b,x=(b=[],function(t,e){return b[t]=e,b.filter(Boolean).join("\n")});function E(t,e,r,n){var o=r?"":n.css;if(t.styleSheet)t.styleSheet.cssText=x(e,o);else{var a=document.createTextNode(o),i=t.childNodes;i[e]&&t.removeChild(i[e]),i.length?t.insertBefore(a,i[e]):t.appendChild(a)}}},avBd:function(t,e,r){var n=r("ggqX"),o=r("J1ta");t.exports=n("String",o)},b055:function(t,e,r){var n=r("NTmt"),o=(r("EGGr"),r("0M54"),r("vGpM")),a=r("Pq4a"),i=r("+Dok"),u=r("gXA1"),s=r("vHtj");function l(t,e){return"{[key: "+o(t)+"]: "+o(e)+"}"}function c(t,e,r){var c=r||l(t,e),f=(o(t),o(e),a(t)&&a(e));function p(r,n){if(f)return r;var o=!0,a={};for(var i in r)if(r.hasOwnProperty(i)){var s=r[i=u(t,i,null)],l=u(e,s,null);o=o&&s===l,a[i]=l}return o&&(a=r),a}return p.meta={kind:"dict",domain:t,codomain:e,name:r,identity:f},p.displayName=c,p.is=function(r){if(!i(r))return!1;for(var n in r)if(r.hasOwnProperty(n)&&(!s(n,t)||!s(r[n],e)))return!1;return!0},p.update=function(t,e){return p(n.update(t,e))},p}c.getDefaultName=l,t.exports=c},c6Rl:function(t,e,r){"use strict";function n(t){return t&&t.__esModule?t:{default:t}}e.__esModule=!0,e.default=function(t){var e={"form-group":!0,"has-error":t.hasError};t.className&&(e[t.className]=!0);return o.default.createElement("div",{className:a.default(e)},t.children)};var o=n(r("q1tI")),a=n(r("TSYQ"));t.exports=e.default},c95b:function(t,e,r){},cWHx:function(t,e){t.exports=function(t){return t.displayName||t.name||"<function"+t.length+">"}},csEI:function(t,e,r){"use strict";e.__esModule=!0;var n,o=r("rAY/"),a=(n=o)&&n.__esModule?n:{default:n},i=a.default.refinement(a.default.Number,function(t){return t%1==0&&t>=0},"Positive"),u=a.default.tuple([i,i],"Cols"),s=a.default.struct({xs:a.default.maybe(u),sm:a.default.maybe(u),md:a.default.maybe(u),lg:a.default.maybe(u)},"Breakpoints");function l(t){var e={};for(var r in t)t.hasOwnProperty(r)&&(e["col-"+r+"-"+t[r]]=!0);return e}s.prototype.getBreakpoints=function(t){var e={};for(var r in this)this.hasOwnProperty(r)&&!a.default.Nil.is(this[r])&&(e[r]=this[r][t]);return e},s.prototype.getLabelClassName=function(){return l(this.getBreakpoints(0))},s.prototype.getInputClassName=function(){return l(this.getBreakpoints(1))},s.prototype.getOffsetClassName=function(){return a.default.mixin(function(t){var e={};for(var r in t)t.hasOwnProperty(r)&&(e["col-"+r+"-offset-"+(12-t[r])]=!0);return e}(this.getBreakpoints(1)),l(this.getBreakpoints(1)))},e.default=s,t.exports=e.default},d9Mc:function(t,e,r){"use strict";e.__esModule=!0,e.default={optional:" (optional)",required:"",add:"Add",remove:"Remove",up:"Up",down:"Down"},t.exports=e.default},d9h0:function(t,e,r){var n=r("NTmt"),o=(r("EGGr"),r("avBd"),r("YI9c"),r("iqFv"),r("+Dok")),a=r("zpUs"),i=r("gXA1"),u=(r("vGpM"),r("b055"),r("F4uB")),s=r("5/9A");function l(t){return"Struct"+u(t)}function c(t,e){return s(p,t,e)}function f(t){return o(t)||(t=a(t)?{}:{name:t}),t.hasOwnProperty("strict")||(t.strict=p.strict),t.hasOwnProperty("defaultProps")||(t.defaultProps={}),t}function p(t,e){var r=(e=f(e)).name,o=e.strict,a=e.defaultProps;var u=r||l(t);function s(e,r){if(s.is(e))return e;if(!(this instanceof s))return new s(e,r);for(var n in t)if(t.hasOwnProperty(n)){var o=e[n];void 0===o&&(o=a[n]),this[n]=i(t[n],o,null)}}return s.meta={kind:"struct",props:t,name:r,identity:!1,strict:o,defaultProps:a},s.displayName=u,s.is=function(t){return t instanceof s},s.update=function(t,e){return new s(n.update(t,e))},s.extend=function(t,e){return c([s].concat(t),e)},s}p.strict=!1,p.getOptions=f,p.getDefaultName=l,p.extend=c,t.exports=p},dnV1:function(t,e,r){"use strict";var n={circle:{className:"sk-circle",divCount:12},"cube-grid":{className:"sk-cube-grid",divCount:9},wave:{className:"sk-wave",divCount:5},"folding-cube":{className:"sk-folding-cube",divCount:4},"three-bounce":{className:"sk-three-bounce",divCount:3},"double-bounce":{className:"sk-double-bounce",divCount:2},"wandering-cubes":{className:"sk-wandering-cubes",divCount:2},"chasing-dots":{className:"sk-chasing-dots",divCount:2},"rotating-plane":{className:"sk-rotating-plane",divCount:1},pulse:{className:"sk-pulse",divCount:1},wordpress:{className:"sk-wordpress",divCount:1}},o={"ball-grid-beat":{divCount:9},"ball-grid-pulse":{divCount:9},"line-spin-fade-loader":{divCount:8},"ball-spin-fade-loader":{divCount:8},"ball-pulse-rise":{divCount:5},"line-scale":{divCount:5},"line-scale-pulse-out":{divCount:5},"line-scale-pulse-out-rapid":{divCount:5},pacman:{divCount:5},"line-scale-party":{divCount:4},"ball-triangle-path":{divCount:3},"ball-scale-multiple":{divCount:3},"ball-scale-ripple-multiple":{divCount:3},"ball-pulse-sync":{divCount:3},"ball-beat":{divCount:3},"ball-zig-zag":{divCount:2},"ball-zig-zag-deflect":{divCount:2},"ball-clip-rotate-pulse":{divCount:2},"ball-clip-rotate-multiple":{divCount:2},"ball-clip-rotate":{divCount:1},"ball-scale-ripple":{divCount:1},"triangle-skew-spin":{divCount:1}};t.exports={spinkitSpinners:n,loadersCssSpinners:o,allSpinners:(Object.assign||function(t){for(var e=1;arguments.length>e;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t})({},n,o)}},"ep+N":function(t,e,r){"use strict";e.__esModule=!0,e.getOptionsOfEnum=function(t){var e=t.meta.map;return Object.keys(e).map(function(t){return{value:t,text:e[t]}})},e.getTypeInfo=function(t){var e=t,r=!1,n=!1,o=void 0,i=void 0;for(;e;)if(o=e.meta.kind,a.default.Function.is(e.getValidationErrorMessage)&&(i=e.getValidationErrorMessage),"maybe"!==o){if("subtype"!==o)break;n=!0,e=e.meta.type}else r=!0,e=e.meta.type;var u=i?function(e,r,n){var o=a.default.validate(e,t,{path:r,context:n});if(!o.isValid()){for(var u=0,s=o.errors.length;s>u;u++)if(a.default.Function.is(o.errors[u].expected.getValidationErrorMessage))return o.errors[u].message;return i(e,r,n)}}:void 0;return{type:t,isMaybe:r,isSubtype:n,innerType:e,getValidationErrorMessage:u}},e.humanize=function(t){return function(t){return t.charAt(0).toUpperCase()+t.slice(1)}(function(t){return t.trim().replace(/([a-z\d])([A-Z]+)/g,"$1_$2").replace(/[-\s]+/g,"_").toLowerCase()}(t).replace(/_id$/,"").replace(/_/g," "))},e.merge=function(t,e){return o.mixin(o.mixin({},t),e,!0)},e.move=function(t,e,r){var n=t.splice(e,1)[0];return t.splice(r,0,n),t},e.getTypeFromUnion=function(t,e){if(u(t))return function t(e,r){var n=e.meta.kind;if("union"===n){var o=e.dispatch(r);return o}if("maybe"===n){var i=a.default.maybe(t(e.meta.type,r),e.meta.name);return i.getValidationErrorMessage=e.getValidationErrorMessage,i.getTcombFormFactory=e.getTcombFormFactory,i}if("subtype"===n){var u=a.default.subtype(t(e.meta.type,r),e.meta.predicate,e.meta.name);return u.getValidationErrorMessage=e.getValidationErrorMessage,u.getTcombFormFactory=e.getTcombFormFactory,u}}(t,e);return t},e.getBaseComponentOptions=s,e.getComponentOptions=l,e.isArraysShallowDiffers=function(t,e){if(t===e)return!1;var r=t.length;if(r!==e.length)return!0;var n=-1;for(;++n<r;)if(t[n]!==e[n])return!0;return!1};var n,o=r("RRLq"),a=(n=o)&&n.__esModule?n:{default:n};var i=function(){function t(e){!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,t),this.seed="tfid-"+e+"-",this.counter=0}return t.prototype.next=function(){return this.seed+this.counter++},t}();function u(t){var e=!0;t:for(;e;){var r=t;switch(e=!1,r.meta.kind){case"union":return!0;case"maybe":case"subtype":t=r.meta.type,e=!0;continue t;default:return!1}}}function s(t,e,r,n){if(a.default.Nil.is(t))return e;if(a.default.Function.is(t))return t(r);if(a.default.Array.is(t)&&u(n)){var o=function(t){for(var e=!0;e;){var r=t;if(e=!1,"union"===r.meta.kind)return r;t=r.meta.type,e=!0}}(n),i=o.dispatch(r);return l(t[function(t,e){for(var r=0,n=t.length;n>r;r++)if(t[r]===e)return r;return-1}(o.meta.types,i)],e,r,i)}return t}function l(t,e,r,n){var o=s(t,e,r,n);return a.default.Function.is(n.getTcombFormOptions)?n.getTcombFormOptions(o):o}e.UIDGenerator=i},fKeY:function(t,e,r){var n=r("N2jO");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},foPf:function(t,e,r){var n=r("ggqX"),o=r("+Dok");t.exports=n("Object",o)},fqnr:function(t,e,r){var n=r("NTmt"),o=(r("EGGr"),r("0M54"),r("vGpM")),a=r("Pq4a"),i=r("jaA8"),u=r("gXA1"),s=r("vHtj");function l(t){return"["+t.map(o).join(", ")+"]"}function c(t,e){var r=e||l(t),o=t.every(a);function c(e,r){if(o)return e;for(var n=!0,a=[],i=0,s=t.length;s>i;i++){var l=e[i],c=u(t[i],l,null);n=n&&l===c,a.push(c)}return n&&(a=e),a}return c.meta={kind:"tuple",types:t,name:e,identity:o},c.displayName=r,c.is=function(e){return i(e)&&e.length===t.length&&t.every(function(t,r){return s(e[r],t)})},c.update=function(t,e){return c(n.update(t,e))},c}c.getDefaultName=l,t.exports=c},"gVk+":function(t,e,r){},gXA1:function(t,e,r){var n=r("i0Gq");r("cWHx"),r("NTmt"),r("oj2M");t.exports=function(t,e,r){return n(t)?t.meta.identity||"object"!=typeof e||null===e?t(e,r):new t(e,r):e}},ggqX:function(t,e,r){r("NTmt"),r("J1ta"),r("0M54"),r("5WQK");t.exports=function(t,e){function r(t,e){return t}return r.meta={kind:"irreducible",name:t,predicate:e,identity:!0},r.displayName=t,r.is=e,r}},i0Gq:function(t,e,r){var n=r("0M54"),o=r("+Dok");t.exports=function(t){return n(t)&&o(t.meta)}},iF7n:function(t,e,r){"use strict";function n(t){return t&&t.__esModule?t:{default:t}}e.__esModule=!0,e.default=function(t){var e=t.label,r=t.breakpoints,n=t.htmlFor,i=t.id;if(e){var u=r?r.getLabelClassName():{};return u["control-label"]=!0,o.default.createElement("label",{htmlFor:n,id:i,className:a.default(u)},e)}};var o=n(r("q1tI")),a=n(r("TSYQ"));t.exports=e.default},iqFv:function(t,e){t.exports=function(t){return!0===t||!1===t}},jLcX:function(t,e){t.exports=function(t){return"number"==typeof t&&isFinite(t)&&!isNaN(t)}},jaA8:function(t,e){t.exports=function(t){return Array.isArray?Array.isArray(t):t instanceof Array}},jj1x:function(t,e,r){var n=r("qwaU");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},k0p1:function(t,e,r){},l260:function(t,e,r){var n=r("NTmt"),o=r("0M54"),a=r("i0Gq"),i=r("1VoI");t.exports=function(t){for(var e,r,u,s=1,l=arguments.length;l>s;)if(e=arguments[s],r=arguments[s+1],o(u=arguments[s+2])&&!a(u)?s+=3:(u=r,r=i.is,s+=2),e.is(t)&&r(t))return u(t);n.fail("Match error")}},l48M:function(t,e,r){},lXET:function(t,e,r){var n=r("i0Gq");function o(t){return n(t)&&"subtype"===t.meta.kind}t.exports=function(t){return{predicates:function t(e){return o(e)?[e.meta.predicate].concat(t(e.meta.type)):[]}(t),unrefinedType:function t(e){return o(e)?t(e.meta.type):e}(t)}}},lgOA:function(t,e,r){"use strict";e.__esModule=!0,e.default=function(t){var e=t.help;if(e)return a.default.createElement("span",{className:"help-block",id:t.attrs.id+"-tip"},e)};var n,o=r("q1tI"),a=(n=o)&&n.__esModule?n:{default:n};t.exports=e.default},mKLz:function(t,e,r){"use strict";e.__esModule=!0;var n=Object.assign||function(t){for(var e=1;arguments.length>e;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t};function o(t){return t&&t.__esModule?t:{default:t}}var a=o(r("q1tI")),i=o(r("rAY/")),u=o(r("TSYQ")),s=o(r("csEI")),l=o(r("iF7n")),c=o(r("y9rk")),f=o(r("lgOA")),p=o(r("vHpL")),d=i.default.struct({horizontal:i.default.maybe(s.default)},"DateConfig");function v(t){for(var e=[],r=1;t>=r;r++)e.push(r);return e}function m(t,e){for(var r=t+"",n=e-r.length,o=0;n>o;o++)r="0"+r;return r}function h(t,e){return a.default.createElement("option",{key:t,value:t+""},e)}var g=[h("","-")],y=g.concat(v(31).map(function(t){return h(t,m(t,2))})),b=g.concat(v(12).map(function(t){return h(t-1,m(t,2))}));e.default=function t(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};function r(t){t.config=r.getConfig(t),t.attrs=r.getAttrs(t);var e=t.config.horizontal?r.renderHorizontal(t):r.renderVertical(t);return r.renderFormGroup(e,t)}return r.getConfig=e.getConfig||function(t){return new d(t.config||{})},r.getAttrs=e.getAttrs||function(t){return i.default.mixin({},t.attrs)},r.renderLabel=e.renderLabel||function(t){return l.default({label:t.label,breakpoints:t.config.horizontal})},r.renderError=e.renderError||function(t){return c.default(t)},r.renderHelp=e.renderHelp||function(t){return f.default(t)},r.renderDate=e.renderDate||function(t){var e=t.value.map(function(t){return t||""}),r={D:a.default.createElement("li",{key:"D"},a.default.createElement("select",{disabled:t.disabled,className:"form-control",value:e[2],onChange:function(r){e[2]="-"===r.target.value?null:r.target.value,t.onChange(e)}},y)),M:a.default.createElement("li",{key:"M"},a.default.createElement("select",{disabled:t.disabled,className:"form-control",value:e[1],onChange:function(r){e[1]="-"===r.target.value?null:r.target.value,t.onChange(e)}},b)),YY:a.default.createElement("li",{key:"YY"},a.default.createElement("input",{type:"text",size:"5",disabled:t.disabled,className:"form-control",value:e[0],onChange:function(r){e[0]=""===r.target.value.trim()?null:r.target.value.trim(),t.onChange(e)}}))};return a.default.createElement("ul",{className:"nav nav-pills"},t.order.map(function(t){return r[t]}))},r.renderVertical=e.renderVertical||function(t){return[r.renderLabel(t),r.renderDate(t),r.renderError(t),r.renderHelp(t)]},r.renderHorizontal=e.renderHorizontal||function(t){var e=r.renderLabel(t),n=e?t.config.horizontal.getInputClassName():t.config.horizontal.getOffsetClassName();return[e,a.default.createElement("div",{className:u.default(n)},r.renderDate(t),r.renderError(t),r.renderHelp(t))]},r.renderFormGroup=e.renderFormGroup||p.default,r.clone=function(){return t(n({},e,arguments.length>0&&void 0!==arguments[0]?arguments[0]:{}))},r}(),t.exports=e.default},"n+pM":function(t,e,r){"use strict";Object.defineProperty(e,"__esModule",{value:!0});var n=Object.assign||function(t){for(var e=1;arguments.length>e;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t},o=function(){function t(t,e){for(var r=0;e.length>r;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,n.key,n)}}return function(e,r,n){return r&&t(e.prototype,r),n&&t(e,n),e}}();function a(t){if(t.lengthComputable);}function i(t){console.log("The transfer is complete.")}function u(t){console.error("An error occurred while transferring the file.")}e.isURL=function(t){return/^(https?:\/\/)?((([a-z\d]([a-z\d-]*[a-z\d])*)\.)+[a-z]{2,}|((\d{1,3}\.){3}\d{1,3}))(\:\d+)?(\/[-a-z\d%@_.~+&:]*)*(\?[;&a-z\d%@_.,~+&:=-]*)?(\#[-a-z\d_]*)?$/i.test(t)},e.convertToSlug=function(t){return t.toLowerCase().replace(/ /g,"_").replace(/[^\w-]+/g,"")};e.ApiRequests=function(){function t(e,r){!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,t),this.token=r,this.username=e}return o(t,[{key:"doPost",value:function(t,e){return fetch(t,{method:"POST",redirect:"follow",credentials:"include",headers:new Headers(n({Authorization:"ApiKey "+this.username+":"+this.token},arguments.length>2&&void 0!==arguments[2]?arguments[2]:{})),body:e}).then(function(t){return t.json()})}},{key:"doDelete",value:function(t){return fetch(t,{method:"DELETE",redirect:"follow",credentials:"include",headers:n({Authorization:"ApiKey "+this.username+":"+this.token},arguments.length>1&&void 0!==arguments[1]?arguments[1]:{})}).then(function(t){return t.text()})}},{key:"doGet",value:function(t){return fetch(t,{method:"GET",redirect:"follow",credentials:"include",headers:n({Authorization:"ApiKey "+this.username+":"+this.token},arguments.length>1&&void 0!==arguments[1]?arguments[1]:{})}).then(function(t){return t.json()})}},{key:"uploadWithProgress",value:function(t,e,r){var n=arguments.length>3&&void 0!==arguments[3]?arguments[3]:a,o=arguments.length>4&&void 0!==arguments[4]?arguments[4]:i,s=arguments.length>5&&void 0!==arguments[5]?arguments[5]:u,l=new XMLHttpRequest;l.upload.addEventListener("progress",function(t){n(t)},!1),l.addEventListener("load",function(t){o(l)}),l.addEventListener("error",function(){s(l)}),l.onreadystatechange=function(){l.readyState==XMLHttpRequest.DONE&&r(l.responseText)},l.open("POST",t,!0),l.setRequestHeader("Cache-Control","no-cache"),l.setRequestHeader("Authorization","ApiKey "+this.username+":"+this.token),l.send(e)}}]),t}()},n5MW:function(t,e,r){"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.importInProgress=function(t){return{type:n.IMPORT_IN_PROGRESS,loading:t}},e.importsLoading=function(t){return{type:n.IMPORTS_LOADING,loading:t}},e.setImportList=function(t){return{type:n.SET_IMPORT_LIST,imports:t}},e.updateImports=function(t){return{type:n.UPDATE_IMPORT_LIST,imports:t}},e.resetImports=function(t){return{type:n.RESET_IMPORT_LIST,imports:t}},e.deleteImport=function(t){return{type:n.DELETE_IMPORT,import_obj:t}};var n=r("X4Nx")},nKEc:function(t,e,r){"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.imports=u,e.importsLoading=s,e.importInProgress=l;var n=r("X4Nx"),o=r("ANjH");function a(t){if(Array.isArray(t)){for(var e=0,r=Array(t.length);t.length>e;e++)r[e]=t[e];return r}return Array.from(t)}var i={imports:[],importsLoading:!1,importInProgress:!1};function u(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:i.imports,e=arguments[1];switch(e.type){case n.UPDATE_IMPORT_LIST:return[].concat(a(t),a(e.imports));case n.SET_IMPORT_LIST:return e.imports;case n.RESET_IMPORT_LIST:return i.imports;case n.DELETE_IMPORT:return t.filter(function(t){return!e.import_obj.id!==t.id});default:return t}}function s(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:i.importsLoading,e=arguments[1];switch(e.type){case n.IMPORTS_LOADING:return e.loading;default:return t}}function l(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:i.importInProgress,e=arguments[1];switch(e.type){case n.IMPORT_IN_PROGRESS:return e.loading;default:return t}}e.default=(0,o.combineReducers)({imports:u,importsLoading:s,importInProgress:l})},oj2M:function(t,e,r){var n=r("cWHx");function o(t,e){return"function"==typeof e?n(e):e}t.exports=function(t){try{return JSON.stringify(t,o,2)}catch(e){return t+""}}},pADC:function(t,e,r){"use strict";function n(t){return t&&t.__esModule?t:{default:t}}e.__esModule=!0;var o=n(r("4Eei")),a=n(r("OQ51")),i=n(r("d9Mc"));o.default.form.Form.templates=a.default,o.default.form.Form.i18n=i.default,e.default=o.default,t.exports=e.default},pdGt:function(t,e,r){var n=r("NTmt"),o=(r("EGGr"),r("0M54"),r("vGpM")),a=r("Pq4a"),i=(r("jaA8"),r("gXA1")),u=r("vHtj"),s=(r("5WQK"),r("O5ya")),l=r("zpUs");function c(t){return t.map(o).join(" | ")}function f(t,e){var r=e||c(t),o=t.every(a);function f(t,e){if(o)return t;var r=f.dispatch(t);return!r&&f.is(t)?t:i(r,t,e)}return f.meta={kind:"union",types:t,name:e,identity:o},f.displayName=r,f.is=function(e){return t.some(function(t){return u(e,t)})},f.dispatch=function(e){for(var r=0,n=t.length;n>r;r++){var o=t[r];if(s(o)){var a=o.dispatch(e);if(!l(a))return a}else if(u(e,o))return o}},f.update=function(t,e){return f(n.update(t,e))},f}f.getDefaultName=c,t.exports=f},q4eH:function(t,e,r){"use strict";e.__esModule=!0;var n=Object.assign||function(t){for(var e=1;arguments.length>e;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t};function o(t){return t&&t.__esModule?t:{default:t}}var a=o(r("q1tI")),i=o(r("TSYQ")),u=o(r("4Go9")),s=o(r("JHhY"));function l(t,e){var r=i.default(function(t){var e={};for(var r in t)t.hasOwnProperty(r)&&(e["col-"+r+"-"+t[r]]=!0);return e}(t));return a.default.createElement("div",{className:r},e)}e.default=function t(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};function r(t){var e=[];return t.help&&e.push(r.renderHelp(t)),t.error&&t.hasError&&e.push(r.renderError(t)),e=e.concat(t.items.map(function(e){return 0===e.buttons.length?r.renderRowWithoutButtons(e,t):r.renderRow(e,t)})),t.add&&e.push(r.renderAddButton(t)),r.renderFieldset(e,t)}return r.renderHelp=e.renderHelp||function(t){return u.default("info",t.help)},r.renderError=e.renderError||function(t){return u.default("danger",t.error)},r.renderRowWithoutButtons=e.renderRowWithoutButtons||function(t){return a.default.createElement("div",{className:"row",key:t.key},l({xs:12},t.input))},r.renderRowButton=e.renderRowButton||function(t){return a.default.createElement("button",{key:t.type,type:"button",className:"btn btn-default btn-"+t.type,onClick:t.click},t.label)},r.renderButtonGroup=e.renderButtonGroup||function(t){return a.default.createElement("div",{className:"btn-group"},t.map(r.renderRowButton))},r.renderRow=e.renderRow||function(t,e){return a.default.createElement("div",{className:"row"},l({sm:8,xs:6},t.input),l({sm:4,xs:6},r.renderButtonGroup(t.buttons,e)))},r.renderAddButton=e.renderAddButton||function(t){var e=t.add;return a.default.createElement("div",{className:"row"},a.default.createElement("div",{className:"col-lg-12"},a.default.createElement("div",{style:{marginBottom:"15px"}},a.default.createElement("button",{type:"button",className:"btn btn-default btn-"+e.type,onClick:e.click},e.label))))},r.renderFieldset=e.renderFieldset||s.default,r.clone=function(){return t(n({},e,arguments.length>0&&void 0!==arguments[0]?arguments[0]:{}))},r}(),t.exports=e.default},qNbZ:function(t,e,r){"use strict";!function(t){var e=function(){function t(t,e){for(var r=0;e.length>r;r++){var n=e[r];n.enumerable=n.enumerable||!1,n.configurable=!0,"value"in n&&(n.writable=!0),Object.defineProperty(t,n.key,n)}}return function(e,r,n){return r&&t(e.prototype,r),n&&t(e,n),e}}();r("3bF+");var n=r("q1tI"),o=v(n),a=r("vDVn"),i=r("n5MW"),u=r("n+pM"),s=v(r("17x9")),l=r("/MKj"),c=v(r("1z8J")),f=r("i8i4"),p=r("NWmT"),d=v(r("pADC"));function v(t){return t&&t.__esModule?t:{default:t}}var m=Object.freeze({PENDING:"PENDING",IN_PROGRESS:"IN_PROGRESS",FINISHED:"FINISHED",FAILED:"FAILED"}),h=function(t){function r(t){!function(t,e){if(!(t instanceof e))throw new TypeError("Cannot call a class as a function")}(this,r);var e=function(t,e){if(!t)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return!e||"object"!=typeof e&&"function"!=typeof e?t:e}(this,(r.__proto__||Object.getPrototypeOf(r)).call(this,t));e.getImports=function(){var t=e.props,r=t.urls,n=t.setImports,o=t.setImportsLoading;o(!0),e.requests.doGet(r.importsURL).then(function(t){n(t.objects),o(!1)})},e.setImportStatus=function(t){var r=e.props.setImportInProgress;return t.error?(e.setState({status:m.FAILED,result:t.error},function(){return r(!1)}),!0):t.status!==m.FINISHED&&t.status!=m.FAILED?(e.setState({status:t.status,result:t.task_result}),!1):(e.setState({status:t.status,result:t.task_result},function(){return r(!1)}),!0)},e.getImportStatus=function(t){window.EventSource?e.watchImportStatus(t):e.pollImportStatus(t,null)},e.watchImportStatus=function(t){var r=e.props.urls,n=new EventSource(r.importsStatusURL+t+"/events/"),o=null;n.onmessage=function(t){var r=JSON.parse(t.data);o=r.version,e.setImportStatus(r)&&n.close()},n.addEventListener("done",function(){return n.close()}),n.onerror=function(){n.readyState===EventSource.CLOSED&&e.props.importInProgress&&e.pollImportStatus(t,o)}},e.pollImportStatus=function(t,r){var n=e,o=e.props,a=o.urls,i=o.setImportInProgress,u=r?"?version="+r:"";e.requests.doGet(a.importsStatusURL+t+"/status/"+u).then(function(r){e.setImportStatus(r)||n.pollImportStatus(t,r.version)}).catch(function(t){n.setState({status:m.FAILED,result:t.message},function(){return i(!1)})})},e.importLayer=function(t){var r=e,n=e.props,o=n.urls,a=n.setImportInProgress;e.setState({status:m.PENDING,result:"Getting Layer Info"},function(){return a(!0)}),e.requests.doPost(o.importURL,JSON.stringify(t),{Accept:"application/json","Content-Type":"application/json"}).then(function(t){t.error?e.setState({status:m.FAILED,result:t.error},function(){return a(!1)}):e.setState({status:m.IN_PROGRESS,result:"Processing"},function(){return e.getImportStatus(t.id)})}).catch(function(t){r.setState({status:m.FAILED,result:t.message},function(){return a(!1)})})},e.onSubmit=function(t){t.preventDefault();var r=e.form.getValue();r&&e.importLayer({url:r.url,permissions:permissionsString("#permission_form","layers")})},e.state={status:m.PENDING,result:null};var n=e.props,o=n.username,a=n.token.split(" for ")[0];return e.requests=new u.ApiRequests(o,a),e}return function(t,e){if("function"!=typeof e&&null!==e)throw new TypeError("Super expression must either be null or a function, not "+typeof e);t.prototype=Object.create(e&&e.prototype,{constructor:{value:t,enumerable:!1,writable:!0,configurable:!0}}),e&&(Object.setPrototypeOf?Object.setPrototypeOf(t,e):t.__proto__=e)}(r,n.Component),e(r,[{key:"componentDidMount",value:function(){this.getImports()}},{key:"render",value:function(){var t=this,e=this.props,r=e.importInProgress;return o.default.createElement("div",null,o.default.createElement("div",{className:"importer-spinner"},(e.importsLoading||r)&&o.default.createElement(c.default,{className:"center",name:"three-bounce"})),o.default.createElement("form",{onSubmit:this.onSubmit},o.default.createElement(d.default.form.Form,{ref:function(e){return t.form=e},type:a.layerForm,options:a.formOptions}),o.default.createElement("div",{className:"form-group"},o.default.createElement("button",{disabled:r,type:"submit",className:"btn btn-primary"},"Import Layer"))),this.state.result&&o.default.createElement("div",{className:"alert alert-"+(this.state.status!=m.FAILED?"success":"danger")},this.state.result))}}]),r}();h.propTypes={urls:s.default.object.isRequired,username:s.default.string.isRequired,token:s.default.string.isRequired,setImportsLoading:s.default.func.isRequired,setImports:s.default.func.isRequired,setImportInProgress:s.default.func.isRequired,importsLoading:s.default.bool.isRequired,imports:s.default.array.isRequired,importInProgress:s.default.bool.isRequired};var g=(0,l.connect)(function(t){return{importsLoading:t.importsLoading,imports:t.imports,importInProgress:t.importInProgress}},function(t){return{setImportsLoading:function(e){return t((0,i.importsLoading)(e))},setImports:function(e){return t((0,i.setImportList)(e))},setImportInProgress:function(e){return t((0,i.importInProgress)(e))}}})(h);t.ArcGISImporterRenderer={show:function(t,e){(0,f.render)(o.default.createElement(l.Provider,{store:p.store},o.default.createElement(g,e)),document.getElementById(t))}}}(r("yLpj"))},qSQR:function(t,e,r){var n=r("l48M");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},qZaT:function(t,e,r){var n=r("JOeG");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},qd7R:function(t,e,r){},qwaU:function(t,e,r){},"rAY/":function(t,e,r){var n=r("NTmt");n.Any=r("1VoI"),n.Array=r("Nkhh"),n.Boolean=r("xQ3S"),n.Date=r("wJ7t"),n.Error=r("yoTv"),n.Function=r("YI9c"),n.Nil=r("7I/v"),n.Number=r("EjkC"),n.Integer=r("JfN4"),n.IntegerT=n.Integer,n.Object=r("foPf"),n.RegExp=r("xoZS"),n.String=r("avBd"),n.Type=r("V7pp"),n.TypeT=n.Type,n.Arr=n.Array,n.Bool=n.Boolean,n.Dat=n.Date,n.Err=n.Error,n.Func=n.Function,n.Num=n.Number,n.Obj=n.Object,n.Re=n.RegExp,n.Str=n.String,n.dict=r("b055"),n.declare=r("EoZQ"),n.enums=r("CZBd"),n.irreducible=r("ggqX"),n.list=r("DCK+"),n.maybe=r("XFaX"),n.refinement=r("NSHF"),n.struct=r("d9h0"),n.tuple=r("fqnr"),n.union=r("pdGt"),n.func=r("L6ir"),n.intersection=r("Ofox"),n.subtype=n.refinement,n.inter=r("V7NQ"),n.interface=n.inter,n.assert=n,n.update=r("GeYz"),n.mixin=r("GUwf"),n.isType=r("i0Gq"),n.is=r("vHtj"),n.getTypeName=r("vGpM"),n.match=r("l260"),t.exports=n},uTZF:function(t,e,r){var n=r("/Dqh");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},ucTV:function(t,e,r){var n=r("gVk+");"string"==typeof n&&(n=[[t.i,n,""]]);var o={hmr:!0,transform:void 0,insertInto:void 0};r("aET+")(n,o);n.locals&&(t.exports=n.locals)},vDVn:function(t,e,r){"use strict";Object.defineProperty(e,"__esModule",{value:!0}),e.formOptions=e.layerForm=void 0;var n=i(r("q1tI")),o=r("n+pM"),a=i(r("pADC"));function i(t){return t&&t.__esModule?t:{default:t}}var u=a.default.refinement(a.default.String,function(t){return(0,o.isURL)(t)});e.layerForm=a.default.struct({url:u}),e.formOptions={fields:{url:{label:n.default.createElement("i",null,"Layer URL"),placeholder:"Enter Your Layer URL",help:"Esri Feature Layer URL Example: https://xxx/ArcGIS/rest/services/xxx/xxx/MapServer/0"}}}},vGpM:function(t,e,r){var n=r("i0Gq"),o=r("cWHx");t.exports=function(t){return n(t)?t.displayName:o(t)}},vHpL:function(t,e,r){"use strict";function n(t){return t&&t.__esModule?t:{default:t}}e.__esModule=!0,e.default=function(t,e){var r=e.path,n=e.hasError,i="form-group-depth-"+r.length;r.length>0&&(i+=" form-group-"+r.join("-"));return o.default.createElement.apply(null,[a.default,{className:i,hasError:n}].concat(t))};var o=n(r("q1tI")),a=n(r("c6Rl"));t.exports=e.default},vHtj:function(t,e,r){var n=r("i0Gq");t.exports=function(t,e){return n(e)?e.is(t):t instanceof e}},"ve+q":function(t,e,r){},wGuA:function(t,e,r){"use strict";e.__esModule=!0;var n=Object.assign||function(t){for(var e=1;arguments.length>e;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t};function o(t){return t&&t.__esModule?t:{default:t}}var a=o(r("q1tI")),i=o(r("rAY/")),u=o(r("TSYQ")),s=o(r("csEI")),l=o(r("iF7n")),c=o(r("y9rk")),f=o(r("lgOA")),p=o(r("vHpL")),d=i.default.struct({addonBefore:i.default.Any,addonAfter:i.default.Any,horizontal:i.default.maybe(s.default),buttonBefore:i.default.Any,buttonAfter:i.default.Any},"TextboxConfig");function v(t){return a.default.createElement("div",{className:"input-group-btn"},t)}function m(t){return a.default.createElement("span",{className:"input-group-addon"},t)}e.default=function t(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};function r(t){if(t.config=r.getConfig(t),t.attrs=r.getAttrs(t),"hidden"===t.type)return r.renderHiddenTextbox(t);var e=t.config.horizontal?r.renderHorizontal(t):r.renderVertical(t);return r.renderFormGroup(e,t)}return r.getConfig=e.getConfig||function(t){return new d(t.config||{})},r.getAttrs=e.getAttrs||function(t){var e=i.default.mixin({},t.attrs);return e.type=t.type,e.className=u.default(e.className),e.className+=(e.className?" ":"")+"form-control",e.disabled=t.disabled,"file"!==t.type&&(e.value=t.value),e.onChange="file"===t.type?function(e){return t.onChange(e.target.files[0])}:function(e){return t.onChange(e.target.value)},t.help&&(e["aria-describedby"]=e["aria-describedby"]||e.id+"-tip"),e},r.renderHiddenTextbox=e.renderHiddenTextbox||function(t){return a.default.createElement("input",{type:"hidden",value:t.value,name:t.attrs.name})},r.renderStatic=e.renderStatic||function(t){return a.default.createElement("p",{className:"form-control-static"},t.value)},r.renderTextbox=e.renderTextbox||function(t){if("static"===t.type)return r.renderStatic(t);var e="textarea"!==t.type?r.renderInput(t):r.renderTextarea(t);return(t.config.addonBefore||t.config.addonAfter||t.config.buttonBefore||t.config.buttonAfter)&&(e=r.renderInputGroup(e,t)),e},r.renderInputGroup=e.renderInputGroup||function(t,e){return r=[e.config.buttonBefore?v(e.config.buttonBefore):null,e.config.addonBefore?m(e.config.addonBefore):null,t,e.config.addonAfter?m(e.config.addonAfter):null,e.config.buttonAfter?v(e.config.buttonAfter):null],a.default.createElement.apply(null,["div",{className:"input-group"}].concat(r));var r},r.renderInput=e.renderInput||function(t){return a.default.createElement("input",t.attrs)},r.renderTextarea=e.renderTextarea||function(t){return a.default.createElement("textarea",t.attrs)},r.renderLabel=e.renderLabel||function(t){return l.default({label:t.label,htmlFor:t.attrs.id,breakpoints:t.config.horizontal})},r.renderError=e.renderError||function(t){return c.default(t)},r.renderHelp=e.renderHelp||function(t){return f.default(t)},r.renderVertical=e.renderVertical||function(t){return[r.renderLabel(t),r.renderTextbox(t),r.renderError(t),r.renderHelp(t)]},r.renderHorizontal=e.renderHorizontal||function(t){var e=r.renderLabel(t),n=e?t.config.horizontal.getInputClassName():t.config.horizontal.getOffsetClassName();return[e,a.default.createElement("div",{className:u.default(n)},r.renderTextbox(t),r.renderError(t),r.renderHelp(t))]},r.renderFormGroup=e.renderFormGroup||p.default,r.clone=function(){return t(n({},e,arguments.length>0&&void 0!==arguments[0]?arguments[0]:{}))},r}(),t.exports=e.default},wJ7t:function(t,e,r){var n=r("ggqX");t.exports=n("Date",function(t){return t instanceof Date})},xQ3S:function(t,e,r){var n=r("ggqX"),o=r("iqFv");t.exports=n("Boolean",o)},xoZS:function(t,e,r){var n=r("ggqX");t.exports=n("RegExp",function(t){return t instanceof RegExp})},y9rk:function(t,e,r){"use strict";e.__esModule=!0,e.default=function(t){var e=t.error;if(t.hasError&&e)return a.default.createElement("span",{className:"help-block error-block"},e)};var n,o=r("q1tI"),a=(n=o)&&n.__esModule?n:{default:n};t.exports=e.default},yFBk:function(t,e,r){"use strict";e.__esModule=!0;var n=Object.assign||function(t){for(var e=1;arguments.length>e;e++){var r=arguments[e];for(var n in r)Object.prototype.hasOwnProperty.call(r,n)&&(t[n]=r[n])}return t};function o(t){return t&&t.__esModule?t:{default:t}}var a=o(r("q1tI")),i=o(r("rAY/")),u=o(r("TSYQ")),s=o(r("csEI")),l=o(r("iF7n")),c=o(r("y9rk")),f=o(r("lgOA")),p=o(r("vHpL")),d=i.default.struct({horizontal:i.default.maybe(s.default)},"RadioConfig");e.default=function t(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};function r(t){t.config=r.getConfig(t);var e=t.config.horizontal?r.renderHorizontal(t):r.renderVertical(t);return r.renderFormGroup(e,t)}return r.getConfig=e.getConfig||function(t){return new d(t.config||{})},r.renderRadios=e.renderRadios||function(t){var e=t.attrs.id,r=function(e){return t.onChange(e.target.value)};return t.options.map(function(n,o){var s=i.default.mixin({},t.attrs);return s.type="radio",s.checked=n.value===t.value,s.disabled=t.disabled,s.value=n.value,s.autoFocus=s.autoFocus&&0===o,s.id=e+"_"+o,s["aria-describedby"]=s["aria-describedby"]||(t.label?e:null),s.onChange=r,function(t,e,r){var n=u.default({radio:!0,disabled:t.disabled});return a.default.createElement("div",{key:r,className:n},a.default.createElement("label",{htmlFor:t.id},a.default.createElement("input",t)," ",e))}(s,n.text,n.value)})},r.renderLabel=e.renderLabel||function(t){return l.default({label:t.label,htmlFor:t.attrs.id,breakpoints:t.config.horizontal})},r.renderError=e.renderError||function(t){return c.default(t)},r.renderHelp=e.renderHelp||function(t){return f.default(t)},r.renderVertical=e.renderVertical||function(t){return[r.renderLabel(t),r.renderRadios(t),r.renderError(t),r.renderHelp(t)]},r.renderHorizontal=e.renderHorizontal||function(t){var e=r.renderLabel(t),n=e?t.config.horizontal.getInputClassName():t.config.horizontal.getOffsetClassName();return[e,a.default.createElement("div",{className:u.default(n)},r.renderRadios(t),r.renderError(t),r.renderHelp(t))]},r.renderFormGroup=e.renderFormGroup||p.default,r.clone=function(){return t(n({},e,arguments.length>0&&void 0!==arguments[0]?arguments[0]:{}))},r}(),t.exports=e.default},yoTv:function(t,e,r){var n=r("ggqX");t.exports=n("Error",function(t){return t instanceof Error})},z2SR:function(t,e,r){},zpUs:function(t,e){t.exports=function(t){return null===t||void 0===t}}});
\ No newline at end of file
@@ -47,21 +47,55 @@ class ArcGISImporter extends Component {
             setImportsLoading(false)
         })
     }
+    setImportStatus = (result) => {
+        // returns true when the import is done
+        const { setImportInProgress } = this.props
+        if (result.error) {
+            this.setState({ status: ImportStatus.FAILED, result: result.error }, () => setImportInProgress(false))
+            return true
+        }
+        if (result.status !== ImportStatus.FINISHED && result.status != ImportStatus.FAILED) {
+            this.setState({ status: result.status, result: result.task_result })
+            return false
+        }
+        this.setState({ status: result.status, result: result.task_result }, () => setImportInProgress(false))
+        return true
+    }
     getImportStatus = (id) => {
+        // status changes are pushed with server-sent events, long polling is the fallback
+        if (window.EventSource) {
+            this.watchImportStatus(id)
+        } else {
+            this.pollImportStatus(id, null)
+        }
+    }
+    watchImportStatus = (id) => {
+        const { urls } = this.props
+        const source = new EventSource(`${urls.importsStatusURL}${id}/events/`)
+        let lastVersion = null
+        source.onmessage = (event) => {
+            const result = JSON.parse(event.data)
+            lastVersion = result.version
+            if (this.setImportStatus(result)) {
+                source.close()
+            }
+        }
+        source.addEventListener('done', () => source.close())
+        source.onerror = () => {
+            // the stream ends every few seconds and the browser reconnects by itself,
+            // poll instead if it gave up
+            if (source.readyState === EventSource.CLOSED && this.props.importInProgress) {
+                this.pollImportStatus(id, lastVersion)
+            }
+        }
+    }
+    pollImportStatus = (id, version) => {
         let that = this
         const { urls, setImportInProgress } = this.props
-        this.requests.doGet(urls.importsURL + id).then(result => {
-            if (result.error) {
-                this.setState({ status: ImportStatus.FAILED, result: result.error }, () => setImportInProgress(false))
-            } else {
-                if (result.status !== ImportStatus.FINISHED && result.status != ImportStatus.FAILED) {
-                    this.setState({ status: result.status, result: result.task_result }, () => {
-                        setTimeout(function () { that.getImportStatus(id) }, 6000);
-                    })
-
-                } else {
-                    this.setState({ status: result.status, result: result.task_result }, () => setImportInProgress(false))
-                }
+        const versionParam = version ? `?version=${version}` : ''
+        this.requests.doGet(`${urls.importsStatusURL}${id}/status/${versionParam}`).then(result => {
+            if (!this.setImportStatus(result)) {
+                that.pollImportStatus(id, result.version)
             }
         }).catch((error) => {
             that.setState({ status: ImportStatus.FAILED, result: error.message }, () => setImportInProgress(false))
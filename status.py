@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+
+from .import_status import ImportStatus
+from .models import ArcGISLayerImport
+
+# columns returned by the status endpoints
+STATUS_FIELDS = ('id', 'status', 'task_result', 'stage', 'total_count', 'processed_count', 'created_count',
+                 'failed_count', 'bytes_transferred', 'rate', 'eta', 'started_at', 'finished_at', 'checkpoint',
+                 'updated_at')
+# longest wait of a long-poll request, clients ask again after it.
+# a waiting request holds a synchronous worker of the django server, size the server workers for the open pages
+STATUS_WAIT = getattr(settings, 'ARCGIS_IMPORTER_STATUS_WAIT', 25)
+# longest life of an events stream, it holds a worker too and browsers reconnect by themselves after it
+STATUS_EVENTS_WAIT = getattr(settings, 'ARCGIS_IMPORTER_STATUS_EVENTS_WAIT', 10)
+# seconds between two checks for a change while waiting
+STATUS_CHECK_INTERVAL = getattr(settings, 'ARCGIS_IMPORTER_STATUS_CHECK_INTERVAL', 0.5)
+DONE_STATUSES = (ImportStatus.FINISHED, ImportStatus.FAILED)
+
+
+def version_key(task_id):
+    return 'arcgis_importer:status:{}'.format(task_id)
+
+
+def to_version(updated_at):
+    # the version token of an import status is its updated_at in milliseconds
+    return str(int(updated_at.timestamp() * 1000)) if updated_at else '0'
+
+
+def publish_version(task):
+    # signal the waiting clients that the import changed, without querying the database
+    cache.set(version_key(task.id), to_version(task.updated_at), STATUS_WAIT * 4)
+
+
+def get_version(task_id):
+    # the cache is only a hint, it may not be shared with the workers (local memory cache)
+    version = cache.get(version_key(task_id))
+    if version is None:
+        updated_at = ArcGISLayerImport.objects.filter(id=task_id).values_list('updated_at', flat=True).first()
+        version = to_version(updated_at)
+    return version
+
+
+def get_status(task_id, user):
+    imports = ArcGISLayerImport.objects.filter(id=task_id)
+    if not user.is_superuser:
+        # users of requests attached to the import follow it too
+        imports = imports.filter(Q(user=user) | Q(followers=user)).distinct()
+    status = imports.values(*STATUS_FIELDS).first()
+    if status:
+        status['version'] = to_version(status['updated_at'])
+    return status
+
+
+def wait_for_change(task_id, version, timeout):
+    # block until the version of the import differs from version or timeout seconds passed
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if get_version(task_id) != version:
+            return True
+        time.sleep(STATUS_CHECK_INTERVAL)
+    return False
@@ -1,9 +1,19 @@
+import datetime
+import gzip
 import json
 import os
 import threading
+import time
+from functools import partial
 
+from celery import chord
 from celery.schedules import crontab
+from django.conf import settings
+from django.core import serializers
+from django.db import connection
+from django.utils import timezone
 from guardian.utils import get_anonymous_user
+from six.moves.urllib.parse import urlparse
 
 from cartoview.log_handler import get_logger
 
@@ -11,23 +21,58 @@ from geonode.celery_app import app
 from geonode.layers.models import Layer
 from geonode.security.views import _perms_info_json
 
-from .esri import EsriManager
+from osgeo_manager.config import LayerConfig
+
+from .esri import (FILTER_OPTIONS, IMPORT_OPTIONS, MAX_CONCURRENCY, MAX_SERVICE_CONCURRENCY, EsriManager,
+                   is_import_alive)
+from .locks import acquire_slot, advisory_lock, release_slot, source_lock_name
+from .import_status import ImportStatus
 from .models import ArcGISLayerImport, ImportedLayer
+from .progress import ProgressReporter
+from .services import get_service_layers
+from .session import create_session
+from .utils import iter_concurrently
 
 logger = get_logger(__name__)
 
+# limits of layers updated at the same time, per ArcGIS host and overall
+UPDATE_HOST_CONCURRENCY = getattr(settings, 'ARCGIS_IMPORTER_UPDATE_HOST_CONCURRENCY', 2)
+UPDATE_CONCURRENCY = getattr(settings, 'ARCGIS_IMPORTER_UPDATE_CONCURRENCY', 8)
+# seconds to wait before checking again for a free slot
+UPDATE_RETRY_DELAY = getattr(settings, 'ARCGIS_IMPORTER_UPDATE_RETRY_DELAY', 60)
+# checks before the update of a layer is given up until the next run
+UPDATE_MAX_RETRIES = getattr(settings, 'ARCGIS_IMPORTER_UPDATE_MAX_RETRIES', 60)
+# layers of a service imported at the same time
+SERVICE_IMPORT_CONCURRENCY = getattr(settings, 'ARCGIS_IMPORTER_SERVICE_IMPORT_CONCURRENCY', 4)
+# finished and failed imports older than that are deleted, None keeps them
+IMPORT_RETENTION_DAYS = getattr(settings, 'ARCGIS_IMPORTER_IMPORT_RETENTION_DAYS', 30)
+# directory where pruned imports are archived as gzipped json lines, None deletes without archive
+IMPORT_ARCHIVE_DIR = getattr(settings, 'ARCGIS_IMPORTER_IMPORT_ARCHIVE_DIR', None)
+PRUNE_BATCH_SIZE = 5000
+# seconds before an import queued behind another download of the same source checks again
+IMPORT_RETRY_DELAY = getattr(settings, 'ARCGIS_IMPORTER_IMPORT_RETRY_DELAY', 60)
+# checks before the queued import is given up
+IMPORT_MAX_RETRIES = getattr(settings, 'ARCGIS_IMPORTER_IMPORT_MAX_RETRIES', 120)
+
 
 @app.task(bind=True, name='arcgis_importer.tasks.celery_import_task', queue='default')
 def celery_import_task(self, task_id):
-    task = ArcGISLayerImport.objects.get(id=task_id)
-    em = EsriManager(task.url, task_id=task.id)
-    layer = em.publish()
-    if layer:
-        ImportedLayer.objects.create(url=task.url, name=layer.alternate)
+    run_import(self, task_id)
 
 
-def background_import(task_id):
-    t = threading.Thread(target=celery_import_task.delay,
+@app.task(bind=True, name='arcgis_importer.tasks.celery_resume_task', queue='default')
+def celery_resume_task(self, task_id):
+    # continue an interrupted import after its last checkpoint
+    run_import(self, task_id, resume=True)
+
+
+@app.task(bind=True, name='arcgis_importer.tasks.celery_service_import_task', queue='default')
+def celery_service_import_task(self, task_id):
+    import_service(ArcGISLayerImport.objects.get(id=task_id))
+
+
+def background_import(task_id, task=celery_import_task):
+    t = threading.Thread(target=task.delay,
                          args=(task_id,))
     t.setDaemon(True)
     t.start()
@@ -35,15 +80,94 @@ def background_import(task_id):
 
 @app.task(bind=True, name='arcgis_importer.tasks.update_imported_layers', queue='default')
 def update_imported_layers(*args, **kwargs):
-    for imported_layer in ImportedLayer.objects.all():
-        # TODO: run update_imported_layer async
-        update_imported_layer(imported_layer)
+    # one subtask per layer, the run report is built by update_imported_layers_report when all of them finished
+    imported_layers_ids = list(ImportedLayer.objects.values_list('id', flat=True))
+    if not imported_layers_ids:
+        return
+    chord(update_imported_layer_task.s(imported_layers_id) for imported_layers_id in imported_layers_ids)(
+        update_imported_layers_report.s(started_at=time.time()))
+
+
+def acquire_update_slots(host, wait=False, poll_interval=5):
+    # a slot of all the updates and one of the updates of the host, None when one of them is not free
+    while True:
+        slots = []
+        for name, limit in (('update:all', UPDATE_CONCURRENCY),
+                            ('update:host:{}'.format(host), UPDATE_HOST_CONCURRENCY)):
+            slot = acquire_slot(name, limit)
+            if not slot:
+                for taken_slot in slots:
+                    release_slot(taken_slot)
+                break
+            slots.append(slot)
+        else:
+            return slots
+        if not wait:
+            return None
+        time.sleep(poll_interval)
+
+
+def retry_update(task, imported_layer, host):
+    # the source lock or the slots stayed taken, reported as given up once the retries are exhausted
+    if task.request.retries >= UPDATE_MAX_RETRIES:
+        logger.warning('update layer {0} gave up after {1} retries'.format(imported_layer.name, UPDATE_MAX_RETRIES))
+        return {'id': imported_layer.id, 'name': imported_layer.name, 'host': host, 'status': 'Gave up',
+                'duration': 0}
+    raise task.retry(countdown=UPDATE_RETRY_DELAY, max_retries=UPDATE_MAX_RETRIES)
 
 
 @app.task(bind=True, name='arcgis_importer.tasks.update_imported_layer', queue='default')
 def update_imported_layer_task(self, imported_layers_id):
-    imported_layer = ImportedLayer.objects.get(id=imported_layers_id)
-    update_imported_layer(imported_layer)
+    try:
+        imported_layer = ImportedLayer.objects.get(id=imported_layers_id)
+    except ImportedLayer.DoesNotExist:
+        # deleted since the run started, still reported so the chord completes
+        return {'id': imported_layers_id, 'name': None, 'host': None, 'status': 'Deleted', 'duration': 0}
+    host = urlparse(imported_layer.url).netloc
+    # eager tasks ignore the retry countdown, they wait for the lock and the slots instead
+    wait = self.request.is_eager
+    with advisory_lock(source_lock_name(imported_layer.url), wait=wait) as locked:
+        if not locked:
+            # the layer source is being downloaded by another import or update
+            return retry_update(self, imported_layer, host)
+        slots = acquire_update_slots(host, wait=wait)
+        if slots is None:
+            return retry_update(self, imported_layer, host)
+        started_at = time.time()
+        try:
+            update_imported_layer(imported_layer)
+        except Exception as e:
+            # report the failure instead of failing the whole run
+            logger.error('update layer {0} failed {1}'.format(imported_layer.name, e))
+            imported_layer.last_update_status = 'Failed'
+            imported_layer.save(update_fields=['last_update_status', 'updated_at'])
+        finally:
+            for slot in slots:
+                release_slot(slot)
+    return {
+        'id': imported_layer.id,
+        'name': imported_layer.name,
+        'host': host,
+        'status': imported_layer.last_update_status,
+        'duration': time.time() - started_at,
+    }
+
+
+@app.task(bind=True, name='arcgis_importer.tasks.update_imported_layers_report', queue='default')
+def update_imported_layers_report(self, results, started_at=None):
+    failed = [result for result in results if result['status'] == 'Failed']
+    deleted = [result for result in results if result['status'] == 'Deleted']
+    gave_up = [result for result in results if result['status'] == 'Gave up']
+    report = {
+        'layers': len(results) - len(deleted),
+        'succeeded': len(results) - len(failed) - len(deleted) - len(gave_up),
+        'failed': [result['name'] for result in failed],
+        'gave_up': [result['name'] for result in gave_up],
+        'duration': time.time() - started_at if started_at else None,
+        'slowest': sorted(results, key=lambda result: result['duration'], reverse=True)[:10],
+    }
+    logger.info('imported layers update finished {}'.format(json.dumps(report)))
+    return report
 
 
 @app.task(bind=True, name='arcgis_importer.tasks.append_imported_layer', queue='default')
@@ -56,13 +180,178 @@ def append_imported_layer_task(self, arcgis_layer_import_id):
     success = em.append_new_data(geonode_layer)
 
 
+def run_import(celery_task, task_id, resume=False):
+    # one download of a source at a time across the workers, the other imports of the source are queued
+    task = ArcGISLayerImport.objects.get(id=task_id)
+    # eager tasks ignore the retry countdown, they wait for the lock instead
+    with advisory_lock(source_lock_name(task.url), wait=celery_task.request.is_eager) as locked:
+        if not locked:
+            if celery_task.request.retries >= IMPORT_MAX_RETRIES:
+                fail_import(task, "The layer source is still being imported by another import")
+                return None
+            raise celery_task.retry(countdown=IMPORT_RETRY_DELAY, max_retries=IMPORT_MAX_RETRIES)
+        task.refresh_from_db(fields=['status'])
+        if task.status == ImportStatus.FINISHED or (not resume and task.status != ImportStatus.PENDING):
+            # already run for another request attached to the same import,
+            # or finished by the import still running when the resume was queued
+            return None
+        return import_layer(task_id, resume=resume)
+
+
+def fail_import(task, error):
+    # an import stopped by an unexpected error isn't left pending or in progress
+    task.refresh_from_db(fields=['status'])
+    if task.status in (ImportStatus.FINISHED, ImportStatus.FAILED):
+        return
+    ProgressReporter(task).update(force=True, status=ImportStatus.FAILED, task_result=str(error),
+                                  finished_at=timezone.now(), eta=None)
+
+
+def import_layer(task_id, resume=False, session=None):
+    task = ArcGISLayerImport.objects.get(id=task_id)
+    try:
+        em = EsriManager(task.url, task_id=task.id, session=session)
+        # read before loading like the updates, None when the service doesn't track changes
+        server_gen = em.get_server_gen()
+        layer = em.publish(resume=resume)
+    except Exception as e:
+        fail_import(task, e)
+        raise
+    if layer:
+        filters = {key: task.config_dict[key] for key in FILTER_OPTIONS if task.config_dict.get(key)}
+        ImportedLayer.objects.create(url=task.url, name=layer.alternate, page_size=em.page_size,
+                                     server_gen=server_gen, filters=json.dumps(filters) if filters else None)
+    return layer
+
+
+def import_service_layer(session, task_id):
+    try:
+        url = ArcGISLayerImport.objects.values_list('url', flat=True).get(id=task_id)
+        # wait for the imports of the same source running on other workers
+        with advisory_lock(source_lock_name(url), wait=True):
+            return import_layer(task_id, session=session)
+    except Exception as e:
+        logger.error('import of service layer {0} failed {1}'.format(task_id, e))
+    finally:
+        # layers are imported in worker threads, each one has its own database connection
+        connection.close()
+
+
+def import_service(parent):
+    # the lock of the service url tells prune_imports the service import is still running
+    with advisory_lock(source_lock_name(parent.url)):
+        progress = ProgressReporter(parent)
+        try:
+            import_service_layers(parent, progress)
+        except Exception as e:
+            logger.error('import of service {0} failed {1}'.format(parent.url, e))
+            # layers not imported yet are left pending, they fail with the service import
+            parent.children.filter(status=ImportStatus.PENDING).update(
+                status=ImportStatus.FAILED, task_result=str(e), finished_at=timezone.now())
+            progress.update(force=True, status=ImportStatus.FAILED, task_result=str(e), finished_at=timezone.now())
+
+
+def import_service_layers(parent, progress):
+    # import all the layers and tables of a service as children of the parent import,
+    # layers are imported concurrently and share one HTTP pool and the service metadata
+    progress.update(force=True, status=ImportStatus.IN_PROGRESS, task_result="Listing service layers")
+    parent_config = parent.config_dict
+    concurrency = min(max(int(parent_config.get('service_concurrency') or SERVICE_IMPORT_CONCURRENCY), 1),
+                      MAX_SERVICE_CONCURRENCY)
+    pages_concurrency = min(max(int(parent_config.get('concurrency') or 1), 1), MAX_CONCURRENCY)
+    session = create_session(pool_size=concurrency * (pages_concurrency + 2))
+    layer_urls = get_service_layers(parent.url, session)
+    options = {key: parent_config[key] for key in IMPORT_OPTIONS if parent_config.get(key) is not None}
+    config_dict = {}
+    if parent_config.get('permissions'):
+        config_dict['permissions'] = parent_config['permissions']
+    children = [EsriManager.create_task(layer_url, config=LayerConfig(config=dict(config_dict)), options=options,
+                                        parent=parent)
+                for layer_url in layer_urls]
+    static_msg = "Layers: Imported {imported} of {total}, Failed {failed}"
+    imported = failed = 0
+    progress.update(force=True, task_result=static_msg.format(imported=0, total=len(children), failed=0))
+    for layer in iter_concurrently(partial(import_service_layer, session), children, concurrency, ordered=False):
+        if layer:
+            imported += 1
+        else:
+            failed += 1
+        progress.update(force=True, task_result=static_msg.format(imported=imported, total=len(children),
+                                                                  failed=failed))
+    status = ImportStatus.FAILED if children and not imported else ImportStatus.FINISHED
+    progress.update(force=True, status=status, finished_at=timezone.now())
+
+
+def archive_imports(imports, archive):
+    for task in imports:
+        line = serializers.serialize('json', [task])[1:-1]
+        archive.write((line + '\n').encode('utf-8'))
+
+
+def delete_imports(ids, archive):
+    if archive:
+        archive_imports(ArcGISLayerImport.objects.filter(id__in=ids).iterator(), archive)
+    # detach children so the cascade doesn't delete rows outside of the batch
+    ArcGISLayerImport.objects.filter(parent_id__in=ids).update(parent=None)
+    ArcGISLayerImport.objects.filter(id__in=ids).delete()
+
+
+@app.task(bind=True, name='arcgis_importer.tasks.prune_imports', queue='default')
+def prune_imports(self, days=IMPORT_RETENTION_DAYS):
+    if days is None:
+        return 0
+    before = timezone.now() - datetime.timedelta(days=days)
+    queryset = ArcGISLayerImport.objects.filter(
+        status__in=[ImportStatus.FINISHED, ImportStatus.FAILED], created_at__lt=before).order_by('id')
+    archive = None
+    if IMPORT_ARCHIVE_DIR:
+        archive_path = os.path.join(IMPORT_ARCHIVE_DIR,
+                                    'imports-{}.jsonl.gz'.format(timezone.now().strftime('%Y%m%d%H%M%S')))
+        archive = gzip.open(archive_path, 'wb')
+    deleted = 0
+    try:
+        while True:
+            # small batches keep the locks and the delete transactions short
+            ids = list(queryset.values_list('id', flat=True)[:PRUNE_BATCH_SIZE])
+            if not ids:
+                break
+            delete_imports(ids, archive)
+            deleted += len(ids)
+        # imports left pending or in progress by a dead worker, their source lock is free
+        stale = ArcGISLayerImport.objects.filter(
+            status__in=[ImportStatus.PENDING, ImportStatus.IN_PROGRESS], created_at__lt=before).order_by('id')
+        ids = [task.id for task in stale.only('id', 'url', 'status', 'updated_at').iterator()
+               if not is_import_alive(task)]
+        for start in range(0, len(ids), PRUNE_BATCH_SIZE):
+            delete_imports(ids[start:start + PRUNE_BATCH_SIZE], archive)
+        deleted += len(ids)
+    finally:
+        if archive:
+            archive.close()
+    logger.info('pruned {0} imports older than {1} days'.format(deleted, days))
+    return deleted
+
+
 def update_imported_layer(imported_layer):
     logger.info('update layer {0} started'.format(imported_layer.name))
     geonode_layer = Layer.objects.get(alternate=imported_layer.name)
-    task = ArcGISLayerImport.objects.create(url=imported_layer.url, user=get_anonymous_user(),
-                                            config=_perms_info_json(geonode_layer))
-    em = EsriManager(task.url, task_id=task.id)
-    success = em.reload_data(geonode_layer)
+    config = _perms_info_json(geonode_layer)
+    if imported_layer.filters:
+        # a partial import is updated with the same fields and rows filters
+        config = json.dumps(dict(json.loads(config), **json.loads(imported_layer.filters)))
+    task = ArcGISLayerImport.objects.create(url=imported_layer.url, user=get_anonymous_user(), config=config)
+    em = EsriManager(task.url, task_id=task.id, page_size=imported_layer.page_size)
+    # read the generation before loading, edits made meanwhile will be extracted by the next update
+    server_gen = em.get_server_gen()
+    success = None
+    if server_gen and imported_layer.server_gen:
+        success = em.sync_changes(geonode_layer, imported_layer.server_gen)
+    if success is None:
+        # no change tracking or the layer table can't be synced
+        success = em.reload_data(geonode_layer)
+    if success:
+        imported_layer.server_gen = server_gen
+        imported_layer.page_size = em.page_size or imported_layer.page_size
     imported_layer.last_update_status = 'Succeeded' if success else 'Failed'
     imported_layer.save()
     logger.info('update layer {0} {1}'.format(imported_layer.name, imported_layer.last_update_status))
@@ -70,3 +359,8 @@ def update_imported_layer(imported_layer):
 
 app.config_from_object('django.conf:settings', namespace="CELERY")
 app.autodiscover_tasks()
+if IMPORT_RETENTION_DAYS is not None:
+    app.conf.beat_schedule.setdefault('arcgis_importer.prune_imports', {
+        'task': 'arcgis_importer.tasks.prune_imports',
+        'schedule': crontab(hour=3, minute=0),
+    })
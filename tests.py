@@ -1,6 +1,506 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
-from django.test import TestCase
+import datetime
+import hashlib
+import struct
+import time
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from . import metadata
+from .metrics import metric_line, render_prometheus
+from .paging import PageSizeController, split_envelope
+from .pbf import (GEOMETRY_POLYGON, PBFDecodeError, WIRE_64BIT, WIRE_LENGTH_DELIMITED, WIRE_VARINT,
+                  decode_feature_collection)
+from .progress import ProgressReporter
+from .utils import iter_concurrently, iter_expanding, iter_prefetched
+
+
+# minimal protobuf encoder to build FeatureCollectionPBuffer messages by hand
+def encode_varint(value):
+    encoded = bytearray()
+    while True:
+        byte = value & 0x7f
+        value >>= 7
+        if value:
+            encoded.append(byte | 0x80)
+        else:
+            encoded.append(byte)
+            return bytes(encoded)
+
+
+def encode_key(field_number, wire_type):
+    return encode_varint(field_number << 3 | wire_type)
+
+
+def encode_field_varint(field_number, value):
+    return encode_key(field_number, WIRE_VARINT) + encode_varint(value)
+
+
+def encode_field_bytes(field_number, value):
+    return encode_key(field_number, WIRE_LENGTH_DELIMITED) + encode_varint(len(value)) + value
+
+
+def encode_field_double(field_number, value):
+    return encode_key(field_number, WIRE_64BIT) + struct.pack('<d', value)
+
+
+def encode_zigzag(value):
+    return (value << 1) ^ (value >> 63)
+
+
+def encode_geometry(coords, lengths=None):
+    geometry = b''
+    if lengths:
+        geometry += encode_field_bytes(2, b''.join(encode_varint(length) for length in lengths))
+    return geometry + encode_field_bytes(3, b''.join(encode_varint(encode_zigzag(coord)) for coord in coords))
+
+
+def encode_transform(scale, translate, origin=None):
+    transform = b''
+    if origin is not None:
+        transform += encode_field_varint(1, origin)
+    transform += encode_field_bytes(2, encode_field_double(1, scale[0]) + encode_field_double(2, scale[1]))
+    transform += encode_field_bytes(3, encode_field_double(1, translate[0]) + encode_field_double(2, translate[1]))
+    return transform
+
+
+def encode_collection(features, field_names=(), geometry_type=None, transform=None, exceeded=False):
+    result = b''
+    if geometry_type:
+        # proto3 doesn't serialize the 0 (point) value
+        result += encode_field_varint(7, geometry_type)
+    if exceeded:
+        result += encode_field_varint(9, 1)
+    if transform:
+        result += encode_field_bytes(12, transform)
+    for name in field_names:
+        result += encode_field_bytes(13, encode_field_bytes(1, name.encode('utf-8')))
+    for attributes, geometry in features:
+        feature = b''.join(encode_field_bytes(1, value) for value in attributes)
+        if geometry:
+            feature += encode_field_bytes(2, geometry)
+        result += encode_field_bytes(15, feature)
+    return encode_field_bytes(2, encode_field_bytes(1, result))
+
+
+class PBFDecodeTest(SimpleTestCase):
+    def test_point_layer_without_geometry_type(self):
+        content = encode_collection([([], encode_geometry([10, 20]))],
+                                    transform=encode_transform((0.5, 0.5), (100.0, 200.0)))
+        features = decode_feature_collection(content)['features']
+        # upperLeft origin is the default, y goes down from the translate
+        self.assertEqual(features[0]['geometry'], {'x': 105.0, 'y': 190.0})
+
+    def test_polygon_upper_left_origin(self):
+        # delta encoded ring (0, 0) (10, 0) (10, 10) (0, 0)
+        geometry = encode_geometry([0, 0, 10, 0, 0, 10, -10, -10], lengths=[4])
+        content = encode_collection([([], geometry)], geometry_type=GEOMETRY_POLYGON,
+                                    transform=encode_transform((2.0, 2.0), (0.0, 100.0)))
+        features = decode_feature_collection(content)['features']
+        self.assertEqual(features[0]['geometry'], {'rings': [[[0.0, 100.0], [20.0, 100.0], [20.0, 80.0],
+                                                              [0.0, 100.0]]]})
+
+    def test_lower_left_origin(self):
+        content = encode_collection([([], encode_geometry([10, 20]))],
+                                    transform=encode_transform((1.0, 1.0), (0.0, 100.0), origin=1))
+        features = decode_feature_collection(content)['features']
+        self.assertEqual(features[0]['geometry'], {'x': 10.0, 'y': 120.0})
+
+    def test_attributes(self):
+        attributes = [encode_field_bytes(1, 'name'.encode('utf-8')), encode_field_varint(4, encode_zigzag(-3)),
+                      b'']
+        content = encode_collection([(attributes, None)], field_names=('NAME', 'VALUE', 'EMPTY'),
+                                    exceeded=True)
+        data = decode_feature_collection(content)
+        self.assertTrue(data['exceededTransferLimit'])
+        self.assertEqual(data['features'][0], {'attributes': {'NAME': 'name', 'VALUE': -3, 'EMPTY': None},
+                                               'geometry': None})
+
+    def test_truncated(self):
+        content = encode_collection([([], encode_geometry([10, 20]))])
+        with self.assertRaises(PBFDecodeError):
+            decode_feature_collection(content[:-1])
+
+    def test_empty(self):
+        self.assertEqual(decode_feature_collection(b''), {'features': [], 'exceededTransferLimit': False})
+
+
+class GeometryTest(SimpleTestCase):
+    def setUp(self):
+        from . import geometry
+        self.geometry = geometry
+
+    def test_point_wkb(self):
+        wkb = self.geometry.build_wkb({'type': 'Point', 'coordinates': [1.0, 2.0]}, self.geometry.ogr.wkbPoint)
+        self.assertEqual(wkb, struct.pack('<BIdd', 1, self.geometry.ogr.wkbPoint, 1.0, 2.0))
+
+    def test_ewkb_srid(self):
+        wkb = self.geometry.build_wkb({'type': 'Point', 'coordinates': [1.0, 2.0]}, self.geometry.ogr.wkbPoint,
+                                      srid=4326)
+        self.assertEqual(wkb[:9], struct.pack('<BII', 1, self.geometry.ogr.wkbPoint | self.geometry.EWKB_SRID_FLAG,
+                                              4326))
+
+    def test_polygon_promoted_to_multi(self):
+        ring = [[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 0.0]]
+        wkb = self.geometry.build_wkb({'type': 'Polygon', 'coordinates': [ring]},
+                                      self.geometry.ogr.wkbMultiPolygon)
+        geom = self.geometry.ogr.CreateGeometryFromWkb(wkb)
+        self.assertEqual(geom.GetGeometryType(), self.geometry.ogr.wkbMultiPolygon)
+        self.assertEqual(geom.GetGeometryCount(), 1)
+
+    def test_mismatched_type(self):
+        self.assertIsNone(self.geometry.build_wkb({'type': 'Point', 'coordinates': [1.0, 2.0]},
+                                                  self.geometry.ogr.wkbPolygon))
+        self.assertIsNone(self.geometry.build_wkb({'type': 'Point', 'coordinates': []},
+                                                  self.geometry.ogr.wkbPoint))
+
+    def test_dequantize_features(self):
+        data = {
+            'transform': {'originPosition': 'upperLeft', 'scale': [0.5, 0.5], 'translate': [100.0, 200.0]},
+            'features': [
+                {'geometry': {'x': 10, 'y': 20}},
+                {'geometry': {'paths': [[[0, 0], [10, 10], [10, 0]]]}},
+                {'geometry': None},
+            ],
+        }
+        self.geometry.dequantize_features(data)
+        self.assertNotIn('transform', data)
+        self.assertEqual(data['features'][0]['geometry'], {'x': 105.0, 'y': 190.0})
+        self.assertEqual(data['features'][1]['geometry'], {'paths': [[[100.0, 200.0], [105.0, 195.0],
+                                                                      [110.0, 195.0]]]})
+
+
+class SyncChangesTest(SimpleTestCase):
+    def setUp(self):
+        from .esri import EsriManager
+        # without the metadata requests of __init__
+        self.manager = EsriManager.__new__(EsriManager)
+        self.manager.task_id = None
+        self.manager._task = None
+        self.manager._outSR = 3857
+        self.manager._fields = None
+        self.manager._request_geometry = True
+        self.manager._max_page_size = 1000
+        self.manager._geometry_query_args = {}
+        self.manager._build_query_args = lambda query_args: query_args
+        self.metadata = {'maxRecordCount': 2, 'extent': {'spatialReference': {'wkid': 102100, 'latestWkid': 3857}}}
+        self.manager.esri_serializer = type(str('Serializer'), (object,), {
+            'supports_pbf': False, '_data': self.metadata, 'get_data': lambda serializer: None})()
+
+    def test_changes_in_out_sr(self):
+        self.assertTrue(self.manager.is_in_out_sr())
+        self.metadata['extent']['spatialReference'] = {'wkid': 4326}
+        self.assertFalse(self.manager.is_in_out_sr())
+
+    def test_query_features_in_out_sr(self):
+        queries = []
+
+        def query_page(query_args):
+            queries.append(query_args)
+            oids = query_args['objectIds'].split(',')
+            return {'features': [{'attributes': {'OBJECTID': int(oid)}} for oid in oids]}, 0
+
+        self.manager.query_page = query_page
+        features = self.manager.query_features('OBJECTID', [1, 2, 3])
+        self.assertEqual([feature['attributes']['OBJECTID'] for feature in features], [1, 2, 3])
+        self.assertEqual([query['objectIds'] for query in queries], ['1,2', '3'])
+        self.assertTrue(all(query['outSR'] == 3857 for query in queries))
+
+
+class FakeTask(object):
+    # import task saving nothing, records the update_fields of each save
+    id = 1
+    updated_at = None
+
+    def __init__(self):
+        self.status = 'PENDING'
+        self.processed_count = None
+        self.saves = []
+
+    def save(self, update_fields=None):
+        self.saves.append(sorted(update_fields))
+
+
+class ProgressReporterTest(SimpleTestCase):
+    def test_coalesced_updates(self):
+        task = FakeTask()
+        progress = ProgressReporter(task, interval=3600, every=3)
+        progress.update(processed_count=1)
+        progress.update(processed_count=2)
+        self.assertEqual(task.saves, [])
+        progress.update(processed_count=3)
+        self.assertEqual(task.saves, [['processed_count', 'updated_at']])
+        self.assertEqual(task.processed_count, 3)
+
+    def test_forced_update_saves_changed_fields(self):
+        task = FakeTask()
+        progress = ProgressReporter(task, interval=3600, every=1000)
+        progress.update(force=True, status='IN_PROGRESS', processed_count=None)
+        self.assertEqual(task.saves, [['status', 'updated_at']])
+        # nothing changed, nothing saved
+        progress.update(force=True, status='IN_PROGRESS')
+        self.assertEqual(len(task.saves), 1)
+
+
+class AttributePlanTest(SimpleTestCase):
+    def setUp(self):
+        from . import mapping
+        self.mapping = mapping
+
+    def test_converters(self):
+        plan = self.mapping.AttributePlan([
+            ('DATE', 0, self.mapping.DateConverter()),
+            ('CODE', 1, self.mapping.DomainConverter({1: 'one'})),
+            ('KIND', 2, self.mapping.SubtypeConverter('TYPE', {1: {'a': 'Asphalt'}, 2: {'a': 'Gravel'}})),
+            ('NAME', 4, None),
+        ], 5)
+        values = plan.apply({'DATE': 86400000, 'CODE': 1, 'KIND': 'a', 'TYPE': 2, 'NAME': 'road'})
+        self.assertEqual(values, [datetime.datetime.fromtimestamp(86400), 'one', 'Gravel', None, 'road'])
+
+    def test_unknown_and_empty_values(self):
+        plan = self.mapping.AttributePlan([
+            ('CODE', 0, self.mapping.DomainConverter({1: 'one'})),
+            ('KIND', 1, self.mapping.SubtypeConverter('TYPE', {1: {'a': 'Asphalt'}})),
+            ('NAME', 2, None),
+        ], 3)
+        # codes missing from the domain are kept, empty values are NULL
+        self.assertEqual(plan.apply({'CODE': 9, 'KIND': 'a', 'TYPE': 3, 'NAME': ''}), [9, 'a', None])
+
+
+class FakeResponse(object):
+    def __init__(self, data=None, status_code=200, headers=None):
+        self.data = data
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def json(self):
+        return self.data
+
+
+class FakeSession(object):
+    # returns the queued responses, records the headers of each request
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def get(self, url, params=None, headers=None):
+        self.requests.append(headers)
+        return self.responses.pop(0)
+
+
+class MetadataTest(SimpleTestCase):
+    url = 'https://example.com/arcgis/rest/services/roads/FeatureServer/0'
+
+    def setUp(self):
+        metadata._local_cache.clear()
+        cache.delete(metadata.cache_key(self.url))
+
+    def test_fresh_metadata_is_cached(self):
+        session = FakeSession(FakeResponse({'name': 'roads'}))
+        self.assertEqual(metadata.get_metadata(self.url, session), {'name': 'roads'})
+        self.assertEqual(metadata.get_metadata(self.url, session), {'name': 'roads'})
+        self.assertEqual(len(session.requests), 1)
+
+    def test_stale_metadata_is_revalidated(self):
+        session = FakeSession(FakeResponse({'name': 'roads'}, headers={'ETag': '"v1"'}),
+                              FakeResponse(status_code=304))
+        metadata.get_metadata(self.url, session, ttl=-1)
+        self.assertEqual(metadata.get_metadata(self.url, session, ttl=-1), {'name': 'roads'})
+        self.assertEqual(session.requests[1], {'If-None-Match': '"v1"'})
+
+    def test_errors_are_not_cached(self):
+        session = FakeSession(FakeResponse({'error': {'code': 500}}), FakeResponse({'name': 'roads'}))
+        metadata.get_metadata(self.url, session)
+        self.assertEqual(metadata.get_metadata(self.url, session), {'name': 'roads'})
+        self.assertEqual(len(session.requests), 2)
+
+
+class PipelineTest(SimpleTestCase):
+    def test_ordered_results(self):
+        def slow_first(item):
+            time.sleep(0.01 * (5 - item))
+            return item * 10
+
+        self.assertEqual(list(iter_concurrently(slow_first, range(5), 3)), [0, 10, 20, 30, 40])
+
+    def test_bounded_pending(self):
+        consumed = []
+
+        def items():
+            for item in range(100):
+                consumed.append(item)
+                yield item
+
+        results = iter_concurrently(lambda item: item, items(), 2, max_pending=3)
+        self.assertEqual(next(results), 0)
+        # the first max_pending calls and the one replacing the consumed result
+        self.assertEqual(len(consumed), 4)
+        results.close()
+
+    def test_call_errors_are_raised(self):
+        def fail_on_two(item):
+            if item == 2:
+                raise ValueError(item)
+            return item
+
+        results = iter_concurrently(fail_on_two, range(5), 2)
+        self.assertEqual([next(results), next(results)], [0, 1])
+        with self.assertRaises(ValueError):
+            next(results)
+
+    def test_prefetched_in_order(self):
+        self.assertEqual(list(iter_prefetched(iter(range(20)), 2)), list(range(20)))
+
+    def test_producer_errors_are_raised(self):
+        def items():
+            yield 1
+            raise ValueError('page')
+
+        results = iter_prefetched(items(), 2)
+        self.assertEqual(next(results), 1)
+        with self.assertRaises(ValueError):
+            next(results)
+
+
+class PageSizeControllerTest(SimpleTestCase):
+    def setUp(self):
+        self.controller = PageSizeController(1000, 2000, minimum=10, target_seconds=5, max_bytes=1000000)
+
+    def test_slow_page_shrinks_by_half_at_most(self):
+        self.controller.observe(1000, 20, 0)
+        self.assertEqual(self.controller.size, 500)
+
+    def test_fast_pages_grow_up_to_the_maximum(self):
+        self.controller.observe(1000, 1, 0)
+        self.assertEqual(self.controller.size, 1500)
+        self.controller.observe(1500, 1, 0)
+        self.assertEqual(self.controller.size, 2000)
+
+    def test_large_page_shrinks(self):
+        self.controller.observe(1000, 1, 2000000)
+        self.assertEqual(self.controller.size, 500)
+
+    def test_partial_page_doesnt_grow(self):
+        self.controller.observe(10, 0.1, 0)
+        self.assertEqual(self.controller.size, 1000)
+
+    def test_failed_page_halves_down_to_the_minimum(self):
+        controller = PageSizeController(15, 2000, minimum=10)
+        controller.failed()
+        self.assertEqual(controller.size, 10)
+
+
+class TilesTest(SimpleTestCase):
+    def test_split_envelope(self):
+        spatial_reference = {'wkid': 4326}
+        quadrants = split_envelope({'xmin': 0, 'ymin': 0, 'xmax': 4, 'ymax': 2, 'spatialReference': spatial_reference})
+        self.assertEqual([(q['xmin'], q['ymin'], q['xmax'], q['ymax']) for q in quadrants],
+                         [(0, 0, 2, 1), (0, 1, 2, 2), (2, 0, 4, 1), (2, 1, 4, 2)])
+        self.assertTrue(all(q['spatialReference'] == spatial_reference for q in quadrants))
+
+    def test_expanding_work(self):
+        # each item below 8 discovers its two children, like a tile split into smaller ones
+        def split(item):
+            return item, [item * 2, item * 2 + 1] if item < 8 else []
+
+        self.assertEqual(sorted(iter_expanding(split, [1], 3)), list(range(1, 16)))
+
+    def test_expanding_errors_are_raised(self):
+        def fail(item):
+            raise ValueError(item)
+
+        with self.assertRaises(ValueError):
+            list(iter_expanding(fail, [1, 2], 2))
+
+
+class PrometheusTest(SimpleTestCase):
+    def test_render(self):
+        recent_metrics = [
+            {'stages': {'fetch': {'seconds': 1.5, 'calls': 2}, 'metadata': {'seconds': 0.5, 'calls': 1}},
+             'counters': {'features': 10}},
+            {'stages': {'fetch': {'seconds': 1.0, 'calls': 1}}, 'counters': {'features': 5}},
+        ]
+        lines = render_prometheus({'FINISHED': 2, 'FAILED': 1}, recent_metrics,
+                                  [(7, {'features_per_second': 12.5}), (8, {})]).splitlines()
+        self.assertIn('arcgis_importer_imports{status="FAILED"} 1', lines)
+        self.assertIn('arcgis_importer_stage_calls{stage="fetch"} 3', lines)
+        self.assertIn('arcgis_importer_features 15', lines)
+        self.assertIn('arcgis_importer_features_per_second{id="7"} 12.5', lines)
+        self.assertFalse(any('id="8"' in line for line in lines))
+        # stages in the import order
+        self.assertLess(lines.index('arcgis_importer_stage_seconds{stage="metadata"} 0.5'),
+                        lines.index('arcgis_importer_stage_seconds{stage="fetch"} 2.5'))
+
+    def test_label_quotes_are_escaped(self):
+        self.assertEqual(metric_line('imports', 1, status='a"b'), 'imports{status="a\\"b"} 1')
+
+
+class RecordingCursor(object):
+    # replays the query results in order and records the statements
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+
+    def execute(self, sql, params=None):
+        self.statements.append(sql)
+
+    def fetchone(self):
+        return self.results.pop(0)
+
+    def fetchall(self):
+        return self.results.pop(0)
+
+
+class SwapWriterTest(SimpleTestCase):
+    def setUp(self):
+        from .writers import PostgisSwapWriter
+        # without the layer and the connection of __init__
+        self.writer = PostgisSwapWriter.__new__(PostgisSwapWriter)
+        self.writer.schema = 'geonode_data'
+        self.writer.live_table = 'roads'
+        self.writer.table = 'roads_staging'
+
+    def test_copy_privileges(self):
+        cursor = RecordingCursor([('geoserver', 'SELECT', 'NO'), ('PUBLIC', 'SELECT', 'NO'),
+                                  ('editor', 'UPDATE', 'YES')], ('owner',), ('importer',))
+        self.writer.copy_privileges(cursor)
+        self.assertIn('GRANT SELECT ON "geonode_data"."roads_staging" TO "geoserver"', cursor.statements)
+        self.assertIn('GRANT SELECT ON "geonode_data"."roads_staging" TO PUBLIC', cursor.statements)
+        self.assertIn('GRANT UPDATE ON "geonode_data"."roads_staging" TO "editor" WITH GRANT OPTION',
+                      cursor.statements)
+        self.assertEqual(cursor.statements[-1], 'ALTER TABLE "geonode_data"."roads_staging" OWNER TO "owner"')
+
+    def test_owner_kept_when_current_user(self):
+        cursor = RecordingCursor([], ('importer',), ('importer',))
+        self.writer.copy_privileges(cursor)
+        self.assertFalse(any(statement.startswith('ALTER TABLE') for statement in cursor.statements))
+
+
+class RowEncoderTest(SimpleTestCase):
+    def setUp(self):
+        from . import writers
+        from .mapping import AttributePlan
+        self.writers = writers
+        self.plan = AttributePlan([('NAME', 0, None), ('NOTE', 1, None)], 2)
+
+    def test_copy_text(self):
+        self.assertEqual(self.writers.copy_text(None), '\\N')
+        self.assertEqual(self.writers.copy_text('a\\b\tc\nd\re'), 'a\\\\b\\tc\\nd\\re')
+        self.assertEqual(self.writers.copy_text(b'\x01\xff'), '\\\\x01ff')
+        self.assertEqual(self.writers.copy_text(datetime.datetime(2020, 1, 2, 3, 4, 5)), '2020-01-02 03:04:05')
+
+    def test_hashed_rows(self):
+        encoder = self.writers.RowEncoder(self.plan, None, geometry=False, hash_rows=True)
+        rows = encoder([{'properties': {'NAME': 'main\tstreet', 'NOTE': None}},
+                        {'properties': {'NAME': 'main\tstreet'}}])
+        line = 'main\\tstreet\t\\N'
+        row_hash = hashlib.md5(line.encode('utf-8')).hexdigest()
+        self.assertEqual(rows, ['{}\t{}\n'.format(line, row_hash)] * 2)
+
+    def test_failed_feature(self):
+        encoder = self.writers.RowEncoder(self.plan, None)
+        rows = encoder([{'properties': {'NAME': 'road'}, 'geometry': None}])
+        self.assertEqual(rows, [None])
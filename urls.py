@@ -3,10 +3,13 @@ from django.conf.urls import include, url
 from tastypie.api import Api
 from . import APP_NAME
 from .rest import ArcGISImportResource
-from .views import index
+from .views import import_events, import_status, index, metrics
 api = Api(api_name=APP_NAME)
 api.register(ArcGISImportResource())
 urlpatterns = [
     url(r'^$', index, name="%s.index" % (APP_NAME)),
     url(r'^api/', include(api.urls)),
+    url(r'^metrics/$', metrics, name="%s.metrics" % (APP_NAME)),
+    url(r'^imports/(?P<pk>\d+)/status/$', import_status, name="%s.import_status" % (APP_NAME)),
+    url(r'^imports/(?P<pk>\d+)/events/$', import_events, name="%s.import_events" % (APP_NAME)),
 ]
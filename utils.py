@@ -1,5 +1,10 @@
 # -*- coding: utf-8 -*-
 import socket
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from queue import Full, Queue
 
 from django.conf import settings
 from kombu import Connection
@@ -28,3 +33,94 @@ def check_broker_status():
             running = _check_async()
 
     return running
+
+
+def iter_concurrently(func, items, max_workers, ordered=True, max_pending=None, executor_class=ThreadPoolExecutor):
+    # map func over items on a thread (or process) pool and yield the results as a bounded stream,
+    # at most max_pending calls are in flight so a slow consumer applies backpressure.
+    max_pending = max(max_pending or max_workers * 2, 1)
+    items = iter(items)
+    pending = deque()
+    with executor_class(max_workers=max_workers) as executor:
+        try:
+            for item in islice(items, max_pending):
+                pending.append(executor.submit(func, item))
+            while pending:
+                if ordered:
+                    future = pending.popleft()
+                else:
+                    done, _not_done = wait(pending, return_when=FIRST_COMPLETED)
+                    future = done.pop()
+                    pending.remove(future)
+                result = future.result()
+                for item in islice(items, 1):
+                    pending.append(executor.submit(func, item))
+                yield result
+        finally:
+            # consumer stopped early or a call failed, don't start the queued calls
+            for future in pending:
+                future.cancel()
+
+
+def iter_expanding(func, items, max_workers):
+    # unordered iter_concurrently for work that discovers more work: func returns (result, new items),
+    # new items are queued after the known ones
+    queued = deque(items)
+    pending = set()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            while queued or pending:
+                while queued and len(pending) < max_workers * 2:
+                    pending.add(executor.submit(func, queued.popleft()))
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result, new_items = future.result()
+                    queued.extend(new_items)
+                    yield result
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def iter_prefetched(items, max_size):
+    # consume items in a background thread, at most max_size items are buffered ahead of the consumer.
+    # errors of the producer are raised to the consumer, stopping the consumer stops the producer.
+    buffer = Queue(maxsize=max(max_size, 1))
+    stopped = threading.Event()
+
+    def put(entry):
+        while not stopped.is_set():
+            try:
+                buffer.put(entry, timeout=0.5)
+                return True
+            except Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put((True, item)):
+                    break
+            else:
+                put((False, None))
+        except BaseException as e:
+            put((False, e))
+        finally:
+            close = getattr(items, 'close', None)
+            if close:
+                close()
+
+    producer = threading.Thread(target=produce)
+    producer.daemon = True
+    producer.start()
+    try:
+        while True:
+            has_item, value = buffer.get()
+            if not has_item:
+                if value is not None:
+                    raise value
+                return
+            yield value
+    finally:
+        stopped.set()
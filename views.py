@@ -1,10 +1,23 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
+import datetime
+import json
+import time
+
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count
+from django.http import HttpResponse, HttpResponseForbidden, JsonResponse, StreamingHttpResponse
 from django.shortcuts import render
+from django.utils import timezone
 
 from . import APP_NAME
+from .import_status import ImportStatus
+from .metrics import METRICS_WINDOW, render_prometheus
+from .models import ArcGISLayerImport
+from .status import DONE_STATUSES, STATUS_EVENTS_WAIT, STATUS_WAIT, get_status, wait_for_change
 
 # Create your views here.
 
@@ -14,3 +27,80 @@ def index(request):
     context = {"APP_NAME": APP_NAME}
     return render(request, template_name="{}/index.html".format(APP_NAME),
                   context=context)
+
+
+def metrics(request):
+    # prometheus scrape endpoint, for staff users or with "Authorization: Bearer <ARCGIS_IMPORTER_METRICS_TOKEN>"
+    token = getattr(settings, 'ARCGIS_IMPORTER_METRICS_TOKEN', None)
+    authorized = request.user.is_authenticated and request.user.is_staff
+    if token and request.META.get('HTTP_AUTHORIZATION', '') == 'Bearer {}'.format(token):
+        authorized = True
+    if not authorized:
+        return HttpResponseForbidden()
+    status_counts = dict(ArcGISLayerImport.objects.order_by().values_list('status').annotate(Count('id')))
+    since = timezone.now() - datetime.timedelta(seconds=METRICS_WINDOW)
+    recent_metrics = []
+    running_metrics = []
+    recent = ArcGISLayerImport.objects.filter(updated_at__gte=since, metrics__isnull=False).only('id', 'status',
+                                                                                                  'metrics')
+    for task in recent.iterator():
+        task_metrics = task.metrics_dict
+        recent_metrics.append(task_metrics)
+        if task.status == ImportStatus.IN_PROGRESS:
+            running_metrics.append((task.id, task_metrics))
+    return HttpResponse(render_prometheus(status_counts, recent_metrics, running_metrics),
+                        content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+def import_status(request, pk):
+    # status fields of an import, with ?version=<version> the request waits (up to ?wait seconds)
+    # for a newer version before answering
+    if not request.user.is_authenticated:
+        return JsonResponse({'error': 'authentication required'}, status=401)
+    version = request.GET.get('version', None)
+    status = get_status(pk, request.user)
+    if not status:
+        return JsonResponse({'error': 'import not found'}, status=404)
+    if version and status['version'] == version and status['status'] not in DONE_STATUSES:
+        try:
+            wait = min(float(request.GET.get('wait', STATUS_WAIT)), STATUS_WAIT)
+        except ValueError:
+            wait = STATUS_WAIT
+        if wait_for_change(pk, version, wait):
+            status = get_status(pk, request.user)
+    return JsonResponse(status, encoder=DjangoJSONEncoder)
+
+
+def status_events(task_id, user, version):
+    deadline = time.time() + STATUS_EVENTS_WAIT
+    while True:
+        status = get_status(task_id, user)
+        if not status:
+            # deleted meanwhile, done closes the stream where an error event would be retried by the browser
+            yield 'event: done\ndata: {}\n\n'
+            return
+        if status['version'] != version:
+            version = status['version']
+            yield 'id: {}\ndata: {}\n\n'.format(version, json.dumps(status, cls=DjangoJSONEncoder))
+        if status['status'] in DONE_STATUSES:
+            yield 'event: done\ndata: {}\n\n'
+            return
+        remaining = deadline - time.time()
+        if remaining <= 0 or not wait_for_change(task_id, version, remaining):
+            # the client reconnects with Last-Event-ID, the connection is not held longer than STATUS_EVENTS_WAIT
+            return
+
+
+def import_events(request, pk):
+    # server-sent events stream of the status changes of an import
+    if not request.user.is_authenticated:
+        return JsonResponse({'error': 'authentication required'}, status=401)
+    if not get_status(pk, request.user):
+        # EventSource doesn't reconnect after a non 200 response
+        return JsonResponse({'error': 'import not found'}, status=404)
+    version = request.META.get('HTTP_LAST_EVENT_ID', None) or request.GET.get('version', None)
+    response = StreamingHttpResponse(status_events(pk, request.user, version), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # disable proxy buffering (nginx)
+    response['X-Accel-Buffering'] = 'no'
+    return response
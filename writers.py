@@ -0,0 +1,637 @@
+# -*- coding: utf-8 -*-
+import datetime
+import hashlib
+import io
+import re
+import struct
+import time
+
+try:
+    import ogr
+except ImportError:
+    from osgeo import ogr
+
+try:
+    import psycopg2
+except ImportError:
+    psycopg2 = None
+
+COPY_SUPPORTED = psycopg2 is not None
+
+from django.conf import settings
+from osgeo_manager.exceptions import EsriFeatureLayerException
+
+from .geometry import build_wkb
+
+try:
+    from celery.utils.log import get_task_logger as get_logger
+except ImportError:
+    from cartoview.log_handler import get_logger
+
+logger = get_logger(__name__)
+
+# libpq connection keywords, other OGR PG: options (schemas, tables, ...) are dropped
+PG_DSN_KEYWORDS = ('host', 'hostaddr', 'port', 'dbname', 'user', 'password', 'sslmode', 'connect_timeout')
+EWKB_SRID_FLAG = 0x20000000
+# schema of the row hashes of the diff loads, kept out of the store schema so GeoServer doesn't list them.
+# it is created on first use when the datastore role can create schemas, otherwise it is created once by an admin:
+# CREATE SCHEMA arcgis_importer AUTHORIZATION <datastore role>
+HASHES_SCHEMA = getattr(settings, 'ARCGIS_IMPORTER_HASHES_SCHEMA', 'arcgis_importer')
+
+
+def pg_dsn(connection_string):
+    # convert an OGR "PG: host=... dbname=..." connection string to a libpq dsn
+    params = connection_string.strip()
+    if params.upper().startswith('PG:'):
+        params = params[3:]
+    return ' '.join(param for param in params.split()
+                    if param.split('=', 1)[0] in PG_DSN_KEYWORDS)
+
+
+def quote_ident(name):
+    return '"{}"'.format(name.replace('"', '""'))
+
+
+def to_ewkb_hex(wkb, srid):
+    # embed the SRID in the top level geometry of a little endian WKB (NDR) buffer
+    wkb = bytes(wkb)
+    geom_type = struct.unpack('<I', wkb[1:5])[0] | EWKB_SRID_FLAG
+    return (wkb[:1] + struct.pack('<II', geom_type, srid) + wkb[5:]).hex()
+
+
+def copy_text(value):
+    # render a value in PostgreSQL COPY text format
+    if value is None:
+        return '\\N'
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(' ')
+    if isinstance(value, (bytes, bytearray)):
+        return '\\\\x' + bytes(value).hex()
+    return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+
+INDEX_DEFINITION = re.compile(r'^(CREATE (?:UNIQUE )?INDEX) (\S+) ON (?:ONLY )?(\S+) (USING .*)$')
+
+
+def index_name(table, suffix):
+    # keep index names in the 63 characters identifiers limit
+    return quote_ident('{}_{}'.format(table[:62 - len(suffix)], suffix))
+
+
+def build_indexes(cursor, schema, table, metrics, geometry_column=None, columns=(), cluster=False):
+    # index the bulk loaded table at once, optionally cluster it on its geometry and update its statistics
+    qualified_table = '{}.{}'.format(quote_ident(schema), quote_ident(table))
+    geometry_index = None
+    if geometry_column:
+        # same name as the index OGR creates with the table
+        geometry_index = index_name(table, '{}_geom_idx'.format(geometry_column))
+        with metrics.timed('index'):
+            cursor.execute('CREATE INDEX IF NOT EXISTS {} ON {} USING GIST ({})'.format(
+                geometry_index, qualified_table, quote_ident(geometry_column)))
+    for column in columns:
+        with metrics.timed('index'):
+            cursor.execute('CREATE INDEX IF NOT EXISTS {} ON {} ({})'.format(
+                index_name(table, '{}_idx'.format(column)), qualified_table, quote_ident(column)))
+    if cluster and geometry_index:
+        # rows close in space are stored together, tiles and bbox queries read fewer pages
+        with metrics.timed('cluster'):
+            cursor.execute('CLUSTER {} USING {}'.format(qualified_table, geometry_index))
+    with metrics.timed('analyze'):
+        cursor.execute('ANALYZE {}'.format(qualified_table))
+
+
+def index_loaded_table(connection_string, schema, table, metrics, geometry_column=None, columns=(), cluster=False):
+    connection = psycopg2.connect(pg_dsn(connection_string))
+    # CREATE INDEX and CLUSTER take their locks for the statement only
+    connection.autocommit = True
+    try:
+        with connection.cursor() as cursor:
+            build_indexes(cursor, schema, table, metrics, geometry_column, columns, cluster)
+    finally:
+        connection.close()
+
+
+def hashes_table():
+    return '{}.{}'.format(quote_ident(HASHES_SCHEMA), quote_ident('row_hashes'))
+
+
+def hashes_key(schema, table):
+    # the row hashes of all the layers share one table, keyed by the qualified layer table
+    return '{}.{}'.format(schema, table)
+
+
+def create_hashes_table(cursor):
+    # the privileges are checked before IF NOT EXISTS, nothing is created when the schema and the table exist
+    cursor.execute('SELECT to_regclass(%s)', [hashes_table()])
+    if cursor.fetchone()[0]:
+        return
+    cursor.execute('SELECT 1 FROM pg_namespace WHERE nspname = %s', [HASHES_SCHEMA])
+    if not cursor.fetchone():
+        cursor.execute('CREATE SCHEMA {}'.format(quote_ident(HASHES_SCHEMA)))
+    cursor.execute('CREATE TABLE IF NOT EXISTS {} (layer text, oid bigint, row_hash char(32) NOT NULL, '
+                   'PRIMARY KEY (layer, oid))'.format(hashes_table()))
+
+
+def delete_hashes(cursor, schema, table):
+    cursor.execute('SELECT to_regclass(%s)', [hashes_table()])
+    if cursor.fetchone()[0]:
+        cursor.execute('DELETE FROM {} WHERE layer = %s'.format(hashes_table()), [hashes_key(schema, table)])
+
+
+def drop_layer_hashes(connection_string, schema, table):
+    # called when the imported layer is deleted
+    connection = psycopg2.connect(pg_dsn(connection_string))
+    try:
+        with connection, connection.cursor() as cursor:
+            delete_hashes(cursor, schema, table)
+    finally:
+        connection.close()
+
+
+def copy_indexes(cursor, schema, source_table, target_table):
+    # create the indexes of source_table on target_table under temporary names, see restore_indexes
+    source = '{}.{}'.format(quote_ident(schema), quote_ident(source_table))
+    target = '{}.{}'.format(quote_ident(schema), quote_ident(target_table))
+    cursor.execute('SELECT i.relname, pg_get_indexdef(i.oid), c.conname, c.contype FROM pg_index x '
+                   'JOIN pg_class i ON i.oid = x.indexrelid '
+                   'LEFT JOIN pg_constraint c ON c.conindid = x.indexrelid AND c.conrelid = x.indrelid '
+                   'WHERE x.indrelid = %s::regclass', (source,))
+    copied = []
+    for position, (name, definition, constraint, constraint_type) in enumerate(cursor.fetchall()):
+        match = INDEX_DEFINITION.match(definition)
+        if not match or (constraint and constraint_type not in ('p', 'u')):
+            logger.warning('index {} is not copied to the new table'.format(name))
+            continue
+        temporary_name = '{}_{}_new'.format(target_table[:50], position)
+        cursor.execute('{} {} ON {} {}'.format(match.group(1), quote_ident(temporary_name), target,
+                                               match.group(4)))
+        copied.append((temporary_name, name, constraint, constraint_type))
+    return copied
+
+
+def restore_indexes(cursor, schema, table, copied):
+    # give the copied indexes the names (and constraints) of the replaced table ones
+    qualified_table = '{}.{}'.format(quote_ident(schema), quote_ident(table))
+    for temporary_name, name, constraint, constraint_type in copied:
+        if constraint:
+            cursor.execute('ALTER TABLE {} ADD CONSTRAINT {} {} USING INDEX {}'.format(
+                qualified_table, quote_ident(constraint), 'PRIMARY KEY' if constraint_type == 'p' else 'UNIQUE',
+                quote_ident(temporary_name)))
+            if constraint != name:
+                cursor.execute('ALTER INDEX {}.{} RENAME TO {}'.format(quote_ident(schema), quote_ident(constraint),
+                                                                       quote_ident(name)))
+        else:
+            cursor.execute('ALTER INDEX {}.{} RENAME TO {}'.format(quote_ident(schema), quote_ident(temporary_name),
+                                                                   quote_ident(name)))
+
+
+class RowEncoder(object):
+    # convert pages of features to COPY rows, None for failed features and the feature itself when OGR must convert it
+
+    def __init__(self, plan, gtype, srid=None, geometry=True, hash_rows=False):
+        self.plan = plan
+        self.gtype = gtype
+        self.srid = srid
+        self.geometry = geometry
+        self.hash_rows = hash_rows
+
+    def values(self, feature_dict):
+        return self.plan.apply(feature_dict["properties"] or {})
+
+    def format(self, values):
+        line = '\t'.join(map(copy_text, values))
+        if self.hash_rows:
+            # row content hash, see PostgisDiffWriter
+            return '{}\t{}\n'.format(line, hashlib.md5(line.encode('utf-8')).hexdigest())
+        return line + '\n'
+
+    def encode(self, feature_dict, timings):
+        started_at = time.time()
+        values = self.values(feature_dict)
+        mapped_at = time.time()
+        timings['attribute_map'] += mapped_at - started_at
+        try:
+            if self.geometry:
+                geom_dict = feature_dict["geometry"]
+                if not geom_dict:
+                    raise EsriFeatureLayerException("No Geometry Information")
+                ewkb = build_wkb(geom_dict, self.gtype, srid=self.srid)
+                if not ewkb:
+                    return feature_dict
+                values.append(ewkb.hex())
+        finally:
+            timings['geometry_build'] += time.time() - mapped_at
+        return self.format(values)
+
+    def convert(self, features):
+        # (rows, seconds spent per stage) of a page
+        timings = {'attribute_map': 0.0, 'geometry_build': 0.0}
+        rows = []
+        for feature_dict in features:
+            try:
+                rows.append(self.encode(feature_dict, timings))
+            except Exception as e:
+                logger.error('Failed to convert feature {}'.format(e))
+                rows.append(None)
+        return rows, timings
+
+    def __call__(self, features):
+        return self.convert(features)[0]
+
+
+class OGRFeatureWriter(object):
+    # fallback writer, inserts features one by one through the OGR layer
+
+    # table statistics are updated by the writer on commit
+    analyzes_on_commit = False
+
+    def __init__(self, manager, layer, gtype):
+        self.manager = manager
+        self.layer = layer
+        self.gtype = gtype
+
+    def begin(self):
+        self.layer.StartTransaction()
+
+    def clear(self):
+        # remove features one by one to allow rollback if an error raised
+        old_feature = self.layer.GetNextFeature()
+        while old_feature:
+            self.layer.DeleteFeature(old_feature.GetFID())
+            old_feature = self.layer.GetNextFeature()
+
+    def delete_features(self, column, values):
+        if not values:
+            return
+        self.layer.SetAttributeFilter('"{}" IN ({})'.format(column, ', '.join(str(int(value)) for value in values)))
+        old_feature = self.layer.GetNextFeature()
+        while old_feature:
+            self.layer.DeleteFeature(old_feature.GetFID())
+            old_feature = self.layer.GetNextFeature()
+        self.layer.SetAttributeFilter(None)
+
+    def delete_features_after(self, column, value):
+        self.layer.SetAttributeFilter('"{}" > {}'.format(column, int(value)))
+        old_feature = self.layer.GetNextFeature()
+        while old_feature:
+            self.layer.DeleteFeature(old_feature.GetFID())
+            old_feature = self.layer.GetNextFeature()
+        self.layer.SetAttributeFilter(None)
+
+    def write(self, feature_dict):
+        return self.manager.create_feature(self.layer, feature_dict, self.gtype)
+
+    def get_converter(self):
+        # OGR features are built on the layer, nothing to convert ahead
+        return None
+
+    def write_rows(self, rows):
+        # rows are the features themselves, returns the number of created features
+        return sum(1 for feature_dict in rows if self.write(feature_dict))
+
+    def checkpoint(self):
+        self.layer.CommitTransaction()
+        self.layer.StartTransaction()
+
+    def commit(self):
+        self.layer.CommitTransaction()
+
+    def rollback(self):
+        self.layer.RollbackTransaction()
+
+
+class PostgisCopyWriter(object):
+    # stream features into an existing PostGIS table with COPY, in one transaction on a dedicated connection
+
+    # append the md5 of each row to the COPY rows
+    hash_rows = False
+    analyzes_on_commit = False
+
+    def __init__(self, manager, layer, gtype, connection_string, schema, table, batch_size=10000,
+                 validate_geometry=True):
+        self.manager = manager
+        self.gtype = gtype
+        self.dsn = pg_dsn(connection_string)
+        self.schema = schema
+        # table the rows are loaded into, may differ from the layer table (live_table) in subclasses
+        self.table = table
+        self.live_table = table
+        self.batch_size = batch_size
+        self.validate_geometry = validate_geometry
+        self.layer = layer
+        self.layer_defn = layer.GetLayerDefn()
+        self.geometry_column = layer.GetGeometryColumn() if manager.esri_serializer.is_feature_layer else None
+        self.fid_column = layer.GetFIDColumn()
+        self.field_names = [self.layer_defn.GetFieldDefn(i).GetName()
+                            for i in range(self.layer_defn.GetFieldCount())]
+        self.srid = None
+        self.start_fid = None
+        self._encoder = None
+        self._connection = None
+        self._buffer = io.StringIO()
+        self._buffered = 0
+
+    @property
+    def qualified_table(self):
+        return '{}.{}'.format(quote_ident(self.schema), quote_ident(self.table))
+
+    @property
+    def qualified_live_table(self):
+        return '{}.{}'.format(quote_ident(self.schema), quote_ident(self.live_table))
+
+    @property
+    def columns(self):
+        columns = list(self.field_names)
+        if self.geometry_column:
+            columns.append(self.geometry_column)
+        return columns
+
+    @property
+    def copy_sql(self):
+        return 'COPY {} ({}) FROM STDIN'.format(self.qualified_table, ', '.join(map(quote_ident, self.columns)))
+
+    @property
+    def encoder(self):
+        # built on first use, the attribute plan needs build_fields() and the srid begin()
+        if not self._encoder:
+            self._encoder = RowEncoder(self.manager.get_attribute_plan(self.layer_defn), self.gtype, self.srid,
+                                       geometry=bool(self.geometry_column), hash_rows=self.hash_rows)
+        return self._encoder
+
+    def begin(self):
+        # make sure OGR issued the (deferred) CREATE TABLE before loading from another connection
+        self.layer.SyncToDisk()
+        self._connection = psycopg2.connect(self.dsn)
+        self.prepare()
+        if self.geometry_column:
+            with self._connection.cursor() as cursor:
+                cursor.execute('SELECT Find_SRID(%s, %s, %s)', (self.schema, self.live_table, self.geometry_column))
+                self.srid = cursor.fetchone()[0]
+                self.update_start_fid(cursor)
+
+    def update_start_fid(self, cursor):
+        if self.fid_column:
+            # rows loaded by this writer are the ones after the current max fid
+            cursor.execute('SELECT COALESCE(MAX({}), 0) FROM {}'.format(quote_ident(self.fid_column),
+                                                                        self.qualified_table))
+            self.start_fid = cursor.fetchone()[0]
+
+    def prepare(self):
+        # hook to create the load table before loading
+        pass
+
+    def finalize(self):
+        # called after the last batch is loaded, before commit.
+        # rows changed without hashing them, stored hashes are not reliable anymore
+        with self._connection.cursor() as cursor:
+            delete_hashes(cursor, self.schema, self.live_table)
+
+    def clear(self):
+        with self._connection.cursor() as cursor:
+            cursor.execute('DELETE FROM {}'.format(self.qualified_table))
+
+    def delete_features(self, column, values):
+        if not values:
+            return
+        with self._connection.cursor() as cursor:
+            cursor.execute('DELETE FROM {} WHERE {} = ANY(%s)'.format(self.qualified_table, quote_ident(column)),
+                           ([int(value) for value in values],))
+
+    def delete_features_after(self, column, value):
+        with self._connection.cursor() as cursor:
+            cursor.execute('DELETE FROM {} WHERE {} > %s'.format(self.qualified_table, quote_ident(column)),
+                           (int(value),))
+
+    def fallback_row(self, feature_dict):
+        # geometry not directly expressible as the layer type, let OGR force it
+        try:
+            values = self.encoder.values(feature_dict)
+            geom = self.manager.create_geometry(self.gtype, feature_dict, None)
+            if geom and self.gtype == geom.GetGeometryType() and geom.IsValid():
+                values.append(to_ewkb_hex(geom.ExportToWkb(ogr.wkbNDR), self.srid))
+            else:
+                values.append(None)
+            return self.encoder.format(values)
+        except Exception as e:
+            logger.error('Failed to convert feature {}'.format(e))
+            return None
+
+    def get_converter(self):
+        # picklable conversion of feature pages to COPY rows, see RowEncoder
+        return self.encoder
+
+    def write_rows(self, rows):
+        # write rows returned by the converter, returns the number of rows loaded
+        created = 0
+        for row in rows:
+            if isinstance(row, dict):
+                row = self.fallback_row(row)
+            if row is None:
+                continue
+            self._buffer.write(row)
+            self._buffered += 1
+            created += 1
+            if self._buffered >= self.batch_size:
+                self.flush()
+        return created
+
+    def write(self, feature_dict):
+        return self.write_rows(self.encoder([feature_dict])) == 1
+
+    def flush(self):
+        if not self._buffered:
+            return
+        self._buffer.seek(0)
+        with self._connection.cursor() as cursor:
+            cursor.copy_expert(self.copy_sql, self._buffer)
+        self._buffer = io.StringIO()
+        self._buffered = 0
+
+    def invalidate_geometries(self):
+        # same result as checking IsValid() per feature, in one set based statement
+        sql = 'UPDATE {0} SET {1} = NULL WHERE {1} IS NOT NULL AND NOT ST_IsValid({1})'.format(
+            self.qualified_table, quote_ident(self.geometry_column))
+        params = None
+        if self.fid_column:
+            sql += ' AND {} > %s'.format(quote_ident(self.fid_column))
+            params = (self.start_fid,)
+        with self._connection.cursor() as cursor:
+            cursor.execute(sql, params)
+
+    def checkpoint(self):
+        # commit the rows loaded so far, loading continues in a new transaction
+        self.flush()
+        if self.geometry_column and self.validate_geometry:
+            self.invalidate_geometries()
+        self._connection.commit()
+        if self.geometry_column:
+            with self._connection.cursor() as cursor:
+                self.update_start_fid(cursor)
+
+    def commit(self):
+        self.flush()
+        if self.geometry_column and self.validate_geometry:
+            self.invalidate_geometries()
+        self.finalize()
+        self._connection.commit()
+        self.close()
+
+    def rollback(self):
+        if self._connection:
+            self._connection.rollback()
+        self.close()
+
+    def close(self):
+        if self._connection:
+            self._connection.close()
+        self._connection = None
+
+
+class PostgisSwapWriter(PostgisCopyWriter):
+    # load into a staging copy of the table and swap it with the live one on commit
+
+    analyzes_on_commit = True
+
+    def __init__(self, manager, layer, gtype, connection_string, schema, table, **kwargs):
+        super(PostgisSwapWriter, self).__init__(manager, layer, gtype, connection_string, schema, table, **kwargs)
+        # keep the staging name in the 63 characters identifiers limit
+        self.table = '{}_staging'.format(table[:55])
+
+    def prepare(self):
+        with self._connection.cursor() as cursor:
+            cursor.execute('DROP TABLE IF EXISTS {}'.format(self.qualified_table))
+            # indexes are built once the staging table is loaded
+            cursor.execute('CREATE TABLE {} (LIKE {} INCLUDING ALL EXCLUDING INDEXES)'.format(
+                self.qualified_table, self.qualified_live_table))
+
+    def clear(self):
+        # staging table starts empty
+        pass
+
+    def copy_privileges(self, cursor):
+        # the staging table replaces the live one, readers like the geoserver role keep their access
+        cursor.execute('SELECT grantee, privilege_type, is_grantable FROM information_schema.role_table_grants '
+                       'WHERE table_schema = %s AND table_name = %s', (self.schema, self.live_table))
+        for grantee, privilege, grantable in cursor.fetchall():
+            cursor.execute('GRANT {} ON {} TO {}{}'.format(
+                privilege, self.qualified_table, grantee if grantee == 'PUBLIC' else quote_ident(grantee),
+                ' WITH GRANT OPTION' if grantable == 'YES' else ''))
+        cursor.execute('SELECT tableowner FROM pg_tables WHERE schemaname = %s AND tablename = %s',
+                       (self.schema, self.live_table))
+        owner = cursor.fetchone()[0]
+        cursor.execute('SELECT current_user')
+        if owner != cursor.fetchone()[0]:
+            cursor.execute('ALTER TABLE {} OWNER TO {}'.format(self.qualified_table, quote_ident(owner)))
+
+    def finalize(self):
+        old_table = '{}_old'.format(self.live_table[:59])
+        metrics = self.manager.metrics
+        with self._connection.cursor() as cursor:
+            # built before the live table is locked, readers are only blocked by the renames
+            with metrics.timed('index'):
+                indexes = copy_indexes(cursor, self.schema, self.live_table, self.table)
+            if self.geometry_column and self.manager.get_option('cluster', False):
+                geometry_index = next((temporary_name for temporary_name, name, constraint, constraint_type
+                                       in indexes if name.endswith('_geom_idx')), None)
+                if geometry_index:
+                    with metrics.timed('cluster'):
+                        cursor.execute('CLUSTER {} USING {}'.format(self.qualified_table,
+                                                                    quote_ident(geometry_index)))
+            with metrics.timed('analyze'):
+                cursor.execute('ANALYZE {}'.format(self.qualified_table))
+            cursor.execute('LOCK TABLE {} IN ACCESS EXCLUSIVE MODE'.format(self.qualified_live_table))
+            self.copy_privileges(cursor)
+            if self.fid_column:
+                # the staging fid default uses the live table sequence, keep it when the live table is dropped
+                cursor.execute('SELECT pg_get_serial_sequence(%s, %s)', (self.qualified_live_table, self.fid_column))
+                sequence = cursor.fetchone()[0]
+                if sequence:
+                    cursor.execute('ALTER SEQUENCE {} OWNED BY {}.{}'.format(sequence, self.qualified_table,
+                                                                             quote_ident(self.fid_column)))
+            cursor.execute('ALTER TABLE {} RENAME TO {}'.format(self.qualified_live_table, quote_ident(old_table)))
+            cursor.execute('ALTER TABLE {} RENAME TO {}'.format(self.qualified_table, quote_ident(self.live_table)))
+            cursor.execute('DROP TABLE {}.{}'.format(quote_ident(self.schema), quote_ident(old_table)))
+            restore_indexes(cursor, self.schema, self.live_table, indexes)
+        super(PostgisSwapWriter, self).finalize()
+
+
+class PostgisDiffWriter(PostgisCopyWriter):
+    # apply only the rows whose hash changed since the last load, keyed by the source OBJECTID
+
+    hash_rows = True
+    analyzes_on_commit = True
+    incoming_table = 'arcgis_importer_incoming'
+    changed_table = 'arcgis_importer_changed'
+
+    def __init__(self, manager, layer, gtype, connection_string, schema, table, oid_column, **kwargs):
+        super(PostgisDiffWriter, self).__init__(manager, layer, gtype, connection_string, schema, table, **kwargs)
+        self.oid_column = oid_column
+        self.live_fid_column = self.fid_column
+        self.table = self.incoming_table
+        # incoming rows have no fid, geometries are validated over the whole temporary table
+        self.fid_column = None
+
+    @property
+    def qualified_table(self):
+        return quote_ident(self.table)
+
+    @property
+    def copy_sql(self):
+        return 'COPY {} ({}, "_row_hash") FROM STDIN'.format(self.qualified_table,
+                                                             ', '.join(map(quote_ident, self.columns)))
+
+    def prepare(self):
+        with self._connection.cursor() as cursor:
+            create_hashes_table(cursor)
+            cursor.execute('CREATE TEMPORARY TABLE {} (LIKE {}) ON COMMIT DROP'.format(self.qualified_table,
+                                                                                     self.qualified_live_table))
+            if self.live_fid_column:
+                cursor.execute('ALTER TABLE {} DROP COLUMN {}'.format(self.qualified_table,
+                                                                      quote_ident(self.live_fid_column)))
+            cursor.execute('ALTER TABLE {} ADD COLUMN "_row_hash" char(32)'.format(self.qualified_table))
+
+    def clear(self):
+        # deleted features are found by the diff
+        pass
+
+    def finalize(self):
+        columns = [quote_ident(column) for column in self.columns]
+        oid = quote_ident(self.oid_column)
+        params = {
+            'live': self.qualified_live_table,
+            'hashes': hashes_table(),
+            'incoming': self.qualified_table,
+            'changed': quote_ident(self.changed_table),
+            'oid': oid,
+            'oid_index': quote_ident('{}_src_oid_idx'.format(self.live_table[:48])),
+            'columns': ', '.join(columns),
+            'assignments': ', '.join('{0} = c.{0}'.format(column) for column in columns),
+        }
+        layer = [hashes_key(self.schema, self.live_table)]
+        with self._connection.cursor() as cursor:
+            cursor.execute('CREATE INDEX ON {incoming} ({oid})'.format(**params))
+            cursor.execute('ANALYZE {incoming}'.format(**params))
+            cursor.execute('CREATE INDEX IF NOT EXISTS {oid_index} ON {live} ({oid})'.format(**params))
+            cursor.execute('DELETE FROM {live} l WHERE NOT EXISTS '
+                           '(SELECT 1 FROM {incoming} i WHERE i.{oid} = l.{oid})'.format(**params))
+            deleted = cursor.rowcount
+            cursor.execute('DELETE FROM {hashes} h WHERE h.layer = %s AND NOT EXISTS '
+                           '(SELECT 1 FROM {incoming} i WHERE i.{oid} = h.oid)'.format(**params), layer)
+            cursor.execute('CREATE TEMPORARY TABLE {changed} ON COMMIT DROP AS SELECT i.* FROM {incoming} i '
+                           'LEFT JOIN {hashes} h ON h.layer = %s AND h.oid = i.{oid} '
+                           'WHERE i.{oid} IS NOT NULL AND h.row_hash IS DISTINCT FROM i."_row_hash"'.format(**params),
+                           layer)
+            cursor.execute('UPDATE {live} l SET {assignments} FROM {changed} c '
+                           'WHERE l.{oid} = c.{oid}'.format(**params))
+            updated = cursor.rowcount
+            cursor.execute('INSERT INTO {live} ({columns}) SELECT {columns} FROM {changed} c '
+                           'WHERE NOT EXISTS (SELECT 1 FROM {live} l WHERE l.{oid} = c.{oid})'.format(**params))
+            inserted = cursor.rowcount
+            cursor.execute('INSERT INTO {hashes} (layer, oid, row_hash) '
+                           'SELECT %s, {oid}, "_row_hash" FROM {changed} '
+                           'ON CONFLICT (layer, oid) DO UPDATE SET row_hash = EXCLUDED.row_hash'.format(**params),
+                           layer)
+            if inserted or updated or deleted:
+                with self.manager.metrics.timed('analyze'):
+                    cursor.execute('ANALYZE {live}'.format(**params))
+        self.manager.update_task("Rows: {} inserted, {} updated, {} deleted".format(inserted, updated, deleted))